@@ -0,0 +1,146 @@
+# benchmarks/async_vs_sync.py
+"""
+Compares requests/sec of the blocking pymongo path against the Motor path.
+
+Both variants serve ``GET /products/{product_id}`` through FastAPI. The sync
+variant is a plain ``def`` route over ``SyncProductRepository``, a frozen copy
+of the blocking pymongo lookup the application used before Motor, and therefore
+runs in Starlette's threadpool; the async variant is an ``async def`` route
+over ``MotorProductRepository``.
+
+By default the collections are in-process mocks that sleep for ``--latency``
+milliseconds per call, which is enough to show threadpool saturation without a
+server. Pass ``--mongo-uri`` to run against a real mongod instead.
+
+Usage:
+    python -m benchmarks.async_vs_sync --requests 2000 --concurrency 200
+    python -m benchmarks.async_vs_sync --mongo-uri mongodb://localhost:27017/
+"""
+
+import argparse
+import asyncio
+import time
+from uuid import UUID, uuid4
+
+import httpx
+from fastapi import FastAPI, HTTPException
+
+from pymongo.collection import Collection
+
+from benchmarks.fakes import AsyncLatencyCollection, LatencyCollection
+from src.core.entities.product import Product, ProductRecord
+from src.infrastructure.mappers import ENTITY_PROJECTION, product_mapper
+from src.infrastructure.repositories.motor_product_repository import MotorProductRepository
+
+
+class SyncProductRepository:
+    """The product lookup over a blocking pymongo collection, kept only as the baseline of this benchmark."""
+
+    def __init__(self, collection: Collection):
+        self.collection = collection
+
+    def get_product_by_id(self, product_id: UUID) -> ProductRecord:
+        return product_mapper.from_document(self.collection.find_one({"id": product_id}, ENTITY_PROJECTION))
+
+
+def _seed_documents(count: int) -> dict:
+    owner_id = uuid4()
+    documents = {}
+    for index in range(count):
+        product_id = uuid4()
+        documents[product_id] = {
+            "id": product_id,
+            "owner_id": owner_id,
+            "title": f"Product {index}",
+            "description": "Benchmark product",
+            "image_url": None,
+            "interests": ["books", "music"],
+        }
+    return documents
+
+
+def build_sync_app(repository: SyncProductRepository) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/products/{product_id}", response_model=Product)
+    def get_product(product_id: UUID):
+        product = repository.get_product_by_id(product_id)
+        if not product:
+            raise HTTPException(status_code=404, detail="Product not found")
+        return product
+
+    return app
+
+
+def build_async_app(repository: MotorProductRepository) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/products/{product_id}", response_model=Product)
+    async def get_product(product_id: UUID):
+        product = await repository.get_product_by_id(product_id)
+        if not product:
+            raise HTTPException(status_code=404, detail="Product not found")
+        return product
+
+    return app
+
+
+async def drive(app: FastAPI, product_ids: list, total: int, concurrency: int) -> float:
+    """Issues ``total`` requests with at most ``concurrency`` in flight and returns requests/sec."""
+    transport = httpx.ASGITransport(app=app)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        async def one(index: int):
+            async with semaphore:
+                response = await http.get(f"/products/{product_ids[index % len(product_ids)]}")
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(index) for index in range(total)))
+        elapsed = time.perf_counter() - started
+    return total / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=5.0, help="mock round-trip time in milliseconds")
+    parser.add_argument("--documents", type=int, default=1000)
+    parser.add_argument("--mongo-uri", default=None, help="benchmark against a real mongod instead of the mock")
+    args = parser.parse_args()
+
+    documents = _seed_documents(args.documents)
+    product_ids = [str(key) for key in documents]
+
+    if args.mongo_uri:
+        from motor.motor_asyncio import AsyncIOMotorClient
+        from pymongo import MongoClient
+
+        sync_collection = MongoClient(args.mongo_uri, uuidRepresentation="standard")["barter_app_bench"]["products"]
+        sync_collection.drop()
+        sync_collection.insert_many(list(documents.values()))
+        sync_collection.create_index("id", unique=True)
+        async_client = AsyncIOMotorClient(args.mongo_uri, uuidRepresentation="standard")
+        async_collection = async_client["barter_app_bench"]["products"]
+    else:
+        latency = args.latency / 1000
+        sync_collection = LatencyCollection(documents, latency)
+        async_collection = AsyncLatencyCollection(documents, latency)
+
+    sync_app = build_sync_app(SyncProductRepository(sync_collection))
+    async_app = build_async_app(MotorProductRepository(async_collection))
+
+    sync_rps = asyncio.run(drive(sync_app, product_ids, args.requests, args.concurrency))
+    async_rps = asyncio.run(drive(async_app, product_ids, args.requests, args.concurrency))
+
+    print(f"requests={args.requests} concurrency={args.concurrency} "
+          f"backend={'mongod' if args.mongo_uri else f'mock ({args.latency} ms)'}")
+    print(f"sync  (def + pymongo):  {sync_rps:10.1f} req/s")
+    print(f"async (async + motor):  {async_rps:10.1f} req/s")
+    print(f"speedup:                {async_rps / sync_rps:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# benchmarks/bulk_ingest.py
+"""
+Reports documents/sec for one-document-per-request inserts against bulk ingestion.
+
+The baseline calls ``MotorProductRepository.create_product`` once per
+document, which is what ``POST /products/`` costs a migrating partner today.
+The bulk runs go through ``ingest_products`` (validation plus unordered
+insert_many) at several chunk sizes.
+
+By default the collection is an in-process mock charging ``--latency``
+milliseconds per round-trip plus ``--per-document`` microseconds per document.
+Pass ``--mongo-uri`` to run against a real mongod instead.
+
+Usage:
+    python -m benchmarks.bulk_ingest --documents 20000
+    python -m benchmarks.bulk_ingest --mongo-uri mongodb://localhost:27017/
+"""
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+from benchmarks.fakes import AsyncLatencyCollection
+from src.core.entities.product import Product
+from src.features.products import product_service
+from src.infrastructure.container import repositories
+from src.infrastructure.repositories.motor_product_repository import MotorProductRepository
+from src.infrastructure.search.mongo_product_search import MongoProductSearch
+
+
+def _raw_products(count: int) -> list[dict]:
+    owner_id = str(uuid4())
+    return [
+        {"owner_id": owner_id, "title": f"Product {index}", "description": "Imported from a partner catalog",
+         "interests": ["books", "music"]}
+        for index in range(count)
+    ]
+
+
+async def one_by_one(repository: MotorProductRepository, items: list[dict]) -> float:
+    started = time.perf_counter()
+    for item in items:
+        await repository.create_product(Product(**item))
+    return len(items) / (time.perf_counter() - started)
+
+
+async def bulk(repository: MotorProductRepository, items: list[dict], chunk_size: int) -> float:
+    repositories.bind(SimpleNamespace(products=repository, product_search=MongoProductSearch(repository.collection)))
+    started = time.perf_counter()
+    results = await product_service.ingest_products(items, chunk_size)
+    elapsed = time.perf_counter() - started
+    assert all(result.error is None for result in results)
+    return len(items) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=20000)
+    parser.add_argument("--baseline-documents", type=int, default=500,
+                        help="documents inserted one by one; kept small because the baseline is slow")
+    parser.add_argument("--chunk-sizes", default="100,1000,5000")
+    parser.add_argument("--latency", type=float, default=2.0, help="mock round-trip time in milliseconds")
+    parser.add_argument("--per-document", type=float, default=5.0, help="mock cost per document in microseconds")
+    parser.add_argument("--mongo-uri", default=None, help="benchmark against a real mongod instead of the mock")
+    args = parser.parse_args()
+
+    if args.mongo_uri:
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        collection = AsyncIOMotorClient(args.mongo_uri, uuidRepresentation="standard")["barter_app_bench"]["products"]
+        asyncio.run(collection.drop())
+
+        def new_collection():
+            return collection
+    else:
+        def new_collection():
+            return AsyncLatencyCollection(latency=args.latency / 1000, per_document=args.per_document / 1_000_000)
+
+    baseline = asyncio.run(one_by_one(MotorProductRepository(new_collection()), _raw_products(args.baseline_documents)))
+    print(f"insert_one per document:        {baseline:12.0f} docs/s")
+    for chunk_size in (int(size) for size in args.chunk_sizes.split(",")):
+        rate = asyncio.run(bulk(MotorProductRepository(new_collection()), _raw_products(args.documents), chunk_size))
+        print(f"bulk, chunk_size={chunk_size:<6}         {rate:12.0f} docs/s  ({rate / baseline:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# benchmarks/entity_mapping.py
+"""
+Measures the per-document cost of turning raw BSON into entities.
+
+"before" decodes full documents (including Mongo's ``_id``) with the driver's
+default codec, converts every UUID field with ``UUID(bytes=...)`` and builds a
+new pydantic model, which is what the repositories did by hand. "after" decodes
+the documents the repositories now receive (``_id`` projected away) with
+``CODEC_OPTIONS``, so UUIDs come out of the driver already decoded, and builds
+the entity's record with its mapper (``RecordMapper``).
+
+With pydantic 2 most of the remaining cost is BSON decoding itself; the gain
+is larger on pydantic 1, where the mapper skips validation entirely.
+
+Usage:
+    python -m benchmarks.entity_mapping --documents 100000
+"""
+
+import argparse
+import time
+from uuid import UUID, uuid4
+
+import bson
+from bson import Binary, ObjectId, UuidRepresentation
+
+from src.core.entities.offer import Offer
+from src.core.entities.product import Product
+from src.infrastructure.mappers import CODEC_OPTIONS, offer_mapper, product_mapper
+
+PRODUCT_UUID_FIELDS = ("id", "owner_id")
+OFFER_UUID_FIELDS = ("id", "product_id", "from_user_id", "to_user_id", "offered_product_id")
+
+
+def _binary(value: UUID) -> Binary:
+    return Binary.from_uuid(value, uuid_representation=UuidRepresentation.STANDARD)
+
+
+def _encoded(documents: list[dict], with_object_id: bool) -> bytes:
+    return b"".join(bson.encode({"_id": ObjectId(), **document} if with_object_id else document)
+                    for document in documents)
+
+
+def _products(count: int) -> list[dict]:
+    owner_id = uuid4()
+    return [{
+        "id": _binary(uuid4()), "owner_id": _binary(owner_id), "title": f"Product {index}",
+        "description": "A well loved paperback", "image_url": None, "interests": ["books", "music"],
+    } for index in range(count)]
+
+
+def _offers(count: int) -> list[dict]:
+    return [{
+        "id": _binary(uuid4()), "product_id": _binary(uuid4()), "from_user_id": _binary(uuid4()),
+        "to_user_id": _binary(uuid4()), "offered_product_id": _binary(uuid4()), "status": "pending",
+    } for _ in range(count)]
+
+
+def before(data: bytes, model, uuid_fields) -> float:
+    started = time.perf_counter()
+    for document in bson.decode_all(data):
+        for field in uuid_fields:
+            document[field] = UUID(bytes=document[field])
+        model(**document)
+    return time.perf_counter() - started
+
+
+def after(data: bytes, mapper) -> float:
+    started = time.perf_counter()
+    for document in bson.decode_all(data, CODEC_OPTIONS):
+        mapper.from_document(document)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3, help="report the best of this many runs")
+    args = parser.parse_args()
+
+    for name, documents, model, uuid_fields, mapper in (
+            ("Product", _products(args.documents), Product, PRODUCT_UUID_FIELDS, product_mapper),
+            ("Offer", _offers(args.documents), Offer, OFFER_UUID_FIELDS, offer_mapper),
+    ):
+        before_seconds = min(before(_encoded(documents, True), model, uuid_fields) for _ in range(args.repeat))
+        after_seconds = min(after(_encoded(documents, False), mapper) for _ in range(args.repeat))
+        per_document = 1_000_000 / args.documents
+        print(f"{name:8} before {before_seconds * per_document:6.2f} us/doc   "
+              f"after {after_seconds * per_document:6.2f} us/doc   "
+              f"({before_seconds / after_seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
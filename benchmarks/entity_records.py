@@ -0,0 +1,122 @@
+# benchmarks/entity_records.py
+"""
+Compares pydantic entities with the slotted records the repositories hold.
+
+For Product, Offer and User, ``--records`` objects (1,000,000 by default) are
+built from decoded documents, once as the pydantic entity through an
+``EntityMapper`` (what the repositories did before) and once as the record
+through its ``RecordMapper``. For each variant the benchmark reports:
+
+- construction time per object, without tracing;
+- memory retained per object, measured with tracemalloc while the objects
+  are alive. Each object is built from its own document, which is then
+  dropped, so the figure includes the field values the object keeps (the
+  ``interests`` list, for instance) as well as the instance itself.
+
+The documents use a small pool of strings and UUIDs, so most field values
+are shared and the difference between the variants is the per-instance
+overhead. Building a pydantic User also validates its ``EmailStr``, which
+dominates its construction time.
+
+Usage:
+    python -m benchmarks.entity_records
+    python -m benchmarks.entity_records --records 100000 --entity Product
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable
+from uuid import uuid4
+
+from src.core.entities.offer import Offer
+from src.core.entities.product import Product
+from src.core.entities.user import User
+from src.infrastructure.mappers import EntityMapper, offer_mapper, product_mapper, user_mapper
+
+POOL_SIZE = 1000
+
+
+def _product_documents(pool: list) -> Callable[[int], dict]:
+    owners = [uuid4() for _ in range(POOL_SIZE)]
+    return lambda index: {
+        "id": pool[index % POOL_SIZE], "owner_id": owners[index % POOL_SIZE], "title": "A well loved paperback",
+        "description": "Some wear on the cover, otherwise like new", "image_url": None,
+        "interests": ["books", "music"], "version": 1,
+    }
+
+
+def _offer_documents(pool: list) -> Callable[[int], dict]:
+    now = datetime.now(timezone.utc)
+    return lambda index: {
+        "id": pool[index % POOL_SIZE], "product_id": pool[(index + 1) % POOL_SIZE],
+        "from_user_id": pool[(index + 2) % POOL_SIZE], "to_user_id": pool[(index + 3) % POOL_SIZE],
+        "offered_product_id": pool[(index + 4) % POOL_SIZE], "status": "pending", "created_at": now,
+        "expires_at": now, "closed_at": None, "version": 1,
+    }
+
+
+def _user_documents(pool: list) -> Callable[[int], dict]:
+    return lambda index: {
+        "id": pool[index % POOL_SIZE], "username": "reader", "email": "reader@example.com",
+        "hashed_password": "$2b$12$abcdefghijklmnopqrstuv", "profile_picture": None,
+        "interests": ["books", "music"],
+    }
+
+
+ENTITIES = {
+    "Product": (Product, product_mapper, _product_documents),
+    "Offer": (Offer, offer_mapper, _offer_documents),
+    "User": (User, user_mapper, _user_documents),
+}
+
+
+def construction_seconds(build: Callable[[dict], object], document: Callable[[int], dict], count: int) -> float:
+    documents = [document(index) for index in range(count)]
+    gc.collect()
+    started = time.perf_counter()
+    objects = [build(document) for document in documents]
+    elapsed = time.perf_counter() - started
+    del objects, documents
+    return elapsed
+
+
+def retained_bytes(build: Callable[[dict], object], document: Callable[[int], dict], count: int) -> int:
+    gc.collect()
+    tracemalloc.start()
+    objects = [build(document(index)) for index in range(count)]
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--entity", action="append", choices=sorted(ENTITIES),
+                        help="entity to measure, repeatable (default: all)")
+    args = parser.parse_args()
+
+    pool = [uuid4() for _ in range(POOL_SIZE)]
+    print(f"{args.records:,} objects per variant")
+    for name in args.entity or list(ENTITIES):
+        model, mapper, documents = ENTITIES[name]
+        document = documents(pool)
+        results = {}
+        for variant, build in (("pydantic", EntityMapper(model).from_document), ("record", mapper.from_document)):
+            seconds = construction_seconds(build, document, args.records)
+            retained = retained_bytes(build, document, args.records)
+            results[variant] = (seconds, retained)
+            print(f"{name:8} {variant:9} {seconds / args.records * 1e6:6.2f} us/object  "
+                  f"{retained / args.records:6.0f} bytes/object  ({retained / 2 ** 20:7.1f} MiB total)")
+        (pydantic_seconds, pydantic_bytes), (record_seconds, record_bytes) = results["pydantic"], results["record"]
+        print(f"{name:8} record vs pydantic: {pydantic_seconds / record_seconds:.1f}x faster, "
+              f"{pydantic_bytes / record_bytes:.1f}x less memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# benchmarks/fakes.py
+"""In-process collection stand-ins that model a fixed network round-trip time."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+
+class LatencyCollection:
+    """
+    Blocking stand-in for a pymongo collection.
+
+    Every call costs ``latency`` seconds plus ``per_document`` seconds for each
+    document it carries, roughly the shape of a round-trip to a real server.
+    """
+
+    def __init__(self, documents: dict = None, latency: float = 0.005, per_document: float = 0.0):
+        self.documents = documents if documents is not None else {}
+        self.latency = latency
+        self.per_document = per_document
+
+    def _cost(self, count: int = 1) -> float:
+        return self.latency + self.per_document * count
+
+    def find_one(self, query: dict, *args, **kwargs):
+        time.sleep(self._cost())
+        document = self.documents.get(query["id"])
+        return dict(document) if document else None
+
+    def insert_one(self, document: dict):
+        time.sleep(self._cost())
+        self.documents[document["id"]] = document
+        return SimpleNamespace(inserted_id=document["id"])
+
+    def insert_many(self, documents: list, ordered: bool = True):
+        time.sleep(self._cost(len(documents)))
+        for document in documents:
+            self.documents[document["id"]] = document
+        return SimpleNamespace(inserted_ids=[document["id"] for document in documents])
+
+
+class AsyncLatencyCollection(LatencyCollection):
+    """Non-blocking stand-in for a Motor collection with the same cost model."""
+
+    async def find_one(self, query: dict, *args, **kwargs):
+        await asyncio.sleep(self._cost())
+        document = self.documents.get(query["id"])
+        return dict(document) if document else None
+
+    async def insert_one(self, document: dict):
+        await asyncio.sleep(self._cost())
+        self.documents[document["id"]] = document
+        return SimpleNamespace(inserted_id=document["id"])
+
+    async def insert_many(self, documents: list, ordered: bool = True):
+        await asyncio.sleep(self._cost(len(documents)))
+        for document in documents:
+            self.documents[document["id"]] = document
+        return SimpleNamespace(inserted_ids=[document["id"] for document in documents])
+
+    def find(self, query: dict, projection: dict = None, *args, **kwargs):
+        return AsyncLatencyCursor(self, query, projection)
+
+
+class AsyncLatencyCursor:
+    """
+    Motor-style cursor over an ``AsyncLatencyCollection``, charged as one round-trip.
+
+    Supports equality filters plus ``$gt``, a single-field ``sort``, ``limit``
+    and inclusion or ``_id``-only exclusion projections.
+    """
+
+    def __init__(self, collection: AsyncLatencyCollection, query: dict, projection: dict = None):
+        self.collection = collection
+        self.query = query
+        self.projection = projection
+        self._sort = None
+        self._limit = 0
+
+    def sort(self, key: str, direction: int = 1):
+        self._sort = (key, direction)
+        return self
+
+    def limit(self, limit: int):
+        self._limit = limit
+        return self
+
+    def _matches(self, document: dict) -> bool:
+        for field, condition in self.query.items():
+            if isinstance(condition, dict):
+                if "$gt" in condition and not str(document.get(field)) > str(condition["$gt"]):
+                    return False
+            elif document.get(field) != condition:
+                return False
+        return True
+
+    def _project(self, document: dict) -> dict:
+        included = [field for field, flag in (self.projection or {}).items() if flag and field != "_id"]
+        if included:
+            return {field: document[field] for field in included if field in document}
+        return {field: value for field, value in document.items() if field != "_id"}
+
+    async def to_list(self, length=None) -> list[dict]:
+        documents = [document for document in self.collection.documents.values() if self._matches(document)]
+        if self._sort:
+            key, direction = self._sort
+            documents.sort(key=lambda document: str(document[key]), reverse=direction < 0)
+        if self._limit:
+            documents = documents[:self._limit]
+        await asyncio.sleep(self.collection._cost(len(documents)))
+        return [self._project(document) for document in documents]
+
+    async def __aiter__(self):
+        for document in await self.to_list():
+            yield document
@@ -0,0 +1,90 @@
+# benchmarks/idle_streams.py
+"""
+Measures what idle ``/offers/stream`` connections cost one worker.
+
+Opens ``--connections`` subscriptions on a ``NotificationHub``, each drained
+by the same generator the endpoint streams (``stream_offer_events``), and
+reports the memory they hold, how long a heartbeat sweep over all of them
+takes (including delivering every heartbeat to its consumer), and the
+latency from ``publish`` to the bytes of an offer event being produced for
+one of them. No sockets are opened; ASGI server buffers come on
+top of these numbers.
+
+Usage:
+    python -m benchmarks.idle_streams --connections 50000
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from uuid import uuid4
+
+from src.core.entities.offer import Offer
+from src.features.offers import offer_service
+from src.infrastructure.notifications import NotificationHub
+
+
+async def consume(user_id, ready: asyncio.Event, received: dict):
+    stream = offer_service.stream_offer_events(user_id)
+    await stream.__anext__()  # retry: preamble
+    ready.set()
+    async for chunk in stream:
+        received[user_id] = (time.perf_counter(), chunk)
+
+
+async def run(connections: int, publishes: int):
+    hub = NotificationHub(heartbeat_seconds=3600)
+    offer_service.offer_notifications = hub
+    received = {}
+    users = [uuid4() for _ in range(connections)]
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    readies, tasks = [], []
+    for user_id in users:
+        ready = asyncio.Event()
+        readies.append(ready)
+        tasks.append(asyncio.create_task(consume(user_id, ready, received)))
+    await asyncio.gather(*(ready.wait() for ready in readies))
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{hub.connection_count} idle connections: {(after - before) / connections / 1024:.2f} KiB each, "
+          f"{(after - before) / 2 ** 20:.1f} MiB total (consumer task included)")
+
+    started = time.perf_counter()
+    woken = await hub.heartbeat_sweep()
+    while len(received) < connections:
+        await asyncio.sleep(0)
+    print(f"heartbeat sweep: {woken} connections woken and served in {(time.perf_counter() - started) * 1e3:.0f}ms")
+
+    latencies = []
+    for index in range(publishes):
+        user_id = users[index % connections]
+        offer = Offer(id=uuid4(), product_id=uuid4(), from_user_id=uuid4(), to_user_id=user_id,
+                      offered_product_id=uuid4())
+        published = time.perf_counter()
+        hub.publish(offer)
+        while received[user_id][1].startswith(b":"):
+            await asyncio.sleep(0)
+        latencies.append(received[user_id][0] - published)
+    latencies.sort()
+    print(f"publish -> event bytes: p50 {latencies[len(latencies) // 2] * 1e6:.0f}µs, "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1e6:.0f}µs")
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    print(f"after disconnect: {hub.connection_count} connections")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--connections", type=int, default=50_000)
+    parser.add_argument("--publishes", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(run(args.connections, args.publishes))
+
+
+if __name__ == "__main__":
+    main()
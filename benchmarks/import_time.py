@@ -0,0 +1,87 @@
+# benchmarks/import_time.py
+"""
+Measures how long ``import main`` takes, i.e. the start-up cost every worker
+pays before the lifespan runs.
+
+Each sample imports ``main`` in a fresh interpreter and times the import
+inside it, so interpreter start-up is excluded. With ``--compare`` the same is
+done for another git revision, exported with ``git archive`` into a temporary
+directory, alternating between the two trees so both see the same machine
+state. ``--modules`` prints the slowest modules of the working tree, from
+``python -X importtime``.
+
+Usage:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --compare HEAD~1 --samples 30
+    python -m benchmarks.import_time --modules 15
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+TIMED_IMPORT = "import time; started = time.perf_counter(); import main; print(time.perf_counter() - started)"
+
+
+def import_seconds(tree: Path) -> float:
+    output = subprocess.run([sys.executable, "-c", TIMED_IMPORT], cwd=tree, check=True, capture_output=True,
+                            text=True).stdout
+    return float(output.split()[-1])
+
+
+def export_revision(revision: str, directory: str) -> Path:
+    archive = subprocess.run(["git", "archive", revision], cwd=ROOT, check=True, capture_output=True).stdout
+    subprocess.run(["tar", "-x", "-C", directory], input=archive, check=True)
+    return Path(directory)
+
+
+def slowest_modules(count: int) -> list[tuple[int, int, str]]:
+    """Returns (self µs, cumulative µs, module) for the ``count`` modules with the highest self time."""
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), module.strip()))
+    return sorted(rows, reverse=True)[:count]
+
+
+def summary(samples: list[float]) -> str:
+    return f"median {statistics.median(samples) * 1e3:7.1f}ms  min {min(samples) * 1e3:7.1f}ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=20, help="imports timed per tree")
+    parser.add_argument("--compare", metavar="REVISION", default=None, help="git revision to compare against")
+    parser.add_argument("--modules", type=int, default=0, help="print the N slowest modules of the working tree")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        trees = {"working tree": ROOT}
+        if args.compare:
+            trees = {args.compare: export_revision(args.compare, directory), **trees}
+        for tree in trees.values():
+            import_seconds(tree)
+        samples = {name: [] for name in trees}
+        for _ in range(args.samples):
+            for name, tree in trees.items():
+                samples[name].append(import_seconds(tree))
+
+    for name, times in samples.items():
+        print(f"{name:>14}: {summary(times)}")
+    if args.compare:
+        before, after = (statistics.median(times) for times in samples.values())
+        print(f"{'change':>14}: {(after - before) * 1e3:+7.1f}ms ({(after / before - 1) * 100:+.1f}%)")
+    for self_us, cumulative_us, module in slowest_modules(args.modules) if args.modules else []:
+        print(f"{self_us / 1e3:8.1f}ms self {cumulative_us / 1e3:8.1f}ms cumulative  {module}")
+
+
+if __name__ == "__main__":
+    main()
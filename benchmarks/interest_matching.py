@@ -0,0 +1,88 @@
+# benchmarks/interest_matching.py
+"""
+Measures ``GET /products/matches/{user_id}``'s core: top-k mutual matches over the
+packed-bitset index in ``src.core.interest_matching``.
+
+The catalog is synthetic: ``--products`` products spread over ``--users``
+owners, every product and user carrying a few tags drawn from ``--tags``
+distinct interests. Columns are loaded straight into the arrays
+(the incremental ``set_product`` path is what the service uses, but calling
+it a million times would only measure Python overhead). Query latency is then
+measured for ``--queries`` random users on a single core.
+
+Usage:
+    python -m benchmarks.interest_matching
+    python -m benchmarks.interest_matching --products 1000000 --tags 1000 --k 50
+"""
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from src.core.interest_matching import WORD_BITS, InterestMatcher, _Rows
+
+
+def random_bits(rng: np.random.Generator, columns: int, tags: int, per_column: int) -> np.ndarray:
+    words = (tags + WORD_BITS - 1) // WORD_BITS
+    bits = np.zeros((words, columns), dtype=np.uint64)
+    tag_ids = rng.integers(0, tags, size=(per_column, columns))
+    for row in tag_ids:
+        word, bit = np.divmod(row, WORD_BITS)
+        np.bitwise_or.at(bits, (word, np.arange(columns)), np.left_shift(np.uint64(1), bit.astype(np.uint64)))
+    return bits
+
+
+def synthetic_matcher(products: int, users: int, tags: int, tags_per_row: int, seed: int) -> InterestMatcher:
+    rng = np.random.default_rng(seed)
+    matcher = InterestMatcher()
+    matcher.tags = {f"tag-{tag}": tag for tag in range(tags)}
+
+    matcher.wants = _Rows(1, capacity=users)
+    matcher.wants.keys = list(range(users))
+    matcher.wants.index = {user: user for user in range(users)}
+    matcher.wants.bits = random_bits(rng, users, tags, tags_per_row)
+
+    matcher.products = _Rows(1, capacity=products)
+    matcher.products.keys = list(range(products))
+    matcher.products.index = {product: product for product in range(products)}
+    matcher.products.bits = random_bits(rng, products, tags, tags_per_row)
+    matcher.product_owner = rng.integers(0, users, size=products).astype(np.int64)
+
+    matcher.has = np.zeros_like(matcher.wants.bits)
+    for word in range(matcher.words):
+        np.bitwise_or.at(matcher.has[word], matcher.product_owner, matcher.products.bits[word])
+    return matcher
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--tags", type=int, default=256)
+    parser.add_argument("--tags-per-row", type=int, default=3)
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    matcher = synthetic_matcher(args.products, args.users, args.tags, args.tags_per_row, args.seed)
+    print(f"index: {args.products} products, {args.users} users, {args.tags} tags "
+          f"({matcher.words} words each), built in {time.perf_counter() - started:.2f}s")
+
+    rng = np.random.default_rng(args.seed + 1)
+    samples, returned = [], 0
+    for user_id in rng.integers(0, args.users, size=args.queries):
+        started = time.perf_counter()
+        returned += len(matcher.matches(int(user_id), args.k))
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    print(f"top-{args.k} mutual matches: mean {statistics.mean(samples) * 1e3:.2f}ms, "
+          f"p50 {samples[len(samples) // 2] * 1e3:.2f}ms, p99 {samples[int(len(samples) * 0.99)] * 1e3:.2f}ms, "
+          f"{returned / args.queries:.1f} results/query")
+
+
+if __name__ == "__main__":
+    main()
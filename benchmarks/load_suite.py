@@ -0,0 +1,427 @@
+# benchmarks/load_suite.py
+"""
+Load tests the real application in-process and compares runs against baselines.
+
+``main.app`` is started with its lifespan, on the in-memory MongoDB stand-in
+of ``benchmarks/standin.py``, and driven through an in-process HTTP client by
+``--concurrency`` virtual users. Each scenario is a weighted mix of requests:
+
+- ``browse-heavy``: product reads (half of them revalidated with
+  ``If-None-Match``), owner listings, matches, search, feeds and inboxes.
+- ``offer-storm``: offers created between random users, accepted or rejected
+  while others are still pending, and the inboxes and outboxes they land in.
+- ``registration-burst``: new users registering and logging in (each hashes
+  a password on the ``BARTER_PASSWORD_HASH_WORKERS`` pool), setting their
+  interests and asking for their first matches.
+
+Before a scenario ``--users`` users with ``--products`` products each are
+created through the API and the feed fan-out of those products is drained;
+that set-up is not measured. Every virtual request acting for a user sends
+that user's access token, so authentication is part of what is measured.
+Latency is measured client-side per route template and the report gives
+throughput and p50, p95 and p99 per route. A response with an unexpected
+status counts as an error. Conflicts (409 or 412) are legitimate for some
+writes, e.g. answering an offer an accepted competitor has closed, so they are
+counted separately per route; ``compare`` flags a route whose conflict rate
+grew by more than ``--threshold``, or exceeds ``--max-conflict-rate``, since a
+write path that always conflicts is broken even if nothing errors.
+
+Every scenario runs in a fresh interpreter, so the in-process indexes, caches
+and trade graph start empty each time. The absolute numbers include the
+stand-in and the client, so they are for comparing revisions on one machine:
+save a baseline with ``--save``, and ``compare`` flags routes whose latency
+grew, or scenarios whose throughput fell, by more than ``--threshold``.
+Baselines saved before conflicts were counted lack them and must be
+regenerated.
+
+Usage:
+    python -m benchmarks.load_suite run --save baseline.json
+    python -m benchmarks.load_suite run --scenario offer-storm --requests 5000 --concurrency 64
+    python -m benchmarks.load_suite compare baseline.json current.json --threshold 0.15
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+from uuid import uuid4
+
+ROOT = Path(__file__).resolve().parent.parent
+INTERESTS = ["books", "music", "vinyl", "cameras", "bikes", "games", "plants", "tools", "art", "watches",
+             "sneakers", "comics"]
+PERCENTILES = (50, 95, 99)
+
+
+class LoadContext:
+    """The state shared by the virtual users: seeded entities, known versions and pending offers."""
+
+    def __init__(self, http, rng: random.Random):
+        self.http = http
+        self.rng = rng
+        self.users: list[str] = []
+        self.tokens: dict[str, str] = {}  # user ID -> access token
+        self.products_by_owner: dict[str, list[str]] = {}
+        self.products: list[tuple[str, str]] = []  # (product ID, owner ID)
+        self.versions: dict[str, str] = {}  # product ID -> last ETag seen
+        self.pending_offers: list[tuple[str, str]] = []  # (offer ID, recipient ID)
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.conflicts: dict[str, int] = defaultdict(int)
+
+    async def request(self, label: str, method: str, url: str, expected: tuple = (200,), conflicts: tuple = (),
+                      **kwargs):
+        started = time.perf_counter()
+        response = await self.http.request(method, url, **kwargs)
+        self.latencies[label].append(time.perf_counter() - started)
+        if response.status_code in conflicts:
+            self.conflicts[label] += 1
+        elif response.status_code not in expected:
+            self.errors[label] += 1
+        return response
+
+    def auth(self, user_id: str) -> dict:
+        return {"Authorization": f"Bearer {self.tokens[user_id]}"}
+
+    def random_product(self) -> tuple[str, str]:
+        return self.rng.choice(self.products)
+
+    def other_user(self, user_id: str) -> str:
+        while True:
+            other = self.rng.choice(self.users)
+            if other != user_id:
+                return other
+
+
+def random_interests(rng: random.Random) -> list[str]:
+    return rng.sample(INTERESTS, 3)
+
+
+async def register(context: LoadContext, measured: bool = True) -> Optional[str]:
+    name = f"user-{uuid4().hex[:12]}"
+    body = {"username": name, "email": f"{name}@example.com", "password": "not-a-real-password",
+            "interests": random_interests(context.rng)}
+    credentials = {"email": body["email"], "password": body["password"]}
+    if measured:
+        response = await context.request("POST /auth/register", "POST", "/auth/register", json=body)
+        if response.status_code == 200:
+            response = await context.request("POST /auth/login", "POST", "/auth/login", json=credentials)
+    else:
+        response = await context.http.post("/auth/register", json=body)
+        if response.status_code == 200:
+            response = await context.http.post("/auth/login", json=credentials)
+    if response.status_code != 200:
+        return None
+    login = response.json()
+    user_id = login["user"]["id"]
+    context.tokens[user_id] = login["access_token"]
+    context.users.append(user_id)
+    context.products_by_owner[user_id] = []
+    return user_id
+
+
+async def seed(context: LoadContext, users: int, products_per_user: int):
+    for _ in range(users):
+        await register(context, measured=False)
+    items = [{"owner_id": owner_id, "title": f"{interest} item {index}",
+              "description": f"A well kept {interest} item, available for trade", "interests": [interest]}
+             for owner_id in context.users for index in range(products_per_user)
+             for interest in [context.rng.choice(INTERESTS)]]
+    response = await context.http.post("/products/bulk", json=items, headers=context.auth(context.users[0]))
+    response.raise_for_status()
+    for item, result in zip(items, response.json()["results"]):
+        context.products.append((result["id"], item["owner_id"]))
+        context.products_by_owner[item["owner_id"]].append(result["id"])
+
+
+async def get_product(context: LoadContext):
+    product_id, _ = context.random_product()
+    headers = {}
+    if product_id in context.versions and context.rng.random() < 0.5:
+        headers["If-None-Match"] = context.versions[product_id]
+    response = await context.request("GET /products/{product_id}", "GET", f"/products/{product_id}",
+                                     expected=(200, 304), headers=headers)
+    if "ETag" in response.headers:
+        context.versions[product_id] = response.headers["ETag"]
+
+
+async def owner_listing(context: LoadContext):
+    owner_id = context.rng.choice(context.users)
+    await context.request("GET /products/owner/{owner_id}", "GET", f"/products/owner/{owner_id}")
+
+
+async def matches(context: LoadContext):
+    user_id = context.rng.choice(context.users)
+    await context.request("GET /products/matches/{user_id}", "GET", f"/products/matches/{user_id}",
+                          headers=context.auth(user_id))
+
+
+async def search(context: LoadContext):
+    await context.request("GET /products/search", "GET", "/products/search",
+                          params={"q": context.rng.choice(INTERESTS)})
+
+
+async def feed(context: LoadContext):
+    user_id = context.rng.choice(context.users)
+    await context.request("GET /feed/{user_id}", "GET", f"/feed/{user_id}", headers=context.auth(user_id))
+
+
+async def inbox(context: LoadContext):
+    user_id = context.rng.choice(context.users)
+    await context.request("GET /offers/inbox/{user_id}", "GET", f"/offers/inbox/{user_id}",
+                          headers=context.auth(user_id))
+
+
+async def outbox(context: LoadContext):
+    user_id = context.rng.choice(context.users)
+    await context.request("GET /offers/outbox/{user_id}", "GET", f"/offers/outbox/{user_id}",
+                          headers=context.auth(user_id))
+
+
+async def create_offer(context: LoadContext):
+    product_id, owner_id = context.random_product()
+    from_user_id = context.other_user(owner_id)
+    if not context.products_by_owner[from_user_id]:
+        return
+    body = {"product_id": product_id, "from_user_id": from_user_id, "to_user_id": owner_id,
+            "offered_product_id": context.rng.choice(context.products_by_owner[from_user_id])}
+    response = await context.request("POST /offers/", "POST", "/offers/", json=body,
+                                     headers=context.auth(from_user_id))
+    if response.status_code == 200:
+        context.pending_offers.append((response.json()["id"], owner_id))
+
+
+async def answer_offer(context: LoadContext):
+    if not context.pending_offers:
+        return await create_offer(context)
+    offer_id, to_user_id = context.pending_offers.pop(context.rng.randrange(len(context.pending_offers)))
+    action = "accept" if context.rng.random() < 0.3 else "reject"
+    await context.request(f"PATCH /offers/{{offer_id}}/{action}", "PATCH", f"/offers/{offer_id}/{action}",
+                          conflicts=(409,), headers=context.auth(to_user_id))
+
+
+async def update_interests(context: LoadContext):
+    user_id = context.rng.choice(context.users[-50:])
+    await context.request("PUT /profile/update_interests/{user_id}", "PUT", f"/profile/update_interests/{user_id}",
+                          json={"interests": random_interests(context.rng)}, headers=context.auth(user_id))
+
+
+async def new_user_matches(context: LoadContext):
+    user_id = context.rng.choice(context.users[-50:])
+    await context.request("GET /products/matches/{user_id}", "GET", f"/products/matches/{user_id}",
+                          headers=context.auth(user_id))
+
+
+Operation = Callable[[LoadContext], Awaitable]
+
+SCENARIOS: dict[str, list[tuple[int, Operation]]] = {
+    "browse-heavy": [(40, get_product), (15, owner_listing), (15, matches), (10, search), (10, feed), (10, inbox)],
+    "offer-storm": [(50, create_offer), (20, answer_offer), (15, inbox), (15, outbox)],
+    "registration-burst": [(60, register), (25, update_interests), (15, new_user_matches)],
+}
+
+
+def percentile(sorted_values: list[float], percent: int) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(int(round(percent / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def summarize(context: LoadContext, elapsed: float) -> dict:
+    routes = {}
+    for label, latencies in sorted(context.latencies.items()):
+        latencies.sort()
+        routes[label] = {"count": len(latencies), "errors": context.errors[label],
+                         "conflicts": context.conflicts[label],
+                         "throughput": len(latencies) / elapsed,
+                         **{f"p{percent}_ms": percentile(latencies, percent) * 1e3 for percent in PERCENTILES}}
+    requests = sum(route["count"] for route in routes.values())
+    return {"requests": requests, "errors": sum(route["errors"] for route in routes.values()),
+            "conflicts": sum(route["conflicts"] for route in routes.values()),
+            "seconds": elapsed, "throughput": requests / elapsed, "routes": routes}
+
+
+async def run_scenario(name: str, args) -> dict:
+    os.environ.setdefault("BARTER_SEARCH_BACKEND", "memory")
+    os.environ.setdefault("BARTER_TOKEN_ALLOW_RANDOM_SECRET", "1")
+    # The seeding uses POST /products/bulk, which needs the bulk scope.
+    os.environ.setdefault("BARTER_TOKEN_SCOPES", "profile products offers trades messages bulk")
+    logging.disable(logging.INFO)
+    import httpx
+    import main
+    from benchmarks.standin import standin_database, use_standin
+    from src.infrastructure.events import event_bus
+
+    use_standin(standin_database())
+    rng = random.Random(args.seed)
+    weights, operations = zip(*SCENARIOS[name])
+    async with main.app.router.lifespan_context(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://load") as http:
+            context = LoadContext(http, rng)
+            await seed(context, args.users, args.products)
+            await event_bus.drain()
+            schedule = rng.choices(operations, weights, k=args.requests)
+
+            async def virtual_user(worker: int):
+                for operation in schedule[worker::args.concurrency]:
+                    await operation(context)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(virtual_user(worker) for worker in range(args.concurrency)))
+            elapsed = time.perf_counter() - started
+    return summarize(context, elapsed)
+
+
+def run_isolated(name: str, args) -> dict:
+    command = [sys.executable, "-m", "benchmarks.load_suite", "scenario", name, "--requests", str(args.requests),
+               "--concurrency", str(args.concurrency), "--users", str(args.users), "--products", str(args.products),
+               "--seed", str(args.seed)]
+    output = subprocess.run(command, cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def git_revision() -> Optional[str]:
+    result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+    return result.stdout.strip() or None
+
+
+def print_report(name: str, result: dict):
+    print(f"{name}: {result['requests']} requests in {result['seconds']:.2f}s, "
+          f"{result['throughput']:.0f} req/s, {result['errors']} errors, {result['conflicts']} conflicts")
+    print(f"  {'route':<40} {'count':>6} {'errors':>6} {'confl.':>6} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'p99 ms':>8}")
+    for label, route in result["routes"].items():
+        print(f"  {label:<40} {route['count']:>6} {route['errors']:>6} {route['conflicts']:>6} "
+              f"{route['throughput']:>8.0f} "
+              f"{route['p50_ms']:>8.2f} {route['p95_ms']:>8.2f} {route['p99_ms']:>8.2f}")
+
+
+def command_run(args):
+    scenarios = args.scenario or list(SCENARIOS)
+    results = {}
+    for name in scenarios:
+        results[name] = run_isolated(name, args)
+        print_report(name, results[name])
+    if args.save:
+        document = {"created_at": datetime.now(timezone.utc).isoformat(), "revision": git_revision(),
+                    "python": platform.python_version(), "machine": platform.machine(),
+                    "settings": {"requests": args.requests, "concurrency": args.concurrency, "users": args.users,
+                                 "products": args.products, "seed": args.seed},
+                    "scenarios": results}
+        Path(args.save).write_text(json.dumps(document, indent=2))
+        print(f"saved {args.save}")
+
+
+def command_scenario(args):
+    print(json.dumps(asyncio.run(run_scenario(args.name, args))))
+
+
+def conflict_rate(route: dict) -> float:
+    return route.get("conflicts", 0) / route["count"] if route["count"] else 0.0
+
+
+def regressions(baseline: dict, current: dict, threshold: float, metrics: list[str],
+                max_conflict_rate: float = 1.0) -> list[str]:
+    """
+    Lists the changes beyond the threshold between two saved runs.
+
+    Args:
+        baseline (dict): The baseline run.
+        current (dict): The run to check.
+        threshold (float): The relative change tolerated, e.g. 0.15 for 15%; conflict rates may grow by as
+            many percentage points.
+        metrics (list[str]): The latency percentiles compared per route, e.g. ["p50_ms", "p95_ms"].
+        max_conflict_rate (float): The share of conflicting responses no route of the current run may exceed,
+            whatever the baseline.
+
+    Returns:
+        list[str]: One line per regression; empty if there is none.
+    """
+    found = []
+    for name, after in current["scenarios"].items():
+        for label, route in after["routes"].items():
+            if conflict_rate(route) > max_conflict_rate:
+                found.append(f"{name}: {label} conflict rate {conflict_rate(route):.0%} "
+                             f"above {max_conflict_rate:.0%}")
+    for name, before in baseline["scenarios"].items():
+        after = current["scenarios"].get(name)
+        if after is None:
+            continue
+        if after["throughput"] < before["throughput"] * (1 - threshold):
+            found.append(f"{name}: throughput {before['throughput']:.0f} -> {after['throughput']:.0f} req/s")
+        for label, route in before["routes"].items():
+            if label not in after["routes"]:
+                continue
+            for metric in metrics:
+                if after["routes"][label][metric] > route[metric] * (1 + threshold):
+                    found.append(f"{name}: {label} {metric} {route[metric]:.2f} -> "
+                                 f"{after['routes'][label][metric]:.2f}")
+            if after["routes"][label]["errors"] > route["errors"]:
+                found.append(f"{name}: {label} errors {route['errors']} -> {after['routes'][label]['errors']}")
+            if conflict_rate(after["routes"][label]) > conflict_rate(route) + threshold:
+                found.append(f"{name}: {label} conflict rate {conflict_rate(route):.0%} -> "
+                             f"{conflict_rate(after['routes'][label]):.0%}")
+    return found
+
+
+def command_compare(args):
+    baseline, current = (json.loads(Path(path).read_text()) for path in (args.baseline, args.current))
+    if baseline["settings"] != current["settings"]:
+        print(f"warning: runs used different settings: {baseline['settings']} vs {current['settings']}")
+    found = regressions(baseline, current, args.threshold, [f"{metric}_ms" for metric in args.metrics.split(",")],
+                        args.max_conflict_rate)
+    for line in found:
+        print(f"REGRESSION {line}")
+    print(f"{len(found)} regressions beyond {args.threshold:.0%} "
+          f"({baseline.get('revision')} -> {current.get('revision')})")
+    sys.exit(1 if found else 0)
+
+
+def add_load_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--requests", type=int, default=3000, help="measured requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=32, help="virtual users sending requests at once")
+    parser.add_argument("--users", type=int, default=100, help="users created before the scenario")
+    parser.add_argument("--products", type=int, default=3, help="products created per seeded user")
+    parser.add_argument("--seed", type=int, default=1, help="seed of the request mix")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run scenarios and report, optionally saving a baseline")
+    run.add_argument("--scenario", action="append", choices=list(SCENARIOS), help="repeatable; default: all")
+    run.add_argument("--save", metavar="PATH", default=None, help="write the results as JSON")
+    add_load_arguments(run)
+    run.set_defaults(handler=command_run)
+
+    scenario = commands.add_parser("scenario", help="run one scenario in this interpreter and print JSON")
+    scenario.add_argument("name", choices=list(SCENARIOS))
+    add_load_arguments(scenario)
+    scenario.set_defaults(handler=command_scenario)
+
+    compare = commands.add_parser("compare", help="flag regressions of a run against a baseline")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--threshold", type=float, default=0.15, help="relative change tolerated")
+    compare.add_argument("--metrics", default="p50,p95", help="latency percentiles compared per route")
+    compare.add_argument("--max-conflict-rate", type=float, default=0.5,
+                         help="share of 409/412 responses no route may exceed")
+    compare.set_defaults(handler=command_compare)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# benchmarks/messaging.py
+"""
+Load test for bucketed message storage: messages/sec and history page latency.
+
+``--senders`` concurrent tasks each send ``--messages`` messages through
+``MotorMessageRepository.append_message``, spread over ``--conversations``
+conversations. Then random history pages of ``--page-size`` messages are
+read at random depths, walking backwards with the same (timestamp, ID) cursor
+the endpoint uses. The same messages are also stored one document per message
+(indexed on conversation and time) to compare page reads against that layout.
+
+Needs a real mongod, since the in-process fakes do not implement update
+operators. Uses the ``barter_app_bench`` database, which is dropped first.
+
+Usage:
+    python -m benchmarks.messaging --mongo-uri mongodb://localhost:27017/
+    python -m benchmarks.messaging --mongo-uri mongodb://localhost:27017/ --senders 200 --messages 500
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from uuid import uuid4
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import DESCENDING
+
+from src.core.entities.message import Conversation, Message
+from src.infrastructure.indexes import INDEXES
+from src.infrastructure.repositories.motor_message_repository import MotorMessageRepository
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    return sorted(samples)[min(int(len(samples) * fraction), len(samples) - 1)]
+
+
+async def send_load(repository: MotorMessageRepository, conversations: list[Conversation],
+                    senders: int, messages: int) -> float:
+    async def sender(index: int):
+        conversation = conversations[index % len(conversations)]
+        sender_id = conversation.participants[index % 2]
+        for number in range(messages):
+            await repository.append_message(
+                Message(conversation_id=conversation.id, sender_id=sender_id, body=f"Message {number} from {index}"),
+                conversation.participants)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(sender(index) for index in range(senders)))
+    return senders * messages / (time.perf_counter() - started)
+
+
+async def read_bucketed(repository: MotorMessageRepository, conversation: Conversation, depth: int,
+                        page_size: int) -> float:
+    before = None
+    for _ in range(depth):
+        page = await repository.get_messages(conversation.id, before, page_size)
+        before = (page[-1].sent_at.timestamp(), page[-1].id)
+    started = time.perf_counter()
+    await repository.get_messages(conversation.id, before, page_size)
+    return time.perf_counter() - started
+
+
+async def read_flat(collection, conversation: Conversation, depth: int, page_size: int) -> float:
+    query = {"conversation_id": conversation.id}
+    for _ in range(depth):
+        page = await collection.find(query, {"_id": False}).sort([("sent_at", DESCENDING), ("id", DESCENDING)]) \
+            .limit(page_size).to_list(page_size)
+        oldest = page[-1]
+        query = {"conversation_id": conversation.id, "$or": [
+            {"sent_at": {"$lt": oldest["sent_at"]}},
+            {"sent_at": oldest["sent_at"], "id": {"$lt": oldest["id"]}},
+        ]}
+    started = time.perf_counter()
+    await collection.find(query, {"_id": False}).sort([("sent_at", DESCENDING), ("id", DESCENDING)]) \
+        .limit(page_size).to_list(page_size)
+    return time.perf_counter() - started
+
+
+async def run(args):
+    database = AsyncIOMotorClient(args.mongo_uri, uuidRepresentation="standard", tz_aware=True)["barter_app_bench"]
+    await database.client.drop_database("barter_app_bench")
+    for name in ("conversations", "message_buckets"):
+        await database[name].create_indexes(INDEXES[name])
+    repository = MotorMessageRepository(database["conversations"], database["message_buckets"], args.bucket_size)
+
+    conversations = [await repository.get_or_create_conversation(Conversation(participants=[uuid4(), uuid4()]))
+                     for _ in range(args.conversations)]
+    rate = await send_load(repository, conversations, args.senders, args.messages)
+    print(f"send: {rate:,.0f} messages/sec ({args.senders} senders, {args.conversations} conversations, "
+          f"bucket size {args.bucket_size})")
+
+    flat = database["messages"]
+    await flat.create_index([("conversation_id", 1), ("sent_at", DESCENDING), ("id", DESCENDING)])
+    async for bucket in database["message_buckets"].find({}, {"_id": False, "messages": True}):
+        await flat.insert_many(bucket["messages"], ordered=False)
+    print(f"stored: {await database['message_buckets'].count_documents({}):,} buckets, "
+          f"{await flat.count_documents({}):,} flat documents")
+
+    per_conversation = args.senders * args.messages // args.conversations
+    max_depth = max(per_conversation // args.page_size - 1, 0)
+    samples = [(random.choice(conversations), random.randint(0, max_depth)) for _ in range(args.pages)]
+    bucketed = [await read_bucketed(repository, conversation, depth, args.page_size)
+                for conversation, depth in samples]
+    flat_pages = [await read_flat(flat, conversation, depth, args.page_size) for conversation, depth in samples]
+    for name, latencies in (("bucketed", bucketed), ("one document per message", flat_pages)):
+        print(f"history page of {args.page_size} ({name}): p50 {percentile(latencies, 0.5) * 1e3:.2f}ms, "
+              f"p99 {percentile(latencies, 0.99) * 1e3:.2f}ms")
+    await database.client.drop_database("barter_app_bench")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mongo-uri", required=True)
+    parser.add_argument("--conversations", type=int, default=100)
+    parser.add_argument("--senders", type=int, default=100)
+    parser.add_argument("--messages", type=int, default=200, help="messages sent by each sender")
+    parser.add_argument("--bucket-size", type=int, default=100)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--pages", type=int, default=500, help="history pages timed per layout")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
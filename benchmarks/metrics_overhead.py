@@ -0,0 +1,174 @@
+# benchmarks/metrics_overhead.py
+"""
+Measures what the Prometheus instrumentation adds to a request.
+
+Serves ``GET /products/{product_id}`` from the same app with and without
+``MetricsMiddleware``, alternating rounds so both see the same machine state,
+and compares median latency. The collection is an in-process mock with
+``--latency`` milliseconds per round-trip (0 by default, the worst case for
+relative overhead since the request does nothing else). Each mocked find also
+feeds a synthetic started/succeeded pair through ``MongoCommandListener`` and a
+checkout through ``MongoPoolListener`` in the instrumented variant, as the
+driver would. Pass ``--mongo-uri`` to use a real mongod with the listeners
+registered on the client instead.
+
+The target for leaving metrics on in production is a p50 regression under 2%.
+
+Usage:
+    python -m benchmarks.metrics_overhead --requests 5000
+    python -m benchmarks.metrics_overhead --mongo-uri mongodb://localhost:27017/
+"""
+
+import argparse
+import asyncio
+import itertools
+import time
+from types import SimpleNamespace
+from uuid import UUID
+
+import httpx
+from fastapi import FastAPI, HTTPException
+
+from benchmarks.async_vs_sync import _seed_documents
+from benchmarks.fakes import AsyncLatencyCollection
+from src.core.entities.product import Product
+from src.infrastructure.metrics import MetricsMiddleware, MongoCommandListener, MongoPoolListener
+from src.infrastructure.repositories.motor_product_repository import MotorProductRepository
+
+
+class ListenedCollection(AsyncLatencyCollection):
+    """Mock collection that reports each find to the MongoDB listeners like the driver does."""
+
+    def __init__(self, documents: dict, latency: float):
+        super().__init__(documents, latency)
+        self.commands = MongoCommandListener()
+        self.pool = MongoPoolListener()
+        self.request_ids = itertools.count()
+
+    async def find_one(self, query: dict, *args, **kwargs):
+        request_id = next(self.request_ids)
+        self.pool.connection_checked_out(SimpleNamespace(duration=0.00001))
+        self.commands.started(SimpleNamespace(request_id=request_id, connection_id=("bench", 1), command_name="find",
+                                              command={"find": "products", "filter": query}))
+        document = await super().find_one(query, *args, **kwargs)
+        self.commands.succeeded(SimpleNamespace(request_id=request_id, connection_id=("bench", 1),
+                                                command_name="find", duration_micros=int(self.latency * 1e6)))
+        return document
+
+
+async def instrumentation_cost(count: int) -> float:
+    """Returns the seconds the middleware and one command's listener calls add per request, measured in isolation."""
+    async def endpoint(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(message):
+        pass
+
+    scope = {"type": "http", "method": "GET", "route": SimpleNamespace(path="/products/{product_id}")}
+    collection = ListenedCollection({}, 0.0)
+    middleware = MetricsMiddleware(endpoint)
+
+    async def instrumented(scope, receive, send):
+        await collection.find_one({"id": None})
+        await middleware(scope, receive, send)
+
+    async def plain(scope, receive, send):
+        await AsyncLatencyCollection.find_one(collection, {"id": None})
+        await endpoint(scope, receive, send)
+
+    elapsed = {}
+    for name, app in (("plain", plain), ("instrumented", instrumented)):
+        started = time.perf_counter()
+        for _ in range(count):
+            await app(scope, None, send)
+        elapsed[name] = time.perf_counter() - started
+    return (elapsed["instrumented"] - elapsed["plain"]) / count
+
+
+def build_app(repository: MotorProductRepository, instrumented: bool) -> FastAPI:
+    app = FastAPI()
+    if instrumented:
+        app.add_middleware(MetricsMiddleware)
+
+    @app.get("/products/{product_id}", response_model=Product)
+    async def get_product(product_id: UUID):
+        product = await repository.get_product_by_id(product_id)
+        if not product:
+            raise HTTPException(status_code=404, detail="Product not found")
+        return product
+
+    return app
+
+
+async def timed_requests(app: FastAPI, product_ids: list[str], count: int) -> list[float]:
+    latencies = []
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as http:
+        for index in range(count):
+            started = time.perf_counter()
+            response = await http.get(f"/products/{product_ids[index % len(product_ids)]}")
+            latencies.append(time.perf_counter() - started)
+            response.raise_for_status()
+    return latencies
+
+
+async def run(args, plain_collection, instrumented_collection, product_ids: list[str]):
+    apps = {
+        "plain": build_app(MotorProductRepository(plain_collection), instrumented=False),
+        "instrumented": build_app(MotorProductRepository(instrumented_collection), instrumented=True),
+    }
+    for app in apps.values():
+        await timed_requests(app, product_ids, args.warmup)
+    samples = {name: [] for name in apps}
+    per_round = args.requests // args.rounds
+    for _ in range(args.rounds):
+        for name, app in apps.items():
+            samples[name].extend(await timed_requests(app, product_ids, per_round))
+
+    medians = {name: sorted(latencies)[len(latencies) // 2] for name, latencies in samples.items()}
+    for name, latencies in samples.items():
+        latencies.sort()
+        print(f"{name:>12}: p50 {medians[name] * 1e6:8.1f}µs  p99 {latencies[int(len(latencies) * 0.99)] * 1e6:8.1f}µs")
+    regression = medians["instrumented"] / medians["plain"] - 1
+    print(f"p50 regression: {regression * 100:+.2f}% "
+          f"({(medians['instrumented'] - medians['plain']) * 1e6:+.1f}µs per request, includes noise)")
+    cost = await instrumentation_cost(args.requests * 10)
+    print(f"instrumentation alone: {cost * 1e6:.2f}µs per request, "
+          f"{cost / medians['plain'] * 100:.2f}% of the plain p50")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000, help="timed requests per variant")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.0, help="mock round-trip time in milliseconds")
+    parser.add_argument("--documents", type=int, default=1000)
+    parser.add_argument("--mongo-uri", default=None, help="benchmark against a real mongod instead of the mock")
+    args = parser.parse_args()
+
+    documents = _seed_documents(args.documents)
+    product_ids = [str(key) for key in documents]
+    if args.mongo_uri:
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        def collection(listeners: list):
+            client = AsyncIOMotorClient(args.mongo_uri, uuidRepresentation="standard", event_listeners=listeners)
+            return client["barter_app_bench"]["products"]
+
+        plain_collection = collection([])
+        instrumented_collection = collection([MongoCommandListener(), MongoPoolListener()])
+
+        async def seed():
+            await plain_collection.drop()
+            await plain_collection.insert_many(list(documents.values()))
+            await plain_collection.create_index("id", unique=True)
+        asyncio.run(seed())
+    else:
+        plain_collection = AsyncLatencyCollection(documents, args.latency / 1000)
+        instrumented_collection = ListenedCollection(documents, args.latency / 1000)
+    asyncio.run(run(args, plain_collection, instrumented_collection, product_ids))
+
+
+if __name__ == "__main__":
+    main()
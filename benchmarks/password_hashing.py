@@ -0,0 +1,102 @@
+# benchmarks/password_hashing.py
+"""
+Measures login throughput with scrypt password hashing, per core.
+
+Every login is one ``verify_password`` of the configured cost
+(``BARTER_PASSWORD_SCRYPT_*``). The same ``--logins`` are run, from
+``--concurrency`` tasks, in two ways:
+
+- ``inline``: verified on the event loop, as a naive endpoint would;
+- ``pool``: verified through ``PasswordHasher`` with ``--workers`` processes
+  (repeatable; default one per CPU), as POST /auth/login does.
+
+For each, the report gives logins/sec, logins/sec per core used, and how late
+a 1 ms ticker on the event loop ran meanwhile (p99 and max), which is the
+delay every other request would have seen. Worker start-up is excluded.
+
+Usage:
+    python -m benchmarks.password_hashing
+    python -m benchmarks.password_hashing --logins 200 --workers 1 --workers 2 --scrypt-n 32768
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import Awaitable, Callable
+
+from src.core.passwords import hash_password, verify_password
+from src.infrastructure.config import PASSWORD_SCRYPT_N, PASSWORD_SCRYPT_P, PASSWORD_SCRYPT_R
+from src.infrastructure.passwords import PasswordHasher
+
+PASSWORD = "correct horse battery staple"
+TICK_SECONDS = 0.001
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    return sorted(samples)[min(int(len(samples) * fraction), len(samples) - 1)]
+
+
+async def measure(name: str, login: Callable[[], Awaitable[bool]], logins: int, concurrency: int, cores: int):
+    lags = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(TICK_SECONDS)
+            lags.append(time.perf_counter() - started - TICK_SECONDS)
+
+    remaining = iter(range(logins))
+
+    async def worker():
+        for _ in remaining:
+            if not await login():
+                raise AssertionError("Password did not verify")
+
+    ticking = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await ticking
+    lags = lags or [elapsed]
+    print(f"  {name:<16} {logins / elapsed:8.1f} logins/s  {logins / elapsed / cores:7.1f} per core"
+          f"  loop lag p99 {percentile(lags, 0.99) * 1000:8.1f} ms  max {max(lags) * 1000:8.1f} ms")
+
+
+async def run(args: argparse.Namespace):
+    hashed_password = hash_password(PASSWORD, args.scrypt_n, args.scrypt_r, args.scrypt_p)
+
+    async def inline() -> bool:
+        return verify_password(PASSWORD, hashed_password)
+
+    await measure("inline", inline, args.logins, args.concurrency, 1)
+
+    for workers in args.workers or [os.cpu_count() or 1]:
+        hasher = PasswordHasher(workers=workers, n=args.scrypt_n, r=args.scrypt_r, p=args.scrypt_p)
+        try:
+            # Start every worker before measuring.
+            await asyncio.gather(*(hasher.verify(PASSWORD, hashed_password) for _ in range(workers)))
+            await measure(f"pool ({workers} proc)", lambda: hasher.verify(PASSWORD, hashed_password),
+                          args.logins, args.concurrency, min(workers, os.cpu_count() or 1))
+        finally:
+            hasher.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--workers", type=int, action="append", help="pool size, repeatable (default: CPU count)")
+    parser.add_argument("--scrypt-n", type=int, default=PASSWORD_SCRYPT_N)
+    parser.add_argument("--scrypt-r", type=int, default=PASSWORD_SCRYPT_R)
+    parser.add_argument("--scrypt-p", type=int, default=PASSWORD_SCRYPT_P)
+    args = parser.parse_args()
+
+    print(f"scrypt n={args.scrypt_n} r={args.scrypt_r} p={args.scrypt_p}, {os.cpu_count()} CPUs")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+# benchmarks/response_serialization.py
+"""
+Measures the serialization CPU saved on ``GET /products/owner/{owner_id}``.
+
+One owner has ``--items`` products (1,000 by default) and each timed listing
+fetches all of them, following ``X-Next-Cursor`` through pages of
+``MAX_PAGE_SIZE``. Three variants of the endpoint are timed on the same
+zero-latency in-process collection, so what differs between them is only how
+the page becomes JSON:
+
+- ``response_model``: the previous endpoint. The repository builds a
+  ProductRecord per document, then FastAPI validates the list against
+  ``List[Product]`` and serializes it.
+- ``entities``: the repository builds the records, which are written by
+  orjson through ``EntityResponse`` without validating them.
+- ``documents``: the current route. The decoded documents are written by
+  orjson directly, no Product is built.
+
+CPU time per listing is measured with ``time.process_time`` and includes the
+in-process HTTP client, which is the same for every variant and does not
+parse the bodies. The steps are
+also timed in isolation, without HTTP.
+
+Usage:
+    python -m benchmarks.response_serialization
+    python -m benchmarks.response_serialization --items 1000 --requests 200
+"""
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import List, Optional
+from uuid import UUID, uuid4
+
+import httpx
+from fastapi import FastAPI, Response
+from pydantic import TypeAdapter
+
+from benchmarks.fakes import AsyncLatencyCollection
+from src.core.entities.product import Product
+from src.core.pagination import MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, decode_cursor, next_cursor
+from src.features.products.routes import products_router
+from src.infrastructure.container import repositories
+from src.infrastructure.mappers import PRODUCT_DOCUMENT_PROJECTION, product_mapper
+from src.infrastructure.repositories.motor_product_repository import MotorProductRepository
+from src.infrastructure.responses import EntityResponse, json_bytes
+
+
+def seed(count: int) -> tuple[UUID, dict]:
+    owner_id = uuid4()
+    documents = {}
+    for index in range(count):
+        product = Product(id=uuid4(), owner_id=owner_id, title=f"Product {index}",
+                          description="A well kept item, available for trade " * 3,
+                          image_url=f"https://images.example.com/{index}.jpg", interests=["books", "music", "vinyl"])
+        documents[product.id] = product_mapper.to_document(product)
+    return owner_id, documents
+
+
+def build_apps(repository: MotorProductRepository) -> dict[str, FastAPI]:
+    response_model_app = FastAPI()
+
+    @response_model_app.get("/products/owner/{owner_id}", response_model=List[Product])
+    async def validated(owner_id: UUID, response: Response, limit: int, cursor: Optional[str] = None):
+        products = await repository.get_products_by_owner_id(owner_id, decode_cursor(cursor), limit)
+        cursor = next_cursor(products, limit)
+        if cursor:
+            response.headers[NEXT_CURSOR_HEADER] = cursor
+        return products
+
+    entities_app = FastAPI()
+
+    @entities_app.get("/products/owner/{owner_id}", response_model=List[Product])
+    async def entities(owner_id: UUID, limit: int, cursor: Optional[str] = None):
+        products = await repository.get_products_by_owner_id(owner_id, decode_cursor(cursor), limit)
+        cursor = next_cursor(products, limit)
+        return EntityResponse(products, headers={NEXT_CURSOR_HEADER: cursor} if cursor else None)
+
+    documents_app = FastAPI()
+    documents_app.include_router(products_router, prefix="/products")
+    return {"response_model": response_model_app, "entities": entities_app, "documents": documents_app}
+
+
+async def fetch_listing(http: httpx.AsyncClient, path: str, count_items: bool = False) -> int:
+    params = {"limit": MAX_PAGE_SIZE}
+    received = 0
+    while True:
+        response = await http.get(path, params=params)
+        response.raise_for_status()
+        if count_items:
+            received += len(response.json())
+        if NEXT_CURSOR_HEADER not in response.headers:
+            return received
+        params["cursor"] = response.headers[NEXT_CURSOR_HEADER]
+
+
+async def cpu_per_listing(app: FastAPI, path: str, count: int, items: int) -> float:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as http:
+        assert await fetch_listing(http, path, count_items=True) == items
+        started = time.process_time()
+        for _ in range(count):
+            await fetch_listing(http, path)
+        return (time.process_time() - started) / count
+
+
+def cpu_per_call(function, count: int) -> float:
+    function()
+    started = time.process_time()
+    for _ in range(count):
+        function()
+    return (time.process_time() - started) / count
+
+
+def isolated(documents: list[dict], count: int) -> dict[str, float]:
+    adapter = TypeAdapter(List[Product])
+    entities = [product_mapper.from_document(document) for document in documents]
+    return {
+        "build ProductRecords from documents": cpu_per_call(
+            lambda: [product_mapper.from_document(document) for document in documents], count),
+        "response_model validate + serialize": cpu_per_call(
+            lambda: adapter.dump_json(adapter.validate_python(entities, from_attributes=True)), count),
+        "orjson from ProductRecords": cpu_per_call(lambda: json_bytes(entities), count),
+        "orjson from documents": cpu_per_call(lambda: json_bytes(documents), count),
+    }
+
+
+async def run(args):
+    owner_id, documents = seed(args.items)
+    collection = AsyncLatencyCollection(documents, latency=0.0)
+    repository = MotorProductRepository(collection)
+    repositories.bind(SimpleNamespace(products=repository))
+    path = f"/products/owner/{owner_id}"
+
+    apps = build_apps(repository)
+    cpu = {name: 0.0 for name in apps}
+    per_round = max(args.requests // args.rounds, 1)
+    for _ in range(args.rounds):
+        for name, app in apps.items():
+            cpu[name] += await cpu_per_listing(app, path, per_round, args.items) / args.rounds
+
+    pages = -(-args.items // MAX_PAGE_SIZE)
+    print(f"GET /products/owner/{{owner_id}}, {args.items} items in {pages} pages, CPU per listing:")
+    for name, seconds in cpu.items():
+        saved = cpu["response_model"] - seconds
+        print(f"{name:>16}: {seconds * 1e3:7.2f}ms  saved {saved * 1e3:6.2f}ms "
+              f"({saved / cpu['response_model'] * 100:4.1f}%)")
+
+    page = [dict((field, document[field]) for field in PRODUCT_DOCUMENT_PROJECTION if field in document)
+            for document in documents.values()]
+    print(f"steps in isolation, CPU per page of {args.items}:")
+    for name, seconds in isolated(page, max(args.requests // 4, 1)).items():
+        print(f"{name:>36}: {seconds * 1e3:7.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1000, help="products of the owner, all fetched per listing")
+    parser.add_argument("--requests", type=int, default=200, help="timed listings per variant")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
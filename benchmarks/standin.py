@@ -0,0 +1,101 @@
+# benchmarks/standin.py
+"""
+An in-memory MongoDB stand-in for running the real application in-process.
+
+``standin_database`` returns a mongomock-motor database that the repositories
+use unchanged, and ``use_standin`` makes ``mongo.connect`` return it, so the
+application lifespan runs as it does against a server: indexes, warm-up and
+the background tasks included.
+
+mongomock lags behind pymongo in three places the repositories depend on, so
+they are adjusted when the module is imported:
+
+- documents are checked by encoding them with mongomock's default codec
+  options, which refuse UUIDs; they are encoded with ``CODEC_OPTIONS`` instead.
+- ``bulk_write`` hands pymongo 4.9+ operations to a builder that predates their
+  ``sort`` argument; the updates are applied one by one.
+- ``find_one_and_update`` with ``ReturnDocument.AFTER`` reads the document
+  back with the original filter unless the projection keeps ``_id``, so a
+  write that changes a field its filter checks (a status transition, a
+  version condition) returns None although it was applied; the matching
+  document is located by ``_id`` first.
+
+mongomock has no ``$text`` index, so the product search must use the
+``memory`` backend (``BARTER_SEARCH_BACKEND=memory``).
+"""
+
+import bson
+import mongomock.collection
+from mongomock_motor import AsyncMongoMockClient
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument, UpdateMany, UpdateOne
+from pymongo.results import BulkWriteResult
+
+from src.infrastructure.database import mongo
+from src.infrastructure.mappers import CODEC_OPTIONS
+
+
+class _BSON:
+    @staticmethod
+    def encode(document, check_keys=False):
+        return bson.encode(document, check_keys, CODEC_OPTIONS)
+
+
+def _bulk_write(self, requests, ordered=True, **kwargs):
+    matched = modified = 0
+    upserted = {}
+    for index, request in enumerate(requests):
+        if isinstance(request, UpdateOne):
+            result = self.update_one(request._filter, request._doc, upsert=bool(request._upsert))
+        elif isinstance(request, UpdateMany):
+            result = self.update_many(request._filter, request._doc, upsert=bool(request._upsert))
+        else:
+            raise NotImplementedError(f"bulk_write does not support {type(request).__name__} on the stand-in")
+        matched += result.matched_count
+        modified += result.modified_count
+        if result.upserted_id is not None:
+            upserted[index] = result.upserted_id
+    return BulkWriteResult({"nInserted": 0, "nMatched": matched, "nModified": modified,
+                            "nUpserted": len(upserted), "nRemoved": 0,
+                            "upserted": [{"index": index, "_id": _id} for index, _id in upserted.items()]}, True)
+
+
+_find_one_and_update = mongomock.collection.Collection.find_one_and_update
+
+
+def _find_one_and_update_by_id(self, filter, update, projection=None, sort=None, upsert=False,
+                               return_document=ReturnDocument.BEFORE, **kwargs):
+    match = self.find_one(filter, {"_id": True}, sort=sort)
+    if match is None:
+        return _find_one_and_update(self, filter, update, projection, sort, upsert, return_document, **kwargs)
+    return _find_one_and_update(self, {"_id": match["_id"]}, update, projection, None, False, return_document,
+                                **kwargs)
+
+
+mongomock.collection.BSON = _BSON
+mongomock.collection.Collection.bulk_write = _bulk_write
+mongomock.collection.Collection.find_one_and_update = _find_one_and_update_by_id
+
+
+def standin_database(name: str = "barter_app") -> AsyncIOMotorDatabase:
+    """
+    Creates an empty in-memory database with the client options of ``client_options``.
+
+    Args:
+        name (str): The database name.
+
+    Returns:
+        AsyncIOMotorDatabase: The database, which the Motor repositories accept as is.
+    """
+    return AsyncMongoMockClient(uuidRepresentation="standard", tz_aware=True)[name]
+
+
+def use_standin(database: AsyncIOMotorDatabase):
+    """
+    Makes ``mongo.connect`` return the stand-in, and ``mongo.close`` leave it intact.
+
+    Args:
+        database (AsyncIOMotorDatabase): The stand-in database.
+    """
+    mongo.connect = lambda *args, **kwargs: database
+    mongo.close = lambda: None
@@ -0,0 +1,177 @@
+# benchmarks/storage_backends.py
+"""
+Runs the same repository workload on the MongoDB and the SQLite backends.
+
+Each backend gets fresh repositories (without the read-through caches, so
+every call reaches storage) and goes through the same phases, each run by
+``--concurrency`` tasks:
+
+- register ``--users`` users, then create ``--products`` products per user;
+- read random products by ID and list random owners' products;
+- create one offer per product, read random inboxes, and accept a share of
+  the offers, which also rejects the competing ones.
+
+Reports operations/sec and p50/p95 latency per phase. The stand-in evaluates
+queries in Python (the inbox $lookup especially), so compare SQLite against
+a real mongod before drawing conclusions.
+
+MongoDB runs on the in-process stand-in from ``benchmarks/standin.py`` unless
+``--mongo-uri`` points at a real mongod (the ``barter_app_bench`` database is
+dropped first). SQLite runs on a temporary file in WAL mode with the pool
+settings from ``BARTER_SQLITE_*``.
+
+Usage:
+    python -m benchmarks.storage_backends
+    python -m benchmarks.storage_backends --backend sqlite --users 2000 --reads 20000
+    python -m benchmarks.storage_backends --mongo-uri mongodb://localhost:27017/
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from typing import Awaitable, Callable
+
+from src.core.entities.offer import OFFER_STATUS_ACCEPTED, Offer
+from src.core.entities.product import Product
+from src.core.entities.user import User
+from src.infrastructure.indexes import ensure_indexes
+from src.infrastructure.repositories.motor_offer_repository import MotorOfferRepository
+from src.infrastructure.repositories.motor_product_repository import MotorProductRepository
+from src.infrastructure.repositories.motor_user_repository import MotorUserRepository
+from src.infrastructure.repositories.sqlite_offer_repository import SQLiteOfferRepository
+from src.infrastructure.repositories.sqlite_product_repository import SQLiteProductRepository
+from src.infrastructure.repositories.sqlite_user_repository import SQLiteUserRepository
+from src.infrastructure.sqlite_database import SQLiteDatabase, ensure_schema
+
+INTERESTS = ["books", "music", "bikes", "games", "tools", "plants", "art", "camping"]
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    return sorted(samples)[min(int(len(samples) * fraction), len(samples) - 1)]
+
+
+async def phase(name: str, calls: list[Callable[[], Awaitable]], concurrency: int) -> list:
+    """Runs the calls on ``concurrency`` tasks, prints the throughput and latency, and returns their results."""
+    latencies = [0.0] * len(calls)
+    results = [None] * len(calls)
+    next_call = iter(range(len(calls)))
+
+    async def worker():
+        for index in next_call:
+            started = time.perf_counter()
+            results[index] = await calls[index]()
+            latencies[index] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    print(f"  {name:<22} {len(calls):>7} ops {len(calls) / elapsed:>10.0f} ops/s"
+          f"  p50 {percentile(latencies, 0.5) * 1000:7.2f} ms  p95 {percentile(latencies, 0.95) * 1000:7.2f} ms")
+    return results
+
+
+async def accept(offers, offer: Offer):
+    try:
+        return await offers.update_offer_status(offer.id, OFFER_STATUS_ACCEPTED)
+    except ValueError:
+        return None  # Already rejected by the acceptance of a competing offer
+
+
+async def workload(users, products, offers, args: argparse.Namespace):
+    rng = random.Random(args.seed)
+    concurrency = args.concurrency
+
+    created_users = await phase("create user", [
+        lambda index=index: users.create_user(User(username=f"user{index}", email=f"user{index}@example.com",
+                                                   hashed_password="x", interests=rng.sample(INTERESTS, 2)))
+        for index in range(args.users)], concurrency)
+    created_products = await phase("create product", [
+        lambda user=user, index=index: products.create_product(Product(
+            owner_id=user.id, title=f"Product {index}", description="Benchmark product",
+            interests=rng.sample(INTERESTS, 2)))
+        for user in created_users for index in range(args.products)], concurrency)
+
+    await phase("get product by id", [
+        lambda product=rng.choice(created_products): products.get_product_by_id(product.id)
+        for _ in range(args.reads)], concurrency)
+    await phase("list owner products", [
+        lambda user=rng.choice(created_users): products.get_products_by_owner_id(user.id, limit=50)
+        for _ in range(args.reads)], concurrency)
+
+    created_offers = []
+    for product in created_products:
+        offered = rng.choice(created_products)
+        if offered.owner_id != product.owner_id:
+            created_offers.append((product, offered))
+    created_offers = await phase("create offer", [
+        lambda product=product, offered=offered: offers.create_offer(Offer(
+            product_id=product.id, from_user_id=offered.owner_id, to_user_id=product.owner_id,
+            offered_product_id=offered.id))
+        for product, offered in created_offers], concurrency)
+    await phase("inbox page", [
+        lambda user=rng.choice(created_users): offers.get_offer_page("to_user_id", user.id, limit=20)
+        for _ in range(args.reads)], concurrency)
+    await phase("accept offer", [
+        lambda offer=offer: accept(offers, offer)
+        for offer in rng.sample(created_offers, len(created_offers) // 10)], concurrency)
+
+
+async def run_mongo(args: argparse.Namespace):
+    if args.mongo_uri:
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        from src.infrastructure.mappers import CODEC_OPTIONS
+
+        client = AsyncIOMotorClient(args.mongo_uri, uuidRepresentation="standard", tz_aware=True)
+        await client.drop_database("barter_app_bench")
+        database = client.get_database("barter_app_bench", codec_options=CODEC_OPTIONS)
+        print(f"mongo ({args.mongo_uri})")
+    else:
+        from benchmarks.standin import standin_database
+
+        database = standin_database("barter_app_bench")
+        print("mongo (in-process stand-in)")
+    await ensure_indexes(database)
+    await workload(MotorUserRepository(database["users"]), MotorProductRepository(database["products"]),
+                   MotorOfferRepository(database["offers"]), args)
+
+
+async def run_sqlite(args: argparse.Namespace):
+    with tempfile.TemporaryDirectory() as directory:
+        database = SQLiteDatabase(os.path.join(directory, "barter_app_bench.db"))
+        print(f"sqlite (WAL, {database.pool_size} connections)")
+        try:
+            await ensure_schema(database)
+            await workload(SQLiteUserRepository(database), SQLiteProductRepository(database),
+                           SQLiteOfferRepository(database), args)
+        finally:
+            database.close()
+
+
+BACKENDS = {
+    "mongo": run_mongo,
+    "sqlite": run_sqlite,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", action="append", choices=sorted(BACKENDS),
+                        help="backend to run, repeatable (default: all)")
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--products", type=int, default=4, help="products per user")
+    parser.add_argument("--reads", type=int, default=5000, help="calls per read phase")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--mongo-uri", default=None, help="benchmark against a real mongod instead of the stand-in")
+    args = parser.parse_args()
+
+    for backend in args.backend or sorted(BACKENDS):
+        asyncio.run(BACKENDS[backend](args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# benchmarks/trade_cycles.py
+"""
+Measures the trade-cycle engine (``src.core.trade_graph``) on a synthetic wants graph.
+
+A random graph with ``--edges`` wants between ``--users`` users is built once;
+then ``--events`` new wants are added one at a time, each followed by the
+cycle search the trade service runs, and as many wants are removed. The
+report compares the per-event cost with rebuilding the graph from scratch,
+which is what a non-incremental engine would pay on every offer.
+
+Users and products are ints here to keep a million-edge graph small; the
+service uses UUIDs, which only changes the constant factor of hashing.
+
+Usage:
+    python -m benchmarks.trade_cycles
+    python -m benchmarks.trade_cycles --users 200000 --edges 1000000 --max-length 6
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from src.core.trade_graph import TradeGraph
+
+
+def random_wants(users: int, edges: int, rng: random.Random) -> list[tuple[int, int, int]]:
+    wants = []
+    for product in range(edges):
+        wanter, owner = rng.randrange(users), rng.randrange(users)
+        if wanter != owner:
+            wants.append((wanter, owner, product))
+    return wants
+
+
+def build(wants: list[tuple[int, int, int]]) -> tuple[TradeGraph, float]:
+    started = time.perf_counter()
+    graph = TradeGraph()
+    for wanter, owner, product in wants:
+        graph.add_want(wanter, owner, product)
+    return graph, time.perf_counter() - started
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    return sorted(samples)[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--min-length", type=int, default=3)
+    parser.add_argument("--max-length", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=10, help="cycles proposed per new want")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    wants = random_wants(args.users, args.edges, rng)
+    graph, build_seconds = build(wants)
+    print(f"graph: {args.users} users, {graph.edge_count} edges, built in {build_seconds:.2f}s "
+          f"({len(wants) / build_seconds:,.0f} wants/s)")
+
+    add_samples, cycles_found = [], 0
+    new_wants = []
+    for offset in range(args.events):
+        wanter, owner = rng.randrange(args.users), rng.randrange(args.users)
+        product = args.edges + offset
+        started = time.perf_counter()
+        if graph.add_want(wanter, owner, product):
+            cycles_found += sum(1 for _ in graph.cycles_through(wanter, owner, args.min_length, args.max_length,
+                                                                 limit=args.limit))
+        add_samples.append(time.perf_counter() - started)
+        new_wants.append((wanter, product))
+
+    remove_samples = []
+    for wanter, product in new_wants:
+        started = time.perf_counter()
+        graph.remove_want(wanter, product)
+        remove_samples.append(time.perf_counter() - started)
+
+    print(f"add want + cycle search: mean {statistics.mean(add_samples) * 1e6:,.0f}µs, "
+          f"p50 {percentile(add_samples, 0.5) * 1e6:,.0f}µs, p99 {percentile(add_samples, 0.99) * 1e6:,.0f}µs, "
+          f"{cycles_found} cycles of length {args.min_length}-{args.max_length} found")
+    print(f"remove want: mean {statistics.mean(remove_samples) * 1e6:,.2f}µs")
+    print(f"full rebuild per event would cost {build_seconds * 1e6:,.0f}µs "
+          f"({build_seconds / statistics.mean(add_samples):,.0f}x the incremental update)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,26 @@
 # main.py
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 import logging
 
+from src.features.auth.auth_service import load_revoked_tokens
+from src.features.feed.feed_service import register_feed_handlers
+from src.features.offers.offer_expiry import offer_expiry_sweeper
 from src.features.offers.routes import offers_router
+from src.features.products.matching_service import warm_interest_matcher
+from src.features.products.product_service import warm_search_index
+from src.features.trades.trade_service import warm_trade_graph
+from src.infrastructure.cache import offer_cache, product_cache, user_cache
+from src.infrastructure.config import METRICS_ENABLED, OFFER_EVENT_SOURCE, SEARCH_BACKEND, STORAGE_BACKEND, WORKERS
+from src.infrastructure.container import close_storage, connect_storage, repositories
+from src.infrastructure.database import mongo
+from src.infrastructure.events import event_bus
+from src.infrastructure.notifications import offer_event_source, offer_notifications
+from src.infrastructure.passwords import password_hasher
+from src.infrastructure.tokens import token_verifier
+from src.infrastructure.metrics import MetricsMiddleware, register_stats, render_metrics
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -12,24 +29,91 @@ try:
     from src.features.auth.routes import auth_router
     from src.features.profile.routes import profile_router
     from src.features.products.routes import products_router
-    # from src.features.messages.routes import messages_router
+    from src.features.trades.routes import trades_router
+    from src.features.feed.routes import feed_router
+    from src.features.messages.routes import messages_router
 except ImportError as e:
     logger.error(f"Error importing routers: {e}")
     raise e
 
-app = FastAPI()
+
+def check_workers():
+    """
+    Refuses to start several worker processes on per-process backends: the
+    in-memory search index and in-process offer notifications would only see
+    the writes made through their own worker. With the MongoDB text index and
+    change streams configured, several workers start, with a warning that the
+    interest matcher and the trade graph still follow their own worker's writes.
+
+    Raises:
+        RuntimeError: If several workers are configured with a per-process search index or offer event source.
+    """
+    if WORKERS <= 1:
+        return
+    per_process = []
+    if SEARCH_BACKEND == "memory":
+        per_process.append("the search index (set BARTER_SEARCH_BACKEND=mongo)")
+    if OFFER_EVENT_SOURCE == "memory":
+        per_process.append("offer notifications (set BARTER_OFFER_EVENT_SOURCE=change_stream)")
+    if per_process:
+        raise RuntimeError(f"{WORKERS} workers configured, but {' and '.join(per_process)} are kept per process; "
+                           f"run a single worker or configure the shared backends")
+    logger.warning(f"{WORKERS} workers configured; the interest matcher and the trade graph are kept per process "
+                   f"and only follow the writes made through their own worker")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    check_workers()
+    repositories.bind(await connect_storage())
+    await token_verifier.start(load_revoked_tokens)
+    await warm_search_index()
+    await warm_trade_graph()
+    await warm_interest_matcher()
+    register_feed_handlers(event_bus)
+    await offer_notifications.start(
+        offer_event_source(mongo.connect()["offers"] if STORAGE_BACKEND == "mongo" else None))
+    event_bus.start()
+    offer_expiry_sweeper.start()
+    yield
+    await offer_expiry_sweeper.stop()
+    await offer_notifications.stop()
+    await event_bus.stop()
+    await token_verifier.stop()
+    password_hasher.close()
+    repositories.unbind()
+    close_storage()
+
+
+app = FastAPI(lifespan=lifespan)
+
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    register_stats("barter_offer_sweep", {"": lambda: offer_expiry_sweeper.stats},
+                   description="Pending offer expiry sweeps (see src/features/offers/offer_expiry.py).")
+    register_stats("barter_cache", {"product": lambda: product_cache.stats, "offer": lambda: offer_cache.stats,
+                                    "user": lambda: user_cache.stats, "token": lambda: token_verifier.cache.stats},
+                   label="cache", description="Read-through repository caches and verified access tokens.")
 
 try:
     app.include_router(auth_router, prefix="/auth")
     app.include_router(profile_router, prefix="/profile")
     app.include_router(products_router, prefix="/products")
     app.include_router(offers_router, prefix="/offers")
-    # app.include_router(messages_router, prefix="/messages")
+    app.include_router(trades_router, prefix="/trades")
+    app.include_router(feed_router, prefix="/feed")
+    app.include_router(messages_router, prefix="/messages")
 except Exception as e:
     logger.error(f"Error including routers: {e}")
     raise e
 
 
 @app.get("/")
-def read_root():
+async def read_root():
     return {"message": "Welcome to the Barter App!"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    body, content_type = render_metrics()
+    return Response(body, media_type=content_type)
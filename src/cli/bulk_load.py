@@ -0,0 +1,88 @@
+# src/cli/bulk_load.py
+"""
+Streams an NDJSON file of products or offers into the bulk ingestion pipeline.
+
+The file is read one chunk of lines at a time, so memory stays bounded by
+``--chunk-size`` no matter how large the catalog is. Each chunk goes through
+the same validation and unordered insert_many path as ``POST /products/bulk``
+and ``POST /offers/bulk``.
+
+Usage:
+    python -m src.cli.bulk_load products catalog.ndjson
+    python -m src.cli.bulk_load offers offers.ndjson --chunk-size 5000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+from src.core.bulk import chunked
+from src.features.offers.offer_service import ingest_offers
+from src.features.products.product_service import ingest_products
+from src.infrastructure.config import BULK_CHUNK_SIZE
+from src.infrastructure.container import close_storage, connect_storage, repositories
+
+logger = logging.getLogger(__name__)
+
+INGESTERS = {
+    "products": ingest_products,
+    "offers": ingest_offers,
+}
+
+
+async def load(kind: str, path: str, chunk_size: int) -> tuple[int, int]:
+    """
+    Loads every line of an NDJSON file.
+
+    Args:
+        kind (str): Either "products" or "offers".
+        path (str): Path to the NDJSON file.
+        chunk_size (int): Number of lines validated and written together.
+
+    Returns:
+        tuple[int, int]: The number of inserted and failed documents.
+    """
+    ingest = INGESTERS[kind]
+    repositories.bind(await connect_storage())
+    inserted = failed = 0
+    with open(path, "r", encoding="utf-8") as lines:
+        numbered_lines = ((number, line) for number, line in enumerate(lines, start=1) if line.strip())
+        for chunk in chunked(numbered_lines, chunk_size):
+            items = []
+            line_numbers = []
+            for number, line in chunk:
+                try:
+                    items.append(json.loads(line))
+                    line_numbers.append(number)
+                except json.JSONDecodeError as e:
+                    failed += 1
+                    logger.warning(f"line {number}: {e}")
+            for result in await ingest(items, chunk_size):
+                if result.error is None:
+                    inserted += 1
+                else:
+                    failed += 1
+                    logger.warning(f"line {line_numbers[result.index]}: {result.error}")
+            logger.info(f"{inserted} inserted, {failed} failed")
+    close_storage()
+    return inserted, failed
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Bulk load products or offers from an NDJSON file.")
+    parser.add_argument("kind", choices=sorted(INGESTERS))
+    parser.add_argument("path")
+    parser.add_argument("--chunk-size", type=int, default=BULK_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    inserted, failed = asyncio.run(load(args.kind, args.path, args.chunk_size))
+    elapsed = time.perf_counter() - started
+    print(f"{inserted} inserted, {failed} failed in {elapsed:.1f}s ({(inserted + failed) / elapsed:.0f} docs/s)")
+
+
+if __name__ == "__main__":
+    main()
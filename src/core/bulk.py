@@ -0,0 +1,73 @@
+# src/core/bulk.py
+
+from itertools import islice
+from typing import Iterable, Iterator, Optional, Type
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    id: Optional[UUID] = None
+    error: Optional[str] = None
+
+
+class BulkResult(BaseModel):
+    inserted: int
+    failed: int
+    results: list[BulkItemResult]
+
+    model_config = ConfigDict(json_encoders={UUID: lambda v: str(v)})
+
+
+def chunked(items: Iterable, size: int) -> Iterator[list]:
+    """
+    Splits an iterable into lists of at most ``size`` items without materializing it.
+
+    Args:
+        items (Iterable): The items to split.
+        size (int): The chunk size.
+
+    Yields:
+        list: The next chunk.
+    """
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def validate_items(items: list[dict], model: Type[BaseModel]) -> tuple[list[tuple[int, BaseModel]],
+                                                                      list[BulkItemResult]]:
+    """
+    Validates raw items against a request model, keeping the failures per item.
+
+    Args:
+        items (list[dict]): The raw items from the request body.
+        model (Type[BaseModel]): The request model each item must satisfy.
+
+    Returns:
+        tuple: The valid items with their original index, and one result per invalid item.
+    """
+    valid = []
+    failures = []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, model(**item)))
+        except (ValidationError, TypeError) as e:
+            failures.append(BulkItemResult(index=index, error=str(e)))
+    return valid, failures
+
+
+def bulk_result(results: list[BulkItemResult]) -> BulkResult:
+    """
+    Summarizes per-item results into the bulk endpoint response.
+
+    Args:
+        results (list[BulkItemResult]): One result per submitted item.
+
+    Returns:
+        BulkResult: The counts together with the per-item results.
+    """
+    inserted = sum(1 for result in results if result.error is None)
+    return BulkResult(inserted=inserted, failed=len(results) - inserted, results=results)
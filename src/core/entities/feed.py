@@ -0,0 +1,22 @@
+# src/core/entities/feed.py
+
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+from uuid import UUID
+
+
+class FeedItem(BaseModel):
+    """A recommended product as stored in a user's feed, denormalized so a page renders without joins."""
+    product_id: UUID
+    owner_id: UUID
+    title: str
+    image_url: Optional[str] = None
+    interests: Optional[list[str]] = []
+    score: int  # Number of the user's interests the product carries
+    added_at: datetime
+
+    class Config:
+        json_encoders = {
+            UUID: lambda v: str(v)
+        }
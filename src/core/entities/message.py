@@ -0,0 +1,34 @@
+# src/core/entities/message.py
+
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+from uuid import UUID
+
+
+class Message(BaseModel):
+    id: Optional[UUID] = None
+    conversation_id: UUID
+    sender_id: UUID
+    body: str
+    offer_id: Optional[UUID] = None  # Offer the message refers to, if any
+    sent_at: Optional[datetime] = None
+
+    class Config:
+        json_encoders = {
+            UUID: lambda v: str(v)
+        }
+
+
+class Conversation(BaseModel):
+    id: Optional[UUID] = None
+    participants: list[UUID]
+    offer_id: Optional[UUID] = None  # Offer being negotiated, if the conversation started from one
+    last_message_at: Optional[datetime] = None
+    last_message_preview: Optional[str] = None
+    unread: dict[str, int] = {}  # Unread message count per participant ID
+
+    class Config:
+        json_encoders = {
+            UUID: lambda v: str(v)
+        }
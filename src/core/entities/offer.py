@@ -1,16 +1,88 @@
 # src/core/entities/offer.py
 
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel
 from uuid import UUID
 
+from src.core.entities.product import ProductSummary
+
+OFFER_STATUS_PENDING = "pending"
+OFFER_STATUS_ACCEPTED = "accepted"
+OFFER_STATUS_REJECTED = "rejected"
+OFFER_STATUS_EXPIRED = "expired"
+
+# Allowed status changes; accepted, rejected and expired offers are final.
+OFFER_TRANSITIONS = {
+    OFFER_STATUS_PENDING: (OFFER_STATUS_ACCEPTED, OFFER_STATUS_REJECTED, OFFER_STATUS_EXPIRED),
+}
+
+# Set by the repository rather than by clients, and kept when an offer is replaced.
+OFFER_TIMESTAMP_FIELDS = ("created_at", "expires_at", "closed_at")
+
+
+class ProductOwnershipError(ValueError):
+    """Raised when an offer's products are not owned by the users it is between."""
+
+
+def statuses_allowed_before(status: str) -> list[str]:
+    """Returns the statuses from which an offer may move to ``status``."""
+    return [source for source, targets in OFFER_TRANSITIONS.items() if status in targets]
+
+
+class OfferCreate(BaseModel):
+    """What a client may set on an offer it creates; the status, version and timestamps are set by the server."""
+    id: Optional[UUID] = None  # Kept when bulk loading offers exported from another deployment
+    product_id: UUID
+    from_user_id: UUID
+    to_user_id: UUID
+    offered_product_id: UUID
+
+
 class Offer(BaseModel):
     id: Optional[UUID] = None
     product_id: UUID
     from_user_id: UUID
     to_user_id: UUID
     offered_product_id: UUID  # Product being offered in the trade
-    status: Optional[str] = "pending"  # Possible statuses: pending, accepted, rejected
+    status: Optional[str] = "pending"  # Possible statuses: pending, accepted, rejected, expired
+    created_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None  # A pending offer expires at this time
+    closed_at: Optional[datetime] = None  # When the offer left pending; drives the retention TTL
+    version: int = 0  # Incremented by the repository on every write; sent as the ETag
+
+    class Config:
+        json_encoders = {
+            UUID: lambda v: str(v)
+        }
+
+
+@dataclass(slots=True, kw_only=True)
+class OfferRecord:
+    """A stored offer as the repositories and caches hold it: the fields of Offer in a slotted dataclass."""
+    id: Optional[UUID] = None
+    product_id: UUID
+    from_user_id: UUID
+    to_user_id: UUID
+    offered_product_id: UUID
+    status: Optional[str] = OFFER_STATUS_PENDING
+    created_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+    closed_at: Optional[datetime] = None
+    version: int = 0
+
+
+class OfferView(Offer):
+    """An offer with summaries of both products of the trade, as listed in inboxes and outboxes."""
+    product: Optional[ProductSummary] = None  # None if the product was deleted
+    offered_product: Optional[ProductSummary] = None
+
+
+class OfferPage(BaseModel):
+    """One page of an inbox or outbox, with the user's offer counts per status for badges."""
+    items: list[OfferView]
+    counts: dict[str, int]
 
     class Config:
         json_encoders = {
@@ -1,9 +1,11 @@
 # src/core/entities/product.py
 
+from dataclasses import dataclass, field
 from typing import Optional
 from pydantic import BaseModel
 from uuid import UUID
 
+
 class Product(BaseModel):
     id: Optional[UUID] = None
     owner_id: UUID
@@ -11,8 +13,40 @@ class Product(BaseModel):
     description: str
     image_url: Optional[str] = None
     interests: Optional[list[str]] = []
+    version: int = 0  # Incremented by the repository on every write; sent as the ETag
 
     class Config:
         json_encoders = {
             UUID: lambda v: str(v)
         }
+
+
+class ProductSummary(BaseModel):
+    """Listing view of a product, without the full description."""
+    id: UUID
+    owner_id: UUID
+    title: str
+    image_url: Optional[str] = None
+    interests: Optional[list[str]] = []
+    score: Optional[float] = None  # Relevance, only set on search results
+
+    class Config:
+        json_encoders = {
+            UUID: lambda v: str(v)
+        }
+
+
+@dataclass(slots=True, kw_only=True)
+class ProductRecord:
+    """
+    A stored product as the repositories and caches hold it: the fields of
+    Product in a slotted dataclass, without pydantic's per-instance state.
+    Product stays the HTTP schema and validates request bodies.
+    """
+    id: Optional[UUID] = None
+    owner_id: UUID
+    title: str
+    description: str
+    image_url: Optional[str] = None
+    interests: Optional[list[str]] = field(default_factory=list)
+    version: int = 0
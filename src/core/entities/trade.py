@@ -0,0 +1,32 @@
+# src/core/entities/trade.py
+
+from typing import Optional
+from pydantic import BaseModel
+from uuid import UUID
+
+TRADE_STATUS_PROPOSED = "proposed"
+TRADE_STATUS_ACCEPTED = "accepted"
+TRADE_STATUS_REJECTED = "rejected"
+TRADE_STATUS_CANCELLED = "cancelled"  # A product of the cycle is no longer available
+
+
+class TradeLeg(BaseModel):
+    from_user_id: UUID  # Gives the product
+    to_user_id: UUID  # Receives the product
+    product_id: UUID
+
+
+class TradeCycle(BaseModel):
+    """A multi-party trade proposal: every participant gives one product and receives another."""
+    id: Optional[UUID] = None
+    key: str  # Participants in canonical rotation, identifies the cycle regardless of where it was found
+    legs: list[TradeLeg]
+    participants: list[UUID]
+    product_ids: list[UUID]
+    accepted_by: list[UUID] = []
+    status: Optional[str] = TRADE_STATUS_PROPOSED  # Possible statuses: proposed, accepted, rejected, cancelled
+
+    class Config:
+        json_encoders = {
+            UUID: lambda v: str(v)
+        }
@@ -1,5 +1,6 @@
 # src/core/entities/user.py
 
+from dataclasses import dataclass, field
 from typing import Optional
 from uuid import UUID
 
@@ -20,3 +21,23 @@ class User(BaseModel):
         json_encoders = {
             UUID: lambda v: str(v)
         }
+
+
+class UserProfile(BaseModel):
+    """A user as the API returns it: every field of User except the password hash."""
+    id: UUID
+    username: str
+    email: EmailStr
+    profile_picture: Optional[str] = None
+    interests: Optional[list[str]] = []
+
+
+@dataclass(slots=True, kw_only=True)
+class UserRecord:
+    """A stored user as the repositories and caches hold it: the fields of User in a slotted dataclass."""
+    id: Optional[UUID] = None
+    username: str
+    email: str
+    hashed_password: str
+    profile_picture: Optional[str] = None
+    interests: Optional[list[str]] = field(default_factory=list)
@@ -0,0 +1,233 @@
+# src/core/interest_matching.py
+"""
+Two-sided interest matching over packed bitsets.
+
+Every interest tag gets a dense integer the first time it is seen, and each
+product and user is stored as a column of uint64 words with one bit per tag:
+
+* product columns hold the product's tags,
+* "wants" columns hold a user's ``interests``,
+* "has" columns hold the union of the tags of the products a user owns.
+
+A product P of owner O is a mutual match for user U when U wants P (P & wants[U])
+and O wants something U owns (wants[O] & has[U]). The arrays are word-major,
+so word ``j`` of every product is one contiguous vector: a query ANDs the
+catalog only with the words in which the user has bits set, keeps the
+products hit on both sides, and popcounts those candidates to score them.
+"""
+
+from collections import Counter
+from typing import Hashable, Iterable, Optional
+
+import numpy as np
+
+WORD_BITS = 64
+
+if hasattr(np, "bitwise_count"):
+    _popcount = np.bitwise_count
+else:  # NumPy < 2.0
+    _BYTE_POPCOUNT = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
+    def _popcount(words: np.ndarray) -> np.ndarray:
+        counts = _BYTE_POPCOUNT[words.view(np.uint8)].reshape(words.shape + (8,))
+        return counts.sum(axis=-1, dtype=np.uint8)
+
+
+def normalize_tags(tags: Optional[Iterable[str]]) -> list[str]:
+    """
+    Lowercases interest tags and drops duplicates, keeping the first occurrence's order.
+
+    Tags match regardless of case. The matcher, the feed fan-out and the stored
+    user interests all go through this function, so they agree on what matches.
+
+    Args:
+        tags (Optional[Iterable[str]]): The tags as entered.
+
+    Returns:
+        list[str]: The normalized tags.
+    """
+    return list(dict.fromkeys(tag.lower() for tag in tags or ()))
+
+
+class _Rows:
+    """Growable word-major uint64 array (words x capacity) with one column per key."""
+
+    def __init__(self, words: int, capacity: int = 1024):
+        self.bits = np.zeros((words, capacity), dtype=np.uint64)
+        self.index: dict[Hashable, int] = {}
+        self.keys: list[Optional[Hashable]] = []
+        self.free: list[int] = []
+
+    def column(self, key: Hashable) -> int:
+        index = self.index.get(key)
+        if index is not None:
+            return index
+        if self.free:
+            index = self.free.pop()
+            self.keys[index] = key
+        else:
+            index = len(self.keys)
+            self.keys.append(key)
+            if index == self.bits.shape[1]:
+                self.bits = np.concatenate([self.bits, np.zeros_like(self.bits)], axis=1)
+        self.index[key] = index
+        return index
+
+    def release(self, key: Hashable) -> Optional[int]:
+        index = self.index.pop(key, None)
+        if index is not None:
+            self.bits[:, index] = 0
+            self.keys[index] = None
+            self.free.append(index)
+        return index
+
+    def widen(self, words: int):
+        extra = np.zeros((words - self.bits.shape[0], self.bits.shape[1]), dtype=np.uint64)
+        self.bits = np.concatenate([self.bits, extra])
+
+
+class InterestMatcher:
+    """In-process index answering "which products are mutual matches for this user"."""
+
+    def __init__(self, words: int = 1):
+        self.tags: dict[str, int] = {}
+        self.products = _Rows(words)
+        self.product_owner = np.full(self.products.bits.shape[1], -1, dtype=np.int64)
+        self.wants = _Rows(words)
+        self.has = np.zeros_like(self.wants.bits)
+        self._owned_tags: dict[Hashable, Counter] = {}
+        self._product_tags: dict[Hashable, tuple[Hashable, frozenset]] = {}
+
+    @property
+    def words(self) -> int:
+        return self.products.bits.shape[0]
+
+    def _tag_ids(self, tags: Iterable[str]) -> list[int]:
+        ids = [self.tags.setdefault(tag, len(self.tags)) for tag in normalize_tags(tags)]
+        needed = (len(self.tags) + WORD_BITS - 1) // WORD_BITS
+        if needed > self.words:
+            self.products.widen(needed)
+            self.wants.widen(needed)
+            self.has = np.concatenate([self.has, np.zeros((needed - self.has.shape[0], self.has.shape[1]),
+                                                          dtype=np.uint64)])
+        return ids
+
+    def _pack(self, tag_ids: Iterable[int]) -> np.ndarray:
+        column = np.zeros(self.words, dtype=np.uint64)
+        for tag_id in tag_ids:
+            column[tag_id // WORD_BITS] |= np.uint64(1 << (tag_id % WORD_BITS))
+        return column
+
+    def _user_column(self, user_id: Hashable) -> int:
+        index = self.wants.column(user_id)
+        missing = self.wants.bits.shape[1] - self.has.shape[1]
+        if missing:
+            self.has = np.concatenate([self.has, np.zeros((self.words, missing), dtype=np.uint64)], axis=1)
+        return index
+
+    def _refresh_has(self, owner_id: Hashable):
+        owned = self._owned_tags.get(owner_id, Counter())
+        self.has[:, self._user_column(owner_id)] = self._pack(tag_id for tag_id, count in owned.items() if count)
+
+    def set_user_interests(self, user_id: Hashable, interests: Iterable[str]):
+        """
+        Replaces the interests of a user.
+
+        Args:
+            user_id (Hashable): The user.
+            interests (Iterable[str]): The user's interest tags.
+        """
+        tag_ids = self._tag_ids(interests)
+        self.wants.bits[:, self._user_column(user_id)] = self._pack(tag_ids)
+
+    def set_product(self, product_id: Hashable, owner_id: Hashable, interests: Iterable[str]):
+        """
+        Adds or replaces a product.
+
+        Args:
+            product_id (Hashable): The product.
+            owner_id (Hashable): The owner of the product.
+            interests (Iterable[str]): The product's interest tags.
+        """
+        self.remove_product(product_id)
+        tag_ids = frozenset(self._tag_ids(interests))
+        index = self.products.column(product_id)
+        missing = self.products.bits.shape[1] - len(self.product_owner)
+        if missing:
+            self.product_owner = np.concatenate([self.product_owner, np.full(missing, -1, dtype=np.int64)])
+        self.products.bits[:, index] = self._pack(tag_ids)
+        self.product_owner[index] = self._user_column(owner_id)
+        self._product_tags[product_id] = (owner_id, tag_ids)
+        self._owned_tags.setdefault(owner_id, Counter()).update(tag_ids)
+        self._refresh_has(owner_id)
+
+    def remove_product(self, product_id: Hashable):
+        """
+        Removes a product. Unknown products are ignored.
+
+        Args:
+            product_id (Hashable): The product.
+        """
+        entry = self._product_tags.pop(product_id, None)
+        if entry is None:
+            return
+        owner_id, tag_ids = entry
+        index = self.products.release(product_id)
+        self.product_owner[index] = -1
+        self._owned_tags[owner_id].subtract(tag_ids)
+        self._refresh_has(owner_id)
+
+    def matches(self, user_id: Hashable, k: int = 20) -> list[tuple[Hashable, int]]:
+        """
+        Returns the top-k mutual matches for a user.
+
+        The score is the number of the user's interests the product carries plus
+        the number of the owner's interests the user's own products carry; both
+        must be non-zero. The user's own products are never returned.
+
+        Args:
+            user_id (Hashable): The user.
+            k (int): Maximum number of matches.
+
+        Returns:
+            list[tuple[Hashable, int]]: (product ID, score) pairs, best first.
+        """
+        user_index = self.wants.index.get(user_id)
+        if user_index is None:
+            return []
+        wants = self.wants.bits[:, user_index]
+        has = self.has[:, user_index]
+        want_words = np.flatnonzero(wants)
+        has_words = np.flatnonzero(has)
+        if not len(want_words) or not len(has_words):
+            return []
+
+        # Owners who want at least one tag of this user's products.
+        users = len(self.wants.keys)
+        interested_owners = np.zeros(users + 1, dtype=bool)  # Last slot stands for "no owner" (-1)
+        for word in has_words:
+            interested_owners[:users] |= (self.wants.bits[word, :users] & has[word]) != 0
+        interested_owners[user_index] = False
+
+        # Products carrying at least one tag this user wants, kept if their owner is interested back.
+        count = len(self.products.keys)
+        wanted = np.zeros(count, dtype=bool)
+        for word in want_words:
+            wanted |= (self.products.bits[word, :count] & wants[word]) != 0
+        candidates = np.flatnonzero(wanted)
+        owners = self.product_owner[candidates]
+        keep = interested_owners[owners]
+        candidates, owners = candidates[keep], owners[keep]
+        if not len(candidates):
+            return []
+
+        scores = np.zeros(len(candidates), dtype=np.int32)
+        for word in want_words:
+            scores += _popcount(self.products.bits[word, candidates] & wants[word])
+        for word in has_words:
+            scores += _popcount(self.wants.bits[word, owners] & has[word])
+        if len(candidates) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            candidates, scores = candidates[top], scores[top]
+        order = np.argsort(-scores, kind="stable")
+        return [(self.products.keys[candidates[index]], int(scores[index])) for index in order]
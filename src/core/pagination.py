@@ -0,0 +1,149 @@
+# src/core/pagination.py
+
+import base64
+import binascii
+import struct
+from typing import Optional
+from uuid import UUID
+
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(last_id: UUID) -> str:
+    """
+    Encodes the id of the last item of a page as an opaque cursor.
+
+    Args:
+        last_id (UUID): The id of the last item returned.
+
+    Returns:
+        str: A URL-safe cursor for the next page.
+    """
+    return base64.urlsafe_b64encode(last_id.bytes).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[UUID]:
+    """
+    Decodes a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor (Optional[str]): The cursor sent by the client.
+
+    Returns:
+        Optional[UUID]: The id to continue after, or None for the first page.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    if not cursor:
+        return None
+    try:
+        return UUID(bytes=base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError):
+        raise ValueError("Invalid cursor")
+
+
+def next_cursor(items: list, limit: int) -> Optional[str]:
+    """
+    Returns the cursor of the page after ``items``, or None if this was the last page.
+
+    Args:
+        items (list): The entities of the current page, ordered by id.
+        limit (int): The requested page size.
+
+    Returns:
+        Optional[str]: The next cursor.
+    """
+    if len(items) < limit:
+        return None
+    return encode_cursor(items[-1].id)
+
+
+def accepts_ndjson(accept: Optional[str]) -> bool:
+    """
+    Checks whether the client asked for a newline-delimited JSON stream.
+
+    Args:
+        accept (Optional[str]): The Accept header.
+
+    Returns:
+        bool: True if the response should be streamed as NDJSON.
+    """
+    return bool(accept) and NDJSON_MEDIA_TYPE in accept
+
+
+def encode_score_cursor(score: float, last_id: UUID) -> str:
+    """
+    Encodes the relevance score and id of the last item of a ranked page.
+
+    Args:
+        score (float): The score of the last item returned.
+        last_id (UUID): The id of the last item returned.
+
+    Returns:
+        str: A URL-safe cursor for the next page.
+    """
+    return base64.urlsafe_b64encode(struct.pack(">d", score) + last_id.bytes).rstrip(b"=").decode("ascii")
+
+
+def decode_score_cursor(cursor: Optional[str]) -> Optional[tuple[float, UUID]]:
+    """
+    Decodes a cursor produced by ``encode_score_cursor``.
+
+    Args:
+        cursor (Optional[str]): The cursor sent by the client.
+
+    Returns:
+        Optional[tuple[float, UUID]]: The score and id to continue after, or None for the first page.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        (score,) = struct.unpack(">d", raw[:8])
+        return score, UUID(bytes=raw[8:])
+    except (binascii.Error, struct.error, ValueError):
+        raise ValueError("Invalid cursor")
+
+
+def encode_offset_cursor(offset: int) -> str:
+    """
+    Encodes a position in a bounded, precomputed list (such as a feed).
+
+    Args:
+        offset (int): The index of the first item of the next page.
+
+    Returns:
+        str: A URL-safe cursor for the next page.
+    """
+    return base64.urlsafe_b64encode(struct.pack(">I", offset)).rstrip(b"=").decode("ascii")
+
+
+def decode_offset_cursor(cursor: Optional[str]) -> int:
+    """
+    Decodes a cursor produced by ``encode_offset_cursor``.
+
+    Args:
+        cursor (Optional[str]): The cursor sent by the client.
+
+    Returns:
+        int: The offset to continue from, 0 for the first page.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    if not cursor:
+        return 0
+    try:
+        (offset,) = struct.unpack(">I", base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return offset
+    except (binascii.Error, struct.error, ValueError):
+        raise ValueError("Invalid cursor")
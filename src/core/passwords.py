@@ -0,0 +1,110 @@
+# src/core/passwords.py
+"""
+Password hashing with scrypt, a memory-hard key derivation function.
+
+Hashes are stored as ``scrypt$<n>$<r>$<p>$<salt>$<key>`` (salt and key in
+unpadded URL-safe base64), so the cost parameters travel with every hash:
+raising ``BARTER_PASSWORD_SCRYPT_N`` applies to new hashes while the stored
+ones still verify. Both functions are CPU-bound and run for tens of
+milliseconds; the application calls them through the process pool in
+``src/infrastructure/passwords.py``, never on the event loop.
+
+Users registered before passwords were hashed on the server have a legacy
+``hashed_password``: whatever their client sent, stored as is. That value is
+the credential itself, so it verifies when the client sends it again as the
+password, and ``needs_rehash`` tells the login to replace it with a scrypt hash.
+"""
+
+import base64
+import hashlib
+import hmac
+import os
+
+SCHEME = "scrypt"
+SALT_BYTES = 16
+KEY_BYTES = 32
+
+
+def _encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _derive(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    # scrypt needs 128 * n * r bytes per lane; hashlib refuses more than maxmem, 32 MiB by default.
+    return hashlib.scrypt(password.encode("utf-8"), salt=salt, n=n, r=r, p=p, dklen=KEY_BYTES,
+                          maxmem=129 * n * r * p + (1 << 20))
+
+
+def hash_password(password: str, n: int, r: int, p: int) -> str:
+    """
+    Hashes a password with a random salt.
+
+    Args:
+        password (str): The password.
+        n (int): CPU/memory cost, a power of two.
+        r (int): Block size.
+        p (int): Parallelization.
+
+    Returns:
+        str: The encoded hash.
+    """
+    salt = os.urandom(SALT_BYTES)
+    return f"{SCHEME}${n}${r}${p}${_encode(salt)}${_encode(_derive(password, salt, n, r, p))}"
+
+
+def is_legacy_hash(hashed_password: str) -> bool:
+    """
+    Tells whether a stored hash predates server-side hashing.
+
+    Args:
+        hashed_password (str): The stored hash.
+
+    Returns:
+        bool: True unless it is in the ``scrypt$...`` format.
+    """
+    return not hashed_password.startswith(f"{SCHEME}$")
+
+
+def needs_rehash(hashed_password: str, n: int, r: int, p: int) -> bool:
+    """
+    Tells whether a stored hash should be replaced after a successful login.
+
+    Args:
+        hashed_password (str): The stored hash.
+        n (int): CPU/memory cost of new hashes.
+        r (int): Block size of new hashes.
+        p (int): Parallelization of new hashes.
+
+    Returns:
+        bool: True for a legacy hash or a scrypt hash with other cost parameters.
+    """
+    return is_legacy_hash(hashed_password) or hashed_password.split("$")[1:4] != [str(n), str(r), str(p)]
+
+
+def verify_password(password: str, hashed_password: str) -> bool:
+    """
+    Checks a password against an encoded hash, in constant time.
+
+    Args:
+        password (str): The password to check.
+        hashed_password (str): A hash returned by ``hash_password``, or a legacy one.
+
+    Returns:
+        bool: Whether the password matches; False for a malformed scrypt hash.
+    """
+    if is_legacy_hash(hashed_password):
+        return bool(hashed_password) and hmac.compare_digest(password.encode("utf-8"),
+                                                             hashed_password.encode("utf-8"))
+    try:
+        scheme, n, r, p, salt, key = hashed_password.split("$")
+        if scheme != SCHEME:
+            return False
+        expected = _decode(key)
+        actual = _derive(password, _decode(salt), int(n), int(r), int(p))
+    except ValueError:
+        return False
+    return hmac.compare_digest(actual, expected)
@@ -0,0 +1,211 @@
+# src/core/repositories.py
+"""
+The interfaces the services expect from a storage backend.
+
+The services only call the methods below, on the repositories bound in
+``src/infrastructure/container.py``. The MongoDB repositories
+(``Motor*Repository``) and the SQLite ones (``SQLite*Repository``) both
+provide them, and the read-through caches wrap either.
+"""
+
+from datetime import datetime
+from typing import AsyncIterator, Optional, Protocol
+from uuid import UUID
+
+from src.core.entities.feed import FeedItem
+from src.core.entities.message import Conversation, Message
+from src.core.entities.offer import OfferRecord, OfferPage
+from src.core.entities.product import ProductRecord
+from src.core.entities.trade import TradeCycle
+from src.core.entities.user import UserRecord
+
+
+class NotFoundError(ValueError):
+    """Raised when an update or delete targets an entity that does not exist."""
+
+
+class UserRepository(Protocol):
+    """Stores users. ``update_user`` and ``patch_user`` raise ValueError if the new email is already registered."""
+
+    async def create_user(self, user: UserRecord) -> UserRecord:
+        ...
+
+    async def get_user_by_email(self, email: str) -> Optional[UserRecord]:
+        ...
+
+    async def get_user_by_id(self, id: UUID) -> Optional[UserRecord]:
+        ...
+
+    def iter_user_interests(self) -> AsyncIterator[tuple[UUID, list[str]]]:
+        ...
+
+    def iter_users_with_interests(self, interests: list[str]) -> AsyncIterator[tuple[UUID, list[str]]]:
+        ...
+
+    async def update_user(self, user: UserRecord) -> Optional[UserRecord]:
+        ...
+
+    async def patch_user(self, id: UUID, fields: Optional[dict] = None, add_interests: Optional[list[str]] = None,
+                         remove_interests: Optional[list[str]] = None) -> Optional[UserRecord]:
+        ...
+
+
+class ProductRepository(Protocol):
+    """
+    Stores products; every write increments the product's version. Updates and deletes given an ``owner_id``
+    only apply to that user's products and raise PermissionDeniedError otherwise.
+    """
+
+    async def create_product(self, product: ProductRecord) -> ProductRecord:
+        ...
+
+    async def create_products(self, products: list[ProductRecord], chunk_size: int = ...) -> list[Optional[str]]:
+        ...
+
+    async def get_product_by_id(self, product_id: UUID) -> Optional[ProductRecord]:
+        ...
+
+    async def get_product_version(self, product_id: UUID) -> Optional[int]:
+        ...
+
+    async def get_products_by_ids(self, product_ids: list[UUID]) -> list[ProductRecord]:
+        ...
+
+    async def update_product(self, product: ProductRecord, expected_versions: Optional[list[int]] = None,
+                             owner_id: Optional[UUID] = None) -> ProductRecord:
+        ...
+
+    async def delete_product(self, product_id: UUID, owner_id: Optional[UUID] = None):
+        ...
+
+    async def get_products_by_owner_id(self, owner_id: UUID, after: Optional[UUID] = None,
+                                       limit: Optional[int] = None) -> list[ProductRecord]:
+        ...
+
+    def iter_products_by_owner_id(self, owner_id: UUID, after: Optional[UUID] = None,
+                                  limit: Optional[int] = None) -> AsyncIterator[ProductRecord]:
+        ...
+
+    async def get_product_documents_by_owner_id(self, owner_id: UUID, after: Optional[UUID] = None,
+                                                limit: Optional[int] = None) -> list[dict]:
+        ...
+
+    def iter_products(self) -> AsyncIterator[ProductRecord]:
+        ...
+
+
+class OfferRepository(Protocol):
+    """
+    Stores offers and enforces their status transitions; every write increments the offer's version. Writes
+    given the acting user (``from_user_id`` or ``to_user_id``) only apply to that user's offers and raise
+    PermissionDeniedError otherwise. ``update_offer`` only applies to pending offers and never writes the status.
+    """
+
+    async def create_offer(self, offer: OfferRecord) -> OfferRecord:
+        ...
+
+    async def create_offers(self, offers: list[OfferRecord], chunk_size: int = ...) -> list[Optional[str]]:
+        ...
+
+    async def get_offer_by_id(self, offer_id: UUID) -> Optional[OfferRecord]:
+        ...
+
+    async def update_offer(self, offer: OfferRecord, expected_versions: Optional[list[int]] = None,
+                           from_user_id: Optional[UUID] = None) -> OfferRecord:
+        ...
+
+    async def delete_offer(self, offer_id: UUID, from_user_id: Optional[UUID] = None):
+        ...
+
+    async def update_offer_status(self, offer_id: UUID, status: str,
+                                  to_user_id: Optional[UUID] = None) -> Optional[tuple[OfferRecord, list[OfferRecord]]]:
+        ...
+
+    async def get_offer_page(self, user_field: str, user_id: UUID, status: Optional[str] = None,
+                             after: Optional[UUID] = None, limit: int = 50) -> OfferPage:
+        ...
+
+    def iter_offers(self, user_field: str, user_id: UUID, status: Optional[str] = None,
+                    after: Optional[UUID] = None, limit: Optional[int] = None) -> AsyncIterator[OfferRecord]:
+        ...
+
+    def iter_offers_by_status(self, status: str) -> AsyncIterator[OfferRecord]:
+        ...
+
+    async def expire_pending_offers(self, now: datetime, limit: int = ...) -> list[OfferRecord]:
+        ...
+
+    async def reject_offers_for_products(self, product_ids: list[UUID]) -> list[OfferRecord]:
+        ...
+
+
+class TradeRepository(Protocol):
+    """Stores multi-party trade proposals; a cycle is only proposed once at a time."""
+
+    async def create_trades(self, trades: list[TradeCycle]) -> list[TradeCycle]:
+        ...
+
+    async def get_trade_by_id(self, trade_id: UUID) -> Optional[TradeCycle]:
+        ...
+
+    async def get_trades_for_user(self, user_id: UUID, status: Optional[str] = None, after: Optional[UUID] = None,
+                                  limit: Optional[int] = None) -> list[TradeCycle]:
+        ...
+
+    async def accept_trade(self, trade_id: UUID, user_id: UUID) -> Optional[TradeCycle]:
+        ...
+
+    async def reject_trade(self, trade_id: UUID, user_id: UUID) -> Optional[TradeCycle]:
+        ...
+
+    async def cancel_trades_with_products(self, product_ids: list[UUID], except_id: Optional[UUID] = None) -> int:
+        ...
+
+    async def cancel_trades_with_leg(self, to_user_id: UUID, product_id: UUID) -> int:
+        ...
+
+
+class FeedRepository(Protocol):
+    """Stores the materialized recommendation feeds, best item first."""
+
+    async def push_items(self, entries: list[tuple[UUID, FeedItem]]):
+        ...
+
+    async def pull_product(self, product_id: UUID) -> int:
+        ...
+
+    async def get_feed(self, user_id: UUID, offset: int = 0, limit: int = 50) -> list[FeedItem]:
+        ...
+
+
+class MessageRepository(Protocol):
+    """Stores conversations, their messages and the participants' unread counters."""
+
+    async def get_or_create_conversation(self, conversation: Conversation) -> Conversation:
+        ...
+
+    async def get_conversation_by_id(self, conversation_id: UUID) -> Optional[Conversation]:
+        ...
+
+    async def get_conversations_for_user(self, user_id: UUID, limit: Optional[int] = None) -> list[Conversation]:
+        ...
+
+    async def append_message(self, message: Message, participants: list[UUID]) -> Message:
+        ...
+
+    async def get_messages(self, conversation_id: UUID, before: Optional[tuple[float, UUID]] = None,
+                           limit: int = 50) -> list[Message]:
+        ...
+
+    async def mark_read(self, conversation_id: UUID, user_id: UUID) -> Optional[Conversation]:
+        ...
+
+
+class RevokedTokenRepository(Protocol):
+    """Stores the IDs of access tokens revoked before their expiry, until they expire."""
+
+    async def revoke_token(self, token_id: str, expires_at: datetime):
+        ...
+
+    async def get_revoked_token_ids(self, now: datetime) -> list[str]:
+        ...
@@ -0,0 +1,105 @@
+# src/core/tokens.py
+"""
+Stateless signed access tokens.
+
+A token is ``<payload>.<signature>``: the payload is the JSON claims (user ID,
+scopes, expiry and a random token ID) in unpadded URL-safe base64, and the
+signature an HMAC-SHA256 of it with the server secret. Checking a token needs
+the secret only, no database read; the token ID lets a token be revoked
+before it expires (see ``src/infrastructure/tokens.py``).
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+from dataclasses import dataclass
+from typing import Iterable
+from uuid import UUID
+
+SCOPE_PROFILE = "profile"
+SCOPE_PRODUCTS = "products"
+SCOPE_OFFERS = "offers"
+SCOPE_TRADES = "trades"
+SCOPE_MESSAGES = "messages"
+# Bulk ingestion writes entities on behalf of any user, so login does not grant it by default.
+SCOPE_BULK = "bulk"
+
+
+class InvalidTokenError(ValueError):
+    """Raised when a token is malformed, badly signed or expired."""
+
+
+class PermissionDeniedError(ValueError):
+    """Raised when the authenticated user may not perform a write, e.g. accept an offer made to someone else."""
+
+
+@dataclass(frozen=True, slots=True)
+class TokenClaims:
+    """What a verified token says about its bearer."""
+    user_id: UUID
+    scopes: frozenset[str]
+    expires_at: int
+    token_id: str
+
+
+def _encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _sign(secret: bytes, payload: str) -> bytes:
+    return base64.urlsafe_b64encode(hmac.new(secret, payload.encode("utf-8"), hashlib.sha256).digest()).rstrip(b"=")
+
+
+def issue_token(secret: bytes, user_id: UUID, scopes: Iterable[str], expires_at: int) -> tuple[str, TokenClaims]:
+    """
+    Creates a signed token.
+
+    Args:
+        secret (bytes): The signing secret.
+        user_id (UUID): The ID of the user the token is issued to.
+        scopes (Iterable[str]): What the token may be used for.
+        expires_at (int): Expiry, in seconds since the epoch.
+
+    Returns:
+        tuple[str, TokenClaims]: The token and its claims.
+    """
+    claims = TokenClaims(user_id=user_id, scopes=frozenset(scopes), expires_at=expires_at,
+                         token_id=secrets.token_urlsafe(12))
+    payload = _encode(json.dumps({"sub": str(user_id), "scp": sorted(claims.scopes), "exp": expires_at,
+                                  "jti": claims.token_id}, separators=(",", ":")).encode("utf-8"))
+    return f"{payload}.{_sign(secret, payload).decode('ascii')}", claims
+
+
+def verify_token(secret: bytes, token: str, now: float) -> TokenClaims:
+    """
+    Checks a token's signature and expiry and returns its claims.
+
+    Args:
+        secret (bytes): The signing secret.
+        token (str): The token.
+        now (float): The current time, in seconds since the epoch.
+
+    Returns:
+        TokenClaims: The claims.
+
+    Raises:
+        InvalidTokenError: If the token is malformed, its signature is wrong or it has expired.
+    """
+    payload, _, signature = token.partition(".")
+    if not payload or not signature or not hmac.compare_digest(signature.encode("utf-8"), _sign(secret, payload)):
+        raise InvalidTokenError("Invalid token")
+    try:
+        fields = json.loads(_decode(payload))
+        claims = TokenClaims(user_id=UUID(fields["sub"]), scopes=frozenset(fields["scp"]),
+                             expires_at=int(fields["exp"]), token_id=str(fields["jti"]))
+    except (ValueError, KeyError, TypeError):
+        raise InvalidTokenError("Invalid token")
+    if claims.expires_at <= now:
+        raise InvalidTokenError("Token has expired")
+    return claims
@@ -0,0 +1,210 @@
+# src/core/trade_graph.py
+"""
+In-memory "wants" graph between users, used to find multi-party trade cycles.
+
+An edge ``wanter -> owner`` exists while ``wanter`` wants at least one product
+owned by ``owner``. The application only records the wants of pending offers
+(see ``src/features/trades/trade_service.py``). Each want is counted, since
+several pending offers may express the same one, and only goes once all of
+them have been removed. A simple
+cycle ``A -> B -> C -> A`` is a trade in which every participant receives a
+product they want and gives away one product: A gets B's product, B gets C's
+and C gets A's.
+
+The graph is maintained incrementally. Adding a want only searches for the
+cycles that go through the new edge: a bounded backward BFS from the wanter
+computes, for every user close enough to matter, the number of hops left to
+close the cycle, and a forward DFS from the owner only steps to users that can
+still close it within the length limit. Removing a want is O(1).
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Hashable, Iterator, Optional
+
+DEFAULT_MIN_CYCLE_LENGTH = 3
+DEFAULT_MAX_CYCLE_LENGTH = 5
+
+
+@dataclass(frozen=True)
+class CycleLeg:
+    giver: Hashable
+    receiver: Hashable
+    product: Hashable
+
+
+class TradeGraph:
+    """Directed graph of users where ``wanter -> owner`` means the wanter wants one of the owner's products."""
+
+    def __init__(self, max_visited: int = 100_000):
+        """
+        Initializes an empty graph.
+
+        Args:
+            max_visited (int): Upper bound on the users explored by one cycle search, so that a
+                single very connected user cannot stall the caller.
+        """
+        self.max_visited = max_visited
+        # wanter -> owner -> product -> number of times the want was added
+        self._out: dict[Hashable, dict[Hashable, dict[Hashable, int]]] = defaultdict(dict)
+        self._in: dict[Hashable, dict[Hashable, dict[Hashable, int]]] = defaultdict(dict)
+        self._owners: dict[Hashable, Hashable] = {}
+        self._wanters: dict[Hashable, set] = defaultdict(set)
+        self.edge_count = 0
+
+    def has_edge(self, wanter: Hashable, owner: Hashable) -> bool:
+        return owner in self._out.get(wanter, ())
+
+    def add_want(self, wanter: Hashable, owner: Hashable, product: Hashable) -> bool:
+        """
+        Records that ``wanter`` wants ``product``, owned by ``owner``. Adding the same want again
+        counts it again.
+
+        Args:
+            wanter (Hashable): The user who wants the product.
+            owner (Hashable): The owner of the product.
+            product (Hashable): The wanted product.
+
+        Returns:
+            bool: True if this created a new wanter -> owner edge, i.e. new cycles may exist.
+        """
+        if wanter == owner:
+            return False
+        products = self._out[wanter].get(owner)
+        new_edge = products is None
+        if new_edge:
+            products = self._out[wanter][owner] = {}
+            self._in[owner][wanter] = products
+            self.edge_count += 1
+        products[product] = products.get(product, 0) + 1
+        self._owners[product] = owner
+        self._wanters[product].add(wanter)
+        return new_edge
+
+    def remove_want(self, wanter: Hashable, product: Hashable) -> bool:
+        """
+        Removes one count of the want of ``wanter`` for ``product``. Unknown wants are ignored.
+
+        Args:
+            wanter (Hashable): The user who no longer wants the product.
+            product (Hashable): The product.
+
+        Returns:
+            bool: True if the want is gone, False if it was unknown or is still counted.
+        """
+        owner = self._owners.get(product)
+        products = self._out.get(wanter, {}).get(owner)
+        if products is None or product not in products:
+            return False
+        if products[product] > 1:
+            products[product] -= 1
+            return False
+        self._forget(wanter, owner, product)
+        return True
+
+    def _forget(self, wanter: Hashable, owner: Hashable, product: Hashable):
+        """Drops the want of ``wanter`` for ``product`` whatever its count."""
+        wanters = self._wanters[product]
+        wanters.discard(wanter)
+        if not wanters:
+            del self._wanters[product]
+            del self._owners[product]
+        products = self._out[wanter][owner]
+        del products[product]
+        if not products:
+            del self._out[wanter][owner]
+            del self._in[owner][wanter]
+            if not self._out[wanter]:
+                del self._out[wanter]
+            if not self._in[owner]:
+                del self._in[owner]
+            self.edge_count -= 1
+
+    def remove_product(self, product: Hashable):
+        """
+        Drops every want for a product, e.g. once it has been traded or deleted.
+
+        Args:
+            product (Hashable): The product.
+        """
+        owner = self._owners.get(product)
+        for wanter in list(self._wanters.get(product, ())):
+            self._forget(wanter, owner, product)
+
+    def _distances_to(self, target: Hashable, max_depth: int) -> dict[Hashable, int]:
+        """Hops from each user within ``max_depth`` hops to ``target``, following edges backwards."""
+        distances = {target: 0}
+        frontier = [target]
+        for depth in range(1, max_depth + 1):
+            next_frontier = []
+            for user in frontier:
+                for wanter in self._in.get(user, ()):
+                    if wanter not in distances:
+                        distances[wanter] = depth
+                        next_frontier.append(wanter)
+            if len(distances) > self.max_visited or not next_frontier:
+                break
+            frontier = next_frontier
+        return distances
+
+    def cycles_through(self, wanter: Hashable, owner: Hashable, min_length: int = DEFAULT_MIN_CYCLE_LENGTH,
+                       max_length: int = DEFAULT_MAX_CYCLE_LENGTH,
+                       limit: Optional[int] = None) -> Iterator[list[Hashable]]:
+        """
+        Yields the simple cycles that contain the edge ``wanter -> owner``.
+
+        Args:
+            wanter (Hashable): Start of the edge.
+            owner (Hashable): End of the edge.
+            min_length (int): Minimum number of users in a cycle.
+            max_length (int): Maximum number of users in a cycle.
+            limit (Optional[int]): Stop after this many cycles.
+
+        Yields:
+            list[Hashable]: The users of each cycle, starting with ``wanter``; each one wants
+            a product of the next, and the last wants a product of ``wanter``.
+        """
+        if not self.has_edge(wanter, owner) or max_length < 2:
+            return
+        # Closing a cycle of L users takes L - 1 hops from owner back to wanter.
+        distances = self._distances_to(wanter, max_length - 1)
+        if distances.get(owner, max_length) > max_length - 1:
+            return
+        found = 0
+        path = [wanter, owner]
+        on_path = {wanter, owner}
+        stack = [iter(self._out.get(owner, ()))]
+        while stack:
+            user = next(stack[-1], None)
+            if user is None:
+                stack.pop()
+                on_path.discard(path.pop())
+                continue
+            if user == wanter:
+                if len(path) >= max(min_length, 2):
+                    yield list(path)
+                    found += 1
+                    if limit is not None and found >= limit:
+                        return
+                continue
+            if user in on_path or len(path) + distances.get(user, max_length) > max_length:
+                continue
+            path.append(user)
+            on_path.add(user)
+            stack.append(iter(self._out.get(user, ())))
+
+    def legs(self, cycle: list[Hashable]) -> list[CycleLeg]:
+        """
+        Picks the product each participant gives in a cycle returned by ``cycles_through``.
+
+        Args:
+            cycle (list[Hashable]): The users of the cycle.
+
+        Returns:
+            list[CycleLeg]: One leg per participant.
+        """
+        legs = []
+        for index, receiver in enumerate(cycle):
+            giver = cycle[(index + 1) % len(cycle)]
+            legs.append(CycleLeg(giver=giver, receiver=receiver, product=next(iter(self._out[receiver][giver]))))
+        return legs
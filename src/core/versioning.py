@@ -0,0 +1,68 @@
+# src/core/versioning.py
+"""
+Entity versions and the HTTP validators derived from them.
+
+Products and offers carry a ``version`` that the repository increments on
+every write. It is sent as a strong ETag, so clients can revalidate a cached
+copy with ``If-None-Match`` and make an update conditional with ``If-Match``.
+"""
+
+from typing import Optional
+
+
+class VersionConflictError(ValueError):
+    """Raised when a conditional write finds the entity at another version."""
+
+
+def etag(version: int) -> str:
+    """
+    Formats a version as a strong entity tag.
+
+    Args:
+        version (int): The version of the entity.
+
+    Returns:
+        str: The ETag header value.
+    """
+    return f'"{version}"'
+
+
+def parse_etags(header: str, weak: bool) -> Optional[list[int]]:
+    """
+    Reads the versions listed in an If-Match or If-None-Match header.
+
+    Args:
+        header (str): The header value, a comma-separated list of entity tags or "*".
+        weak (bool): Whether W/ tags count, as in the weak comparison of If-None-Match.
+            If-Match uses the strong comparison, where they never match.
+
+    Returns:
+        Optional[list[int]]: The versions, or None for "*" (any version). Tags not produced by ``etag`` are skipped.
+    """
+    if header.strip() == "*":
+        return None
+    versions = []
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            if not weak:
+                continue
+            tag = tag[2:]
+        if len(tag) > 2 and tag[0] == tag[-1] == '"' and tag[1:-1].isdigit():
+            versions.append(int(tag[1:-1]))
+    return versions
+
+
+def etag_matches(header: str, version: int) -> bool:
+    """
+    Checks an If-None-Match header against the current version.
+
+    Args:
+        header (str): The If-None-Match header.
+        version (int): The current version of the entity.
+
+    Returns:
+        bool: True if the client's copy is current and a 304 can be sent.
+    """
+    versions = parse_etags(header, weak=True)
+    return versions is None or version in versions
@@ -0,0 +1,110 @@
+# src/features/auth/auth_service.py
+from datetime import datetime, timezone
+from typing import Optional
+
+from src.core.entities.user import UserRecord
+from src.core.interest_matching import normalize_tags
+from src.core.tokens import TokenClaims
+from src.features.products import matching_service
+from src.infrastructure.container import repositories
+from src.infrastructure.mappers import bson_now
+from src.infrastructure.passwords import password_hasher
+from src.infrastructure.tokens import token_verifier
+
+
+async def register_user(username: str, email: str, password: str, interests: Optional[list[str]] = None) -> UserRecord:
+    """
+    Creates a user with a server-side hash of their password.
+
+    The email is not looked up first: the insert is the only round-trip, and the
+    unique email index rejects it if the address is taken, even when two
+    registrations race.
+
+    Args:
+        username (str): The username.
+        email (str): The email address.
+        password (str): The password, in clear.
+        interests (Optional[list[str]]): The user's interests.
+
+    Returns:
+        UserRecord: The created user.
+
+    Raises:
+        ValueError: If the email is already registered.
+    """
+    user = UserRecord(username=username, email=email, hashed_password=await password_hasher.hash(password),
+                      interests=normalize_tags(interests))
+    user = await repositories.users.create_user(user)
+    matching_service.index_user(user)
+    return user
+
+
+async def authenticate(email: str, password: str) -> Optional[UserRecord]:
+    """
+    Checks a user's credentials.
+
+    An unknown email still costs one hash, so the response time does not tell
+    which addresses are registered. A legacy hash, or one made with another
+    scrypt cost, is replaced with a new hash of the password once it verifies.
+
+    Args:
+        email (str): The email address.
+        password (str): The password, in clear.
+
+    Returns:
+        Optional[UserRecord]: The user, or None if the email or the password is wrong.
+    """
+    user = await repositories.users.get_user_by_email(email)
+    if user is None:
+        await password_hasher.hash(password)
+        return None
+    if not await password_hasher.verify(password, user.hashed_password):
+        return None
+    if password_hasher.needs_rehash(user.hashed_password):
+        user = await repositories.users.patch_user(
+            user.id, {"hashed_password": await password_hasher.hash(password)}) or user
+    return user
+
+
+async def login(email: str, password: str) -> Optional[tuple[UserRecord, str, TokenClaims]]:
+    """
+    Checks a user's credentials and issues them an access token.
+
+    Args:
+        email (str): The email address.
+        password (str): The password, in clear.
+
+    Returns:
+        Optional[tuple[UserRecord, str, TokenClaims]]: The user, the token and its claims, or None if the
+        email or the password is wrong.
+    """
+    user = await authenticate(email, password)
+    if user is None:
+        return None
+    token, claims = token_verifier.issue(user.id)
+    return user, token, claims
+
+
+async def logout(claims: TokenClaims):
+    """
+    Revokes an access token before it expires.
+
+    The token is refused at once by this process, and by the others once they
+    reload the revocation list.
+
+    Args:
+        claims (TokenClaims): The claims of the token to revoke.
+    """
+    await repositories.revoked_tokens.revoke_token(claims.token_id,
+                                                   datetime.fromtimestamp(claims.expires_at, timezone.utc))
+    token_verifier.revoke(claims.token_id)
+
+
+async def load_revoked_tokens() -> list[str]:
+    """
+    Lists the revoked tokens that have not expired yet, for ``token_verifier``.
+
+    Returns:
+        list[str]: Their IDs.
+    """
+    return await repositories.revoked_tokens.get_revoked_token_ids(bson_now())
@@ -0,0 +1,80 @@
+# src/features/auth/dependencies.py
+"""
+Request authentication for the routers.
+
+Routes declare ``claims: TokenClaims = Depends(require_scope(SCOPE_...))``
+and then compare ``claims.user_id`` with the user they act for, in memory;
+writes that depend on stored state (who may accept an offer, who owns a
+product) pass it down to the repository, which makes it part of the write
+filter instead of reading the document first.
+"""
+
+from typing import Callable, Iterable, Optional
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from src.core.tokens import InvalidTokenError, TokenClaims
+from src.infrastructure.tokens import token_verifier
+
+bearer = HTTPBearer(auto_error=False)
+
+
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=detail,
+                         headers={"WWW-Authenticate": "Bearer"})
+
+
+def require_scope(scope: str) -> Callable[..., TokenClaims]:
+    """
+    Builds a dependency that authenticates the request and requires a scope.
+
+    Args:
+        scope (str): The scope the token must carry.
+
+    Returns:
+        Callable[..., TokenClaims]: The dependency, resolving to the token's claims.
+    """
+
+    def dependency(credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer)) -> TokenClaims:
+        if credentials is None:
+            raise _unauthorized("Not authenticated")
+        try:
+            claims = token_verifier.verify(credentials.credentials)
+        except InvalidTokenError as e:
+            raise _unauthorized(str(e))
+        if scope not in claims.scopes:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=f"Token lacks the '{scope}' scope")
+        return claims
+
+    return dependency
+
+
+def ensure_self(claims: TokenClaims, user_id: UUID):
+    """
+    Refuses a request made on behalf of another user.
+
+    Args:
+        claims (TokenClaims): The caller's claims.
+        user_id (UUID): The user the request acts for.
+
+    Raises:
+        HTTPException: 403 if the caller is not that user.
+    """
+    if claims.user_id != user_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed for another user")
+
+
+def ensure_among(claims: TokenClaims, user_ids: Iterable[UUID]):
+    """
+    Refuses a request from a user who is not one of the given users.
+
+    Args:
+        claims (TokenClaims): The caller's claims.
+        user_ids (Iterable[UUID]): The users allowed, e.g. a conversation's participants.
+
+    Raises:
+        HTTPException: 403 if the caller is not among them.
+    """
+    if claims.user_id not in user_ids:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed for another user")
@@ -1,28 +1,53 @@
 # src/features/auth/routes.py
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, EmailStr
-from src.core.entities.user import User
-from src.infrastructure.repositories.mongo_user_repository import MongoUserRepository
-from src.infrastructure.database import users_collection
+from src.core.entities.user import UserProfile
+from src.core.tokens import SCOPE_PROFILE, TokenClaims
+from src.features.auth import auth_service
+from src.features.auth.dependencies import require_scope
 
 
 class UserCreate(BaseModel):
     username: str
     email: EmailStr
-    hashed_password: str
+    password: str
     interests: Optional[list[str]] = []
 
 
+class LoginRequest(BaseModel):
+    email: EmailStr
+    password: str
+
+
+class TokenResponse(BaseModel):
+    access_token: str
+    token_type: str = "bearer"
+    expires_at: int
+    user: UserProfile
+
+
 auth_router = APIRouter()
-user_repository = MongoUserRepository(users_collection)
 
 
-@auth_router.post("/register", response_model=User)
-def register(user: UserCreate):
-    existing_user = user_repository.get_user_by_email(user.email)
-    if existing_user:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
-    new_user = User(**user.dict())
-    return user_repository.create_user(new_user)
+@auth_router.post("/register", response_model=UserProfile)
+async def register(user: UserCreate):
+    try:
+        return await auth_service.register_user(user.username, user.email, user.password, user.interests)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@auth_router.post("/login", response_model=TokenResponse)
+async def login(login_request: LoginRequest):
+    result = await auth_service.login(login_request.email, login_request.password)
+    if result is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password")
+    user, token, claims = result
+    return {"access_token": token, "expires_at": claims.expires_at, "user": user}
+
+
+@auth_router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(claims: TokenClaims = Depends(require_scope(SCOPE_PROFILE))):
+    await auth_service.logout(claims)
@@ -0,0 +1,81 @@
+# src/features/feed/feed_service.py
+
+from datetime import datetime, timezone
+
+from src.core.entities.feed import FeedItem
+from src.core.entities.product import ProductRecord
+from src.core.interest_matching import normalize_tags
+from src.core.pagination import DEFAULT_PAGE_SIZE
+from src.infrastructure.config import FEED_FANOUT_BATCH
+from src.infrastructure.container import repositories
+from src.infrastructure.events import EventBus, PRODUCT_DELETED, PRODUCT_SAVED
+from uuid import UUID
+
+
+async def fan_out_product(product: ProductRecord, batch_size: int = FEED_FANOUT_BATCH):
+    """
+    Pushes a created or updated product into the feeds of the users interested in it.
+
+    Any previous copy is pulled first, so an update re-ranks the product and
+    drops it from feeds whose users no longer match. Tags match regardless of
+    case, as in the interest matcher. Feeds are written in batches of
+    ``batch_size`` with one bulk write each.
+
+    Args:
+        product (ProductRecord): The product.
+        batch_size (int): Number of feeds updated per bulk write.
+    """
+    await repositories.feeds.pull_product(product.id)
+    tags = set(normalize_tags(product.interests))
+    if not tags:
+        return
+    added_at = datetime.now(timezone.utc)
+    batch = []
+    async for user_id, interests in repositories.users.iter_users_with_interests(list(tags)):
+        if user_id == product.owner_id:
+            continue
+        item = FeedItem(product_id=product.id, owner_id=product.owner_id, title=product.title,
+                        image_url=product.image_url, interests=product.interests,
+                        score=len(tags.intersection(normalize_tags(interests))), added_at=added_at)
+        batch.append((user_id, item))
+        if len(batch) >= batch_size:
+            await repositories.feeds.push_items(batch)
+            batch = []
+    await repositories.feeds.push_items(batch)
+
+
+async def purge_product(product_id: UUID):
+    """
+    Removes a deleted product from every feed. Runs on the event worker, after
+    the delete request has returned.
+
+    Args:
+        product_id (UUID): The ID of the deleted product.
+    """
+    await repositories.feeds.pull_product(product_id)
+
+
+def register_feed_handlers(bus: EventBus):
+    """
+    Subscribes the feed fan-out to product events.
+
+    Args:
+        bus (EventBus): The event bus product writes are published on.
+    """
+    bus.subscribe(PRODUCT_SAVED, fan_out_product)
+    bus.subscribe(PRODUCT_DELETED, purge_product)
+
+
+async def get_feed(user_id: UUID, offset: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> list[FeedItem]:
+    """
+    Retrieves one page of a user's precomputed feed.
+
+    Args:
+        user_id (UUID): The ID of the user.
+        offset (int): Index of the first item of the page.
+        limit (int): Maximum number of items.
+
+    Returns:
+        list[FeedItem]: The recommended products, best first.
+    """
+    return await repositories.feeds.get_feed(user_id, offset, limit)
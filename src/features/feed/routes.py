@@ -0,0 +1,41 @@
+# src/features/feed/routes.py
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from uuid import UUID
+from typing import List, Optional
+from src.core.entities.feed import FeedItem
+from src.core.tokens import SCOPE_PROFILE, TokenClaims
+from src.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, decode_offset_cursor, \
+    encode_offset_cursor
+from src.features.auth.dependencies import ensure_self, require_scope
+from src.features.feed.feed_service import get_feed
+
+feed_router = APIRouter()
+
+
+@feed_router.get("/{user_id}", response_model=List[FeedItem])
+async def get_feed_endpoint(user_id: UUID, response: Response,
+                            limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+                            cursor: Optional[str] = None,
+                            claims: TokenClaims = Depends(require_scope(SCOPE_PROFILE))):
+    """
+    Endpoint to read a user's recommendation feed, one page at a time.
+
+    Args:
+        user_id (UUID): The ID of the user, who must be the caller.
+        limit (int): Page size.
+        cursor (Optional[str]): Cursor returned with the previous page.
+        claims (TokenClaims): The caller's token claims.
+
+    Returns:
+        list[FeedItem]: The recommended products, best first.
+    """
+    ensure_self(claims, user_id)
+    try:
+        offset = decode_offset_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    items = await get_feed(user_id, offset, limit)
+    if len(items) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_offset_cursor(offset + limit)
+    return items
@@ -0,0 +1,116 @@
+# src/features/messages/message_service.py
+
+from src.core.entities.message import Conversation, Message
+from src.core.pagination import DEFAULT_PAGE_SIZE
+from src.infrastructure.cache import conversation_cache
+from src.infrastructure.container import repositories
+from typing import Optional
+from uuid import UUID
+
+
+async def start_conversation(conversation: Conversation) -> Conversation:
+    """
+    Starts a conversation, or returns the one the same participants already have about the same offer.
+
+    Args:
+        conversation (Conversation): The participants and the optional offer.
+
+    Returns:
+        Conversation: The conversation.
+    """
+    if len(set(conversation.participants)) < 2:
+        raise ValueError("A conversation needs at least two participants")
+    conversation.participants = sorted(set(conversation.participants))
+    return await repositories.messages.get_or_create_conversation(conversation)
+
+
+async def get_conversation_by_id(conversation_id: UUID) -> Conversation:
+    """
+    Retrieves a conversation by its ID.
+
+    Args:
+        conversation_id (UUID): The ID of the conversation.
+
+    Returns:
+        Conversation: The conversation, or None if it does not exist.
+    """
+    return await repositories.messages.get_conversation_by_id(conversation_id)
+
+
+async def get_conversations_for_user(user_id: UUID, limit: int = DEFAULT_PAGE_SIZE) -> list[Conversation]:
+    """
+    Retrieves a user's conversations, most recently active first.
+
+    Args:
+        user_id (UUID): The ID of the user.
+        limit (int): Maximum number of conversations.
+
+    Returns:
+        list[Conversation]: The conversations, with the user's unread counts.
+    """
+    return await repositories.messages.get_conversations_for_user(user_id, limit)
+
+
+async def get_participants(conversation_id: UUID) -> Optional[list[UUID]]:
+    """
+    Retrieves the participants of a conversation, from the cache once read.
+
+    Args:
+        conversation_id (UUID): The ID of the conversation.
+
+    Returns:
+        Optional[list[UUID]]: The participants, or None if the conversation does not exist.
+    """
+    async def load():
+        conversation = await repositories.messages.get_conversation_by_id(conversation_id)
+        return conversation.participants if conversation else None
+    # Participants never change, so the send path and access checks skip the conversation read once cached.
+    return await conversation_cache.get_or_load(conversation_id, load)
+
+
+async def send_message(message: Message) -> Optional[Message]:
+    """
+    Sends a message in a conversation.
+
+    Args:
+        message (Message): The message.
+
+    Returns:
+        Message: The stored message, or None if the conversation does not exist.
+    """
+    participants = await get_participants(message.conversation_id)
+    if participants is None:
+        return None
+    if message.sender_id not in participants:
+        raise ValueError("Sender is not a participant of the conversation")
+    return await repositories.messages.append_message(message, participants)
+
+
+async def get_messages(conversation_id: UUID, before: Optional[tuple[float, UUID]] = None,
+                       limit: int = DEFAULT_PAGE_SIZE) -> list[Message]:
+    """
+    Retrieves one page of a conversation's history, newest first.
+
+    Args:
+        conversation_id (UUID): The ID of the conversation.
+        before (Optional[tuple[float, UUID]]): Position of the oldest message of the previous page.
+        limit (int): Maximum number of messages.
+
+    Returns:
+        list[Message]: The messages, newest first.
+    """
+    return await repositories.messages.get_messages(conversation_id, before, limit)
+
+
+async def mark_read(conversation_id: UUID, user_id: UUID) -> Conversation:
+    """
+    Marks every message of a conversation as read by a participant.
+
+    Args:
+        conversation_id (UUID): The ID of the conversation.
+        user_id (UUID): The participant.
+
+    Returns:
+        Conversation: The updated conversation, or None if the user is not a participant.
+    """
+    return await repositories.messages.mark_read(conversation_id, user_id)
@@ -0,0 +1,164 @@
+# src/features/messages/routes.py
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import BaseModel
+from uuid import UUID
+from typing import List, Optional
+from src.core.entities.message import Conversation, Message
+from src.core.tokens import SCOPE_MESSAGES, TokenClaims
+from src.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, decode_score_cursor, \
+    encode_score_cursor
+from src.features.messages.message_service import start_conversation, get_conversation_by_id, \
+    get_conversations_for_user, get_participants, send_message, get_messages, mark_read
+from src.features.auth.dependencies import ensure_among, ensure_self, require_scope
+
+messages_router = APIRouter()
+
+authenticated = require_scope(SCOPE_MESSAGES)
+
+
+class ConversationCreateRequest(BaseModel):
+    participants: List[UUID]
+    offer_id: Optional[UUID] = None
+
+
+class MessageCreateRequest(BaseModel):
+    sender_id: UUID
+    body: str
+    offer_id: Optional[UUID] = None
+
+
+@messages_router.post("/conversations", response_model=Conversation)
+async def start_conversation_endpoint(conversation_request: ConversationCreateRequest,
+                                      claims: TokenClaims = Depends(authenticated)):
+    """
+    Endpoint to start a conversation, optionally about an offer. Starting the
+    same conversation twice returns the existing one.
+
+    Args:
+        conversation_request (ConversationCreateRequest): The participants, among them the caller, and the
+            optional offer.
+        claims (TokenClaims): The caller's token claims.
+
+    Returns:
+        Conversation: The conversation.
+    """
+    ensure_among(claims, conversation_request.participants)
+    try:
+        return await start_conversation(Conversation(**conversation_request.model_dump()))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@messages_router.get("/conversations/user/{user_id}", response_model=List[Conversation])
+async def get_conversations_for_user_endpoint(user_id: UUID,
+                                              limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+                                              claims: TokenClaims = Depends(authenticated)):
+    """
+    Endpoint to list a user's conversations, most recently active first.
+
+    Args:
+        user_id (UUID): The ID of the user, who must be the caller.
+        limit (int): Maximum number of conversations.
+        claims (TokenClaims): The caller's token claims.
+
+    Returns:
+        list[Conversation]: The conversations, with unread counts.
+    """
+    ensure_self(claims, user_id)
+    return await get_conversations_for_user(user_id, limit)
+
+
+@messages_router.get("/conversations/{conversation_id}", response_model=Conversation)
+async def get_conversation_endpoint(conversation_id: UUID, claims: TokenClaims = Depends(authenticated)):
+    """
+    Endpoint to retrieve a conversation by its ID; only its participants may.
+
+    Args:
+        conversation_id (UUID): The ID of the conversation.
+        claims (TokenClaims): The caller's token claims.
+
+    Returns:
+        Conversation: The conversation.
+    """
+    conversation = await get_conversation_by_id(conversation_id)
+    if conversation is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
+    ensure_among(claims, conversation.participants)
+    return conversation
+
+
+@messages_router.post("/conversations/{conversation_id}/messages", response_model=Message)
+async def send_message_endpoint(conversation_id: UUID, message_request: MessageCreateRequest,
+                                claims: TokenClaims = Depends(authenticated)):
+    """
+    Endpoint to send a message in a conversation.
+
+    Args:
+        conversation_id (UUID): The ID of the conversation.
+        message_request (MessageCreateRequest): The sender, who must be the caller, the text and an optional
+            offer reference.
+        claims (TokenClaims): The caller's token claims.
+
+    Returns:
+        Message: The stored message.
+    """
+    ensure_self(claims, message_request.sender_id)
+    try:
+        message = await send_message(Message(conversation_id=conversation_id, **message_request.model_dump()))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    if message is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
+    return message
+
+
+@messages_router.get("/conversations/{conversation_id}/messages", response_model=List[Message])
+async def get_messages_endpoint(conversation_id: UUID, response: Response,
+                                limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+                                cursor: Optional[str] = None, claims: TokenClaims = Depends(authenticated)):
+    """
+    Endpoint to read a conversation's history backwards, newest message first; only its participants may.
+
+    Args:
+        conversation_id (UUID): The ID of the conversation.
+        limit (int): Page size.
+        cursor (Optional[str]): Cursor returned with the previous page, to continue with older messages.
+        claims (TokenClaims): The caller's token claims.
+
+    Returns:
+        list[Message]: The messages, newest first.
+    """
+    try:
+        before = decode_score_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    participants = await get_participants(conversation_id)
+    if participants is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
+    ensure_among(claims, participants)
+    messages = await get_messages(conversation_id, before, limit)
+    if len(messages) == limit:
+        oldest = messages[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_score_cursor(oldest.sent_at.timestamp(), oldest.id)
+    return messages
+
+
+@messages_router.post("/conversations/{conversation_id}/read", response_model=Conversation)
+async def mark_read_endpoint(conversation_id: UUID, user_id: UUID, claims: TokenClaims = Depends(authenticated)):
+    """
+    Endpoint to reset a participant's unread counter.
+
+    Args:
+        conversation_id (UUID): The ID of the conversation.
+        user_id (UUID): The participant who read the conversation, who must be the caller.
+        claims (TokenClaims): The caller's token claims.
+
+    Returns:
+        Conversation: The updated conversation.
+    """
+    ensure_self(claims, user_id)
+    conversation = await mark_read(conversation_id, user_id)
+    if conversation is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
+    return conversation
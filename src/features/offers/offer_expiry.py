@@ -0,0 +1,114 @@
+# src/features/offers/offer_expiry.py
+"""
+Background expiry of pending offers.
+
+``OfferExpirySweeper`` runs on the event loop from the application lifespan.
+Every ``interval`` seconds it expires overdue pending offers in batches of
+``batch_size`` until a batch comes back short, yielding to the event loop
+between batches so requests keep being served during a large sweep. Several
+workers may sweep at once: each batch only closes offers that are still
+pending, so an offer is expired, and reported, by exactly one of them.
+
+``stats`` records how long sweeps take and how many offers they process, to
+size ``BARTER_OFFER_SWEEP_BATCH_SIZE`` and ``BARTER_OFFER_SWEEP_INTERVAL_SECONDS``.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from src.features.offers import offer_service
+from src.infrastructure.config import OFFER_SWEEP_BATCH_SIZE, OFFER_SWEEP_INTERVAL_SECONDS
+from src.infrastructure.mappers import bson_now
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SweepStats:
+    """Counters describing the sweeps run so far."""
+    sweeps: int = 0
+    failures: int = 0
+    batches: int = 0
+    offers_expired: int = 0
+    total_duration_seconds: float = 0.0
+    last_duration_seconds: float = 0.0
+    last_offers_expired: int = 0
+    max_batch_duration_seconds: float = 0.0
+
+
+class OfferExpirySweeper:
+    """Periodically moves pending offers past their expiry to expired."""
+
+    def __init__(self, interval: float = OFFER_SWEEP_INTERVAL_SECONDS, batch_size: int = OFFER_SWEEP_BATCH_SIZE):
+        """
+        Initializes the OfferExpirySweeper instance.
+
+        Args:
+            interval (float): Seconds between the end of one sweep and the start of the next.
+            batch_size (int): Maximum number of offers expired per update_many.
+        """
+        self.interval = interval
+        self.batch_size = batch_size
+        self.stats = SweepStats()
+        self._task: Optional[asyncio.Task] = None
+
+    async def sweep(self) -> int:
+        """
+        Expires every overdue pending offer, one batch at a time.
+
+        Returns:
+            int: The number of offers expired.
+        """
+        started = time.perf_counter()
+        now = bson_now()
+        expired = 0
+        while True:
+            batch_started = time.perf_counter()
+            count = await offer_service.expire_offers(now, self.batch_size)
+            self.stats.batches += 1
+            self.stats.max_batch_duration_seconds = max(self.stats.max_batch_duration_seconds,
+                                                        time.perf_counter() - batch_started)
+            expired += count
+            if count < self.batch_size:
+                break
+            await asyncio.sleep(0)
+        duration = time.perf_counter() - started
+        self.stats.sweeps += 1
+        self.stats.offers_expired += expired
+        self.stats.total_duration_seconds += duration
+        self.stats.last_duration_seconds = duration
+        self.stats.last_offers_expired = expired
+        if expired:
+            logger.info(f"Expired {expired} pending offers in {duration * 1e3:.0f}ms")
+        return expired
+
+    async def _run(self):
+        while True:
+            try:
+                await self.sweep()
+            except Exception:
+                self.stats.failures += 1
+                logger.exception("Offer expiry sweep failed")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        """Starts sweeping on the running event loop; the first sweep runs immediately."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stops sweeping, abandoning the sweep in progress. Expired batches are already committed."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+offer_expiry_sweeper = OfferExpirySweeper()
@@ -1,27 +1,69 @@
 # src/features/offers/offer_service.py
 
-from src.infrastructure.repositories.mongo_offer_repository import MongoOfferRepository
-from src.core.entities.offer import Offer
-from src.infrastructure.database import offers_collection
+from src.core.bulk import BulkItemResult, chunked, validate_items
+from src.core.pagination import DEFAULT_PAGE_SIZE
+from src.core.entities.offer import OfferCreate, OfferPage, OfferRecord, OFFER_STATUS_ACCEPTED, \
+    OFFER_STATUS_PENDING, OFFER_STATUS_REJECTED, ProductOwnershipError
+from src.features.trades import trade_service
+from src.infrastructure.config import BULK_CHUNK_SIZE
+from src.infrastructure.container import repositories
+from src.infrastructure.events import OFFER_CHANGED, event_bus
+from src.infrastructure.notifications import HEARTBEAT, OVERFLOW, offer_notifications
+from src.infrastructure.responses import json_bytes
+from datetime import datetime
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
-offer_repository = MongoOfferRepository(offers_collection)
 
+async def _ownership_errors(offers: list[OfferRecord]) -> list[Optional[str]]:
+    """
+    Checks, with one product read, that each offer asks for a product of its recipient
+    and offers one of its sender's, so no offer puts a want on someone else's product.
+
+    Args:
+        offers (list[OfferRecord]): The offers.
 
-def create_offer(offer: Offer) -> Offer:
+    Returns:
+        list[Optional[str]]: One error per offer, None where its products check out.
     """
-    Creates a new offer.
+    product_ids = list({product_id for offer in offers for product_id in (offer.product_id, offer.offered_product_id)})
+    owners = {product.id: product.owner_id for product in await repositories.products.get_products_by_ids(product_ids)}
+    errors = []
+    for offer in offers:
+        if owners.get(offer.product_id) != offer.to_user_id:
+            errors.append("The requested product is not owned by the user the offer is made to")
+        elif owners.get(offer.offered_product_id) != offer.from_user_id:
+            errors.append("The offered product is not owned by the user making the offer")
+        else:
+            errors.append(None)
+    return errors
+
+
+async def create_offer(offer: OfferRecord) -> OfferRecord:
+    """
+    Creates a new offer and adds the want it expresses to the trade graph.
 
     Args:
-        offer (Offer): The offer to be created.
+        offer (OfferRecord): The offer to be created.
 
     Returns:
-        Offer: The created offer.
+        OfferRecord: The created offer.
+
+    Raises:
+        ProductOwnershipError: If the recipient does not own the requested product or the
+            sender does not own the offered one.
     """
-    return offer_repository.create_offer(offer)
+    (error,) = await _ownership_errors([offer])
+    if error:
+        raise ProductOwnershipError(error)
+    offer = await repositories.offers.create_offer(offer)
+    await event_bus.publish(OFFER_CHANGED, offer)
+    if offer.status == OFFER_STATUS_PENDING:
+        await trade_service.add_want(offer.from_user_id, offer.to_user_id, offer.product_id)
+    return offer
 
 
-def get_offer_by_id(offer_id: UUID) -> Offer:
+async def get_offer_by_id(offer_id: UUID) -> OfferRecord:
     """
     Retrieves an offer by its ID.
 
@@ -29,43 +71,253 @@ def get_offer_by_id(offer_id: UUID) -> Offer:
         offer_id (UUID): The ID of the offer.
 
     Returns:
-        Offer: The retrieved offer.
+        OfferRecord: The retrieved offer.
     """
-    return offer_repository.get_offer_by_id(offer_id)
+    return await repositories.offers.get_offer_by_id(offer_id)
 
 
-def update_offer(offer: Offer) -> Offer:
+async def update_offer(offer: OfferRecord, expected_versions: Optional[list[int]] = None,
+                       from_user_id: Optional[UUID] = None) -> OfferRecord:
     """
-    Updates an existing offer.
+    Updates a pending offer. Its status is not written; it only changes through ``update_offer_status``.
+    The updated offer is published as OFFER_CHANGED, and when it now asks for another product,
+    its want moves in the trade graph.
 
     Args:
-        offer (Offer): The offer to be updated.
+        offer (OfferRecord): The offer to be updated.
+        expected_versions (Optional[list[int]]): Only update if the offer is at one of these versions.
+        from_user_id (Optional[UUID]): Only update the offer if this user made it.
 
     Returns:
-        Offer: The updated offer.
+        OfferRecord: The updated offer.
+
+    Raises:
+        VersionConflictError: If the offer was modified since the client read it.
+        PermissionDeniedError: If another user made the offer.
+        ProductOwnershipError: If the users do not own the products the offer now names.
+        ValueError: If the offer is no longer pending.
+        NotFoundError: If the offer does not exist.
     """
-    return offer_repository.update_offer(offer)
+    (error,) = await _ownership_errors([offer])
+    if error:
+        raise ProductOwnershipError(error)
+    previous = await repositories.offers.get_offer_by_id(offer.id)
+    updated_offer = await repositories.offers.update_offer(offer, expected_versions, from_user_id)
+    await event_bus.publish(OFFER_CHANGED, updated_offer)
+    if previous is not None and (previous.to_user_id, previous.product_id) != (updated_offer.to_user_id,
+                                                                              updated_offer.product_id):
+        await trade_service.remove_want(previous.from_user_id, previous.product_id)
+        await trade_service.add_want(updated_offer.from_user_id, updated_offer.to_user_id, updated_offer.product_id)
+    return updated_offer
 
 
-def delete_offer(offer_id: UUID):
+async def delete_offer(offer_id: UUID, from_user_id: Optional[UUID] = None):
     """
-    Deletes an offer by its ID.
+    Deletes an offer by its ID. The offer, as it was last stored, is published as
+    OFFER_CHANGED so both parties hear of it, and a pending offer's want leaves the trade graph.
 
     Args:
         offer_id (UUID): The ID of the offer.
+        from_user_id (Optional[UUID]): Only delete the offer if this user made it.
+
+    Raises:
+        PermissionDeniedError: If another user made the offer.
+        NotFoundError: If the offer does not exist.
     """
-    return offer_repository.delete_offer(offer_id)
+    offer = await repositories.offers.get_offer_by_id(offer_id)
+    await repositories.offers.delete_offer(offer_id, from_user_id)
+    if offer is None:
+        return
+    await event_bus.publish(OFFER_CHANGED, offer)
+    if offer.status == OFFER_STATUS_PENDING:
+        await trade_service.remove_want(offer.from_user_id, offer.product_id)
 
 
-def update_offer_status(offer_id: UUID, status: str) -> Offer:
+async def update_offer_status(offer_id: UUID, status: str, to_user_id: Optional[UUID] = None) -> OfferRecord:
     """
-    Updates the status of an offer.
+    Updates the status of an offer. Accepting an offer rejects the other
+    pending offers for the same products; every offer that changed is published
+    as OFFER_CHANGED, so their senders are notified, and the trade graph follows.
 
     Args:
         offer_id (UUID): The ID of the offer.
         status (str): The new status of the offer.
+        to_user_id (Optional[UUID]): Only update the offer if it was made to this user.
+
+    Returns:
+        OfferRecord: The updated offer, or None if the offer does not exist.
+
+    Raises:
+        PermissionDeniedError: If the offer was made to another user.
+        ValueError: If the offer cannot move to the requested status.
+    """
+    result = await repositories.offers.update_offer_status(offer_id, status, to_user_id)
+    if result is None:
+        return None
+    offer, rejected_offers = result
+    await event_bus.publish(OFFER_CHANGED, offer)
+    for rejected_offer in rejected_offers:
+        await event_bus.publish(OFFER_CHANGED, rejected_offer)
+        await trade_service.remove_want(rejected_offer.from_user_id, rejected_offer.product_id)
+    if offer.status == OFFER_STATUS_ACCEPTED:
+        await trade_service.remove_products([offer.product_id, offer.offered_product_id])
+    elif offer.status == OFFER_STATUS_REJECTED:
+        await trade_service.remove_want(offer.from_user_id, offer.product_id)
+    return offer
+
+
+async def expire_offers(now: datetime, limit: int) -> int:
+    """
+    Expires one batch of pending offers whose expiry has passed, and takes their
+    wants out of the trade graph like a rejection would.
+
+    Args:
+        now (datetime): The sweep time.
+        limit (int): Maximum number of offers expired.
+
+    Returns:
+        int: The number of offers expired.
+    """
+    expired_offers = await repositories.offers.expire_pending_offers(now, limit)
+    for offer in expired_offers:
+        await event_bus.publish(OFFER_CHANGED, offer)
+        await trade_service.remove_want(offer.from_user_id, offer.product_id)
+    return len(expired_offers)
+
+
+async def get_inbox(user_id: UUID, status: Optional[str] = None, after: Optional[UUID] = None,
+                    limit: int = DEFAULT_PAGE_SIZE) -> OfferPage:
+    """
+    Retrieves one page of the offers a user has received, with product summaries and counts per status.
+
+    Args:
+        user_id (UUID): The ID of the receiving user.
+        status (Optional[str]): Only list offers in this status.
+        after (Optional[UUID]): The ID of the last offer of the previous page.
+        limit (int): Maximum number of offers to list.
+
+    Returns:
+        OfferPage: The received offers and the inbox counts.
+    """
+    return await repositories.offers.get_offer_page("to_user_id", user_id, status, after, limit)
+
+
+async def get_outbox(user_id: UUID, status: Optional[str] = None, after: Optional[UUID] = None,
+                     limit: int = DEFAULT_PAGE_SIZE) -> OfferPage:
+    """
+    Retrieves one page of the offers a user has sent, with product summaries and counts per status.
+
+    Args:
+        user_id (UUID): The ID of the sending user.
+        status (Optional[str]): Only list offers in this status.
+        after (Optional[UUID]): The ID of the last offer of the previous page.
+        limit (int): Maximum number of offers to list.
+
+    Returns:
+        OfferPage: The sent offers and the outbox counts.
+    """
+    return await repositories.offers.get_offer_page("from_user_id", user_id, status, after, limit)
+
+
+def stream_offers_to_user(user_id: UUID, status: Optional[str] = None, after: Optional[UUID] = None,
+                          limit: Optional[int] = None) -> AsyncIterator[OfferRecord]:
+    """
+    Streams the offers a user has received without loading them into memory.
+
+    Args:
+        user_id (UUID): The ID of the receiving user.
+        status (Optional[str]): Only stream offers in this status.
+        after (Optional[UUID]): The ID of the last offer already received.
+        limit (Optional[int]): Maximum number of offers to stream.
+
+    Returns:
+        AsyncIterator[OfferRecord]: The received offers.
+    """
+    return repositories.offers.iter_offers("to_user_id", user_id, status, after, limit)
+
+
+def stream_offers_from_user(user_id: UUID, status: Optional[str] = None, after: Optional[UUID] = None,
+                            limit: Optional[int] = None) -> AsyncIterator[OfferRecord]:
+    """
+    Streams the offers a user has sent without loading them into memory.
+
+    Args:
+        user_id (UUID): The ID of the sending user.
+        status (Optional[str]): Only stream offers in this status.
+        after (Optional[UUID]): The ID of the last offer already received.
+        limit (Optional[int]): Maximum number of offers to stream.
+
+    Returns:
+        AsyncIterator[OfferRecord]: The sent offers.
+    """
+    return repositories.offers.iter_offers("from_user_id", user_id, status, after, limit)
+
+
+async def stream_offer_events(user_id: UUID) -> AsyncIterator[bytes]:
+    """
+    Yields server-sent events for the offers a user sends or receives, as they change.
+
+    ``offer`` events carry the offer as JSON. An ``overflow`` event means the
+    client fell behind and some changes were dropped, so it should refetch its
+    inbox and outbox. Comment lines are heartbeats that keep proxies from
+    closing idle connections.
+
+    Args:
+        user_id (UUID): The ID of the subscribed user.
+
+    Yields:
+        bytes: Encoded server-sent events.
+    """
+    subscription = offer_notifications.subscribe(user_id)
+    try:
+        yield b"retry: 5000\n\n"
+        while True:
+            item = await subscription.get()
+            if item is HEARTBEAT:
+                yield b": heartbeat\n\n"
+            elif item is OVERFLOW:
+                yield b"event: overflow\ndata: {}\n\n"
+            else:
+                yield b"event: offer\ndata: " + json_bytes(item) + b"\n\n"
+    finally:
+        offer_notifications.unsubscribe(subscription)
+
+
+async def ingest_offers(items: list[dict], chunk_size: int = BULK_CHUNK_SIZE) -> list[BulkItemResult]:
+    """
+    Validates raw offer documents in one pass and inserts the valid ones in chunks. Like
+    ``create_offer``, every offer starts pending with server-set version and timestamps,
+    whatever the document says, and offers naming products their users do not own are refused.
+
+    The offers of each chunk are published as OFFER_CHANGED once it is
+    written, so their recipients are notified and the feed and trade graph
+    subscribers see them as they would offers created one by one.
+
+    Args:
+        items (list[dict]): The raw offers, as sent by the client or read from a file.
+        chunk_size (int): Maximum number of documents per insert_many call.
 
     Returns:
-        Offer: The updated offer.
+        list[BulkItemResult]: One result per item, in submission order.
     """
-    return offer_repository.update_offer_status(offer_id, status)
+    valid, results = validate_items(items, OfferCreate)
+    for chunk in chunked(valid, chunk_size):
+        offers = []
+        candidates = [(index, OfferRecord(**offer.model_dump())) for index, offer in chunk]
+        for (index, offer), error in zip(candidates, await _ownership_errors([offer for _, offer in candidates])):
+            if error:
+                results.append(BulkItemResult(index=index, id=None, error=error))
+            else:
+                offers.append((index, offer))
+        if not offers:
+            continue
+        errors = await repositories.offers.create_offers([offer for _, offer in offers], chunk_size)
+        results.extend(BulkItemResult(index=index, id=None if error else offer.id, error=error)
+                       for (index, offer), error in zip(offers, errors))
+        for (_, offer), error in zip(offers, errors):
+            if error is not None:
+                continue
+            await event_bus.publish(OFFER_CHANGED, offer)
+            await trade_service.add_want(offer.from_user_id, offer.to_user_id, offer.product_id)
+    results.sort(key=lambda result: result.index)
+    return results
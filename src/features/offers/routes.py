@@ -1,15 +1,31 @@
 # src/features/offers/routes.py
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from uuid import UUID
-from typing import Optional
-from src.core.entities.offer import Offer
-from src.features.offers.offer_service import create_offer, get_offer_by_id, update_offer, delete_offer, \
-    update_offer_status
+from typing import List, Optional
+from src.core.bulk import BulkResult, bulk_result
+from src.core.entities.offer import Offer, OfferPage, OfferRecord, ProductOwnershipError
+from src.core.repositories import NotFoundError
+from src.core.tokens import SCOPE_BULK, SCOPE_OFFERS, PermissionDeniedError, TokenClaims
+from src.core.versioning import VersionConflictError, etag, etag_matches, parse_etags
+from src.infrastructure.config import BULK_MAX_ITEMS
+from src.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NDJSON_MEDIA_TYPE, NEXT_CURSOR_HEADER, \
+    accepts_ndjson, decode_cursor, next_cursor
+from src.features.offers.offer_service import create_offer, get_offer_by_id, update_offer, \
+    delete_offer, update_offer_status, get_inbox, get_outbox, stream_offers_to_user, stream_offers_from_user, \
+    ingest_offers, stream_offer_events
+from src.features.auth.dependencies import ensure_among, ensure_self, require_scope
+from src.infrastructure.responses import EntityResponse, ndjson_lines, not_modified
 
 offers_router = APIRouter()
 
+authenticated = require_scope(SCOPE_OFFERS)
+
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+OFFER_CACHE_CONTROL = "private, no-cache"
+
 
 class OfferCreateRequest(BaseModel):
     product_id: UUID
@@ -24,96 +40,263 @@ class OfferUpdateRequest(BaseModel):
     from_user_id: UUID
     to_user_id: UUID
     offered_product_id: UUID
-    status: Optional[str]
 
 
 @offers_router.post("/", response_model=Offer)
-def create_offer_endpoint(offer_request: OfferCreateRequest):
+async def create_offer_endpoint(offer_request: OfferCreateRequest, claims: TokenClaims = Depends(authenticated)):
     """
-    Endpoint to create a new offer.
+    Endpoint to create a new offer, made by the authenticated user. The requested
+    product must belong to the recipient and the offered one to the sender, or 400 is answered.
 
     Args:
         offer_request (OfferCreateRequest): Request body containing offer details.
+        claims (TokenClaims): The caller's token claims.
 
     Returns:
         Offer: The created offer.
     """
-    offer = Offer(**offer_request.dict())
-    return create_offer(offer)
+    ensure_self(claims, offer_request.from_user_id)
+    try:
+        offer = await create_offer(OfferRecord(**offer_request.model_dump()))
+    except ProductOwnershipError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return EntityResponse(offer, headers={"ETag": etag(offer.version)})
+
+
+@offers_router.post("/bulk", response_model=BulkResult)
+async def create_offers_bulk_endpoint(items: List[dict] = Body(...),
+                                      claims: TokenClaims = Depends(require_scope(SCOPE_BULK))):
+    """
+    Endpoint to create many offers in one request.
+
+    Items are validated individually and the valid ones are written with
+    unordered insert_many calls, so one bad item does not fail the batch.
+    Items may be made by any user, so the token needs the ``bulk`` scope.
+
+    Args:
+        items (List[dict]): The offers to create.
+        claims (TokenClaims): The caller's token claims.
+
+    Returns:
+        BulkResult: Counts and one result per item, with the new ID or the error.
+    """
+    if len(items) > BULK_MAX_ITEMS:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            detail=f"At most {BULK_MAX_ITEMS} items per request")
+    return bulk_result(await ingest_offers(items))
+
+
+@offers_router.get("/stream")
+async def stream_offers_endpoint(user_id: UUID, claims: TokenClaims = Depends(authenticated)):
+    """
+    Endpoint to receive the offers a user sends or receives as server-sent events,
+    whenever they are created or change status.
+
+    Args:
+        user_id (UUID): The ID of the subscribed user, who must be the caller.
+        claims (TokenClaims): The caller's token claims.
+
+    Returns:
+        StreamingResponse: A text/event-stream of ``offer`` and ``overflow`` events.
+    """
+    ensure_self(claims, user_id)
+    return StreamingResponse(stream_offer_events(user_id), media_type=EVENT_STREAM_MEDIA_TYPE,
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
 
 @offers_router.get("/{offer_id}", response_model=Offer)
-def get_offer_endpoint(offer_id: UUID):
+async def get_offer_endpoint(offer_id: UUID, if_none_match: Optional[str] = Header(None),
+                             claims: TokenClaims = Depends(authenticated)):
     """
-    Endpoint to get an offer by its ID.
+    Endpoint to get an offer by its ID; only the two users it is between may.
+
+    The response carries the offer's version as a strong ETag; an unchanged
+    offer is answered with 304 to ``If-None-Match``. The caller is authorized
+    first, so a 304 never tells another user that the offer exists.
 
     Args:
         offer_id (UUID): The ID of the offer.
+        if_none_match (Optional[str]): ETags of the copies the client has.
+        claims (TokenClaims): The caller's token claims.
 
     Returns:
         Offer: The retrieved offer.
     """
-    offer = get_offer_by_id(offer_id)
+    offer = await get_offer_by_id(offer_id)
     if not offer:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Offer not found")
-    return offer
+    ensure_among(claims, (offer.from_user_id, offer.to_user_id))
+    if if_none_match and etag_matches(if_none_match, offer.version):
+        return not_modified(offer.version, OFFER_CACHE_CONTROL)
+    return EntityResponse(offer, headers={"ETag": etag(offer.version), "Cache-Control": OFFER_CACHE_CONTROL})
 
 
 @offers_router.put("/", response_model=Offer)
-def update_offer_endpoint(offer_request: OfferUpdateRequest):
+async def update_offer_endpoint(offer_request: OfferUpdateRequest, if_match: Optional[str] = Header(None),
+                                claims: TokenClaims = Depends(authenticated)):
     """
-    Endpoint to update an existing offer.
+    Endpoint to update a pending offer; only the user who made it may. The
+    status only changes through accept, reject and expiry, so closed offers
+    are answered with 409.
+
+    Sending the ETag of the offer as ``If-Match`` makes the update
+    conditional: it fails with 412 if the offer changed since it was read.
 
     Args:
         offer_request (OfferUpdateRequest): Request body containing updated offer details.
+        if_match (Optional[str]): ETags of the versions the update may replace.
+        claims (TokenClaims): The caller's token claims.
 
     Returns:
         Offer: The updated offer.
     """
-    offer = Offer(**offer_request.dict())
-    return update_offer(offer)
+    ensure_self(claims, offer_request.from_user_id)
+    try:
+        offer = await update_offer(OfferRecord(**offer_request.model_dump()),
+                                   parse_etags(if_match, weak=False) if if_match else None, claims.user_id)
+    except PermissionDeniedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except VersionConflictError as e:
+        raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail=str(e))
+    except NotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ProductOwnershipError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return EntityResponse(offer, headers={"ETag": etag(offer.version)})
 
 
 @offers_router.delete("/{offer_id}")
-def delete_offer_endpoint(offer_id: UUID):
+async def delete_offer_endpoint(offer_id: UUID, claims: TokenClaims = Depends(authenticated)):
     """
-    Endpoint to delete an offer by its ID.
+    Endpoint to delete an offer by its ID; only the user who made it may.
 
     Args:
         offer_id (UUID): The ID of the offer.
+        claims (TokenClaims): The caller's token claims.
 
     Returns:
         dict: Message indicating the result of the operation.
     """
-    delete_offer(offer_id)
+    try:
+        await delete_offer(offer_id, claims.user_id)
+    except PermissionDeniedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except NotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     return {"message": "Offer deleted successfully"}
 
 
 @offers_router.patch("/{offer_id}/accept", response_model=Offer)
-def accept_offer_endpoint(offer_id: UUID):
+async def accept_offer_endpoint(offer_id: UUID, claims: TokenClaims = Depends(authenticated)):
     """
-    Endpoint to accept an offer by its ID.
+    Endpoint to accept an offer by its ID; only the user it was made to may.
 
     Args:
         offer_id (UUID): The ID of the offer.
+        claims (TokenClaims): The caller's token claims.
 
     Returns:
         Offer: The updated offer with accepted status.
     """
-    offer = update_offer_status(offer_id, "accepted")
-    return offer
+    try:
+        offer = await update_offer_status(offer_id, "accepted", claims.user_id)
+    except PermissionDeniedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    if not offer:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Offer not found")
+    return EntityResponse(offer)
 
 
 @offers_router.patch("/{offer_id}/reject", response_model=Offer)
-def reject_offer_endpoint(offer_id: UUID):
+async def reject_offer_endpoint(offer_id: UUID, claims: TokenClaims = Depends(authenticated)):
     """
-    Endpoint to reject an offer by its ID.
+    Endpoint to reject an offer by its ID; only the user it was made to may.
 
     Args:
         offer_id (UUID): The ID of the offer.
+        claims (TokenClaims): The caller's token claims.
 
     Returns:
         Offer: The updated offer with rejected status.
     """
-    offer = update_offer_status(offer_id, "rejected")
-    return offer
+    try:
+        offer = await update_offer_status(offer_id, "rejected", claims.user_id)
+    except PermissionDeniedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    if not offer:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Offer not found")
+    return EntityResponse(offer)
+
+
+@offers_router.get("/inbox/{user_id}", response_model=OfferPage)
+async def get_inbox_endpoint(user_id: UUID,
+                             status_filter: Optional[str] = Query(None, alias="status"),
+                             limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+                             cursor: Optional[str] = None, accept: Optional[str] = Header(None),
+                             claims: TokenClaims = Depends(authenticated)):
+    """
+    Endpoint to list the offers a user has received, one page at a time.
+
+    Args:
+        user_id (UUID): The ID of the receiving user.
+        status_filter (Optional[str]): Only list offers in this status.
+        limit (Optional[int]): Page size, defaults to DEFAULT_PAGE_SIZE.
+        cursor (Optional[str]): Cursor returned with the previous page.
+        accept (Optional[str]): The Accept header; application/x-ndjson streams the listing.
+        claims (TokenClaims): The caller's token claims; users may only list their own offers.
+
+    Returns:
+        OfferPage: The received offers with both products summarized, and the inbox counts per status.
+    """
+    ensure_self(claims, user_id)
+    try:
+        after = decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if accepts_ndjson(accept):
+        return StreamingResponse(ndjson_lines(stream_offers_to_user(user_id, status_filter, after, limit)),
+                                 media_type=NDJSON_MEDIA_TYPE)
+    limit = limit or DEFAULT_PAGE_SIZE
+    page = await get_inbox(user_id, status_filter, after, limit)
+    cursor = next_cursor(page.items, limit)
+    return EntityResponse(page, headers={NEXT_CURSOR_HEADER: cursor} if cursor else None)
+
+
+@offers_router.get("/outbox/{user_id}", response_model=OfferPage)
+async def get_outbox_endpoint(user_id: UUID,
+                              status_filter: Optional[str] = Query(None, alias="status"),
+                              limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+                              cursor: Optional[str] = None, accept: Optional[str] = Header(None),
+                              claims: TokenClaims = Depends(authenticated)):
+    """
+    Endpoint to list the offers a user has sent, one page at a time.
+
+    Args:
+        user_id (UUID): The ID of the sending user.
+        status_filter (Optional[str]): Only list offers in this status.
+        limit (Optional[int]): Page size, defaults to DEFAULT_PAGE_SIZE.
+        cursor (Optional[str]): Cursor returned with the previous page.
+        accept (Optional[str]): The Accept header; application/x-ndjson streams the listing.
+        claims (TokenClaims): The caller's token claims; users may only list their own offers.
+
+    Returns:
+        OfferPage: The sent offers with both products summarized, and the outbox counts per status.
+    """
+    ensure_self(claims, user_id)
+    try:
+        after = decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if accepts_ndjson(accept):
+        return StreamingResponse(ndjson_lines(stream_offers_from_user(user_id, status_filter, after, limit)),
+                                 media_type=NDJSON_MEDIA_TYPE)
+    limit = limit or DEFAULT_PAGE_SIZE
+    page = await get_outbox(user_id, status_filter, after, limit)
+    cursor = next_cursor(page.items, limit)
+    return EntityResponse(page, headers={NEXT_CURSOR_HEADER: cursor} if cursor else None)
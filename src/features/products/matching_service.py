@@ -0,0 +1,74 @@
+# src/features/products/matching_service.py
+
+from src.core.entities.product import ProductRecord, ProductSummary
+from src.core.entities.user import UserRecord
+from src.core.interest_matching import InterestMatcher
+from src.infrastructure.container import repositories
+from uuid import UUID
+
+interest_matcher = InterestMatcher()
+
+
+def index_product(product: ProductRecord):
+    """
+    Adds or refreshes a product in the matching index.
+
+    Args:
+        product (ProductRecord): The product.
+    """
+    interest_matcher.set_product(product.id, product.owner_id, product.interests or [])
+
+
+def remove_product(product_id: UUID):
+    """
+    Removes a product from the matching index.
+
+    Args:
+        product_id (UUID): The ID of the product.
+    """
+    interest_matcher.remove_product(product_id)
+
+
+def index_user(user: UserRecord):
+    """
+    Refreshes a user's interests in the matching index. None is ignored, so the
+    result of a repository update can be passed as is.
+
+    Args:
+        user (UserRecord): The user.
+    """
+    if user is not None:
+        interest_matcher.set_user_interests(user.id, user.interests or [])
+
+
+async def warm_interest_matcher():
+    """
+    Loads every user's interests and every product's tags into the matching index.
+    The index belongs to this process and only follows writes made through it, so
+    the API must run as a single worker (see ``WORKERS`` in the config).
+    """
+    async for user_id, interests in repositories.users.iter_user_interests():
+        interest_matcher.set_user_interests(user_id, interests)
+    async for product in repositories.products.iter_products():
+        index_product(product)
+
+
+async def get_matches(user_id: UUID, k: int = 20) -> list[ProductSummary]:
+    """
+    Retrieves the products that are mutual matches for a user: the user wants the
+    product and its owner wants something the user owns.
+
+    Args:
+        user_id (UUID): The ID of the user.
+        k (int): Maximum number of matches.
+
+    Returns:
+        list[ProductSummary]: The matches, best first, with the match score.
+    """
+    matches = interest_matcher.matches(user_id, k)
+    if not matches:
+        return []
+    products = await repositories.products.get_products_by_ids([product_id for product_id, _ in matches])
+    scores = dict(matches)
+    return [ProductSummary(id=product.id, owner_id=product.owner_id, title=product.title, image_url=product.image_url,
+                           interests=product.interests, score=scores[product.id]) for product in products]
@@ -1,27 +1,36 @@
 # src/features/products/product_service.py
 
-from src.infrastructure.repositories.mongo_product_repository import MongoProductRepository
-from src.core.entities.product import Product
-from src.infrastructure.database import products_collection
+from src.core.bulk import BulkItemResult, validate_items
+from src.core.pagination import DEFAULT_PAGE_SIZE
+from src.features.products import matching_service
+from src.features.trades import trade_service
+from src.core.entities.product import Product, ProductRecord, ProductSummary
+from src.infrastructure.config import BULK_CHUNK_SIZE
+from src.infrastructure.container import repositories
+from src.infrastructure.events import PRODUCT_DELETED, PRODUCT_SAVED, event_bus
+from src.infrastructure.search.in_memory_product_search import InMemoryProductSearch
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
-product_repository = MongoProductRepository(products_collection)
 
-
-def create_product(product: Product) -> Product:
+async def create_product(product: ProductRecord) -> ProductRecord:
     """
     Creates a new product.
 
     Args:
-        product (Product): The product to be created.
+        product (ProductRecord): The product to be created.
 
     Returns:
-        Product: The created product.
+        ProductRecord: The created product.
     """
-    return product_repository.create_product(product)
+    product = await repositories.products.create_product(product)
+    await repositories.product_search.index_product(product)
+    matching_service.index_product(product)
+    await event_bus.publish(PRODUCT_SAVED, product)
+    return product
 
 
-def get_product_by_id(product_id: UUID) -> Product:
+async def get_product_by_id(product_id: UUID) -> ProductRecord:
     """
     Retrieves a product by its ID.
 
@@ -29,42 +38,164 @@ def get_product_by_id(product_id: UUID) -> Product:
         product_id (UUID): The ID of the product.
 
     Returns:
-        Product: The retrieved product.
+        ProductRecord: The retrieved product.
+    """
+    return await repositories.products.get_product_by_id(product_id)
+
+
+async def get_product_version(product_id: UUID) -> Optional[int]:
+    """
+    Retrieves only the current version of a product, for conditional requests.
+
+    Args:
+        product_id (UUID): The ID of the product.
+
+    Returns:
+        Optional[int]: The version, or None if the product does not exist.
     """
-    return product_repository.get_product_by_id(product_id)
+    return await repositories.products.get_product_version(product_id)
 
 
-def update_product(product: Product) -> Product:
+async def update_product(product: ProductRecord, expected_versions: Optional[list[int]] = None,
+                         owner_id: Optional[UUID] = None) -> ProductRecord:
     """
     Updates an existing product.
 
     Args:
-        product (Product): The product to be updated.
+        product (ProductRecord): The product to be updated.
+        expected_versions (Optional[list[int]]): Only update if the product is at one of these versions.
+        owner_id (Optional[UUID]): Only update the product if this user owns it.
 
     Returns:
-        Product: The updated product.
+        ProductRecord: The updated product.
+
+    Raises:
+        VersionConflictError: If the product was modified since the client read it.
+        PermissionDeniedError: If another user owns the product.
+        NotFoundError: If the product does not exist.
     """
-    return product_repository.update_product(product)
+    product = await repositories.products.update_product(product, expected_versions, owner_id)
+    await repositories.product_search.index_product(product)
+    matching_service.index_product(product)
+    await event_bus.publish(PRODUCT_SAVED, product)
+    return product
 
 
-def delete_product(product_id: UUID):
+async def delete_product(product_id: UUID, owner_id: Optional[UUID] = None):
     """
     Deletes a product by its ID.
 
     Args:
         product_id (UUID): The ID of the product.
+        owner_id (Optional[UUID]): Only delete the product if this user owns it.
+
+    Raises:
+        PermissionDeniedError: If another user owns the product.
+        NotFoundError: If the product does not exist.
+    """
+    result = await repositories.products.delete_product(product_id, owner_id)
+    await repositories.product_search.remove_product(product_id)
+    matching_service.remove_product(product_id)
+    await trade_service.remove_products([product_id])
+    await event_bus.publish(PRODUCT_DELETED, product_id)
+    return result
+
+
+async def get_products_by_owner_id(owner_id: UUID, after: Optional[UUID] = None,
+                                   limit: Optional[int] = None) -> list[ProductRecord]:
+    """
+    Retrieves one page of products by the owner's ID.
+
+    Args:
+        owner_id (UUID): The ID of the owner.
+        after (Optional[UUID]): The ID of the last product of the previous page.
+        limit (Optional[int]): Maximum number of products to return.
+
+    Returns:
+        list[ProductRecord]: List of products owned by the user.
+    """
+    return await repositories.products.get_products_by_owner_id(owner_id, after, limit)
+
+
+async def get_product_documents_by_owner_id(owner_id: UUID, after: Optional[UUID] = None,
+                                            limit: Optional[int] = None) -> list[dict]:
     """
-    return product_repository.delete_product(product_id)
+    Retrieves one page of an owner's products as documents, ready to be serialized as Products.
+
+    Args:
+        owner_id (UUID): The ID of the owner.
+        after (Optional[UUID]): The ID of the last product of the previous page.
+        limit (Optional[int]): Maximum number of products to return.
+
+    Returns:
+        list[dict]: The documents of the products owned by the user.
+    """
+    return await repositories.products.get_product_documents_by_owner_id(owner_id, after, limit)
 
 
-def get_products_by_owner_id(owner_id: UUID) -> list[Product]:
+def stream_products_by_owner_id(owner_id: UUID, after: Optional[UUID] = None,
+                                limit: Optional[int] = None) -> AsyncIterator[ProductRecord]:
     """
-    Retrieves all products by the owner's ID.
+    Streams products by the owner's ID without loading the listing into memory.
 
     Args:
         owner_id (UUID): The ID of the owner.
+        after (Optional[UUID]): The ID of the last product already received.
+        limit (Optional[int]): Maximum number of products to stream.
+
+    Returns:
+        AsyncIterator[ProductRecord]: The products owned by the user.
+    """
+    return repositories.products.iter_products_by_owner_id(owner_id, after, limit)
+
+
+async def ingest_products(items: list[dict], chunk_size: int = BULK_CHUNK_SIZE) -> list[BulkItemResult]:
+    """
+    Validates raw product documents in one pass and inserts the valid ones in chunks.
+
+    Args:
+        items (list[dict]): The raw products, as sent by the client or read from a file.
+        chunk_size (int): Maximum number of documents per insert_many call.
+
+    Returns:
+        list[BulkItemResult]: One result per item, in submission order.
+    """
+    valid, results = validate_items(items, Product)
+    products = [ProductRecord(**product.model_dump()) for _, product in valid]
+    errors = await repositories.products.create_products(products, chunk_size)
+    results.extend(BulkItemResult(index=index, id=None if error else product.id, error=error)
+                   for (index, _), product, error in zip(valid, products, errors))
+    for product, error in zip(products, errors):
+        if error is None:
+            await repositories.product_search.index_product(product)
+            matching_service.index_product(product)
+            await event_bus.publish(PRODUCT_SAVED, product)
+    results.sort(key=lambda result: result.index)
+    return results
+
+
+async def search_products(query: str, interest: Optional[str] = None, after: Optional[tuple[float, UUID]] = None,
+                          limit: int = DEFAULT_PAGE_SIZE) -> list[ProductSummary]:
+    """
+    Searches products by title, description and interests, most relevant first.
+
+    Args:
+        query (str): The search terms.
+        interest (Optional[str]): Only return products tagged with this interest.
+        after (Optional[tuple[float, UUID]]): Score and ID of the last result of the previous page.
+        limit (int): Maximum number of results.
 
     Returns:
-        list[Product]: List of products owned by the user.
+        list[ProductSummary]: The matching products.
+    """
+    return await repositories.product_search.search(query, interest, after, limit)
+
+
+async def warm_search_index():
+    """
+    Loads every stored product into the in-process search index. No-op for the MongoDB backend.
+    The in-process index misses products written by other workers; use it with a single worker.
     """
-    return product_repository.get_products_by_owner_id(owner_id)
+    if isinstance(repositories.product_search, InMemoryProductSearch):
+        await repositories.product_search.index_products(
+            [product async for product in repositories.products.iter_products()])
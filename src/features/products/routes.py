@@ -1,15 +1,31 @@
 # src/features/products/routes.py
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from uuid import UUID
 from typing import Optional, List
-from src.core.entities.product import Product
-from src.features.products.product_service import create_product, get_product_by_id, update_product, delete_product, \
-    get_products_by_owner_id
+from src.core.bulk import BulkResult, bulk_result
+from src.core.entities.product import Product, ProductRecord, ProductSummary
+from src.core.repositories import NotFoundError
+from src.core.tokens import SCOPE_BULK, SCOPE_PRODUCTS, PermissionDeniedError, TokenClaims
+from src.core.versioning import VersionConflictError, etag, etag_matches, parse_etags
+from src.infrastructure.config import BULK_MAX_ITEMS, PRODUCT_CACHE_MAX_AGE_SECONDS
+from src.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NDJSON_MEDIA_TYPE, NEXT_CURSOR_HEADER, \
+    accepts_ndjson, decode_cursor, decode_score_cursor, encode_cursor, encode_score_cursor
+from src.features.products.product_service import create_product, get_product_by_id, get_product_version, \
+    update_product, delete_product, get_product_documents_by_owner_id, \
+    stream_products_by_owner_id, ingest_products, search_products
+from src.features.products.matching_service import get_matches
+from src.features.auth.dependencies import ensure_self, require_scope
+from src.infrastructure.responses import EntityResponse, ndjson_lines, not_modified
 
 products_router = APIRouter()
 
+authenticated = require_scope(SCOPE_PRODUCTS)
+
+PRODUCT_CACHE_CONTROL = f"public, max-age={PRODUCT_CACHE_MAX_AGE_SECONDS}, must-revalidate"
+
 
 class ProductCreateRequest(BaseModel):
     owner_id: UUID
@@ -29,79 +45,207 @@ class ProductUpdateRequest(BaseModel):
 
 
 @products_router.post("/", response_model=Product)
-def create_product_endpoint(product_request: ProductCreateRequest):
+async def create_product_endpoint(product_request: ProductCreateRequest,
+                                  claims: TokenClaims = Depends(authenticated)):
     """
-    Endpoint to create a new product.
+    Endpoint to create a new product, owned by the authenticated user.
 
     Args:
         product_request (ProductCreateRequest): Request body containing product details.
+        claims (TokenClaims): The caller's token claims.
 
     Returns:
         Product: The created product.
     """
-    product = Product(**product_request.dict())
-    return create_product(product)
+    ensure_self(claims, product_request.owner_id)
+    product = await create_product(ProductRecord(**product_request.model_dump()))
+    return EntityResponse(product, headers={"ETag": etag(product.version)})
+
+
+@products_router.post("/bulk", response_model=BulkResult)
+async def create_products_bulk_endpoint(items: List[dict] = Body(...),
+                                        claims: TokenClaims = Depends(require_scope(SCOPE_BULK))):
+    """
+    Endpoint to create many products in one request.
+
+    Items are validated individually and the valid ones are written with
+    unordered insert_many calls, so one bad item does not fail the batch.
+    Items may be owned by any user, so the token needs the ``bulk`` scope.
+
+    Args:
+        items (List[dict]): The products to create.
+        claims (TokenClaims): The caller's token claims.
+
+    Returns:
+        BulkResult: Counts and one result per item, with the new ID or the error.
+    """
+    if len(items) > BULK_MAX_ITEMS:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            detail=f"At most {BULK_MAX_ITEMS} items per request")
+    return bulk_result(await ingest_products(items))
+
+
+@products_router.get("/search", response_model=List[ProductSummary])
+async def search_products_endpoint(q: str = Query(..., min_length=1), interest: Optional[str] = None,
+                                   limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+                                   cursor: Optional[str] = None):
+    """
+    Endpoint to search products by title, description and interests, most relevant first.
+
+    The next page is requested by passing the ``X-Next-Cursor`` response header
+    back as ``cursor``.
+
+    Args:
+        q (str): The search terms.
+        interest (Optional[str]): Only return products tagged with this interest.
+        limit (int): Page size.
+        cursor (Optional[str]): Cursor returned with the previous page.
+
+    Returns:
+        list[ProductSummary]: The matching products, without descriptions.
+    """
+    try:
+        after = decode_score_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    products = await search_products(q, interest, after, limit)
+    headers = {}
+    if len(products) == limit:
+        headers[NEXT_CURSOR_HEADER] = encode_score_cursor(products[-1].score, products[-1].id)
+    return EntityResponse(products, headers=headers)
+
+
+@products_router.get("/matches/{user_id}", response_model=List[ProductSummary])
+async def get_matches_endpoint(user_id: UUID, k: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+                               claims: TokenClaims = Depends(authenticated)):
+    """
+    Endpoint to get the products that are mutual matches for a user: products
+    carrying the user's interests whose owners are interested in what the user owns.
+
+    Args:
+        user_id (UUID): The ID of the user, who must be the caller.
+        k (int): Maximum number of matches.
+        claims (TokenClaims): The caller's token claims.
+
+    Returns:
+        list[ProductSummary]: The matches, best first; ``score`` is the match score.
+    """
+    ensure_self(claims, user_id)
+    return EntityResponse(await get_matches(user_id, k))
 
 
 @products_router.get("/{product_id}", response_model=Product)
-def get_product_endpoint(product_id: UUID):
+async def get_product_endpoint(product_id: UUID, if_none_match: Optional[str] = Header(None)):
     """
     Endpoint to get a product by its ID.
 
+    The response carries the product's version as a strong ETag. When the
+    client sends it back as ``If-None-Match`` and the product is unchanged, a
+    304 is answered after reading only the version.
+
     Args:
         product_id (UUID): The ID of the product.
+        if_none_match (Optional[str]): ETags of the copies the client has.
 
     Returns:
         Product: The retrieved product.
     """
-    product = get_product_by_id(product_id)
+    if if_none_match:
+        version = await get_product_version(product_id)
+        if version is not None and etag_matches(if_none_match, version):
+            return not_modified(version, PRODUCT_CACHE_CONTROL)
+    product = await get_product_by_id(product_id)
     if not product:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
-    return product
+    return EntityResponse(product, headers={"ETag": etag(product.version), "Cache-Control": PRODUCT_CACHE_CONTROL})
 
 
 @products_router.put("/", response_model=Product)
-def update_product_endpoint(product_request: ProductUpdateRequest):
+async def update_product_endpoint(product_request: ProductUpdateRequest, if_match: Optional[str] = Header(None),
+                                  claims: TokenClaims = Depends(authenticated)):
     """
-    Endpoint to update an existing product.
+    Endpoint to update an existing product; only its owner may.
+
+    Sending the ETag of the product as ``If-Match`` makes the update
+    conditional: it fails with 412 if the product changed since it was read.
 
     Args:
         product_request (ProductUpdateRequest): Request body containing updated product details.
+        if_match (Optional[str]): ETags of the versions the update may replace.
+        claims (TokenClaims): The caller's token claims.
 
     Returns:
         Product: The updated product.
     """
-    product = Product(**product_request.dict())
-    return update_product(product)
+    ensure_self(claims, product_request.owner_id)
+    try:
+        product = await update_product(ProductRecord(**product_request.model_dump()),
+                                       parse_etags(if_match, weak=False) if if_match else None, claims.user_id)
+    except PermissionDeniedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except VersionConflictError as e:
+        raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail=str(e))
+    except NotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    return EntityResponse(product, headers={"ETag": etag(product.version)})
 
 
 @products_router.delete("/{product_id}")
-def delete_product_endpoint(product_id: UUID):
+async def delete_product_endpoint(product_id: UUID, claims: TokenClaims = Depends(authenticated)):
     """
-    Endpoint to delete a product by its ID.
+    Endpoint to delete a product by its ID; only its owner may.
 
     Args:
         product_id (UUID): The ID of the product.
+        claims (TokenClaims): The caller's token claims.
 
     Returns:
         dict: Message indicating the result of the operation.
     """
-    delete_product(product_id)
+    try:
+        await delete_product(product_id, claims.user_id)
+    except PermissionDeniedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except NotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     return {"message": "Product deleted successfully"}
 
 
 @products_router.get("/owner/{owner_id}", response_model=List[Product])
-def get_products_by_owner_id_endpoint(owner_id: UUID):
+async def get_products_by_owner_id_endpoint(owner_id: UUID,
+                                            limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+                                            cursor: Optional[str] = None,
+                                            accept: Optional[str] = Header(None)):
     """
-    Endpoint to get all products by the owner's ID.
+    Endpoint to get the products of an owner, one page at a time.
+
+    The next page is requested by passing the ``X-Next-Cursor`` response header
+    back as ``cursor``. Clients sending ``Accept: application/x-ndjson`` get the
+    listing streamed one product per line instead, unpaged unless ``limit`` is set.
+    Pages are serialized straight from the decoded documents, without building
+    a Product for each of them.
 
     Args:
         owner_id (UUID): The ID of the owner.
+        limit (Optional[int]): Page size, defaults to DEFAULT_PAGE_SIZE.
+        cursor (Optional[str]): Cursor returned with the previous page.
+        accept (Optional[str]): The Accept header.
 
     Returns:
         list[Product]: List of products owned by the user.
     """
-    products = get_products_by_owner_id(owner_id)
-    if not products:
+    try:
+        after = decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if accepts_ndjson(accept):
+        return StreamingResponse(ndjson_lines(stream_products_by_owner_id(owner_id, after, limit)),
+                                 media_type=NDJSON_MEDIA_TYPE)
+    limit = limit or DEFAULT_PAGE_SIZE
+    products = await get_product_documents_by_owner_id(owner_id, after, limit)
+    if not products and after is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No products found for this user")
-    return products
+    headers = {}
+    if len(products) == limit:
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(products[-1]["id"])
+    return EntityResponse(products, headers=headers)
@@ -1,37 +1,47 @@
 # src/features/profile/profile_service.py
+from typing import Optional
 from uuid import UUID
 
-from src.infrastructure.repositories.mongo_user_repository import MongoUserRepository
-from src.core.entities.user import User
-from src.infrastructure.database import users_collection
-from bson import ObjectId, Binary, UuidRepresentation
+from src.core.entities.user import UserRecord
+from src.core.interest_matching import normalize_tags
+from src.features.products import matching_service
+from src.infrastructure.container import repositories
 
-user_repository = MongoUserRepository(users_collection)
 
+async def update_interests(user_id: UUID, interests: list[str]) -> UserRecord:
+    user = await repositories.users.patch_user(user_id, {"interests": normalize_tags(interests)})
+    matching_service.index_user(user)
+    return user
 
-def update_interests(user_id: UUID, interests: list[str]) -> User:
-    user = user_repository.collection.find_one(
-        {"id": Binary.from_uuid(user_id, uuid_representation=UuidRepresentation.STANDARD)})
-    if not user:
-        return None
 
-    user["interests"] = interests
-    updated_user = User(**user)
-    return user_repository.update_user(updated_user)
+async def update_profile_picture(user_id: UUID, profile_picture_url: str) -> UserRecord:
+    return await repositories.users.patch_user(user_id, {"profile_picture": profile_picture_url})
 
 
-def update_profile_picture(user_id: UUID, profile_picture_url: str) -> User:
-    user = user_repository.collection.find_one(
-        {"id": Binary.from_uuid(user_id, uuid_representation=UuidRepresentation.STANDARD)})
-    if not user:
-        return None
-    user["profile_picture"] = profile_picture_url
-    updated_user = User(**user)
-    return user_repository.update_user(updated_user)
+async def update_user_info(user: UserRecord) -> UserRecord:
+    user.interests = normalize_tags(user.interests)
+    updated_user = await repositories.users.update_user(user)
+    matching_service.index_user(updated_user)
+    return updated_user
 
 
-def update_user_info(user: User) -> User:
-    existing_user = user_repository.get_user_by_email(user.email)
-    if not existing_user:
-        return None
-    return user_repository.update_user(user)
+async def add_interests(user_id: UUID, interests: list[str]) -> UserRecord:
+    user = await repositories.users.patch_user(user_id, add_interests=normalize_tags(interests))
+    matching_service.index_user(user)
+    return user
+
+
+async def remove_interests(user_id: UUID, interests: list[str]) -> UserRecord:
+    user = await repositories.users.patch_user(user_id, remove_interests=normalize_tags(interests))
+    matching_service.index_user(user)
+    return user
+
+
+async def patch_user(user_id: UUID, fields: dict, add_interests: Optional[list[str]] = None,
+                     remove_interests: Optional[list[str]] = None) -> UserRecord:
+    if fields.get("interests") is not None:
+        fields = {**fields, "interests": normalize_tags(fields["interests"])}
+    user = await repositories.users.patch_user(user_id, fields, normalize_tags(add_interests) or None,
+                                               normalize_tags(remove_interests) or None)
+    matching_service.index_user(user)
+    return user
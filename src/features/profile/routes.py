@@ -1,14 +1,20 @@
 # src/features/profile/routes.py
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, EmailStr
 from typing import List, Optional
-from src.core.entities.user import User
-from src.features.profile.profile_service import update_interests, update_profile_picture, update_user_info
+from src.core.entities.user import UserProfile, UserRecord
+from src.core.tokens import SCOPE_PROFILE, TokenClaims
+from src.features.auth.dependencies import ensure_self, require_scope
+from src.features.profile.profile_service import update_interests, update_profile_picture, update_user_info, \
+    add_interests, remove_interests, patch_user
+from src.infrastructure.passwords import password_hasher
 
 profile_router = APIRouter()
 
+authenticated = require_scope(SCOPE_PROFILE)
+
 
 class InterestsUpdateRequest(BaseModel):
     interests: List[str]
@@ -18,35 +24,89 @@ class ProfilePictureUpdateRequest(BaseModel):
     profile_picture_url: str
 
 
+class UserPatchRequest(BaseModel):
+    username: Optional[str] = None
+    email: Optional[EmailStr] = None
+    profile_picture: Optional[str] = None
+    interests: Optional[List[str]] = None
+    add_interests: Optional[List[str]] = None
+    remove_interests: Optional[List[str]] = None
+
+
 class UserUpdateRequest(BaseModel):
     id: UUID
     username: str
     email: EmailStr
-    hashed_password: str
+    password: str
     interests: Optional[List[str]] = []
     profile_picture: Optional[str] = None
 
 
-@profile_router.put("/update_interests/{user_id}", response_model=User)
-def update_user_interests(user_id: UUID, interests_update_request: InterestsUpdateRequest):
-    updated_user = update_interests(user_id, interests_update_request.interests)
+@profile_router.put("/update_interests/{user_id}", response_model=UserProfile)
+async def update_user_interests(user_id: UUID, interests_update_request: InterestsUpdateRequest,
+                                claims: TokenClaims = Depends(authenticated)):
+    ensure_self(claims, user_id)
+    updated_user = await update_interests(user_id, interests_update_request.interests)
+    if not updated_user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return updated_user
+
+
+@profile_router.put("/update_profile_picture/{user_id}", response_model=UserProfile)
+async def update_user_profile_picture(user_id: UUID, profile_picture_update_request: ProfilePictureUpdateRequest,
+                                      claims: TokenClaims = Depends(authenticated)):
+    ensure_self(claims, user_id)
+    updated_user = await update_profile_picture(user_id, profile_picture_update_request.profile_picture_url)
+    if not updated_user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return updated_user
+
+
+@profile_router.put("/update_user", response_model=UserProfile)
+async def update_user(user_update_request: UserUpdateRequest, claims: TokenClaims = Depends(authenticated)):
+    ensure_self(claims, user_update_request.id)
+    updated_user = UserRecord(**user_update_request.model_dump(exclude={"password"}),
+                              hashed_password=await password_hasher.hash(user_update_request.password))
+    try:
+        updated_user = await update_user_info(updated_user)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if not updated_user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return updated_user
+
+
+@profile_router.post("/{user_id}/interests", response_model=UserProfile)
+async def add_user_interests(user_id: UUID, interests_update_request: InterestsUpdateRequest,
+                             claims: TokenClaims = Depends(authenticated)):
+    ensure_self(claims, user_id)
+    updated_user = await add_interests(user_id, interests_update_request.interests)
     if not updated_user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     return updated_user
 
 
-@profile_router.put("/update_profile_picture/{user_id}", response_model=User)
-def update_user_profile_picture(user_id: UUID, profile_picture_update_request: ProfilePictureUpdateRequest):
-    updated_user = update_profile_picture(user_id, profile_picture_update_request.profile_picture_url)
+@profile_router.delete("/{user_id}/interests/{interest}", response_model=UserProfile)
+async def remove_user_interest(user_id: UUID, interest: str, claims: TokenClaims = Depends(authenticated)):
+    ensure_self(claims, user_id)
+    updated_user = await remove_interests(user_id, [interest])
     if not updated_user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     return updated_user
 
 
-@profile_router.put("/update_user", response_model=User)
-def update_user(user_update_request: UserUpdateRequest):
-    updated_user = User(**user_update_request.dict())
-    updated_user = update_user_info(updated_user)
+@profile_router.patch("/{user_id}", response_model=UserProfile)
+async def patch_user_profile(user_id: UUID, user_patch_request: UserPatchRequest,
+                             claims: TokenClaims = Depends(authenticated)):
+    ensure_self(claims, user_id)
+    fields = user_patch_request.model_dump(exclude_unset=True, exclude={"add_interests", "remove_interests"})
+    # Only the profile picture may be cleared; null for any other field means "leave unchanged".
+    fields = {name: value for name, value in fields.items() if value is not None or name == "profile_picture"}
+    try:
+        updated_user = await patch_user(user_id, fields, user_patch_request.add_interests,
+                                        user_patch_request.remove_interests)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     if not updated_user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     return updated_user
@@ -0,0 +1,110 @@
+# src/features/trades/routes.py
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from uuid import UUID
+from typing import List, Optional
+from src.core.entities.trade import TradeCycle
+from src.core.tokens import SCOPE_TRADES, TokenClaims
+from src.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, decode_cursor, next_cursor
+from src.features.trades.trade_service import get_trade_by_id, get_trades_for_user, accept_trade, reject_trade
+from src.features.auth.dependencies import ensure_among, ensure_self, require_scope
+
+trades_router = APIRouter()
+
+authenticated = require_scope(SCOPE_TRADES)
+
+
+@trades_router.get("/user/{user_id}", response_model=List[TradeCycle])
+async def get_trades_for_user_endpoint(user_id: UUID, response: Response,
+                                       status_filter: Optional[str] = Query(None, alias="status"),
+                                       limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+                                       cursor: Optional[str] = None,
+                                       claims: TokenClaims = Depends(authenticated)):
+    """
+    Endpoint to list the multi-party trades proposed to a user, one page at a time.
+
+    Args:
+        user_id (UUID): The ID of the participant.
+        status_filter (Optional[str]): Only list trades in this status.
+        limit (int): Page size.
+        cursor (Optional[str]): Cursor returned with the previous page.
+        claims (TokenClaims): The caller's token claims; users may only list their own trades.
+
+    Returns:
+        list[TradeCycle]: The trades.
+    """
+    ensure_self(claims, user_id)
+    try:
+        after = decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    trades = await get_trades_for_user(user_id, status_filter, after, limit)
+    cursor = next_cursor(trades, limit)
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
+    return trades
+
+
+@trades_router.get("/{trade_id}", response_model=TradeCycle)
+async def get_trade_endpoint(trade_id: UUID, claims: TokenClaims = Depends(authenticated)):
+    """
+    Endpoint to get a trade by its ID; only its participants may.
+
+    Args:
+        trade_id (UUID): The ID of the trade.
+        claims (TokenClaims): The caller's token claims.
+
+    Returns:
+        TradeCycle: The trade.
+    """
+    trade = await get_trade_by_id(trade_id)
+    if not trade:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Trade not found")
+    ensure_among(claims, trade.participants)
+    return trade
+
+
+@trades_router.patch("/{trade_id}/accept", response_model=TradeCycle)
+async def accept_trade_endpoint(trade_id: UUID, user_id: UUID, claims: TokenClaims = Depends(authenticated)):
+    """
+    Endpoint to accept a trade on behalf of one of its participants.
+
+    Args:
+        trade_id (UUID): The ID of the trade.
+        user_id (UUID): The accepting participant, who must be the caller.
+        claims (TokenClaims): The caller's token claims.
+
+    Returns:
+        TradeCycle: The updated trade; its status becomes accepted once every participant accepted.
+    """
+    ensure_self(claims, user_id)
+    try:
+        trade = await accept_trade(trade_id, user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    if not trade:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Trade not found")
+    return trade
+
+
+@trades_router.patch("/{trade_id}/reject", response_model=TradeCycle)
+async def reject_trade_endpoint(trade_id: UUID, user_id: UUID, claims: TokenClaims = Depends(authenticated)):
+    """
+    Endpoint to reject a trade on behalf of one of its participants.
+
+    Args:
+        trade_id (UUID): The ID of the trade.
+        user_id (UUID): The rejecting participant, who must be the caller.
+        claims (TokenClaims): The caller's token claims.
+
+    Returns:
+        TradeCycle: The updated trade with rejected status.
+    """
+    ensure_self(claims, user_id)
+    try:
+        trade = await reject_trade(trade_id, user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    if not trade:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Trade not found")
+    return trade
@@ -0,0 +1,155 @@
+# src/features/trades/trade_service.py
+
+from src.core.entities.offer import OFFER_STATUS_PENDING
+from src.core.entities.trade import TradeCycle, TradeLeg, TRADE_STATUS_ACCEPTED
+from src.core.trade_graph import TradeGraph
+from src.infrastructure.config import TRADE_MAX_CYCLE_LENGTH, TRADE_MAX_PROPOSALS_PER_WANT, TRADE_MIN_CYCLE_LENGTH
+from src.infrastructure.container import repositories
+from src.infrastructure.events import OFFER_CHANGED, event_bus
+from typing import Optional
+from uuid import UUID
+
+# Only pending offers add wants. Interest matches are not edges: every user would want every product sharing
+# a tag with their interests, making the graph dense, and a proposal built on an interest overlap would not be
+# something the participants asked for. GET /products/matches/{user_id} serves those instead.
+trade_graph = TradeGraph()
+
+
+def _cycle_key(participants: list[UUID]) -> str:
+    start = participants.index(min(participants, key=str))
+    return "-".join(str(user_id) for user_id in participants[start:] + participants[:start])
+
+
+def _trade_from_cycle(cycle: list[UUID]) -> TradeCycle:
+    legs = [TradeLeg(from_user_id=leg.giver, to_user_id=leg.receiver, product_id=leg.product)
+            for leg in trade_graph.legs(cycle)]
+    return TradeCycle(key=_cycle_key(cycle), legs=legs, participants=cycle,
+                      product_ids=[leg.product_id for leg in legs])
+
+
+async def add_want(wanter_id: UUID, owner_id: UUID, product_id: UUID) -> list[TradeCycle]:
+    """
+    Adds a want to the trade graph and proposes the trade cycles it closes.
+
+    Args:
+        wanter_id (UUID): The user who wants the product.
+        owner_id (UUID): The owner of the product.
+        product_id (UUID): The wanted product.
+
+    Returns:
+        list[TradeCycle]: The newly proposed trades.
+    """
+    if not trade_graph.add_want(wanter_id, owner_id, product_id):
+        return []
+    cycles = trade_graph.cycles_through(wanter_id, owner_id, TRADE_MIN_CYCLE_LENGTH, TRADE_MAX_CYCLE_LENGTH,
+                                        limit=TRADE_MAX_PROPOSALS_PER_WANT)
+    return await repositories.trades.create_trades([_trade_from_cycle(cycle) for cycle in cycles])
+
+
+async def remove_want(wanter_id: UUID, product_id: UUID):
+    """
+    Removes a want from the trade graph and, once no pending offer expresses it any more,
+    cancels the proposals relying on it.
+
+    Args:
+        wanter_id (UUID): The user who no longer wants the product.
+        product_id (UUID): The product.
+    """
+    if trade_graph.remove_want(wanter_id, product_id):
+        await repositories.trades.cancel_trades_with_leg(wanter_id, product_id)
+
+
+async def remove_products(product_ids: list[UUID], except_trade_id: Optional[UUID] = None):
+    """
+    Removes traded or deleted products from the trade graph and cancels the proposals involving them.
+
+    Args:
+        product_ids (list[UUID]): The products that are no longer available.
+        except_trade_id (Optional[UUID]): A trade to leave untouched, e.g. the one that traded them.
+    """
+    for product_id in product_ids:
+        trade_graph.remove_product(product_id)
+    await repositories.trades.cancel_trades_with_products(product_ids, except_trade_id)
+
+
+async def warm_trade_graph():
+    """
+    Loads the wants of every pending offer into the trade graph. Cycles that already
+    exist are not proposed again; only wants added afterwards create proposals.
+    Like the interest matcher, the graph is per process and assumes a single worker.
+    """
+    async for offer in repositories.offers.iter_offers_by_status(OFFER_STATUS_PENDING):
+        trade_graph.add_want(offer.from_user_id, offer.to_user_id, offer.product_id)
+
+
+async def get_trade_by_id(trade_id: UUID) -> TradeCycle:
+    """
+    Retrieves a trade proposal by its ID.
+
+    Args:
+        trade_id (UUID): The ID of the trade.
+
+    Returns:
+        TradeCycle: The trade.
+    """
+    return await repositories.trades.get_trade_by_id(trade_id)
+
+
+async def get_trades_for_user(user_id: UUID, status: Optional[str] = None, after: Optional[UUID] = None,
+                              limit: Optional[int] = None) -> list[TradeCycle]:
+    """
+    Retrieves one page of the trades a user takes part in.
+
+    Args:
+        user_id (UUID): The ID of the participant.
+        status (Optional[str]): Only return trades in this status.
+        after (Optional[UUID]): The ID of the last trade of the previous page.
+        limit (Optional[int]): Maximum number of trades to return.
+
+    Returns:
+        list[TradeCycle]: The trades.
+    """
+    return await repositories.trades.get_trades_for_user(user_id, status, after, limit)
+
+
+async def accept_trade(trade_id: UUID, user_id: UUID) -> TradeCycle:
+    """
+    Accepts a trade on behalf of a participant. Once everyone has accepted, the
+    traded products leave the graph, competing proposals are cancelled and the
+    pending offers involving the traded products are rejected, as accepting an
+    offer does.
+
+    Args:
+        trade_id (UUID): The ID of the trade.
+        user_id (UUID): The accepting participant.
+
+    Returns:
+        TradeCycle: The updated trade, or None if the trade does not exist.
+
+    Raises:
+        ValueError: If the user is not a participant or the trade is no longer proposed.
+    """
+    trade = await repositories.trades.accept_trade(trade_id, user_id)
+    if trade and trade.status == TRADE_STATUS_ACCEPTED:
+        await remove_products(trade.product_ids, except_trade_id=trade.id)
+        for offer in await repositories.offers.reject_offers_for_products(trade.product_ids):
+            await event_bus.publish(OFFER_CHANGED, offer)
+            await remove_want(offer.from_user_id, offer.product_id)
+    return trade
+
+
+async def reject_trade(trade_id: UUID, user_id: UUID) -> TradeCycle:
+    """
+    Rejects a trade on behalf of a participant.
+
+    Args:
+        trade_id (UUID): The ID of the trade.
+        user_id (UUID): The rejecting participant.
+
+    Returns:
+        TradeCycle: The updated trade, or None if the trade does not exist.
+
+    Raises:
+        ValueError: If the user is not a participant or the trade is no longer proposed.
+    """
+    return await repositories.trades.reject_trade(trade_id, user_id)
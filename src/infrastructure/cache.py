@@ -0,0 +1,223 @@
+# src/infrastructure/cache.py
+
+import asyncio
+import copy
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from typing import Any, Awaitable, Callable, Hashable, Optional, Protocol
+
+from src.infrastructure.config import CACHE_MAX_SIZE, CACHE_TTL_SECONDS
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how a cache has been used."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    coalesced: int = 0
+
+
+class Cache(Protocol):
+    """
+    Interface the caching repositories rely on; any backend providing it can be plugged in.
+
+    Callers change the records they read, so a backend must not hand out the stored value itself.
+    """
+
+    stats: CacheStats
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        ...
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        ...
+
+    def set(self, key: Hashable, value: Any):
+        ...
+
+    def invalidate(self, key: Hashable):
+        ...
+
+    def invalidate_where(self, predicate: Callable[[Any], bool]):
+        ...
+
+
+def copy_record(record: Any) -> Any:
+    """
+    Copies a record dataclass and its list fields.
+
+    Args:
+        record (Any): The record.
+
+    Returns:
+        Any: A copy that can be changed without changing the record.
+    """
+    duplicate = copy.copy(record)
+    for record_field in fields(record):
+        value = getattr(record, record_field.name)
+        if isinstance(value, list):
+            setattr(duplicate, record_field.name, list(value))
+    return duplicate
+
+
+class LRUCache:
+    """
+    Bounded in-process LRU cache with a per-entry TTL and single-flight loading.
+
+    Concurrent misses on the same key share one call to the loader, so a hot
+    entry expiring cannot send a burst of identical queries to the database.
+
+    Values are held by reference. Give a ``copy`` function for mutable values:
+    the cache then stores a copy and hands out copies, so a caller changing
+    what it was given cannot change the cached entry or another caller's value.
+    """
+
+    def __init__(self, max_size: int = CACHE_MAX_SIZE, ttl: float = CACHE_TTL_SECONDS,
+                 clock: Callable[[], float] = time.monotonic, copy: Optional[Callable[[Any], Any]] = None):
+        """
+        Initializes the LRUCache instance.
+
+        Args:
+            max_size (int): Maximum number of entries kept before the least recently used is evicted.
+            ttl (float): Seconds an entry stays valid after it was stored.
+            clock (Callable[[], float]): Monotonic time source, injectable for tests.
+            copy (Optional[Callable[[Any], Any]]): Copies a value on the way in and out; None to share values.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.copy = copy
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _detach(self, value: Any) -> Any:
+        return value if self.copy is None or value is None else self.copy(value)
+
+    def _lookup(self, key: Hashable) -> tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self._entries[key]
+            self.stats.expirations += 1
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the cached value for a key, or None if it is absent or expired.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            Optional[Any]: The cached value.
+        """
+        found, value = self._lookup(key)
+        if found:
+            self.stats.hits += 1
+            return self._detach(value)
+        self.stats.misses += 1
+        return None
+
+    def set(self, key: Hashable, value: Any):
+        """
+        Stores a value, evicting least recently used entries beyond ``max_size``.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to store.
+        """
+        self._entries[key] = (self.clock() + self.ttl, self._detach(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: Hashable):
+        """
+        Drops a key, including any load in flight for it, so a stale read is never stored.
+
+        Args:
+            key (Hashable): The cache key.
+        """
+        self._entries.pop(key, None)
+        self._inflight.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Any], bool]):
+        """
+        Drops every entry whose value matches a predicate, for writes that touch
+        entities the caller cannot list by key.
+
+        Args:
+            predicate (Callable[[Any], bool]): Returns True for values to drop.
+        """
+        for key in [key for key, (_, value) in self._entries.items() if predicate(value)]:
+            del self._entries[key]
+        self._inflight.clear()
+
+    def clear(self):
+        """Drops every entry."""
+        self._entries.clear()
+        self._inflight.clear()
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Returns the cached value for a key, calling ``loader`` once on a miss.
+
+        A None result is returned but not cached, so lookups of missing
+        entities always reach the database.
+
+        Args:
+            key (Hashable): The cache key.
+            loader (Callable[[], Awaitable[Any]]): Coroutine function fetching the value.
+
+        Returns:
+            Any: The cached or freshly loaded value.
+        """
+        found, value = self._lookup(key)
+        if found:
+            self.stats.hits += 1
+            return self._detach(value)
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.stats.coalesced += 1
+            return self._detach(await asyncio.shield(pending))
+
+        self.stats.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except BaseException as e:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark the exception as retrieved in case nobody else was waiting on it.
+                future.exception()
+            raise
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+            if value is not None:
+                self.set(key, value)
+        future.set_result(value)
+        return value
+
+
+product_cache = LRUCache(copy=copy_record)
+offer_cache = LRUCache(copy=copy_record)
+user_cache = LRUCache(copy=copy_record)
+conversation_cache = LRUCache()
@@ -0,0 +1,119 @@
+# src/infrastructure/config.py
+
+import os
+from typing import Optional
+
+
+def _optional_int(name: str) -> Optional[int]:
+    value = os.getenv(name, "")
+    return int(value) if value else None
+
+
+# Storage backend (src/infrastructure/container.py): "mongo" or "sqlite", an embedded database file for
+# single-node deployments and CI that need no MongoDB server.
+STORAGE_BACKEND = os.getenv("BARTER_STORAGE_BACKEND", "mongo")
+
+# MongoDB client (src/infrastructure/database.py), created in the application lifespan. Unset optional values
+# keep the driver defaults; options given in the URI take precedence over the defaults below.
+MONGO_URI = os.getenv("BARTER_MONGO_URI", "mongodb://localhost:27017/")
+MONGO_DATABASE = os.getenv("BARTER_MONGO_DATABASE", "barter_app")
+MONGO_MIN_POOL_SIZE = int(os.getenv("BARTER_MONGO_MIN_POOL_SIZE", "0"))
+MONGO_MAX_POOL_SIZE = int(os.getenv("BARTER_MONGO_MAX_POOL_SIZE", "100"))
+MONGO_MAX_IDLE_TIME_MS = _optional_int("BARTER_MONGO_MAX_IDLE_TIME_MS")
+MONGO_CONNECT_TIMEOUT_MS = int(os.getenv("BARTER_MONGO_CONNECT_TIMEOUT_MS", "20000"))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("BARTER_MONGO_SERVER_SELECTION_TIMEOUT_MS", "30000"))
+MONGO_SOCKET_TIMEOUT_MS = _optional_int("BARTER_MONGO_SOCKET_TIMEOUT_MS")
+MONGO_WAIT_QUEUE_TIMEOUT_MS = _optional_int("BARTER_MONGO_WAIT_QUEUE_TIMEOUT_MS")
+# Write concern: "majority" or a number of members for w, whether to wait for the journal, and how long to wait.
+MONGO_WRITE_CONCERN = os.getenv("BARTER_MONGO_WRITE_CONCERN", "")
+MONGO_JOURNAL = os.getenv("BARTER_MONGO_JOURNAL", "")
+MONGO_WRITE_TIMEOUT_MS = _optional_int("BARTER_MONGO_WRITE_TIMEOUT_MS")
+# primary, primaryPreferred, secondary, secondaryPreferred or nearest.
+MONGO_READ_PREFERENCE = os.getenv("BARTER_MONGO_READ_PREFERENCE", "primary")
+# Comma-separated wire compressors in order of preference, e.g. "zstd,snappy,zlib" (zstd and snappy need
+# the zstandard and python-snappy packages).
+MONGO_COMPRESSORS = os.getenv("BARTER_MONGO_COMPRESSORS", "")
+
+# SQLite storage (src/infrastructure/sqlite_database.py), opened in the application lifespan in WAL mode.
+# Statements run on a pool of threads that each hold their own connection; ":memory:" uses a single one.
+SQLITE_PATH = os.getenv("BARTER_SQLITE_PATH", "barter_app.db")
+SQLITE_POOL_SIZE = int(os.getenv("BARTER_SQLITE_POOL_SIZE", "4"))
+# How long a write waits for the lock held by another connection, and prepared statements kept per connection.
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("BARTER_SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_STATEMENT_CACHE_SIZE = int(os.getenv("BARTER_SQLITE_STATEMENT_CACHE_SIZE", "256"))
+# NORMAL only syncs at WAL checkpoints (a power loss may drop the last commits); FULL syncs every commit.
+SQLITE_SYNCHRONOUS = os.getenv("BARTER_SQLITE_SYNCHRONOUS", "NORMAL")
+
+# Password hashing (src/core/passwords.py): scrypt cost parameters for new hashes (n * r * 128 bytes of memory
+# per hash), run on a pool of worker processes (default: one per CPU); at most PASSWORD_HASH_MAX_PENDING hashes
+# are queued or running at once, further logins and registrations wait for a slot.
+PASSWORD_SCRYPT_N = int(os.getenv("BARTER_PASSWORD_SCRYPT_N", str(2 ** 14)))
+PASSWORD_SCRYPT_R = int(os.getenv("BARTER_PASSWORD_SCRYPT_R", "8"))
+PASSWORD_SCRYPT_P = int(os.getenv("BARTER_PASSWORD_SCRYPT_P", "1"))
+PASSWORD_HASH_WORKERS = _optional_int("BARTER_PASSWORD_HASH_WORKERS")
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("BARTER_PASSWORD_HASH_MAX_PENDING", "64"))
+
+# Access tokens (src/core/tokens.py), issued by POST /auth/login. Every worker must share the secret, and the
+# server refuses to start without it. For local development only, TOKEN_ALLOW_RANDOM_SECRET lets each process
+# sign with a random secret instead; tokens then only work on the process that issued them, until it restarts.
+# TOKEN_SCOPES are the space-separated scopes granted at login.
+TOKEN_SECRET = os.getenv("BARTER_TOKEN_SECRET", "")
+TOKEN_ALLOW_RANDOM_SECRET = os.getenv("BARTER_TOKEN_ALLOW_RANDOM_SECRET", "false").lower() in ("1", "true", "yes")
+TOKEN_TTL_SECONDS = int(os.getenv("BARTER_TOKEN_TTL_SECONDS", "3600"))
+TOKEN_SCOPES = os.getenv("BARTER_TOKEN_SCOPES", "profile products offers trades messages").split()
+# Verified tokens kept in memory, and how often revoked token IDs are reloaded from storage.
+TOKEN_CACHE_SIZE = int(os.getenv("BARTER_TOKEN_CACHE_SIZE", "10000"))
+TOKEN_REVOCATION_REFRESH_SECONDS = float(os.getenv("BARTER_TOKEN_REVOCATION_REFRESH_SECONDS", "30"))
+
+# Prometheus metrics at GET /metrics (src/infrastructure/metrics.py): request, MongoDB command and pool timings.
+METRICS_ENABLED = os.getenv("BARTER_METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# Read-through cache in front of the repositories (see src/infrastructure/cache.py).
+CACHE_MAX_SIZE = int(os.getenv("BARTER_CACHE_MAX_SIZE", "10000"))
+CACHE_TTL_SECONDS = float(os.getenv("BARTER_CACHE_TTL_SECONDS", "60"))
+
+# HTTP caching of GET /products/{id}: responses carry an ETag and may be reused this long before revalidating.
+# Offers are private to their parties and always revalidated.
+PRODUCT_CACHE_MAX_AGE_SECONDS = int(os.getenv("BARTER_PRODUCT_CACHE_MAX_AGE_SECONDS", "0"))
+
+# Bulk ingestion (POST /products/bulk, POST /offers/bulk and src/cli/bulk_load.py).
+BULK_CHUNK_SIZE = int(os.getenv("BARTER_BULK_CHUNK_SIZE", "1000"))
+BULK_MAX_ITEMS = int(os.getenv("BARTER_BULK_MAX_ITEMS", "10000"))
+
+# Offer lifecycle: pending offers expire after OFFER_TTL_SECONDS; a background sweep marks them expired
+# in batches, and closed offers are deleted by a TTL index OFFER_RETENTION_SECONDS after they closed.
+OFFER_TTL_SECONDS = int(os.getenv("BARTER_OFFER_TTL_SECONDS", str(14 * 24 * 3600)))
+OFFER_SWEEP_INTERVAL_SECONDS = float(os.getenv("BARTER_OFFER_SWEEP_INTERVAL_SECONDS", "60"))
+OFFER_SWEEP_BATCH_SIZE = int(os.getenv("BARTER_OFFER_SWEEP_BATCH_SIZE", "1000"))
+OFFER_RETENTION_SECONDS = int(os.getenv("BARTER_OFFER_RETENTION_SECONDS", str(90 * 24 * 3600)))
+
+# Product search backend: "mongo" uses the products text index, "memory" an in-process inverted index.
+# Defaults to "memory" with SQLite storage.
+SEARCH_BACKEND = os.getenv("BARTER_SEARCH_BACKEND", "mongo" if STORAGE_BACKEND == "mongo" else "memory")
+
+# Multi-party trade cycles (src/core/trade_graph.py): cycle lengths and proposals created per new want.
+TRADE_MIN_CYCLE_LENGTH = int(os.getenv("BARTER_TRADE_MIN_CYCLE_LENGTH", "3"))
+TRADE_MAX_CYCLE_LENGTH = int(os.getenv("BARTER_TRADE_MAX_CYCLE_LENGTH", "5"))
+TRADE_MAX_PROPOSALS_PER_WANT = int(os.getenv("BARTER_TRADE_MAX_PROPOSALS_PER_WANT", "10"))
+
+# In-process event bus (src/infrastructure/events.py): events queued before publishers wait.
+EVENT_QUEUE_SIZE = int(os.getenv("BARTER_EVENT_QUEUE_SIZE", "10000"))
+
+# Materialized recommendation feeds: items kept per user and feeds updated per bulk_write.
+FEED_MAX_ITEMS = int(os.getenv("BARTER_FEED_MAX_ITEMS", "500"))
+FEED_FANOUT_BATCH = int(os.getenv("BARTER_FEED_FANOUT_BATCH", "1000"))
+
+# Server worker processes; uvicorn and gunicorn take their default worker count from WEB_CONCURRENCY.
+# The in-memory search index and in-process offer notifications only follow writes made through their
+# own process, so several workers require SEARCH_BACKEND "mongo" and OFFER_EVENT_SOURCE "change_stream";
+# the application refuses to start otherwise. The interest matcher and the trade graph stay per process.
+WORKERS = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+# Offer push notifications (GET /offers/stream): "memory" uses the in-process event bus,
+# "change_stream" a MongoDB change stream (requires a replica set, needed with several workers).
+OFFER_EVENT_SOURCE = os.getenv("BARTER_OFFER_EVENT_SOURCE", "memory")
+OFFER_STREAM_QUEUE_SIZE = int(os.getenv("BARTER_OFFER_STREAM_QUEUE_SIZE", "100"))
+OFFER_STREAM_HEARTBEAT_SECONDS = float(os.getenv("BARTER_OFFER_STREAM_HEARTBEAT_SECONDS", "15"))
+
+# Messaging: messages stored per bucket document, and conversations cached for the send path.
+MESSAGE_BUCKET_SIZE = int(os.getenv("BARTER_MESSAGE_BUCKET_SIZE", "100"))
@@ -0,0 +1,183 @@
+# src/infrastructure/container.py
+"""
+Wires the repositories to a database.
+
+``Repositories`` holds every repository, and the product search backend, of
+one storage backend: ``Repositories.on_mongo`` builds them on the collections
+of a MongoDB database and ``Repositories.on_sqlite`` on a SQLite database.
+The application lifespan (or a CLI entry point) calls ``connect_storage``,
+which opens the backend selected by ``BARTER_STORAGE_BACKEND``, and binds the
+result with ``repositories.bind``; the services look their repositories up on
+``repositories`` at call time, so importing a service touches no collection,
+and tests or benchmarks can bind repositories built on another database.
+"""
+
+from typing import Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from src.core.repositories import FeedRepository, MessageRepository, OfferRepository, ProductRepository, \
+    RevokedTokenRepository, TradeRepository, UserRepository
+from src.infrastructure.cache import offer_cache, product_cache, user_cache
+from src.infrastructure.config import SEARCH_BACKEND, STORAGE_BACKEND
+from src.infrastructure.database import mongo
+from src.infrastructure.indexes import ensure_indexes
+from src.infrastructure.repositories.cached_offer_repository import CachedOfferRepository
+from src.infrastructure.repositories.cached_product_repository import CachedProductRepository
+from src.infrastructure.repositories.cached_user_repository import CachedUserRepository
+from src.infrastructure.repositories.motor_feed_repository import MotorFeedRepository
+from src.infrastructure.repositories.motor_message_repository import MotorMessageRepository
+from src.infrastructure.repositories.motor_offer_repository import MotorOfferRepository
+from src.infrastructure.repositories.motor_product_repository import MotorProductRepository
+from src.infrastructure.repositories.motor_revoked_token_repository import MotorRevokedTokenRepository
+from src.infrastructure.repositories.motor_trade_repository import MotorTradeRepository
+from src.infrastructure.repositories.motor_user_repository import MotorUserRepository
+from src.infrastructure.repositories.sqlite_feed_repository import SQLiteFeedRepository
+from src.infrastructure.repositories.sqlite_message_repository import SQLiteMessageRepository
+from src.infrastructure.repositories.sqlite_offer_repository import SQLiteOfferRepository
+from src.infrastructure.repositories.sqlite_product_repository import SQLiteProductRepository
+from src.infrastructure.repositories.sqlite_revoked_token_repository import SQLiteRevokedTokenRepository
+from src.infrastructure.repositories.sqlite_trade_repository import SQLiteTradeRepository
+from src.infrastructure.repositories.sqlite_user_repository import SQLiteUserRepository
+from src.infrastructure.search.in_memory_product_search import InMemoryProductSearch
+from src.infrastructure.search.mongo_product_search import MongoProductSearch
+from src.infrastructure.sqlite_database import SQLiteDatabase, ensure_schema, sqlite
+
+
+class Repositories:
+    """The repositories of the application, all on one storage backend."""
+
+    def __init__(self, users: UserRepository, products: ProductRepository, offers: OfferRepository,
+                 trades: TradeRepository, feeds: FeedRepository, messages: MessageRepository,
+                 revoked_tokens: RevokedTokenRepository, product_search):
+        """
+        Initializes the Repositories instance. Users, products and offers are read through the caches.
+
+        Args:
+            users (UserRepository): The user repository.
+            products (ProductRepository): The product repository.
+            offers (OfferRepository): The offer repository.
+            trades (TradeRepository): The trade repository.
+            feeds (FeedRepository): The feed repository.
+            messages (MessageRepository): The message repository.
+            revoked_tokens (RevokedTokenRepository): The revoked access token repository.
+            product_search: The product search backend.
+        """
+        self.users = CachedUserRepository(users, user_cache)
+        self.products = CachedProductRepository(products, product_cache)
+        self.offers = CachedOfferRepository(offers, offer_cache)
+        self.trades = trades
+        self.feeds = feeds
+        self.messages = messages
+        self.revoked_tokens = revoked_tokens
+        self.product_search = product_search
+
+    @classmethod
+    def on_mongo(cls, database: AsyncIOMotorDatabase) -> "Repositories":
+        """
+        Builds the repositories on the collections of a MongoDB database.
+
+        Args:
+            database (AsyncIOMotorDatabase): The application database.
+
+        Returns:
+            Repositories: The repositories.
+        """
+        if SEARCH_BACKEND == "memory":
+            product_search = InMemoryProductSearch()
+        elif SEARCH_BACKEND == "mongo":
+            product_search = MongoProductSearch(database["products"])
+        else:
+            raise ValueError(f"Unknown search backend: {SEARCH_BACKEND}")
+        return cls(MotorUserRepository(database["users"]), MotorProductRepository(database["products"]),
+                   MotorOfferRepository(database["offers"]), MotorTradeRepository(database["trades"]),
+                   MotorFeedRepository(database["feeds"]),
+                   MotorMessageRepository(database["conversations"], database["message_buckets"]),
+                   MotorRevokedTokenRepository(database["revoked_tokens"]), product_search)
+
+    @classmethod
+    def on_sqlite(cls, database: SQLiteDatabase) -> "Repositories":
+        """
+        Builds the repositories on the tables of a SQLite database.
+
+        Args:
+            database (SQLiteDatabase): The application database.
+
+        Returns:
+            Repositories: The repositories.
+
+        Raises:
+            ValueError: If the search backend is not "memory", the only one that works without MongoDB.
+        """
+        if SEARCH_BACKEND != "memory":
+            raise ValueError(f"Search backend {SEARCH_BACKEND} is not available with SQLite storage; use memory")
+        return cls(SQLiteUserRepository(database), SQLiteProductRepository(database),
+                   SQLiteOfferRepository(database), SQLiteTradeRepository(database), SQLiteFeedRepository(database),
+                   SQLiteMessageRepository(database), SQLiteRevokedTokenRepository(database), InMemoryProductSearch())
+
+
+async def connect_storage() -> Repositories:
+    """
+    Connects to the backend selected by ``STORAGE_BACKEND`` and ensures its indexes (or schema).
+
+    Returns:
+        Repositories: The repositories on the connected database.
+
+    Raises:
+        ValueError: If the storage backend is unknown.
+    """
+    if STORAGE_BACKEND == "mongo":
+        database = mongo.connect()
+        await ensure_indexes(database)
+        return Repositories.on_mongo(database)
+    if STORAGE_BACKEND == "sqlite":
+        database = sqlite.connect()
+        await ensure_schema(database)
+        return Repositories.on_sqlite(database)
+    raise ValueError(f"Unknown storage backend: {STORAGE_BACKEND}")
+
+
+def close_storage():
+    """Closes the connection opened by ``connect_storage``."""
+    if STORAGE_BACKEND == "mongo":
+        mongo.close()
+    elif STORAGE_BACKEND == "sqlite":
+        sqlite.close()
+
+
+class RepositoryProvider:
+    """
+    Gives the services the bound Repositories.
+
+    It is module-level rather than kept on ``app.state`` and injected with
+    ``Depends`` because most service calls have no request: event bus
+    handlers, the offer expiry sweeper, startup warm-ups and the CLIs all reach
+    the same services. Only ``bind`` and ``unbind`` change it, from the
+    lifespan or an entry point, so a test or benchmark swaps the storage by
+    binding other Repositories rather than by patching modules.
+    """
+
+    def __init__(self):
+        """Initializes the RepositoryProvider instance, with nothing bound."""
+        self._repositories: Optional[Repositories] = None
+
+    def bind(self, repositories: Repositories):
+        """
+        Makes the services use the given repositories.
+
+        Args:
+            repositories (Repositories): The repositories.
+        """
+        self._repositories = repositories
+
+    def unbind(self):
+        """Forgets the bound repositories, e.g. once the client is closed."""
+        self._repositories = None
+
+    def __getattr__(self, name):
+        if self._repositories is None:
+            raise RuntimeError("Repositories are not bound; call connect_storage() and repositories.bind() first")
+        return getattr(self._repositories, name)
+
+
+repositories = RepositoryProvider()
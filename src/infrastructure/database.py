@@ -1,8 +1,101 @@
-from pymongo import MongoClient
+# src/infrastructure/database.py
+"""
+MongoDB connection lifecycle.
 
-client = MongoClient("mongodb://localhost:27017/")
-db = client["barter_app"]
+No client exists at import time. ``mongo.connect()`` is called from the
+application lifespan (or a CLI entry point), so each worker process opens its
+own pool after any fork, and ``mongo.close()`` releases it at shutdown. The
+client is configured from the BARTER_MONGO_* settings in config.py.
+"""
 
-users_collection = db["users"]
-products_collection = db["products"]
-offers_collection = db["offers"]
\ No newline at end of file
+from typing import Optional
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+
+from src.infrastructure.config import MONGO_COMPRESSORS, MONGO_CONNECT_TIMEOUT_MS, MONGO_DATABASE, MONGO_JOURNAL, \
+    MONGO_MAX_IDLE_TIME_MS, MONGO_MAX_POOL_SIZE, MONGO_MIN_POOL_SIZE, MONGO_READ_PREFERENCE, \
+    MONGO_SERVER_SELECTION_TIMEOUT_MS, MONGO_SOCKET_TIMEOUT_MS, MONGO_URI, MONGO_WAIT_QUEUE_TIMEOUT_MS, \
+    MONGO_WRITE_CONCERN, MONGO_WRITE_TIMEOUT_MS
+from src.infrastructure.mappers import CODEC_OPTIONS
+from src.infrastructure.metrics import mongo_event_listeners
+
+
+def client_options() -> dict:
+    """
+    Builds the MongoClient keyword arguments from the settings.
+
+    Returns:
+        dict: Pool, timeout, write concern, read preference and compression options.
+    """
+    options = {
+        "uuidRepresentation": "standard",
+        "tz_aware": True,
+        "appname": "barter_app",
+        "minPoolSize": MONGO_MIN_POOL_SIZE,
+        "maxPoolSize": MONGO_MAX_POOL_SIZE,
+        "connectTimeoutMS": MONGO_CONNECT_TIMEOUT_MS,
+        "serverSelectionTimeoutMS": MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        "readPreference": MONGO_READ_PREFERENCE,
+        "event_listeners": mongo_event_listeners(),
+    }
+    optional = {
+        "maxIdleTimeMS": MONGO_MAX_IDLE_TIME_MS,
+        "socketTimeoutMS": MONGO_SOCKET_TIMEOUT_MS,
+        "waitQueueTimeoutMS": MONGO_WAIT_QUEUE_TIMEOUT_MS,
+        "wTimeoutMS": MONGO_WRITE_TIMEOUT_MS,
+        "compressors": MONGO_COMPRESSORS or None,
+    }
+    options.update((name, value) for name, value in optional.items() if value is not None)
+    if MONGO_WRITE_CONCERN:
+        options["w"] = int(MONGO_WRITE_CONCERN) if MONGO_WRITE_CONCERN.isdigit() else MONGO_WRITE_CONCERN
+    if MONGO_JOURNAL:
+        options["journal"] = MONGO_JOURNAL.lower() in ("1", "true", "yes")
+    return options
+
+
+class MongoConnection:
+    """Owns the Motor client of the process, created on connect rather than on import."""
+
+    def __init__(self):
+        """Initializes the MongoConnection instance, without connecting."""
+        self.client: Optional[AsyncIOMotorClient] = None
+        self._database: Optional[AsyncIOMotorDatabase] = None
+
+    def connect(self, uri: str = MONGO_URI, database_name: str = MONGO_DATABASE) -> AsyncIOMotorDatabase:
+        """
+        Creates the client if there is none yet. The driver opens sockets in the
+        background, up to ``BARTER_MONGO_MIN_POOL_SIZE`` of them right away.
+
+        Args:
+            uri (str): The MongoDB connection string.
+            database_name (str): The application database.
+
+        Returns:
+            AsyncIOMotorDatabase: The application database.
+        """
+        if self.client is None:
+            self.client = AsyncIOMotorClient(uri, **client_options())
+            self._database = self.client.get_database(database_name, codec_options=CODEC_OPTIONS)
+        return self._database
+
+    @property
+    def database(self) -> AsyncIOMotorDatabase:
+        """
+        The application database.
+
+        Raises:
+            RuntimeError: If ``connect`` has not been called.
+        """
+        if self._database is None:
+            raise RuntimeError("MongoDB is not connected; call mongo.connect() first")
+        return self._database
+
+    def close(self):
+        """Closes the client and its pool. A later ``connect`` creates a new one."""
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+            self._database = None
+
+
+mongo = MongoConnection()
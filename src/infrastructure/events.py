@@ -0,0 +1,102 @@
+# src/infrastructure/events.py
+"""
+In-process event bus.
+
+Services publish domain events after a write commits; subscribers run on a
+background worker, so fan-out work (feeds, notifications) never delays the
+request that caused it. ``publish`` waits when ``max_pending`` events are
+queued, which pushes back on writers instead of growing memory without bound.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Optional
+
+from src.infrastructure.config import EVENT_QUEUE_SIZE
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_SAVED = "product.saved"  # Payload: the created or updated Product
+PRODUCT_DELETED = "product.deleted"  # Payload: the ID of the deleted product
+OFFER_CHANGED = "offer.changed"  # Payload: the created or updated Offer, or a deleted one as it was last stored
+
+Handler = Callable[[Any], Awaitable[None]]
+
+
+class EventBus:
+    """Queue of (topic, payload) events consumed by one worker task."""
+
+    def __init__(self, max_pending: int = EVENT_QUEUE_SIZE):
+        self._handlers: dict[str, list[Handler]] = defaultdict(list)
+        self._queue: asyncio.Queue = asyncio.Queue(max_pending)
+        self._worker: Optional[asyncio.Task] = None
+
+    def subscribe(self, topic: str, handler: Handler):
+        """
+        Registers a coroutine function called with the payload of every event on ``topic``.
+
+        Args:
+            topic (str): The event topic.
+            handler (Handler): The subscriber.
+        """
+        self._handlers[topic].append(handler)
+
+    def unsubscribe(self, topic: str, handler: Handler):
+        """
+        Removes a subscriber registered with ``subscribe``; events already queued are not delivered to it.
+
+        Args:
+            topic (str): The event topic.
+            handler (Handler): The subscriber.
+        """
+        handlers = self._handlers.get(topic)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+
+    async def publish(self, topic: str, payload: Any):
+        """
+        Queues an event for the subscribers of ``topic``.
+
+        Args:
+            topic (str): The event topic.
+            payload (Any): The event payload.
+        """
+        if self._handlers.get(topic):
+            await self._queue.put((topic, payload))
+
+    async def _run(self):
+        while True:
+            topic, payload = await self._queue.get()
+            try:
+                for handler in self._handlers.get(topic, ()):
+                    try:
+                        await handler(payload)
+                    except Exception:
+                        logger.exception(f"Event handler {handler.__qualname__} failed on {topic}")
+            finally:
+                self._queue.task_done()
+
+    def start(self):
+        """Starts the worker on the running event loop."""
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+    async def drain(self):
+        """Waits until every queued event has been handled."""
+        await self._queue.join()
+
+    async def stop(self):
+        """Handles the queued events, then stops the worker."""
+        if self._worker is None:
+            return
+        await self.drain()
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+
+event_bus = EventBus()
@@ -0,0 +1,214 @@
+# src/infrastructure/indexes.py
+"""
+Declarative index registry for the barter_app collections.
+
+``INDEXES`` is the single source of truth for the indexes every repository
+query relies on; ``main.py`` applies it at startup through ``ensure_indexes``.
+``QUERY_SHAPES`` lists one representative filter per repository query so that
+``verify_query_plans`` can ``explain()`` each of them and fail when one falls
+back to a collection scan.
+
+Usage:
+    python -m src.infrastructure.indexes            # create the indexes
+    python -m src.infrastructure.indexes --check    # create, then verify the query plans
+"""
+
+import argparse
+import asyncio
+import logging
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from pymongo.errors import OperationFailure
+
+from src.infrastructure.config import OFFER_RETENTION_SECONDS
+
+logger = logging.getLogger(__name__)
+
+INDEXES: dict[str, list[IndexModel]] = {
+    "users": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+        IndexModel([("interests", ASCENDING)], name="interests"),
+    ],
+    "products": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("owner_id", ASCENDING), ("id", ASCENDING)], name="owner_id_id"),
+        IndexModel([("title", TEXT), ("description", TEXT), ("interests", TEXT)], name="product_text",
+                   weights={"title": 10, "interests": 5, "description": 1}),
+    ],
+    "offers": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("to_user_id", ASCENDING), ("status", ASCENDING), ("id", ASCENDING)],
+                   name="to_user_id_status_id"),
+        IndexModel([("from_user_id", ASCENDING), ("status", ASCENDING), ("id", ASCENDING)],
+                   name="from_user_id_status_id"),
+        IndexModel([("product_id", ASCENDING), ("status", ASCENDING)], name="product_id_status"),
+        IndexModel([("offered_product_id", ASCENDING), ("status", ASCENDING)], name="offered_product_id_status"),
+        IndexModel([("status", ASCENDING), ("expires_at", ASCENDING)], name="status_expires_at"),
+        # Pending offers have no closed_at and are never removed by the TTL monitor.
+        IndexModel([("closed_at", ASCENDING)], name="closed_at_ttl", expireAfterSeconds=OFFER_RETENTION_SECONDS),
+    ],
+    "trades": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        # A cycle may only be proposed once at a time; settled proposals do not block a new one.
+        IndexModel([("key", ASCENDING)], name="key_proposed_unique", unique=True,
+                   partialFilterExpression={"status": "proposed"}),
+        IndexModel([("participants", ASCENDING), ("status", ASCENDING), ("id", ASCENDING)],
+                   name="participants_status_id"),
+        IndexModel([("product_ids", ASCENDING), ("status", ASCENDING)], name="product_ids_status"),
+    ],
+    "feeds": [
+        IndexModel([("user_id", ASCENDING)], name="user_id_unique", unique=True),
+        IndexModel([("items.product_id", ASCENDING)], name="items_product_id"),
+    ],
+    "conversations": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        # One conversation per set of participants and offer.
+        IndexModel([("key", ASCENDING)], name="key_unique", unique=True),
+        IndexModel([("participants", ASCENDING), ("last_message_at", DESCENDING)],
+                   name="participants_last_message_at"),
+    ],
+    "message_buckets": [
+        # Appends look for the open bucket; history reads walk buckets newest first.
+        IndexModel([("conversation_id", ASCENDING), ("count", ASCENDING)], name="conversation_id_count"),
+        # One bucket per sequence number, so that only one sender opens the next bucket. Partial because
+        # buckets written before they were numbered have no seq.
+        IndexModel([("conversation_id", ASCENDING), ("seq", ASCENDING)], name="conversation_id_seq_unique",
+                   unique=True, partialFilterExpression={"seq": {"$exists": True}}),
+        IndexModel([("conversation_id", ASCENDING), ("first_at", DESCENDING)], name="conversation_id_first_at"),
+    ],
+    "revoked_tokens": [
+        IndexModel([("token_id", ASCENDING)], name="token_id_unique", unique=True),
+        # Also serves the refresh of the revocation list, which reads the unexpired tokens.
+        IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+    ],
+}
+
+
+# (collection, description, filter) for every query issued by the repositories.
+QUERY_SHAPES: list[tuple[str, str, dict]] = [
+    ("users", "get_user_by_id", {"id": uuid4()}),
+    ("users", "get_user_by_email", {"email": "explain@example.com"}),
+    ("users", "iter_users_with_interests", {"interests": {"$in": ["explain"]}}),
+    ("products", "get_product_by_id", {"id": uuid4()}),
+    ("products", "get_products_by_owner_id", {"owner_id": uuid4()}),
+    ("products", "search_products", {"$text": {"$search": "explain"}}),
+    ("offers", "get_offer_by_id", {"id": uuid4()}),
+    ("offers", "get_offer_page (inbox)", {"to_user_id": uuid4(), "status": "pending"}),
+    ("offers", "get_offer_page (outbox)", {"from_user_id": uuid4(), "status": "pending"}),
+    ("offers", "competing offers by product_id", {"product_id": {"$in": [uuid4()]}, "status": "pending"}),
+    ("offers", "competing offers by offered_product_id",
+     {"offered_product_id": {"$in": [uuid4()]}, "status": "pending"}),
+    ("trades", "get_trade_by_id", {"id": uuid4()}),
+    ("trades", "get_trades_for_user", {"participants": uuid4(), "status": "proposed"}),
+    ("trades", "cancel_trades_with_products", {"status": "proposed", "product_ids": {"$in": [uuid4()]}}),
+    ("offers", "expire_pending_offers", {"status": "pending", "expires_at": {"$lte": datetime.now(timezone.utc)}}),
+    ("feeds", "get_feed", {"user_id": uuid4()}),
+    ("feeds", "pull_product", {"items.product_id": uuid4()}),
+    ("conversations", "get_conversation_by_id", {"id": uuid4()}),
+    ("conversations", "get_conversations_for_user", {"participants": uuid4()}),
+    ("message_buckets", "append_message", {"conversation_id": uuid4(), "count": {"$lt": 100}}),
+    ("message_buckets", "append_message", {"conversation_id": uuid4(), "seq": {"$exists": True}}),
+    ("message_buckets", "get_messages",
+     {"conversation_id": uuid4(), "first_at": {"$lte": datetime.now(timezone.utc)}}),
+    ("revoked_tokens", "get_revoked_token_ids", {"expires_at": {"$gt": datetime.now(timezone.utc)}}),
+]
+
+
+INDEX_OPTIONS_CONFLICT = 85
+
+
+class QueryPlanError(RuntimeError):
+    """Raised when a repository query is not served by an index."""
+
+
+async def ensure_indexes(database: AsyncIOMotorDatabase):
+    """
+    Creates every index in the registry. Existing indexes are left untouched,
+    except that TTL indexes take their configured expireAfterSeconds.
+
+    Args:
+        database (AsyncIOMotorDatabase): The barter_app database.
+    """
+    for collection_name, index_models in INDEXES.items():
+        try:
+            names = await database[collection_name].create_indexes(index_models)
+        except OperationFailure as e:
+            if e.code != INDEX_OPTIONS_CONFLICT:
+                raise
+            await _update_ttls(database, collection_name, index_models)
+            names = await database[collection_name].create_indexes(index_models)
+        logger.info(f"Ensured indexes on {collection_name}: {', '.join(names)}")
+
+
+async def _update_ttls(database: AsyncIOMotorDatabase, collection_name: str, index_models: list[IndexModel]):
+    """Applies changed TTLs (such as a new retention period) to existing indexes with collMod."""
+    for model in index_models:
+        document = model.document
+        if "expireAfterSeconds" in document:
+            await database.command("collMod", collection_name, index={
+                "name": document["name"], "expireAfterSeconds": document["expireAfterSeconds"]})
+            logger.info(f"Set {collection_name}.{document['name']} to expire after "
+                        f"{document['expireAfterSeconds']}s")
+
+
+def _plan_stages(plan: dict):
+    """Yields every stage name in an explain() plan tree."""
+    if not isinstance(plan, dict):
+        return
+    if "stage" in plan:
+        yield plan["stage"]
+    for key in ("inputStage", "queryPlan", "winningPlan"):
+        if key in plan:
+            yield from _plan_stages(plan[key])
+    for child in plan.get("inputStages", []):
+        yield from _plan_stages(child)
+
+
+async def verify_query_plans(database: AsyncIOMotorDatabase) -> dict[str, list[str]]:
+    """
+    Runs explain() on every registered query shape.
+
+    Args:
+        database (AsyncIOMotorDatabase): The barter_app database.
+
+    Returns:
+        dict[str, list[str]]: The winning plan stages per query.
+
+    Raises:
+        QueryPlanError: If any query falls back to a COLLSCAN.
+    """
+    plans = {}
+    offenders = []
+    for collection_name, description, query in QUERY_SHAPES:
+        explanation = await database[collection_name].find(query).explain()
+        stages = list(_plan_stages(explanation["queryPlanner"]["winningPlan"]))
+        plans[f"{collection_name}.{description}"] = stages
+        if "COLLSCAN" in stages:
+            offenders.append(f"{collection_name}.{description}")
+    if offenders:
+        raise QueryPlanError(f"Queries without index support: {', '.join(offenders)}")
+    return plans
+
+
+async def _run(check: bool):
+    from src.infrastructure.database import mongo
+
+    database = mongo.connect()
+    try:
+        await ensure_indexes(database)
+        if check:
+            for query, stages in (await verify_query_plans(database)).items():
+                print(f"{query}: {' <- '.join(stages)}")
+    finally:
+        mongo.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Create the barter_app indexes.")
+    parser.add_argument("--check", action="store_true", help="fail if any repository query does a COLLSCAN")
+    asyncio.run(_run(parser.parse_args().check))
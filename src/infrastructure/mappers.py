@@ -0,0 +1,177 @@
+# src/infrastructure/mappers.py
+"""
+Mapping between MongoDB documents and entities.
+
+The clients in ``database.py`` are configured with ``CODEC_OPTIONS``, so UUID
+fields are encoded and decoded as BSON binary subtype 4 by the driver itself
+and no repository converts them by hand. Each entity gets one mapper built
+at import time that turns a decoded document into the entity in a single
+call. Products, offers and users are mapped to their slotted records
+(``RecordMapper``), which the repositories and caches hold instead of pydantic
+models; the other entities are pydantic models (``EntityMapper``).
+"""
+
+from dataclasses import fields as dataclass_fields
+from datetime import datetime, timezone
+from typing import Any, Generic, Optional, Type, TypeVar
+
+from bson import UuidRepresentation
+from bson.codec_options import CodecOptions
+from pydantic import BaseModel
+
+from src.core.entities.feed import FeedItem
+from src.core.entities.message import Conversation, Message
+from src.core.entities.offer import OfferRecord, OfferView
+from src.core.entities.product import Product, ProductRecord, ProductSummary
+from src.core.entities.trade import TradeCycle
+from src.core.entities.user import UserRecord
+
+CODEC_OPTIONS = CodecOptions(uuid_representation=UuidRepresentation.STANDARD, tz_aware=True)
+
+# Repositories never need Mongo's own _id, so it is not sent over the wire.
+ENTITY_PROJECTION = {"_id": False}
+# Fields of a product document that make up a ProductSummary (plus the search score, when present).
+PRODUCT_SUMMARY_PROJECTION = {"_id": False, "id": True, "owner_id": True, "title": True, "image_url": True,
+                              "interests": True, "score": True}
+
+EntityT = TypeVar("EntityT", bound=BaseModel)
+RecordT = TypeVar("RecordT")
+
+
+def bson_now() -> datetime:
+    """Returns the current UTC time truncated to milliseconds, so it compares equal after a round-trip."""
+    now = datetime.now(timezone.utc)
+    return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+
+class EntityMapper(Generic[EntityT]):
+    """Converts documents of one collection to and from its entity type."""
+
+    def __init__(self, model: Type[EntityT]):
+        """
+        Initializes the EntityMapper instance.
+
+        Args:
+            model (Type[EntityT]): The pydantic entity stored in the collection.
+        """
+        self.model = model
+        if hasattr(model, "model_validate"):
+            # pydantic 2 validates in compiled code, which is cheaper than model_construct
+            # and copies field defaults correctly.
+            self._build = model.model_validate
+        else:
+            fields = tuple(model.__fields__)
+            construct = model.construct
+            self._build = lambda document: construct(**{name: document[name] for name in fields if name in document})
+
+    def to_document(self, entity: EntityT) -> dict:
+        """
+        Converts an entity into a document ready for insertion.
+
+        Args:
+            entity (EntityT): The entity.
+
+        Returns:
+            dict: The document; UUIDs are left for the driver to encode.
+        """
+        return entity.model_dump()
+
+    def from_document(self, document: Optional[dict]) -> Optional[EntityT]:
+        """
+        Converts a document read with CODEC_OPTIONS into an entity.
+
+        Args:
+            document (Optional[dict]): The decoded document, or None.
+
+        Returns:
+            Optional[EntityT]: The entity, or None if there was no document.
+        """
+        if document is None:
+            return None
+        return self._build(document)
+
+
+class RecordMapper(Generic[RecordT]):
+    """Converts documents of one collection to and from its slotted record type."""
+
+    def __init__(self, record: Type[RecordT]):
+        """
+        Initializes the RecordMapper instance.
+
+        Args:
+            record (Type[RecordT]): The record dataclass stored in the collection.
+        """
+        self.record = record
+        self.fields = tuple(field.name for field in dataclass_fields(record))
+
+    def to_document(self, entity: Any) -> dict:
+        """
+        Converts a record, or the pydantic entity with the same fields, into a document ready for insertion.
+
+        Args:
+            entity (Any): The record or entity.
+
+        Returns:
+            dict: The document; UUIDs are left for the driver to encode.
+        """
+        return {name: getattr(entity, name) for name in self.fields}
+
+    def from_document(self, document: Optional[dict]) -> Optional[RecordT]:
+        """
+        Converts a document read with CODEC_OPTIONS into a record, without validation;
+        fields the document lacks (e.g. written before they existed) take their defaults.
+
+        Args:
+            document (Optional[dict]): The decoded document, or None.
+
+        Returns:
+            Optional[RecordT]: The record, or None if there was no document.
+        """
+        if document is None:
+            return None
+        try:
+            return self.record(**document)
+        except TypeError:
+            # The document carries fields the record does not have; keep only the record's.
+            return self.record(**{name: document[name] for name in self.fields if name in document})
+
+
+def version_condition(versions: list[int]) -> dict:
+    """
+    Builds the query condition for a conditional write at any of ``versions``.
+
+    Args:
+        versions (list[int]): The versions the client has, from If-Match.
+
+    Returns:
+        dict: The condition on the ``version`` field; documents written before versioning count as version 0.
+    """
+    return {"$in": [*versions, None] if 0 in versions else versions}
+
+
+def document_projection(model: Type[BaseModel]) -> dict:
+    """
+    Builds a projection returning exactly the fields of an entity, for documents
+    that are sent to clients without building the entity first.
+
+    Args:
+        model (Type[BaseModel]): The pydantic entity stored in the collection.
+
+    Returns:
+        dict: The projection, without Mongo's _id.
+    """
+    fields = getattr(model, "model_fields", None) or model.__fields__
+    return {"_id": False, **{name: True for name in fields}}
+
+
+PRODUCT_DOCUMENT_PROJECTION = document_projection(Product)
+
+product_mapper = RecordMapper(ProductRecord)
+offer_mapper = RecordMapper(OfferRecord)
+user_mapper = RecordMapper(UserRecord)
+product_summary_mapper = EntityMapper(ProductSummary)
+offer_view_mapper = EntityMapper(OfferView)
+trade_mapper = EntityMapper(TradeCycle)
+feed_item_mapper = EntityMapper(FeedItem)
+conversation_mapper = EntityMapper(Conversation)
+message_mapper = EntityMapper(Message)
@@ -0,0 +1,348 @@
+# src/infrastructure/metrics.py
+"""
+Prometheus instrumentation, exported at ``GET /metrics``.
+
+* ``MetricsMiddleware`` is a plain ASGI middleware recording, per route
+  template and method, a latency histogram and a response counter by status
+  code, plus in-flight requests per method. Requests that match no route are
+  recorded under one ``<unmatched>`` label so scanners cannot create series.
+* ``MongoCommandListener`` times every MongoDB command by collection and
+  command name, using the duration the driver measures itself.
+* ``MongoPoolListener`` records how long operations wait to check a
+  connection out of the pool, which is where pool exhaustion shows up.
+* ``StatsCollector`` exports existing stats dataclasses (such as the offer
+  expiry sweeper's) at scrape time, so the code keeping them stays unaware of
+  Prometheus.
+
+prometheus_client is only used for the registry and the text format. Its
+metric classes take a lock per bucket, counter and gauge on every update.
+Request metrics here are plain objects updated from the event loop without
+locks; MongoDB listeners are called from the driver's threads, so their
+families take one lock per observation. Both are converted when scraped,
+which keeps the cost per request at a few microseconds (see
+benchmarks/metrics_overhead.py).
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import asdict
+from itertools import accumulate
+from typing import Any, Callable, Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, HistogramMetricFamily
+from pymongo import monitoring
+
+from src.infrastructure.config import METRICS_ENABLED
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+# Buckets from 1ms to 10s; MongoDB commands get finer ones down to 100µs.
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COMMAND_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+
+class HistogramFamily:
+    """A histogram per label set, safe to update from any thread."""
+
+    def __init__(self, name: str, documentation: str, labels: list[str], buckets: tuple[float, ...]):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.buckets = buckets
+        self._bounds = [str(bound) for bound in buckets] + ["+Inf"]
+        self._series: dict[tuple, list] = {}  # Labels to [count per bucket, with +Inf last; sum]
+        self._lock = threading.Lock()
+
+    def observe(self, labels: tuple, value: float):
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][bisect_left(self.buckets, value)] += 1
+            series[1] += value
+
+    def collect(self) -> HistogramMetricFamily:
+        family = HistogramMetricFamily(self.name, self.documentation, labels=self.labels)
+        with self._lock:
+            snapshot = [(labels, list(counts), total) for labels, (counts, total) in self._series.items()]
+        for labels, counts, total in snapshot:
+            family.add_metric(list(labels), list(zip(self._bounds, accumulate(counts))), total)
+        return family
+
+
+class CounterFamily:
+    """A counter per label set, safe to update from any thread."""
+
+    def __init__(self, name: str, documentation: str, labels: list[str]):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def add(self, labels: tuple, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def collect(self):
+        family = CounterMetricFamily(self.name, self.documentation, labels=self.labels)
+        with self._lock:
+            snapshot = list(self._values.items())
+        for labels, value in snapshot:
+            family.add_metric(list(labels), value)
+        return family
+
+
+mongodb_command_duration = HistogramFamily("mongodb_command_duration_seconds", "Time spent on MongoDB commands.",
+                                           ["collection", "command"], COMMAND_BUCKETS)
+mongodb_command_failures = CounterFamily("mongodb_command_failures", "MongoDB commands that failed.",
+                                       ["collection", "command"])
+mongodb_pool_checkout_wait = HistogramFamily("mongodb_pool_checkout_wait_seconds",
+                                             "Time spent waiting for a connection from the MongoDB pool.",
+                                             [], COMMAND_BUCKETS)
+mongodb_pool_checkout_failures = CounterFamily("mongodb_pool_checkout_failures",
+                                             "Connection checkouts that failed, e.g. on wait queue timeout.",
+                                             ["reason"])
+
+MONGODB_FAMILIES = (mongodb_command_duration, mongodb_command_failures, mongodb_pool_checkout_wait,
+                    mongodb_pool_checkout_failures)
+
+
+class _RouteStats:
+    """Latency histogram and response counts of one (method, route) pair."""
+
+    __slots__ = ("bucket_counts", "sum", "responses")
+
+    def __init__(self):
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)  # The last one is +Inf
+        self.sum = 0.0
+        self.responses: dict[int, int] = {}
+
+
+class RequestMetrics:
+    """
+    HTTP request metrics. They are only updated and scraped on the event loop,
+    so unlike the MongoDB families they need no lock, and one dict lookup per
+    request reaches every series of its route.
+    """
+
+    def __init__(self):
+        self.routes: dict[tuple[str, str], _RouteStats] = {}
+        self.in_progress: dict[str, int] = {}
+
+    def record(self, method: str, route: str, status_code: int, elapsed: float):
+        stats = self.routes.get((method, route))
+        if stats is None:
+            stats = self.routes[(method, route)] = _RouteStats()
+        stats.bucket_counts[bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+        stats.sum += elapsed
+        stats.responses[status_code] = stats.responses.get(status_code, 0) + 1
+
+    def collect(self):
+        bounds = [str(bound) for bound in LATENCY_BUCKETS] + ["+Inf"]
+        duration = HistogramMetricFamily("http_request_duration_seconds", "Time spent serving HTTP requests.",
+                                         labels=["method", "route"])
+        responses = CounterMetricFamily("http_responses", "HTTP responses sent.",
+                                        labels=["method", "route", "status"])
+        in_progress = GaugeMetricFamily("http_requests_in_progress", "HTTP requests being served.",
+                                        labels=["method"])
+        for (method, route), stats in self.routes.items():
+            duration.add_metric([method, route], list(zip(bounds, accumulate(stats.bucket_counts))), stats.sum)
+            for status_code, count in stats.responses.items():
+                responses.add_metric([method, route, str(status_code)], count)
+        for method, count in self.in_progress.items():
+            in_progress.add_metric([method], count)
+        return [duration, responses, in_progress]
+
+
+http_metrics = RequestMetrics()
+
+
+class MetricsCollector:
+    """Hands the request metrics and the MongoDB families to the prometheus_client registry."""
+
+    def collect(self):
+        return http_metrics.collect() + [family.collect() for family in MONGODB_FAMILIES]
+
+
+def route_template(scope) -> str:
+    """
+    Returns the path template of the route that served a request, e.g. ``/products/{product_id}``.
+
+    FastAPI versions that keep included routers nested record the full template
+    in the effective route context; older ones flatten routes, so the matched
+    route's own path is already complete.
+    """
+    fastapi_scope = scope.get("fastapi")
+    context = fastapi_scope.get("effective_route_context") if fastapi_scope else None
+    return getattr(context, "path_format", None) or getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency, responses and in-flight requests per route into ``http_metrics``."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        in_progress = http_metrics.in_progress
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress[method] = in_progress.get(method, 0) + 1
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_progress[method] -= 1
+            http_metrics.record(method, route_template(scope), status_code, elapsed)
+
+
+def _collection_name(command_name: str, command: dict) -> str:
+    if command_name == "getMore":
+        return command.get("collection", "")
+    target = command.get(command_name)
+    return target if isinstance(target, str) else ""
+
+
+class MongoCommandListener(monitoring.CommandListener):
+    """Times MongoDB commands by collection and command name."""
+
+    def __init__(self):
+        # The collection is only known when the command starts; keep it until it ends.
+        self._collections: dict[tuple[int, Any], str] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        self._collections[(event.request_id, event.connection_id)] = _collection_name(event.command_name,
+                                                                                      event.command)
+
+    def _labels(self, event) -> tuple[str, str]:
+        return self._collections.pop((event.request_id, event.connection_id), ""), event.command_name
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        mongodb_command_duration.observe(self._labels(event), event.duration_micros / 1e6)
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        labels = self._labels(event)
+        mongodb_command_duration.observe(labels, event.duration_micros / 1e6)
+        mongodb_command_failures.add(labels)
+
+
+class MongoPoolListener(monitoring.ConnectionPoolListener):
+    """Records connection pool checkout wait times; other pool events are ignored."""
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent):
+        mongodb_pool_checkout_wait.observe((), event.duration)
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent):
+        mongodb_pool_checkout_wait.observe((), event.duration)
+        mongodb_pool_checkout_failures.add((event.reason,))
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        pass
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_checked_in(self, event):
+        pass
+
+
+class StatsCollector:
+    """Exports the numeric fields of stats dataclasses as gauges named ``<prefix>_<field>``."""
+
+    def __init__(self, prefix: str, sources: dict[str, Callable[[], Any]], label: Optional[str] = None,
+                 description: str = ""):
+        """
+        Initializes the StatsCollector instance.
+
+        Args:
+            prefix (str): Metric name prefix.
+            sources (dict[str, Callable[[], Any]]): Label value to a function returning the stats dataclass.
+            label (Optional[str]): Label name distinguishing the sources; None for a single source.
+            description (str): Help text for the metrics.
+        """
+        self.prefix = prefix
+        self.sources = sources
+        self.label = label
+        self.description = description
+
+    def collect(self):
+        families = {}
+        for label_value, source in self.sources.items():
+            for field, value in asdict(source()).items():
+                if not isinstance(value, (int, float)):
+                    continue
+                family = families.get(field)
+                if family is None:
+                    family = families[field] = GaugeMetricFamily(f"{self.prefix}_{field}", self.description,
+                                                                 labels=[self.label] if self.label else [])
+                family.add_metric([label_value] if self.label else [], value)
+        return list(families.values())
+
+
+def register_stats(prefix: str, sources: dict[str, Callable[[], Any]], label: Optional[str] = None,
+                   description: str = ""):
+    """
+    Registers stats dataclasses to be exported on every scrape.
+
+    Args:
+        prefix (str): Metric name prefix.
+        sources (dict[str, Callable[[], Any]]): Label value to a function returning the stats dataclass.
+        label (Optional[str]): Label name distinguishing the sources; None for a single source.
+        description (str): Help text for the metrics.
+    """
+    if METRICS_ENABLED:
+        REGISTRY.register(StatsCollector(prefix, sources, label, description))
+
+
+if METRICS_ENABLED:
+    REGISTRY.register(MetricsCollector())
+
+
+def mongo_event_listeners() -> list:
+    """Returns the listeners to pass to MongoDB clients, none when metrics are disabled."""
+    if not METRICS_ENABLED:
+        return []
+    return [MongoCommandListener(), MongoPoolListener()]
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """
+    Renders every registered metric in the Prometheus text format.
+
+    Returns:
+        tuple[bytes, str]: The body and its content type.
+    """
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
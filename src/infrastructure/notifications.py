@@ -0,0 +1,224 @@
+# src/infrastructure/notifications.py
+"""
+Push delivery of offer changes to connected clients.
+
+``NotificationHub`` keeps one bounded buffer per open connection, keyed by user.
+Offers are published to both parties' buffers without awaiting, so a slow
+client never holds up the source: when its buffer is full, it is cleared and
+replaced by a single OVERFLOW marker telling the client to refetch its inbox.
+A buffer is a slotted deque plus at most one pending future rather than an
+asyncio.Queue, and a single heartbeat task wakes idle connections in slices
+spread over the interval, so an idle connection costs one small object and
+one suspended generator, with no per connection timer.
+
+Where changes come from is pluggable:
+
+* ``InProcessOfferSource`` listens to the in-process event bus; enough for a
+  single node and for tests.
+* ``ChangeStreamOfferSource`` tails a MongoDB change stream on the offers
+  collection, so every worker sees writes made by any node (replica set only).
+"""
+
+import asyncio
+import logging
+from collections import defaultdict, deque
+from typing import Optional, Protocol
+from uuid import UUID
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.errors import PyMongoError
+
+from src.core.entities.offer import OfferRecord
+from src.infrastructure.config import OFFER_EVENT_SOURCE, OFFER_STREAM_HEARTBEAT_SECONDS, OFFER_STREAM_QUEUE_SIZE
+from src.infrastructure.events import EventBus, OFFER_CHANGED, event_bus
+from src.infrastructure.mappers import offer_mapper
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT = object()
+OVERFLOW = object()
+
+
+HEARTBEAT_SLICE = 1000  # Connections woken per event loop turn during a heartbeat sweep
+
+
+class Subscription:
+    """Bounded buffer of pending items for one connection, read by a single consumer."""
+
+    __slots__ = ("user_id", "items", "size", "waiter")
+
+    def __init__(self, user_id: UUID, size: int):
+        self.user_id = user_id
+        self.items = deque()
+        self.size = size
+        self.waiter: Optional[asyncio.Future] = None
+
+    def empty(self) -> bool:
+        return not self.items
+
+    def offer(self, item):
+        if len(self.items) >= self.size:
+            self.items.clear()
+            item = OVERFLOW
+        self.items.append(item)
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+    async def get(self):
+        while not self.items:
+            self.waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self.waiter
+            finally:
+                self.waiter = None
+        return self.items.popleft()
+
+
+class NotificationHub:
+    """Fans offer changes out to the open connections of the users involved."""
+
+    def __init__(self, queue_size: int = OFFER_STREAM_QUEUE_SIZE,
+                 heartbeat_seconds: float = OFFER_STREAM_HEARTBEAT_SECONDS):
+        self.queue_size = queue_size
+        self.heartbeat_seconds = heartbeat_seconds
+        self._subscriptions: dict[UUID, set[Subscription]] = defaultdict(set)
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def connection_count(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def subscribe(self, user_id: UUID) -> Subscription:
+        subscription = Subscription(user_id, self.queue_size)
+        self._subscriptions[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscriptions = self._subscriptions.get(subscription.user_id)
+        if subscriptions is not None:
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.user_id]
+
+    def publish(self, offer: OfferRecord):
+        """
+        Queues an offer change for every connection of its sender and recipient.
+
+        Args:
+            offer (OfferRecord): The offer as it is after the change.
+        """
+        for user_id in {offer.from_user_id, offer.to_user_id}:
+            for subscription in self._subscriptions.get(user_id, ()):
+                subscription.offer(offer)
+
+    async def heartbeat_sweep(self) -> int:
+        """
+        Queues a heartbeat for every idle connection, yielding to the event loop
+        every HEARTBEAT_SLICE connections.
+
+        Returns:
+            int: The number of connections woken.
+        """
+        woken = 0
+        for subscriptions in list(self._subscriptions.values()):
+            for subscription in list(subscriptions):
+                if subscription.empty():
+                    subscription.offer(HEARTBEAT)
+                    woken += 1
+                    if woken % HEARTBEAT_SLICE == 0:
+                        await asyncio.sleep(0)
+        return woken
+
+    async def _heartbeat(self):
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            await self.heartbeat_sweep()
+
+    async def start(self, source: "OfferSource"):
+        """
+        Starts the heartbeat and the change source.
+
+        Args:
+            source (OfferSource): Where offer changes come from.
+        """
+        self._tasks = [asyncio.create_task(self._heartbeat()), asyncio.create_task(source.run(self))]
+        await asyncio.sleep(0)  # Let the source subscribe before the first request is served
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+class OfferSource(Protocol):
+    async def run(self, hub: NotificationHub):
+        """Delivers offer changes to ``hub.publish`` until cancelled."""
+        ...
+
+
+class InProcessOfferSource:
+    """Offer changes published on the in-process event bus by this worker's offer service."""
+
+    def __init__(self, bus: EventBus):
+        self.bus = bus
+
+    async def run(self, hub: NotificationHub):
+        async def deliver(offer: OfferRecord):
+            hub.publish(offer)
+        self.bus.subscribe(OFFER_CHANGED, deliver)
+        try:
+            await asyncio.get_running_loop().create_future()  # Delivers until the hub cancels the source
+        finally:
+            self.bus.unsubscribe(OFFER_CHANGED, deliver)
+
+
+class ChangeStreamOfferSource:
+    """Offer changes read from a MongoDB change stream, resumed after transient errors."""
+
+    def __init__(self, collection: AsyncIOMotorCollection, retry_seconds: float = 1.0):
+        self.collection = collection
+        self.retry_seconds = retry_seconds
+
+    async def run(self, hub: NotificationHub):
+        pipeline = [{"$match": {"operationType": {"$in": ["insert", "update", "replace"]}}}]
+        resume_token: Optional[dict] = None
+        while True:
+            try:
+                async with self.collection.watch(pipeline, full_document="updateLookup",
+                                                 resume_after=resume_token) as stream:
+                    async for change in stream:
+                        resume_token = stream.resume_token
+                        document = change.get("fullDocument")
+                        if document:
+                            document.pop("_id", None)
+                            hub.publish(offer_mapper.from_document(document))
+            except PyMongoError:
+                logger.exception("Offer change stream failed, resuming")
+                await asyncio.sleep(self.retry_seconds)
+
+
+def offer_event_source(collection: Optional[AsyncIOMotorCollection]) -> OfferSource:
+    """
+    Builds the offer source selected by ``OFFER_EVENT_SOURCE``.
+
+    Args:
+        collection (Optional[AsyncIOMotorCollection]): The offers collection, for change streams;
+            None when the offers are not stored in MongoDB.
+
+    Returns:
+        OfferSource: The configured source.
+
+    Raises:
+        ValueError: If the source is unknown, or is "change_stream" without an offers collection.
+    """
+    if OFFER_EVENT_SOURCE == "change_stream":
+        if collection is None:
+            raise ValueError("The change_stream offer event source needs MongoDB storage; use memory")
+        return ChangeStreamOfferSource(collection)
+    if OFFER_EVENT_SOURCE == "memory":
+        return InProcessOfferSource(event_bus)
+    raise ValueError(f"Unknown offer event source: {OFFER_EVENT_SOURCE}")
+
+
+offer_notifications = NotificationHub()
@@ -0,0 +1,104 @@
+# src/infrastructure/passwords.py
+"""
+Password hashing off the event loop.
+
+scrypt keeps a core busy for tens of milliseconds per hash, which on the event
+loop would stall every other request and in the request threadpool would tie
+up the threads that sync endpoints need. ``PasswordHasher`` runs ``src/core/passwords.py`` on a pool of
+``BARTER_PASSWORD_HASH_WORKERS`` worker processes instead, started on first
+use and shut down from the application lifespan. Workers are spawned rather
+than forked, so they never inherit the parent's event loop, database
+connections or threads.
+
+At most ``BARTER_PASSWORD_HASH_MAX_PENDING`` hashes are queued or running at
+once; further callers wait for a slot, which bounds the memory a burst of
+logins can take (every running hash holds ``128 * n * r`` bytes).
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from src.core.passwords import hash_password, needs_rehash, verify_password
+from src.infrastructure.config import PASSWORD_HASH_MAX_PENDING, PASSWORD_HASH_WORKERS, PASSWORD_SCRYPT_N, \
+    PASSWORD_SCRYPT_P, PASSWORD_SCRYPT_R
+
+
+class PasswordHasher:
+    """Hashes and verifies passwords on a bounded pool of worker processes."""
+
+    def __init__(self, workers: Optional[int] = PASSWORD_HASH_WORKERS, max_pending: int = PASSWORD_HASH_MAX_PENDING,
+                 n: int = PASSWORD_SCRYPT_N, r: int = PASSWORD_SCRYPT_R, p: int = PASSWORD_SCRYPT_P):
+        """
+        Initializes the PasswordHasher instance, without starting the workers.
+
+        Args:
+            workers (Optional[int]): Worker processes; None for one per CPU.
+            max_pending (int): Maximum number of hashes queued or running at once.
+            n (int): scrypt CPU/memory cost of new hashes.
+            r (int): scrypt block size of new hashes.
+            p (int): scrypt parallelization of new hashes.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.n = n
+        self.r = r
+        self.p = p
+        self._slots = asyncio.Semaphore(max_pending)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+    async def _run(self, function, *args):
+        async with self._slots:
+            return await asyncio.get_running_loop().run_in_executor(self._pool(), function, *args)
+
+    async def hash(self, password: str) -> str:
+        """
+        Hashes a password with the configured cost.
+
+        Args:
+            password (str): The password.
+
+        Returns:
+            str: The encoded hash, to store as the user's ``hashed_password``.
+        """
+        return await self._run(hash_password, password, self.n, self.r, self.p)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """
+        Checks a password against a stored hash.
+
+        Args:
+            password (str): The password to check.
+            hashed_password (str): The stored hash.
+
+        Returns:
+            bool: Whether the password matches.
+        """
+        return await self._run(verify_password, password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """
+        Tells whether a stored hash is legacy or was made with another cost. Cheap: runs inline.
+
+        Args:
+            hashed_password (str): The stored hash.
+
+        Returns:
+            bool: Whether to hash the password again with the configured cost.
+        """
+        return needs_rehash(hashed_password, self.n, self.r, self.p)
+
+    def close(self):
+        """Waits for running hashes and stops the workers. A later call starts new ones."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,73 @@
+# src/infrastructure/repositories/cached_offer_repository.py
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from src.core.entities.offer import OfferRecord
+from src.core.repositories import OfferRepository
+from src.infrastructure.cache import Cache
+
+
+class CachedOfferRepository:
+    """Read-through cache in front of an offer repository.
+
+    Lookups by ID are served from the cache; every write refreshes or drops the
+    cached entry. Methods not overridden here are delegated unchanged.
+    """
+
+    def __init__(self, repository: OfferRepository, cache: Cache):
+        """
+        Initializes the CachedOfferRepository instance.
+
+        Args:
+            repository (OfferRepository): The repository reads fall through to.
+            cache (Cache): The cache holding offers by ID.
+        """
+        self.repository = repository
+        self.cache = cache
+
+    def __getattr__(self, name):
+        return getattr(self.repository, name)
+
+    async def create_offer(self, offer: OfferRecord) -> OfferRecord:
+        created_offer = await self.repository.create_offer(offer)
+        self.cache.set(created_offer.id, created_offer)
+        return created_offer
+
+    async def get_offer_by_id(self, offer_id: UUID) -> OfferRecord:
+        return await self.cache.get_or_load(offer_id, lambda: self.repository.get_offer_by_id(offer_id))
+
+    async def update_offer(self, offer: OfferRecord, expected_versions: Optional[list[int]] = None,
+                           from_user_id: Optional[UUID] = None) -> OfferRecord:
+        self.cache.invalidate(offer.id)
+        updated_offer = await self.repository.update_offer(offer, expected_versions, from_user_id)
+        self.cache.set(updated_offer.id, updated_offer)
+        return updated_offer
+
+    async def delete_offer(self, offer_id: UUID, from_user_id: Optional[UUID] = None):
+        self.cache.invalidate(offer_id)
+        return await self.repository.delete_offer(offer_id, from_user_id)
+
+    async def update_offer_status(self, offer_id: UUID, status: str, to_user_id: Optional[UUID] = None) \
+            -> Optional[tuple[OfferRecord, list[OfferRecord]]]:
+        self.cache.invalidate(offer_id)
+        result = await self.repository.update_offer_status(offer_id, status, to_user_id)
+        if result:
+            updated_offer, rejected_offers = result
+            self.cache.set(offer_id, updated_offer)
+            for offer in rejected_offers:
+                self.cache.set(offer.id, offer)
+        return result
+
+    async def expire_pending_offers(self, now: datetime, limit: int) -> list[OfferRecord]:
+        expired_offers = await self.repository.expire_pending_offers(now, limit)
+        for offer in expired_offers:
+            self.cache.invalidate(offer.id)
+        return expired_offers
+
+    async def reject_offers_for_products(self, product_ids: list[UUID]) -> list[OfferRecord]:
+        rejected_offers = await self.repository.reject_offers_for_products(product_ids)
+        for offer in rejected_offers:
+            self.cache.set(offer.id, offer)
+        return rejected_offers
@@ -0,0 +1,55 @@
+# src/infrastructure/repositories/cached_product_repository.py
+
+from typing import Optional
+from uuid import UUID
+
+from src.core.entities.product import ProductRecord
+from src.core.repositories import ProductRepository
+from src.infrastructure.cache import Cache
+
+
+class CachedProductRepository:
+    """Read-through cache in front of a product repository.
+
+    Lookups by ID are served from the cache; every write refreshes or drops the
+    cached entry. Methods not overridden here are delegated unchanged.
+    """
+
+    def __init__(self, repository: ProductRepository, cache: Cache):
+        """
+        Initializes the CachedProductRepository instance.
+
+        Args:
+            repository (ProductRepository): The repository reads fall through to.
+            cache (Cache): The cache holding products by ID.
+        """
+        self.repository = repository
+        self.cache = cache
+
+    def __getattr__(self, name):
+        return getattr(self.repository, name)
+
+    async def create_product(self, product: ProductRecord) -> ProductRecord:
+        created_product = await self.repository.create_product(product)
+        self.cache.set(created_product.id, created_product)
+        return created_product
+
+    async def get_product_by_id(self, product_id: UUID) -> ProductRecord:
+        return await self.cache.get_or_load(product_id, lambda: self.repository.get_product_by_id(product_id))
+
+    async def get_product_version(self, product_id: UUID) -> Optional[int]:
+        cached_product = self.cache.get(product_id)
+        if cached_product is not None:
+            return cached_product.version
+        return await self.repository.get_product_version(product_id)
+
+    async def update_product(self, product: ProductRecord, expected_versions: Optional[list[int]] = None,
+                             owner_id: Optional[UUID] = None) -> ProductRecord:
+        self.cache.invalidate(product.id)
+        updated_product = await self.repository.update_product(product, expected_versions, owner_id)
+        self.cache.set(updated_product.id, updated_product)
+        return updated_product
+
+    async def delete_product(self, product_id: UUID, owner_id: Optional[UUID] = None):
+        self.cache.invalidate(product_id)
+        return await self.repository.delete_product(product_id, owner_id)
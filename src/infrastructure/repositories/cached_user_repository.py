@@ -0,0 +1,53 @@
+# src/infrastructure/repositories/cached_user_repository.py
+
+from typing import Optional
+from uuid import UUID
+
+from src.core.entities.user import UserRecord
+from src.core.repositories import UserRepository
+from src.infrastructure.cache import Cache
+
+
+class CachedUserRepository:
+    """Read-through cache in front of a user repository.
+
+    Lookups by ID are served from the cache; every write refreshes or drops the
+    cached entry. Methods not overridden here are delegated unchanged.
+    """
+
+    def __init__(self, repository: UserRepository, cache: Cache):
+        """
+        Initializes the CachedUserRepository instance.
+
+        Args:
+            repository (UserRepository): The repository reads fall through to.
+            cache (Cache): The cache holding users by ID.
+        """
+        self.repository = repository
+        self.cache = cache
+
+    def __getattr__(self, name):
+        return getattr(self.repository, name)
+
+    async def create_user(self, user: UserRecord) -> UserRecord:
+        created_user = await self.repository.create_user(user)
+        self.cache.set(created_user.id, created_user)
+        return created_user
+
+    async def get_user_by_id(self, id: UUID) -> UserRecord:
+        return await self.cache.get_or_load(id, lambda: self.repository.get_user_by_id(id))
+
+    async def update_user(self, user: UserRecord) -> UserRecord:
+        self.cache.invalidate(user.id)
+        updated_user = await self.repository.update_user(user)
+        if updated_user:
+            self.cache.set(updated_user.id, updated_user)
+        return updated_user
+
+    async def patch_user(self, id: UUID, fields: Optional[dict] = None, add_interests: Optional[list[str]] = None,
+                         remove_interests: Optional[list[str]] = None) -> UserRecord:
+        self.cache.invalidate(id)
+        updated_user = await self.repository.patch_user(id, fields, add_interests, remove_interests)
+        if updated_user:
+            self.cache.set(id, updated_user)
+        return updated_user
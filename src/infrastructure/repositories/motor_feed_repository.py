@@ -0,0 +1,79 @@
+# src/infrastructure/repositories/motor_feed_repository.py
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import UpdateOne
+from src.core.entities.feed import FeedItem
+from uuid import UUID
+from src.infrastructure.config import FEED_MAX_ITEMS
+from src.infrastructure.mappers import feed_item_mapper
+
+
+class MotorFeedRepository:
+    """
+    Asynchronous repository for materialized recommendation feeds.
+
+    Each user has one document whose ``items`` array is kept sorted by score
+    (then recency) and capped at ``max_items`` by every write, so reading a page
+    is a single indexed lookup with a $slice projection.
+    """
+
+    def __init__(self, collection: AsyncIOMotorCollection, max_items: int = FEED_MAX_ITEMS):
+        """
+        Initializes the MotorFeedRepository instance.
+
+        Args:
+            collection (AsyncIOMotorCollection): Motor collection.
+            max_items (int): Maximum number of items kept per feed.
+        """
+        self.collection = collection
+        self.max_items = max_items
+
+    async def push_items(self, entries: list[tuple[UUID, FeedItem]]):
+        """
+        Adds one item to each of several feeds in one unordered bulk write.
+
+        Args:
+            entries (list[tuple[UUID, FeedItem]]): (user ID, item) pairs.
+        """
+        if not entries:
+            return
+        await self.collection.bulk_write([
+            UpdateOne({"user_id": user_id}, {"$push": {"items": {
+                "$each": [feed_item_mapper.to_document(item)],
+                "$sort": {"score": -1, "added_at": -1},
+                "$slice": self.max_items,
+            }}}, upsert=True)
+            for user_id, item in entries
+        ], ordered=False)
+
+    async def pull_product(self, product_id: UUID) -> int:
+        """
+        Removes a product from every feed that holds it.
+
+        Args:
+            product_id (UUID): The ID of the product.
+
+        Returns:
+            int: The number of feeds changed.
+        """
+        result = await self.collection.update_many({"items.product_id": product_id},
+                                                   {"$pull": {"items": {"product_id": product_id}}})
+        return result.modified_count
+
+    async def get_feed(self, user_id: UUID, offset: int = 0, limit: int = 50) -> list[FeedItem]:
+        """
+        Retrieves one page of a user's feed.
+
+        Args:
+            user_id (UUID): The ID of the user.
+            offset (int): Index of the first item to return.
+            limit (int): Maximum number of items to return.
+
+        Returns:
+            list[FeedItem]: The items, best first.
+        """
+        feed = await self.collection.find_one({"user_id": user_id},
+                                              {"_id": False, "items": {"$slice": [offset, limit]}})
+        if not feed:
+            return []
+        return [feed_item_mapper.from_document(item) for item in feed.get("items", [])]
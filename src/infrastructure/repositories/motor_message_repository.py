@@ -0,0 +1,199 @@
+# src/infrastructure/repositories/motor_message_repository.py
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import DESCENDING, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from src.core.entities.message import Conversation, Message
+from uuid import UUID, uuid4
+from src.infrastructure.config import MESSAGE_BUCKET_SIZE
+from src.infrastructure.mappers import bson_now, conversation_mapper, message_mapper
+
+CONVERSATION_PROJECTION = {"_id": False, "key": False}
+PREVIEW_LENGTH = 100
+
+
+def conversation_key(participants: list[UUID], offer_id: Optional[UUID] = None) -> str:
+    key = "-".join(sorted(str(participant) for participant in participants))
+    return f"{key}:{offer_id}" if offer_id else key
+
+
+class MotorMessageRepository:
+    """
+    Asynchronous repository for conversations and their messages in MongoDB.
+
+    Messages are stored in bucket documents holding up to ``bucket_size``
+    messages of one conversation. Sending appends to the open bucket with a
+    single $push, and a page of history is read from one or two buckets
+    instead of one document per message. Buckets are numbered, and a unique
+    (conversation_id, seq) index lets only one sender open the next bucket,
+    so a conversation never has two open buckets. Each conversation document
+    keeps per-participant unread counters, maintained with $inc.
+    """
+
+    def __init__(self, conversations: AsyncIOMotorCollection, buckets: AsyncIOMotorCollection,
+                 bucket_size: int = MESSAGE_BUCKET_SIZE):
+        """
+        Initializes the MotorMessageRepository instance.
+
+        Args:
+            conversations (AsyncIOMotorCollection): The conversations collection.
+            buckets (AsyncIOMotorCollection): The message buckets collection.
+            bucket_size (int): Maximum number of messages per bucket.
+        """
+        self.conversations = conversations
+        self.buckets = buckets
+        self.bucket_size = bucket_size
+
+    async def get_or_create_conversation(self, conversation: Conversation) -> Conversation:
+        """
+        Returns the conversation between the same participants about the same offer, creating it if needed.
+
+        Args:
+            conversation (Conversation): The conversation to create.
+
+        Returns:
+            Conversation: The existing or created conversation.
+        """
+        conversation.id = conversation.id or uuid4()
+        key = conversation_key(conversation.participants, conversation.offer_id)
+        document = {**conversation_mapper.to_document(conversation), "key": key}
+        try:
+            conversation_dict = await self.conversations.find_one_and_update(
+                {"key": key}, {"$setOnInsert": document}, upsert=True,
+                projection=CONVERSATION_PROJECTION, return_document=ReturnDocument.AFTER)
+        except DuplicateKeyError:
+            # Lost a race against another upsert of the same conversation.
+            conversation_dict = await self.conversations.find_one({"key": key}, CONVERSATION_PROJECTION)
+        return conversation_mapper.from_document(conversation_dict)
+
+    async def get_conversation_by_id(self, conversation_id: UUID) -> Conversation:
+        """
+        Retrieves a conversation by its ID.
+
+        Args:
+            conversation_id (UUID): The ID of the conversation.
+
+        Returns:
+            Conversation: The conversation, or None if it does not exist.
+        """
+        return conversation_mapper.from_document(
+            await self.conversations.find_one({"id": conversation_id}, CONVERSATION_PROJECTION))
+
+    async def get_conversations_for_user(self, user_id: UUID, limit: Optional[int] = None) -> list[Conversation]:
+        """
+        Retrieves a user's conversations, most recently active first.
+
+        Args:
+            user_id (UUID): The ID of the participant.
+            limit (Optional[int]): Maximum number of conversations to return.
+
+        Returns:
+            list[Conversation]: The conversations.
+        """
+        cursor = self.conversations.find({"participants": user_id}, CONVERSATION_PROJECTION) \
+            .sort("last_message_at", DESCENDING)
+        if limit:
+            cursor = cursor.limit(limit)
+        return [conversation_mapper.from_document(conversation_dict) async for conversation_dict in cursor]
+
+    async def append_message(self, message: Message, participants: list[UUID]) -> Message:
+        """
+        Stores a message and bumps the unread counters of the other participants.
+
+        The bucket append and the conversation update are independent and are
+        sent concurrently.
+
+        Args:
+            message (Message): The message.
+            participants (list[UUID]): The participants of the conversation.
+
+        Returns:
+            Message: The stored message, with its ID and timestamp.
+        """
+        message.id = message.id or uuid4()
+        message.sent_at = message.sent_at or bson_now()
+        unread = {f"unread.{participant}": 1 for participant in participants if participant != message.sender_id}
+        await asyncio.gather(
+            self._append_to_bucket(message),
+            self.conversations.update_one(
+                {"id": message.conversation_id},
+                {"$inc": unread, "$set": {"last_message_at": message.sent_at,
+                                          "last_message_preview": message.body[:PREVIEW_LENGTH]}}),
+        )
+        return message
+
+    async def _append_to_bucket(self, message: Message):
+        """
+        Pushes a message onto the conversation's open bucket, opening the next bucket when there is none.
+
+        Args:
+            message (Message): The message, with its ID and timestamp.
+        """
+        message_dict = message_mapper.to_document(message)
+        while True:
+            result = await self.buckets.update_one(
+                {"conversation_id": message.conversation_id, "count": {"$lt": self.bucket_size}},
+                {"$push": {"messages": message_dict}, "$inc": {"count": 1},
+                 "$min": {"first_at": message.sent_at}, "$max": {"last_at": message.sent_at}})
+            if result.matched_count:
+                return
+            latest = await self.buckets.find_one({"conversation_id": message.conversation_id, "seq": {"$exists": True}},
+                                                 {"_id": False, "seq": True}, sort=[("seq", DESCENDING)])
+            try:
+                await self.buckets.insert_one({"conversation_id": message.conversation_id,
+                                               "seq": latest["seq"] + 1 if latest else 0, "count": 1,
+                                               "messages": [message_dict], "first_at": message.sent_at,
+                                               "last_at": message.sent_at})
+                return
+            except DuplicateKeyError:
+                # Another sender opened this bucket first: append to it instead.
+                continue
+
+    async def get_messages(self, conversation_id: UUID, before: Optional[tuple[float, UUID]] = None,
+                           limit: int = 50) -> list[Message]:
+        """
+        Retrieves one page of a conversation's history, newest first.
+
+        Args:
+            conversation_id (UUID): The ID of the conversation.
+            before (Optional[tuple[float, UUID]]): Timestamp and ID of the oldest message already returned.
+            limit (int): Maximum number of messages to return.
+
+        Returns:
+            list[Message]: The messages, newest first.
+        """
+        query = {"conversation_id": conversation_id}
+        if before is not None:
+            query["first_at"] = {"$lte": datetime.fromtimestamp(before[0], timezone.utc)}
+        cursor = self.buckets.find(query, {"_id": False, "messages": True}).sort("first_at", DESCENDING) \
+            .batch_size(limit // self.bucket_size + 2)
+        messages = []
+        async for bucket in cursor:
+            for message_dict in bucket["messages"]:
+                message = message_mapper.from_document(message_dict)
+                if before is None or (message.sent_at.timestamp(), message.id) < before:
+                    messages.append(message)
+            if len(messages) >= limit:
+                break
+        messages.sort(key=lambda message: (message.sent_at, message.id), reverse=True)
+        return messages[:limit]
+
+    async def mark_read(self, conversation_id: UUID, user_id: UUID) -> Conversation:
+        """
+        Resets a participant's unread counter.
+
+        Args:
+            conversation_id (UUID): The ID of the conversation.
+            user_id (UUID): The participant.
+
+        Returns:
+            Conversation: The updated conversation, or None if the user is not a participant.
+        """
+        conversation_dict = await self.conversations.find_one_and_update(
+            {"id": conversation_id, "participants": user_id}, {"$set": {f"unread.{user_id}": 0}},
+            projection=CONVERSATION_PROJECTION, return_document=ReturnDocument.AFTER)
+        return conversation_mapper.from_document(conversation_dict)
@@ -0,0 +1,405 @@
+# src/infrastructure/repositories/motor_offer_repository.py
+
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Optional
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.errors import BulkWriteError
+from src.core.entities.offer import Offer, OfferRecord, OfferPage, OFFER_STATUS_ACCEPTED, OFFER_STATUS_EXPIRED, \
+    OFFER_STATUS_PENDING, OFFER_STATUS_REJECTED, OFFER_TIMESTAMP_FIELDS, statuses_allowed_before
+from src.core.repositories import NotFoundError
+from src.core.tokens import PermissionDeniedError
+from src.core.versioning import VersionConflictError
+from uuid import UUID, uuid4
+from src.infrastructure.config import BULK_CHUNK_SIZE, OFFER_SWEEP_BATCH_SIZE, OFFER_TTL_SECONDS
+from src.infrastructure.mappers import ENTITY_PROJECTION, bson_now, offer_mapper, offer_view_mapper, \
+    version_condition
+
+PRODUCTS_COLLECTION = "products"
+
+
+class MotorOfferRepository:
+    """Asynchronous repository for managing offers in MongoDB."""
+
+    def __init__(self, collection: AsyncIOMotorCollection, ttl_seconds: int = OFFER_TTL_SECONDS):
+        """
+        Initializes the MotorOfferRepository instance.
+
+        Args:
+            collection (AsyncIOMotorCollection): Motor collection.
+            ttl_seconds (int): How long a new offer stays pending before it expires.
+        """
+        self.collection = collection
+        self.ttl = timedelta(seconds=ttl_seconds)
+
+    def _stamp(self, offer: OfferRecord, now: datetime):
+        """Fills in the ID, the first version and the lifecycle timestamps of a new offer."""
+        if offer.id is None:
+            offer.id = uuid4()
+        offer.version = 1
+        offer.created_at = offer.created_at or now
+        offer.expires_at = offer.expires_at or offer.created_at + self.ttl
+        if offer.status != OFFER_STATUS_PENDING:
+            offer.closed_at = offer.closed_at or now
+
+    async def create_offer(self, offer: OfferRecord) -> OfferRecord:
+        """
+        Creates a new offer.
+
+        Args:
+            offer (OfferRecord): The offer to be created.
+
+        Returns:
+            OfferRecord: The created offer.
+        """
+        self._stamp(offer, bson_now())
+        await self.collection.insert_one(offer_mapper.to_document(offer))
+        return offer
+
+    async def create_offers(self, offers: list[OfferRecord], chunk_size: int = BULK_CHUNK_SIZE) -> list[Optional[str]]:
+        """
+        Creates many offers with unordered insert_many calls of at most ``chunk_size`` documents.
+
+        A failing document (for example a duplicate ID) does not stop the rest
+        of its chunk from being written.
+
+        Args:
+            offers (list[OfferRecord]): The offers to be created; missing IDs are assigned.
+            chunk_size (int): Maximum number of documents per insert_many call.
+
+        Returns:
+            list[Optional[str]]: One entry per offer, None if it was inserted or the error message otherwise.
+        """
+        errors = [None] * len(offers)
+        now = bson_now()
+        for offset in range(0, len(offers), chunk_size):
+            documents = []
+            for offer in offers[offset:offset + chunk_size]:
+                self._stamp(offer, now)
+                documents.append(offer_mapper.to_document(offer))
+            try:
+                await self.collection.insert_many(documents, ordered=False)
+            except BulkWriteError as e:
+                for write_error in e.details["writeErrors"]:
+                    errors[offset + write_error["index"]] = write_error["errmsg"]
+        return errors
+
+    async def get_offer_by_id(self, offer_id: UUID) -> OfferRecord:
+        """
+        Retrieves an offer by its ID.
+
+        Args:
+            offer_id (UUID): The ID of the offer.
+
+        Returns:
+            OfferRecord: The retrieved offer.
+        """
+        return offer_mapper.from_document(await self.collection.find_one({"id": offer_id}, ENTITY_PROJECTION))
+
+    async def update_offer(self, offer: OfferRecord, expected_versions: Optional[list[int]] = None,
+                           from_user_id: Optional[UUID] = None) -> OfferRecord:
+        """
+        Updates a pending offer and increments its version. The status and lifecycle timestamps are kept as
+        stored: they only change through ``update_offer_status`` and the expiry sweep.
+
+        Args:
+            offer (OfferRecord): The offer to be updated; its status and version are ignored.
+            expected_versions (Optional[list[int]]): Only update if the stored version is one of these.
+            from_user_id (Optional[UUID]): Only update if the stored offer was made by this user.
+
+        Returns:
+            OfferRecord: The updated offer.
+
+        Raises:
+            VersionConflictError: If the offer is at another version than expected.
+            PermissionDeniedError: If the offer was made by another user than ``from_user_id``.
+            ValueError: If the offer is no longer pending.
+            NotFoundError: If the offer does not exist.
+        """
+        query = {"id": offer.id, "status": OFFER_STATUS_PENDING}
+        if expected_versions is not None:
+            query["version"] = version_condition(expected_versions)
+        if from_user_id is not None:
+            query["from_user_id"] = from_user_id
+        document = offer_mapper.to_document(offer)
+        for field in (*OFFER_TIMESTAMP_FIELDS, "status", "version"):
+            document.pop(field, None)
+        offer_dict = await self.collection.find_one_and_update(query, {"$set": document, "$inc": {"version": 1}},
+                                                               projection=ENTITY_PROJECTION,
+                                                               return_document=ReturnDocument.AFTER)
+        if not offer_dict:
+            current = await self.collection.find_one({"id": offer.id},
+                                                     {"_id": False, "from_user_id": True, "status": True})
+            if current is not None and from_user_id is not None and current["from_user_id"] != from_user_id:
+                raise PermissionDeniedError("Only the user who made the offer may change it")
+            if current is not None and current["status"] != OFFER_STATUS_PENDING:
+                raise ValueError(f"Offer is {current['status']} and can no longer be changed")
+            if current is not None and expected_versions is not None:
+                raise VersionConflictError("Offer was modified since it was read")
+            raise NotFoundError("Offer not found")
+        return offer_mapper.from_document(offer_dict)
+
+    async def delete_offer(self, offer_id: UUID, from_user_id: Optional[UUID] = None):
+        """
+        Deletes an offer by its ID.
+
+        Args:
+            offer_id (UUID): The ID of the offer.
+            from_user_id (Optional[UUID]): Only delete the offer if it was made by this user.
+
+        Raises:
+            PermissionDeniedError: If the offer was made by another user than ``from_user_id``.
+            NotFoundError: If the offer does not exist.
+        """
+        query = {"id": offer_id}
+        if from_user_id is not None:
+            query["from_user_id"] = from_user_id
+        result = await self.collection.delete_one(query)
+        if result.deleted_count == 0:
+            if from_user_id is not None and await self.collection.find_one({"id": offer_id}, {"_id": True}):
+                raise PermissionDeniedError("Only the user who made the offer may delete it")
+            raise NotFoundError("Offer not found")
+
+    async def update_offer_status(self, offer_id: UUID, status: str, to_user_id: Optional[UUID] = None) \
+            -> Optional[tuple[OfferRecord, list[OfferRecord]]]:
+        """
+        Moves an offer to a new status in a single round-trip.
+
+        The update only matches while the offer is in a status allowed by
+        OFFER_TRANSITIONS, so concurrent accepts cannot both succeed, and, with
+        ``to_user_id``, while it is made to that user, so the recipient check
+        costs no read. Accepting an offer also rejects every other pending
+        offer involving either of its products: they are found with one find
+        and closed with one update_many on their IDs that still requires them
+        to be pending, as the expiry sweep does.
+
+        Args:
+            offer_id (UUID): The ID of the offer.
+            status (str): The new status of the offer.
+            to_user_id (Optional[UUID]): Only update the offer if it was made to this user.
+
+        Returns:
+            Optional[tuple[OfferRecord, list[OfferRecord]]]: The updated offer and the competing offers an
+            accept rejected, as they are now; None if the offer does not exist.
+
+        Raises:
+            PermissionDeniedError: If the offer was made to another user than ``to_user_id``.
+            ValueError: If the offer cannot move to the requested status.
+        """
+        now = bson_now()
+        query = {"id": offer_id, "status": {"$in": statuses_allowed_before(status)}}
+        if to_user_id is not None:
+            query["to_user_id"] = to_user_id
+        offer_dict = await self.collection.find_one_and_update(
+            query,
+            {"$set": {"status": status, "closed_at": now}, "$inc": {"version": 1}},
+            projection=ENTITY_PROJECTION,
+            return_document=ReturnDocument.AFTER
+        )
+        if not offer_dict:
+            current = await self.collection.find_one({"id": offer_id}, {"status": 1, "to_user_id": 1})
+            if not current:
+                return None
+            if to_user_id is not None and current.get("to_user_id") != to_user_id:
+                raise PermissionDeniedError("Only the user the offer was made to may accept or reject it")
+            raise ValueError(f"Offer cannot move from {current.get('status')} to {status}")
+
+        rejected = []
+        if status == OFFER_STATUS_ACCEPTED:
+            rejected = await self._reject_competing(offer_id, [offer_dict['product_id'],
+                                                               offer_dict['offered_product_id']], now)
+        return offer_mapper.from_document(offer_dict), rejected
+
+    async def reject_offers_for_products(self, product_ids: list[UUID]) -> list[OfferRecord]:
+        """
+        Rejects every pending offer involving one of the products, e.g. once a trade has given them away.
+
+        Args:
+            product_ids (list[UUID]): The products that are no longer available.
+
+        Returns:
+            list[OfferRecord]: The offers this call rejected, as they are now.
+        """
+        return await self._reject_competing(None, product_ids, bson_now())
+
+    async def _reject_competing(self, offer_id: Optional[UUID], traded_products: list[UUID],
+                                now: datetime) -> list[OfferRecord]:
+        """Rejects the pending offers other than ``offer_id`` involving the traded products; returns them as stored."""
+        query = {"status": OFFER_STATUS_PENDING,
+                 "$or": [{"product_id": {"$in": traded_products}}, {"offered_product_id": {"$in": traded_products}}]}
+        if offer_id is not None:
+            query["id"] = {"$ne": offer_id}
+        candidates = await self.collection.find(query, ENTITY_PROJECTION).to_list(length=None)
+        if not candidates:
+            return []
+        candidate_ids = [offer_dict["id"] for offer_dict in candidates]
+        result = await self.collection.update_many(
+            {"id": {"$in": candidate_ids}, "status": OFFER_STATUS_PENDING},
+            {"$set": {"status": OFFER_STATUS_REJECTED, "closed_at": now}, "$inc": {"version": 1}})
+        if result.modified_count != len(candidates):
+            # Some offers were settled concurrently; only report the ones rejected here, as stored.
+            candidates = await self.collection.find(
+                {"id": {"$in": candidate_ids}, "status": OFFER_STATUS_REJECTED, "closed_at": now},
+                ENTITY_PROJECTION).to_list(length=None)
+        else:
+            for offer_dict in candidates:
+                offer_dict.update(status=OFFER_STATUS_REJECTED, closed_at=now, version=offer_dict.get("version", 0) + 1)
+        return [offer_mapper.from_document(offer_dict) for offer_dict in candidates]
+
+    async def get_offers_to_user(self, user_id: UUID, status: Optional[str] = None, after: Optional[UUID] = None,
+                                 limit: Optional[int] = None) -> list[OfferRecord]:
+        """
+        Retrieves one page of offers received by a user, ordered by offer ID.
+
+        Args:
+            user_id (UUID): The ID of the receiving user.
+            status (Optional[str]): Only return offers in this status.
+            after (Optional[UUID]): Only return offers whose ID sorts after this one.
+            limit (Optional[int]): Maximum number of offers to return.
+
+        Returns:
+            list[OfferRecord]: The received offers.
+        """
+        return [offer async for offer in self.iter_offers("to_user_id", user_id, status, after, limit)]
+
+    async def get_offers_from_user(self, user_id: UUID, status: Optional[str] = None, after: Optional[UUID] = None,
+                                   limit: Optional[int] = None) -> list[OfferRecord]:
+        """
+        Retrieves one page of offers sent by a user, ordered by offer ID.
+
+        Args:
+            user_id (UUID): The ID of the sending user.
+            status (Optional[str]): Only return offers in this status.
+            after (Optional[UUID]): Only return offers whose ID sorts after this one.
+            limit (Optional[int]): Maximum number of offers to return.
+
+        Returns:
+            list[OfferRecord]: The sent offers.
+        """
+        return [offer async for offer in self.iter_offers("from_user_id", user_id, status, after, limit)]
+
+    async def get_offer_page(self, user_field: str, user_id: UUID, status: Optional[str] = None,
+                             after: Optional[UUID] = None, limit: int = 50) -> OfferPage:
+        """
+        Retrieves one page of a user's offers with both products joined in, and the user's
+        offer counts per status, in a single aggregation.
+
+        The leading $match uses the (user field, status, id) index; a $facet then
+        pages and joins the requested offers while grouping all of the user's offers
+        by status, so badge counts need no separate count queries.
+
+        Args:
+            user_field (str): Either "to_user_id" or "from_user_id".
+            user_id (UUID): The ID of the user.
+            status (Optional[str]): Only list offers in this status. Counts always cover every status.
+            after (Optional[UUID]): Only list offers whose ID sorts after this one.
+            limit (int): Maximum number of offers to list.
+
+        Returns:
+            OfferPage: The offers, ordered by offer ID, and the counts per status.
+        """
+        page_match = {}
+        if status is not None:
+            page_match["status"] = status
+        if after is not None:
+            page_match["id"] = {"$gt": after}
+        items = [
+            {"$match": page_match},
+            {"$sort": {"id": ASCENDING}},
+            {"$limit": limit},
+            {"$lookup": {"from": PRODUCTS_COLLECTION, "localField": "product_id", "foreignField": "id",
+                         "as": "product"}},
+            {"$lookup": {"from": PRODUCTS_COLLECTION, "localField": "offered_product_id", "foreignField": "id",
+                         "as": "offered_product"}},
+            # Each lookup matches at most one product by its unique ID; a deleted product leaves the field unset.
+            {"$unwind": {"path": "$product", "preserveNullAndEmptyArrays": True}},
+            {"$unwind": {"path": "$offered_product", "preserveNullAndEmptyArrays": True}},
+            {"$project": {"_id": False, "product.description": False, "product._id": False,
+                          "offered_product.description": False, "offered_product._id": False}},
+        ]
+        pipeline = [
+            {"$match": {user_field: user_id}},
+            {"$facet": {
+                "items": items,
+                "counts": [{"$group": {"_id": "$status", "count": {"$sum": 1}}}],
+            }},
+        ]
+        result = await self.collection.aggregate(pipeline).to_list(length=1)
+        facets = result[0] if result else {"items": [], "counts": []}
+        return OfferPage(items=[offer_view_mapper.from_document(document) for document in facets["items"]],
+                         counts={count["_id"]: count["count"] for count in facets["counts"]})
+
+    async def iter_offers(self, user_field: str, user_id: UUID, status: Optional[str] = None,
+                          after: Optional[UUID] = None, limit: Optional[int] = None) -> AsyncIterator[OfferRecord]:
+        """
+        Yields the offers of a user as the cursor produces them, ordered by offer ID.
+
+        Args:
+            user_field (str): Either "to_user_id" or "from_user_id".
+            user_id (UUID): The ID of the user.
+            status (Optional[str]): Only yield offers in this status.
+            after (Optional[UUID]): Only yield offers whose ID sorts after this one.
+            limit (Optional[int]): Maximum number of offers to yield.
+
+        Yields:
+            OfferRecord: The matching offers.
+        """
+        query = {user_field: user_id}
+        if status is not None:
+            query["status"] = status
+        if after is not None:
+            query["id"] = {"$gt": after}
+        cursor = self.collection.find(query, ENTITY_PROJECTION).sort("id", ASCENDING)
+        if limit:
+            cursor = cursor.limit(limit)
+        async for offer_dict in cursor:
+            yield offer_mapper.from_document(offer_dict)
+
+    async def iter_offers_by_status(self, status: str) -> AsyncIterator[OfferRecord]:
+        """
+        Yields every offer in a status. This scans the collection and is meant for
+        rebuilding in-process state at startup, not for request handling.
+
+        Args:
+            status (str): The status of the offers.
+
+        Yields:
+            OfferRecord: The matching offers.
+        """
+        async for offer_dict in self.collection.find({"status": status}, ENTITY_PROJECTION):
+            yield offer_mapper.from_document(offer_dict)
+
+    async def expire_pending_offers(self, now: datetime, limit: int = OFFER_SWEEP_BATCH_SIZE) -> list[OfferRecord]:
+        """
+        Moves at most ``limit`` pending offers whose expiry has passed to expired.
+
+        The batch is selected with a bounded find on the (status, expires_at)
+        index and closed with one update_many on its IDs, which still requires
+        the offers to be pending, so an offer accepted or rejected in between
+        keeps its status.
+
+        Args:
+            now (datetime): The sweep time; offers expiring at or before it are expired.
+            limit (int): Maximum number of offers expired.
+
+        Returns:
+            list[OfferRecord]: The offers this call expired, as they are now.
+        """
+        candidates = await self.collection.find(
+            {"status": OFFER_STATUS_PENDING, "expires_at": {"$lte": now}}, ENTITY_PROJECTION
+        ).sort("expires_at", ASCENDING).limit(limit).to_list(length=limit)
+        if not candidates:
+            return []
+        result = await self.collection.update_many(
+            {"id": {"$in": [offer_dict["id"] for offer_dict in candidates]}, "status": OFFER_STATUS_PENDING},
+            {"$set": {"status": OFFER_STATUS_EXPIRED, "closed_at": now}, "$inc": {"version": 1}})
+        if result.modified_count != len(candidates):
+            # Some offers were settled concurrently; only report the ones expired here, as stored.
+            candidates = await self.collection.find(
+                {"id": {"$in": [offer_dict["id"] for offer_dict in candidates]},
+                 "status": OFFER_STATUS_EXPIRED, "closed_at": now}, ENTITY_PROJECTION).to_list(length=limit)
+        else:
+            for offer_dict in candidates:
+                offer_dict.update(status=OFFER_STATUS_EXPIRED, closed_at=now, version=offer_dict.get("version", 0) + 1)
+        return [offer_mapper.from_document(offer_dict) for offer_dict in candidates]
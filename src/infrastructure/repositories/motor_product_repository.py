@@ -0,0 +1,238 @@
+# src/infrastructure/repositories/motor_product_repository.py
+
+from typing import AsyncIterator, Optional
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.errors import BulkWriteError
+from src.core.entities.product import Product, ProductRecord
+from src.core.repositories import NotFoundError
+from src.core.tokens import PermissionDeniedError
+from src.core.versioning import VersionConflictError
+from uuid import UUID, uuid4
+from src.infrastructure.config import BULK_CHUNK_SIZE
+from src.infrastructure.mappers import ENTITY_PROJECTION, PRODUCT_DOCUMENT_PROJECTION, product_mapper, \
+    version_condition
+
+
+class MotorProductRepository:
+    """Asynchronous repository for managing products in MongoDB."""
+
+    def __init__(self, collection: AsyncIOMotorCollection):
+        """
+        Initializes the MotorProductRepository instance.
+
+        Args:
+            collection (AsyncIOMotorCollection): Motor collection.
+        """
+        self.collection = collection
+
+    async def create_product(self, product: ProductRecord) -> ProductRecord:
+        """
+        Creates a new product.
+
+        Args:
+            product (ProductRecord): The product to be created.
+
+        Returns:
+            ProductRecord: The created product.
+        """
+        if product.id is None:
+            product.id = uuid4()
+        product.version = 1
+        await self.collection.insert_one(product_mapper.to_document(product))
+        return product
+
+    async def create_products(self, products: list[ProductRecord],
+                              chunk_size: int = BULK_CHUNK_SIZE) -> list[Optional[str]]:
+        """
+        Creates many products with unordered insert_many calls of at most ``chunk_size`` documents.
+
+        A failing document (for example a duplicate ID) does not stop the rest
+        of its chunk from being written.
+
+        Args:
+            products (list[ProductRecord]): The products to be created; missing IDs are assigned.
+            chunk_size (int): Maximum number of documents per insert_many call.
+
+        Returns:
+            list[Optional[str]]: One entry per product, None if it was inserted or the error message otherwise.
+        """
+        errors = [None] * len(products)
+        for offset in range(0, len(products), chunk_size):
+            documents = []
+            for product in products[offset:offset + chunk_size]:
+                if product.id is None:
+                    product.id = uuid4()
+                product.version = 1
+                documents.append(product_mapper.to_document(product))
+            try:
+                await self.collection.insert_many(documents, ordered=False)
+            except BulkWriteError as e:
+                for write_error in e.details["writeErrors"]:
+                    errors[offset + write_error["index"]] = write_error["errmsg"]
+        return errors
+
+    async def get_product_by_id(self, product_id: UUID) -> ProductRecord:
+        """
+        Retrieves a product by its ID.
+
+        Args:
+            product_id (UUID): The ID of the product.
+
+        Returns:
+            ProductRecord: The retrieved product.
+        """
+        return product_mapper.from_document(await self.collection.find_one({"id": product_id}, ENTITY_PROJECTION))
+
+    async def get_product_version(self, product_id: UUID) -> Optional[int]:
+        """
+        Reads only the version of a product, to answer conditional requests without loading it.
+
+        Args:
+            product_id (UUID): The ID of the product.
+
+        Returns:
+            Optional[int]: The current version, or None if the product does not exist.
+        """
+        product_dict = await self.collection.find_one({"id": product_id}, {"_id": False, "version": True})
+        return None if product_dict is None else product_dict.get("version", 0)
+
+    async def get_products_by_ids(self, product_ids: list[UUID]) -> list[ProductRecord]:
+        """
+        Retrieves several products in one round-trip, in the order of ``product_ids``.
+
+        Args:
+            product_ids (list[UUID]): The IDs of the products.
+
+        Returns:
+            list[ProductRecord]: The products that exist.
+        """
+        cursor = self.collection.find({"id": {"$in": product_ids}}, ENTITY_PROJECTION)
+        products = {product_dict["id"]: product_mapper.from_document(product_dict) async for product_dict in cursor}
+        return [products[product_id] for product_id in product_ids if product_id in products]
+
+    async def update_product(self, product: ProductRecord, expected_versions: Optional[list[int]] = None,
+                             owner_id: Optional[UUID] = None) -> ProductRecord:
+        """
+        Updates an existing product and increments its version.
+
+        Args:
+            product (ProductRecord): The product to be updated; its version is ignored.
+            expected_versions (Optional[list[int]]): Only update if the stored version is one of these.
+            owner_id (Optional[UUID]): Only update if the stored product is owned by this user.
+
+        Returns:
+            ProductRecord: The updated product, with its new version.
+
+        Raises:
+            VersionConflictError: If the product is at another version than expected.
+            PermissionDeniedError: If the product is owned by another user than ``owner_id``.
+            NotFoundError: If the product does not exist.
+        """
+        query = {"id": product.id}
+        if expected_versions is not None:
+            query["version"] = version_condition(expected_versions)
+        if owner_id is not None:
+            query["owner_id"] = owner_id
+        document = product_mapper.to_document(product)
+        del document["version"]
+        product_dict = await self.collection.find_one_and_update(query, {"$set": document, "$inc": {"version": 1}},
+                                                                 projection=ENTITY_PROJECTION,
+                                                                 return_document=ReturnDocument.AFTER)
+        if not product_dict:
+            current = await self.collection.find_one({"id": product.id}, {"_id": False, "owner_id": True})
+            if current is not None and owner_id is not None and current["owner_id"] != owner_id:
+                raise PermissionDeniedError("Only the owner of the product may change it")
+            if current is not None and expected_versions is not None:
+                raise VersionConflictError("Product was modified since it was read")
+            raise NotFoundError("Product not found")
+        return product_mapper.from_document(product_dict)
+
+    async def delete_product(self, product_id: UUID, owner_id: Optional[UUID] = None):
+        """
+        Deletes a product by its ID.
+
+        Args:
+            product_id (UUID): The ID of the product.
+            owner_id (Optional[UUID]): Only delete the product if it is owned by this user.
+
+        Raises:
+            PermissionDeniedError: If the product is owned by another user than ``owner_id``.
+            NotFoundError: If the product does not exist.
+        """
+        query = {"id": product_id}
+        if owner_id is not None:
+            query["owner_id"] = owner_id
+        result = await self.collection.delete_one(query)
+        if result.deleted_count == 0:
+            if owner_id is not None and await self.collection.find_one({"id": product_id}, {"_id": True}):
+                raise PermissionDeniedError("Only the owner of the product may delete it")
+            raise NotFoundError("Product not found")
+
+    async def get_products_by_owner_id(self, owner_id: UUID, after: Optional[UUID] = None,
+                                       limit: Optional[int] = None) -> list[ProductRecord]:
+        """
+        Retrieves one page of products by the owner's ID, ordered by product ID.
+
+        Args:
+            owner_id (UUID): The ID of the owner.
+            after (Optional[UUID]): Only return products whose ID sorts after this one.
+            limit (Optional[int]): Maximum number of products to return.
+
+        Returns:
+            list[ProductRecord]: List of products owned by the user.
+        """
+        return [product async for product in self.iter_products_by_owner_id(owner_id, after, limit)]
+
+    async def iter_products_by_owner_id(self, owner_id: UUID, after: Optional[UUID] = None,
+                                        limit: Optional[int] = None) -> AsyncIterator[ProductRecord]:
+        """
+        Yields products by the owner's ID as the cursor produces them, ordered by product ID.
+
+        Args:
+            owner_id (UUID): The ID of the owner.
+            after (Optional[UUID]): Only yield products whose ID sorts after this one.
+            limit (Optional[int]): Maximum number of products to yield.
+
+        Yields:
+            ProductRecord: The products owned by the user.
+        """
+        async for product_dict in self._find_by_owner_id(owner_id, after, limit, ENTITY_PROJECTION):
+            yield product_mapper.from_document(product_dict)
+
+    async def get_product_documents_by_owner_id(self, owner_id: UUID, after: Optional[UUID] = None,
+                                                limit: Optional[int] = None) -> list[dict]:
+        """
+        Retrieves one page of an owner's products as decoded documents, for
+        serialization without building a Product per document.
+
+        Args:
+            owner_id (UUID): The ID of the owner.
+            after (Optional[UUID]): Only return products whose ID sorts after this one.
+            limit (Optional[int]): Maximum number of products to return.
+
+        Returns:
+            list[dict]: The documents, holding exactly the Product fields.
+        """
+        cursor = self._find_by_owner_id(owner_id, after, limit, PRODUCT_DOCUMENT_PROJECTION)
+        return await cursor.to_list(length=None)
+
+    def _find_by_owner_id(self, owner_id: UUID, after: Optional[UUID], limit: Optional[int], projection: dict):
+        query = {"owner_id": owner_id}
+        if after is not None:
+            query["id"] = {"$gt": after}
+        cursor = self.collection.find(query, projection).sort("id", ASCENDING)
+        if limit:
+            cursor = cursor.limit(limit)
+        return cursor
+
+    async def iter_products(self) -> AsyncIterator[ProductRecord]:
+        """
+        Yields every product, e.g. to build an in-process search index.
+
+        Yields:
+            ProductRecord: All stored products.
+        """
+        async for product_dict in self.collection.find({}, ENTITY_PROJECTION):
+            yield product_mapper.from_document(product_dict)
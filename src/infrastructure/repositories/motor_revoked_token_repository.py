@@ -0,0 +1,53 @@
+# src/infrastructure/repositories/motor_revoked_token_repository.py
+
+from datetime import datetime
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.errors import DuplicateKeyError
+
+
+class MotorRevokedTokenRepository:
+    """
+    Asynchronous repository for revoked access tokens in MongoDB.
+
+    One document per token, removed by the ``expires_at`` TTL index once the
+    token has expired on its own, so the collection only holds the tokens that
+    still need to be refused.
+    """
+
+    def __init__(self, collection: AsyncIOMotorCollection):
+        """
+        Initializes the MotorRevokedTokenRepository instance.
+
+        Args:
+            collection (AsyncIOMotorCollection): Motor collection.
+        """
+        self.collection = collection
+
+    async def revoke_token(self, token_id: str, expires_at: datetime):
+        """
+        Records a token as revoked; revoking it again is a no-op.
+
+        Args:
+            token_id (str): The ID of the token.
+            expires_at (datetime): When the token expires, after which the record may go.
+        """
+        try:
+            await self.collection.update_one({"token_id": token_id},
+                                             {"$setOnInsert": {"token_id": token_id, "expires_at": expires_at}},
+                                             upsert=True)
+        except DuplicateKeyError:
+            pass  # Revoked concurrently by another request
+
+    async def get_revoked_token_ids(self, now: datetime) -> list[str]:
+        """
+        Lists the revoked tokens that have not expired yet.
+
+        Args:
+            now (datetime): The current time.
+
+        Returns:
+            list[str]: Their IDs.
+        """
+        cursor = self.collection.find({"expires_at": {"$gt": now}}, {"_id": False, "token_id": True})
+        return [document["token_id"] async for document in cursor]
@@ -0,0 +1,190 @@
+# src/infrastructure/repositories/motor_trade_repository.py
+
+from typing import Optional
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.errors import BulkWriteError
+from src.core.entities.trade import TradeCycle, TRADE_STATUS_ACCEPTED, TRADE_STATUS_CANCELLED, \
+    TRADE_STATUS_PROPOSED, TRADE_STATUS_REJECTED
+from uuid import UUID, uuid4
+from src.infrastructure.mappers import ENTITY_PROJECTION, trade_mapper
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+class MotorTradeRepository:
+    """Asynchronous repository for multi-party trade proposals in MongoDB."""
+
+    def __init__(self, collection: AsyncIOMotorCollection):
+        """
+        Initializes the MotorTradeRepository instance.
+
+        Args:
+            collection (AsyncIOMotorCollection): Motor collection.
+        """
+        self.collection = collection
+
+    async def create_trades(self, trades: list[TradeCycle]) -> list[TradeCycle]:
+        """
+        Inserts trade proposals in one unordered insert_many.
+
+        A cycle that is already proposed is skipped: the partial unique index on
+        ``key`` rejects it and the other proposals are still inserted.
+
+        Args:
+            trades (list[TradeCycle]): The proposals.
+
+        Returns:
+            list[TradeCycle]: The proposals that were inserted.
+        """
+        if not trades:
+            return []
+        for trade in trades:
+            trade.id = trade.id or uuid4()
+        failed = set()
+        try:
+            await self.collection.insert_many([trade_mapper.to_document(trade) for trade in trades], ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                if error.get("code") != DUPLICATE_KEY_ERROR:
+                    raise
+                failed.add(error["index"])
+        return [trade for index, trade in enumerate(trades) if index not in failed]
+
+    async def get_trade_by_id(self, trade_id: UUID) -> TradeCycle:
+        """
+        Retrieves a trade proposal by its ID.
+
+        Args:
+            trade_id (UUID): The ID of the trade.
+
+        Returns:
+            TradeCycle: The trade, or None if it does not exist.
+        """
+        return trade_mapper.from_document(await self.collection.find_one({"id": trade_id}, ENTITY_PROJECTION))
+
+    async def get_trades_for_user(self, user_id: UUID, status: Optional[str] = None, after: Optional[UUID] = None,
+                                  limit: Optional[int] = None) -> list[TradeCycle]:
+        """
+        Retrieves one page of the trades a user takes part in, ordered by trade ID.
+
+        Args:
+            user_id (UUID): The ID of the participant.
+            status (Optional[str]): Only return trades in this status.
+            after (Optional[UUID]): Only return trades whose ID sorts after this one.
+            limit (Optional[int]): Maximum number of trades to return.
+
+        Returns:
+            list[TradeCycle]: The trades.
+        """
+        query = {"participants": user_id}
+        if status is not None:
+            query["status"] = status
+        if after is not None:
+            query["id"] = {"$gt": after}
+        cursor = self.collection.find(query, ENTITY_PROJECTION).sort("id", ASCENDING)
+        if limit:
+            cursor = cursor.limit(limit)
+        return [trade_mapper.from_document(trade_dict) async for trade_dict in cursor]
+
+    async def _explain_no_match(self, trade_id: UUID, user_id: UUID):
+        current = await self.collection.find_one({"id": trade_id}, {"status": 1, "participants": 1})
+        if not current:
+            return None
+        if user_id not in current.get("participants", []):
+            raise ValueError("User is not part of this trade")
+        raise ValueError(f"Trade is already {current.get('status')}")
+
+    async def accept_trade(self, trade_id: UUID, user_id: UUID) -> TradeCycle:
+        """
+        Records a participant's acceptance; the trade becomes accepted once every participant has accepted.
+
+        Args:
+            trade_id (UUID): The ID of the trade.
+            user_id (UUID): The accepting participant.
+
+        Returns:
+            TradeCycle: The updated trade, or None if the trade does not exist.
+
+        Raises:
+            ValueError: If the user is not a participant or the trade is no longer proposed.
+        """
+        trade_dict = await self.collection.find_one_and_update(
+            {"id": trade_id, "status": TRADE_STATUS_PROPOSED, "participants": user_id},
+            {"$addToSet": {"accepted_by": user_id}},
+            projection=ENTITY_PROJECTION,
+            return_document=ReturnDocument.AFTER
+        )
+        if not trade_dict:
+            return await self._explain_no_match(trade_id, user_id)
+        if len(trade_dict["accepted_by"]) == len(trade_dict["participants"]):
+            # Only the last acceptance flips the status, even if two arrive together.
+            completed = await self.collection.find_one_and_update(
+                {"id": trade_id, "status": TRADE_STATUS_PROPOSED},
+                {"$set": {"status": TRADE_STATUS_ACCEPTED}},
+                projection=ENTITY_PROJECTION,
+                return_document=ReturnDocument.AFTER
+            )
+            if completed:
+                trade_dict = completed
+        return trade_mapper.from_document(trade_dict)
+
+    async def reject_trade(self, trade_id: UUID, user_id: UUID) -> TradeCycle:
+        """
+        Rejects a proposed trade on behalf of one of its participants.
+
+        Args:
+            trade_id (UUID): The ID of the trade.
+            user_id (UUID): The rejecting participant.
+
+        Returns:
+            TradeCycle: The updated trade, or None if the trade does not exist.
+
+        Raises:
+            ValueError: If the user is not a participant or the trade is no longer proposed.
+        """
+        trade_dict = await self.collection.find_one_and_update(
+            {"id": trade_id, "status": TRADE_STATUS_PROPOSED, "participants": user_id},
+            {"$set": {"status": TRADE_STATUS_REJECTED}},
+            projection=ENTITY_PROJECTION,
+            return_document=ReturnDocument.AFTER
+        )
+        if not trade_dict:
+            return await self._explain_no_match(trade_id, user_id)
+        return trade_mapper.from_document(trade_dict)
+
+    async def cancel_trades_with_products(self, product_ids: list[UUID], except_id: Optional[UUID] = None) -> int:
+        """
+        Cancels the proposed trades that involve any of the given products.
+
+        Args:
+            product_ids (list[UUID]): Products that are no longer available.
+            except_id (Optional[UUID]): A trade to leave untouched.
+
+        Returns:
+            int: The number of cancelled trades.
+        """
+        query = {"status": TRADE_STATUS_PROPOSED, "product_ids": {"$in": product_ids}}
+        if except_id is not None:
+            query["id"] = {"$ne": except_id}
+        result = await self.collection.update_many(query, {"$set": {"status": TRADE_STATUS_CANCELLED}})
+        return result.modified_count
+
+    async def cancel_trades_with_leg(self, to_user_id: UUID, product_id: UUID) -> int:
+        """
+        Cancels the proposed trades in which a user receives a product they no longer want.
+
+        Args:
+            to_user_id (UUID): The receiving user.
+            product_id (UUID): The product.
+
+        Returns:
+            int: The number of cancelled trades.
+        """
+        result = await self.collection.update_many(
+            {"status": TRADE_STATUS_PROPOSED, "product_ids": product_id,
+             "legs": {"$elemMatch": {"to_user_id": to_user_id, "product_id": product_id}}},
+            {"$set": {"status": TRADE_STATUS_CANCELLED}}
+        )
+        return result.modified_count
@@ -0,0 +1,83 @@
+# src/infrastructure/repositories/motor_user_repository.py
+from typing import AsyncIterator, Optional
+from uuid import uuid4, UUID
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from src.core.entities.user import UserRecord
+from src.infrastructure.mappers import ENTITY_PROJECTION, user_mapper
+
+
+class MotorUserRepository():
+
+    def __init__(self, collection: AsyncIOMotorCollection):
+        self.collection = collection
+
+    async def create_user(self, user: UserRecord) -> UserRecord:
+        if not user.id:
+            user.id = uuid4()
+        try:
+            await self.collection.insert_one(user_mapper.to_document(user))
+        except DuplicateKeyError:
+            raise ValueError("Email already registered")
+        return user
+
+    async def get_user_by_email(self, email: str) -> UserRecord:
+        return user_mapper.from_document(await self.collection.find_one({"email": email}, ENTITY_PROJECTION))
+
+    async def get_user_by_id(self, id: UUID) -> UserRecord:
+        return user_mapper.from_document(await self.collection.find_one({"id": id}, ENTITY_PROJECTION))
+
+    async def iter_user_interests(self) -> AsyncIterator[tuple[UUID, list[str]]]:
+        """Yields (user ID, interests) for every user, e.g. to build an in-process index."""
+        async for user_dict in self.collection.find({}, {"_id": False, "id": True, "interests": True}):
+            yield user_dict["id"], user_dict.get("interests") or []
+
+    async def iter_users_with_interests(self, interests: list[str]) -> AsyncIterator[tuple[UUID, list[str]]]:
+        """Yields (user ID, interests) for every user sharing at least one of ``interests``."""
+        query = {"interests": {"$in": interests}}
+        async for user_dict in self.collection.find(query, {"_id": False, "id": True, "interests": True}):
+            yield user_dict["id"], user_dict.get("interests") or []
+
+    async def update_user(self, user: UserRecord) -> UserRecord:
+        try:
+            user_dict = await self.collection.find_one_and_update(
+                {"id": user.id}, {"$set": user_mapper.to_document(user)},
+                projection=ENTITY_PROJECTION, return_document=ReturnDocument.AFTER)
+        except DuplicateKeyError:
+            raise ValueError("Email already registered")
+        return user_mapper.from_document(user_dict)
+
+    async def patch_user(self, id: UUID, fields: Optional[dict] = None, add_interests: Optional[list[str]] = None,
+                         remove_interests: Optional[list[str]] = None) -> UserRecord:
+        """
+        Applies a partial update in one round-trip and returns the updated user.
+
+        ``fields`` are written with $set, ``add_interests`` with $addToSet and
+        ``remove_interests`` with $pull, so only the changed values travel to
+        the server. Returns None if the user does not exist.
+
+        Raises:
+            ValueError: If the update touches ``interests`` in conflicting ways,
+                or the new email is already registered.
+        """
+        fields = dict(fields or {})
+        update = {}
+        if fields:
+            update["$set"] = fields
+        if add_interests:
+            update["$addToSet"] = {"interests": {"$each": add_interests}}
+        if remove_interests:
+            update["$pull"] = {"interests": {"$in": remove_interests}}
+        interest_operations = ("interests" in fields) + bool(add_interests) + bool(remove_interests)
+        if interest_operations > 1:
+            raise ValueError("Interests can only be replaced, added to or removed from in one request")
+        if not update:
+            return await self.get_user_by_id(id)
+        try:
+            user_dict = await self.collection.find_one_and_update(
+                {"id": id}, update, projection=ENTITY_PROJECTION, return_document=ReturnDocument.AFTER)
+        except DuplicateKeyError:
+            raise ValueError("Email already registered")
+        return user_mapper.from_document(user_dict)
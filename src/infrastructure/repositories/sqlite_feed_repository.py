@@ -0,0 +1,87 @@
+# src/infrastructure/repositories/sqlite_feed_repository.py
+
+import sqlite3
+from uuid import UUID
+
+from src.core.entities.feed import FeedItem
+from src.infrastructure.config import FEED_MAX_ITEMS
+from src.infrastructure.mappers import feed_item_mapper
+from src.infrastructure.sqlite_database import SQLiteDatabase, to_json
+
+ITEM_COLUMNS = "product_id, owner_id, title, image_url, interests, score, added_at"
+INSERT_ITEM = f"INSERT INTO feed_items (user_id, {ITEM_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+# Keeps the best ``max_items`` rows of one feed, read off the (user_id, score, added_at) index.
+TRIM_FEED = "DELETE FROM feed_items WHERE user_id = ? AND rowid NOT IN " \
+            "(SELECT rowid FROM feed_items WHERE user_id = ? ORDER BY score DESC, added_at DESC LIMIT ?)"
+DELETE_PRODUCT = "DELETE FROM feed_items WHERE product_id = ? RETURNING user_id"
+SELECT_FEED_PAGE = f"SELECT {ITEM_COLUMNS} FROM feed_items WHERE user_id = ? " \
+                   f"ORDER BY score DESC, added_at DESC LIMIT ? OFFSET ?"
+
+
+class SQLiteFeedRepository:
+    """
+    Asynchronous repository for materialized recommendation feeds in SQLite.
+
+    Each feed item is one row; every write trims the feeds it touched to
+    ``max_items`` rows, so a page is a range of the (user_id, score, added_at)
+    index.
+    """
+
+    def __init__(self, database: SQLiteDatabase, max_items: int = FEED_MAX_ITEMS):
+        """
+        Initializes the SQLiteFeedRepository instance.
+
+        Args:
+            database (SQLiteDatabase): The database.
+            max_items (int): Maximum number of items kept per feed.
+        """
+        self.database = database
+        self.max_items = max_items
+
+    async def push_items(self, entries: list[tuple[UUID, FeedItem]]):
+        """
+        Adds one item to each of several feeds in one transaction.
+
+        Args:
+            entries (list[tuple[UUID, FeedItem]]): (user ID, item) pairs.
+        """
+        if not entries:
+            return
+
+        def push(connection: sqlite3.Connection):
+            connection.executemany(INSERT_ITEM, (
+                (user_id, item.product_id, item.owner_id, item.title, item.image_url, to_json(item.interests or []),
+                 item.score, item.added_at)
+                for user_id, item in entries))
+            users = dict.fromkeys(user_id for user_id, _ in entries)
+            connection.executemany(TRIM_FEED, ((user_id, user_id, self.max_items) for user_id in users))
+
+        await self.database.transaction(push)
+
+    async def pull_product(self, product_id: UUID) -> int:
+        """
+        Removes a product from every feed that holds it.
+
+        Args:
+            product_id (UUID): The ID of the product.
+
+        Returns:
+            int: The number of feeds changed.
+        """
+        rows = await self.database.fetch_all(DELETE_PRODUCT, (product_id,))
+        return len({row["user_id"] for row in rows})
+
+    async def get_feed(self, user_id: UUID, offset: int = 0, limit: int = 50) -> list[FeedItem]:
+        """
+        Retrieves one page of a user's feed.
+
+        Args:
+            user_id (UUID): The ID of the user.
+            offset (int): Index of the first item to return.
+            limit (int): Maximum number of items to return.
+
+        Returns:
+            list[FeedItem]: The items, best first.
+        """
+        rows = await self.database.fetch_all(SELECT_FEED_PAGE, (user_id, limit, offset))
+        return [feed_item_mapper.from_document(row) for row in rows]
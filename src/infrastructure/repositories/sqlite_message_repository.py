@@ -0,0 +1,193 @@
+# src/infrastructure/repositories/sqlite_message_repository.py
+
+import sqlite3
+from typing import Optional
+from uuid import UUID, uuid4
+
+from src.core.entities.message import Conversation, Message
+from src.infrastructure.mappers import bson_now, conversation_mapper, message_mapper
+from src.infrastructure.repositories.motor_message_repository import PREVIEW_LENGTH, conversation_key
+from src.infrastructure.sqlite_database import NO_LIMIT, SQLiteDatabase, placeholders, to_json
+
+CONVERSATION_COLUMNS = "id, participants, offer_id, last_message_at, last_message_preview"
+INSERT_CONVERSATION = f"INSERT OR IGNORE INTO conversations (key, {CONVERSATION_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)"
+INSERT_PARTICIPANT = "INSERT OR IGNORE INTO conversation_participants (conversation_id, user_id) VALUES (?, ?)"
+SELECT_CONVERSATION_BY_KEY = f"SELECT {CONVERSATION_COLUMNS} FROM conversations WHERE key = ?"
+SELECT_CONVERSATION_BY_ID = f"SELECT {CONVERSATION_COLUMNS} FROM conversations WHERE id = ?"
+# Served by the conversation_participants user_id index.
+SELECT_CONVERSATIONS_FOR_USER = f"SELECT {CONVERSATION_COLUMNS} FROM conversations WHERE id IN " \
+                                f"(SELECT conversation_id FROM conversation_participants WHERE user_id = ?) " \
+                                f"ORDER BY last_message_at DESC LIMIT ?"
+SELECT_UNREAD = "SELECT user_id, unread FROM conversation_participants WHERE conversation_id = ?"
+MESSAGE_COLUMNS = "id, conversation_id, sender_id, body, offer_id, sent_at"
+INSERT_MESSAGE = f"INSERT INTO messages ({MESSAGE_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)"
+INCREMENT_UNREAD = "UPDATE conversation_participants SET unread = unread + 1 WHERE conversation_id = ? AND user_id = ?"
+UPDATE_LAST_MESSAGE = "UPDATE conversations SET last_message_at = ?, last_message_preview = ? WHERE id = ?"
+RESET_UNREAD = "UPDATE conversation_participants SET unread = 0 WHERE conversation_id = ? AND user_id = ?"
+# Newest first, read off the (conversation_id, sent_at, id) index.
+SELECT_MESSAGES = {
+    False: f"SELECT {MESSAGE_COLUMNS} FROM messages WHERE conversation_id = ? "
+           f"ORDER BY sent_at DESC, id DESC LIMIT ?",
+    True: f"SELECT {MESSAGE_COLUMNS} FROM messages WHERE conversation_id = ? AND (sent_at, id) < (?, ?) "
+          f"ORDER BY sent_at DESC, id DESC LIMIT ?",
+}
+
+
+def _conversation(connection: sqlite3.Connection, row: Optional[sqlite3.Row]) -> Optional[dict]:
+    """Adds the unread counters from ``conversation_participants`` to a conversation row."""
+    if row is None:
+        return None
+    unread = connection.execute(SELECT_UNREAD, (row["id"],)).fetchall()
+    return {**dict(row), "unread": {str(participant["user_id"]): participant["unread"] for participant in unread}}
+
+
+class SQLiteMessageRepository:
+    """
+    Asynchronous repository for conversations and their messages in SQLite.
+
+    Each message is one row, so a page of history is a range of the
+    (conversation_id, sent_at, id) index. The unread counters are one row per
+    participant in ``conversation_participants``; sending a message inserts it,
+    bumps the counters and updates the conversation in one transaction.
+    """
+
+    def __init__(self, database: SQLiteDatabase):
+        """
+        Initializes the SQLiteMessageRepository instance.
+
+        Args:
+            database (SQLiteDatabase): The database.
+        """
+        self.database = database
+
+    async def get_or_create_conversation(self, conversation: Conversation) -> Conversation:
+        """
+        Returns the conversation between the same participants about the same offer, creating it if needed.
+
+        Args:
+            conversation (Conversation): The conversation to create.
+
+        Returns:
+            Conversation: The existing or created conversation.
+        """
+        conversation.id = conversation.id or uuid4()
+        key = conversation_key(conversation.participants, conversation.offer_id)
+
+        def get_or_create(connection: sqlite3.Connection) -> dict:
+            # The unique key makes a concurrent creation of the same conversation a no-op.
+            inserted = connection.execute(INSERT_CONVERSATION, (
+                key, conversation.id, to_json(conversation.participants), conversation.offer_id,
+                conversation.last_message_at, conversation.last_message_preview)).rowcount
+            if inserted:
+                connection.executemany(INSERT_PARTICIPANT, (
+                    (conversation.id, participant) for participant in dict.fromkeys(conversation.participants)))
+            return _conversation(connection, connection.execute(SELECT_CONVERSATION_BY_KEY, (key,)).fetchone())
+
+        return conversation_mapper.from_document(await self.database.transaction(get_or_create))
+
+    async def get_conversation_by_id(self, conversation_id: UUID) -> Conversation:
+        """
+        Retrieves a conversation by its ID.
+
+        Args:
+            conversation_id (UUID): The ID of the conversation.
+
+        Returns:
+            Conversation: The conversation, or None if it does not exist.
+        """
+        def get(connection: sqlite3.Connection) -> Optional[dict]:
+            return _conversation(connection, connection.execute(SELECT_CONVERSATION_BY_ID,
+                                                                (conversation_id,)).fetchone())
+
+        return conversation_mapper.from_document(await self.database.run(get))
+
+    async def get_conversations_for_user(self, user_id: UUID, limit: Optional[int] = None) -> list[Conversation]:
+        """
+        Retrieves a user's conversations, most recently active first.
+
+        Args:
+            user_id (UUID): The ID of the participant.
+            limit (Optional[int]): Maximum number of conversations to return.
+
+        Returns:
+            list[Conversation]: The conversations.
+        """
+        def get(connection: sqlite3.Connection) -> list[dict]:
+            rows = connection.execute(SELECT_CONVERSATIONS_FOR_USER, (user_id, limit or NO_LIMIT)).fetchall()
+            if not rows:
+                return []
+            # One query for the counters of the whole page.
+            unread = {}
+            for participant in connection.execute(
+                    f"SELECT conversation_id, user_id, unread FROM conversation_participants "
+                    f"WHERE conversation_id IN ({placeholders(len(rows))})", tuple(row["id"] for row in rows)):
+                unread.setdefault(participant["conversation_id"], {})[str(participant["user_id"])] = \
+                    participant["unread"]
+            return [{**dict(row), "unread": unread.get(row["id"], {})} for row in rows]
+
+        return [conversation_mapper.from_document(row) for row in await self.database.run(get)]
+
+    async def append_message(self, message: Message, participants: list[UUID]) -> Message:
+        """
+        Stores a message and bumps the unread counters of the other participants, in one transaction.
+
+        Args:
+            message (Message): The message.
+            participants (list[UUID]): The participants of the conversation.
+
+        Returns:
+            Message: The stored message, with its ID and timestamp.
+        """
+        message.id = message.id or uuid4()
+        message.sent_at = message.sent_at or bson_now()
+
+        def append(connection: sqlite3.Connection):
+            connection.execute(INSERT_MESSAGE, (message.id, message.conversation_id, message.sender_id, message.body,
+                                                message.offer_id, message.sent_at))
+            connection.executemany(INCREMENT_UNREAD, ((message.conversation_id, participant)
+                                                      for participant in participants
+                                                      if participant != message.sender_id))
+            connection.execute(UPDATE_LAST_MESSAGE, (message.sent_at, message.body[:PREVIEW_LENGTH],
+                                                     message.conversation_id))
+
+        await self.database.transaction(append)
+        return message
+
+    async def get_messages(self, conversation_id: UUID, before: Optional[tuple[float, UUID]] = None,
+                           limit: int = 50) -> list[Message]:
+        """
+        Retrieves one page of a conversation's history, newest first.
+
+        Args:
+            conversation_id (UUID): The ID of the conversation.
+            before (Optional[tuple[float, UUID]]): Timestamp and ID of the oldest message already returned.
+            limit (int): Maximum number of messages to return.
+
+        Returns:
+            list[Message]: The messages, newest first.
+        """
+        if before is None:
+            parameters = (conversation_id, limit)
+        else:
+            parameters = (conversation_id, round(before[0] * 1000), before[1], limit)
+        rows = await self.database.fetch_all(SELECT_MESSAGES[before is not None], parameters)
+        return [message_mapper.from_document(row) for row in rows]
+
+    async def mark_read(self, conversation_id: UUID, user_id: UUID) -> Conversation:
+        """
+        Resets a participant's unread counter.
+
+        Args:
+            conversation_id (UUID): The ID of the conversation.
+            user_id (UUID): The participant.
+
+        Returns:
+            Conversation: The updated conversation, or None if the user is not a participant.
+        """
+        def mark(connection: sqlite3.Connection) -> Optional[dict]:
+            if connection.execute(RESET_UNREAD, (conversation_id, user_id)).rowcount == 0:
+                return None
+            return _conversation(connection, connection.execute(SELECT_CONVERSATION_BY_ID,
+                                                                (conversation_id,)).fetchone())
+
+        return conversation_mapper.from_document(await self.database.transaction(mark))
@@ -0,0 +1,428 @@
+# src/infrastructure/repositories/sqlite_offer_repository.py
+
+import sqlite3
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Optional
+from uuid import UUID, uuid4
+
+from src.core.entities.offer import Offer, OfferRecord, OfferPage, OFFER_STATUS_ACCEPTED, OFFER_STATUS_EXPIRED, \
+    OFFER_STATUS_PENDING, OFFER_STATUS_REJECTED, statuses_allowed_before
+from src.core.repositories import NotFoundError
+from src.core.tokens import PermissionDeniedError
+from src.core.versioning import VersionConflictError
+from src.infrastructure.config import BULK_CHUNK_SIZE, OFFER_RETENTION_SECONDS, OFFER_SWEEP_BATCH_SIZE, \
+    OFFER_TTL_SECONDS
+from src.infrastructure.mappers import bson_now, offer_mapper, offer_view_mapper
+from src.infrastructure.sqlite_database import NO_LIMIT, NO_UUID, SCAN_PAGE_SIZE, SQLiteDatabase, placeholders
+
+OFFER_COLUMNS = "id, product_id, from_user_id, to_user_id, offered_product_id, status, created_at, expires_at, " \
+                "closed_at, version"
+INSERT_OFFER = f"INSERT INTO offers ({OFFER_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+SELECT_OFFER_BY_ID = f"SELECT {OFFER_COLUMNS} FROM offers WHERE id = ?"
+# Read after a conditional write matched nothing, to tell why.
+SELECT_OFFER_STATE = "SELECT status, from_user_id, to_user_id FROM offers WHERE id = ?"
+UPDATE_OFFER = "UPDATE offers SET product_id = ?, from_user_id = ?, to_user_id = ?, offered_product_id = ?, " \
+               "version = version + 1 WHERE id = ? AND status = ?"
+DELETE_OFFER = "DELETE FROM offers WHERE id = ?"
+REJECT_COMPETING = f"UPDATE offers SET status = ?, closed_at = ?, version = version + 1 " \
+                   f"WHERE id != ? AND status = ? AND (product_id IN (?, ?) OR offered_product_id IN (?, ?)) " \
+                   f"RETURNING {OFFER_COLUMNS}"
+# Formatted with one placeholder per product.
+REJECT_FOR_PRODUCTS = f"UPDATE offers SET status = ?, closed_at = ?, version = version + 1 " \
+                      f"WHERE status = ? AND (product_id IN ({{products}}) OR offered_product_id IN ({{products}})) " \
+                      f"RETURNING {OFFER_COLUMNS}"
+SELECT_OFFERS_BY_STATUS_PAGE = f"SELECT {OFFER_COLUMNS} FROM offers WHERE status = ? AND id > ? ORDER BY id LIMIT ?"
+# The overdue offers are found on the (status, expires_at) index.
+EXPIRE_OVERDUE = f"UPDATE offers SET status = ?, closed_at = ?, version = version + 1 WHERE id IN " \
+                 f"(SELECT id FROM offers WHERE status = ? AND expires_at <= ? ORDER BY expires_at LIMIT ?) " \
+                 f"RETURNING {OFFER_COLUMNS}"
+# SQLite has no TTL index; the sweep deletes offers closed longer ago than the retention period instead.
+DELETE_RETIRED = "DELETE FROM offers WHERE id IN (SELECT id FROM offers WHERE closed_at <= ? LIMIT ?)"
+
+USER_FIELDS = ("to_user_id", "from_user_id")
+SUMMARY_FIELDS = ("id", "owner_id", "title", "image_url", "interests")
+# Both products of each listed offer are joined in, without their descriptions.
+PAGE_COLUMNS = ", ".join([*(f"o.{column}" for column in OFFER_COLUMNS.split(", ")),
+                          *(f"p.{field} AS product_{field}" for field in SUMMARY_FIELDS),
+                          *(f"q.{field} AS offered_product_{field}" for field in SUMMARY_FIELDS)])
+PAGE_FROM = "FROM offers o LEFT JOIN products p ON p.id = o.product_id " \
+            "LEFT JOIN products q ON q.id = o.offered_product_id"
+
+
+def _offer_values(offer: OfferRecord) -> tuple:
+    return (offer.id, offer.product_id, offer.from_user_id, offer.to_user_id, offer.offered_product_id, offer.status,
+            offer.created_at, offer.expires_at, offer.closed_at, offer.version)
+
+
+def _page_queries(user_field: str) -> dict[bool, str]:
+    """The page query of an inbox or outbox, with and without a status filter; both use the (user, status, id) index."""
+    select = f"SELECT {PAGE_COLUMNS} {PAGE_FROM} WHERE o.{user_field} = ?"
+    return {False: f"{select} AND o.id > ? ORDER BY o.id LIMIT ?",
+            True: f"{select} AND o.status = ? AND o.id > ? ORDER BY o.id LIMIT ?"}
+
+
+PAGE_QUERIES = {user_field: _page_queries(user_field) for user_field in USER_FIELDS}
+COUNT_QUERIES = {user_field: f"SELECT status, COUNT(*) AS count FROM offers WHERE {user_field} = ? GROUP BY status"
+                 for user_field in USER_FIELDS}
+LIST_QUERIES = {user_field: {False: f"SELECT {OFFER_COLUMNS} FROM offers WHERE {user_field} = ? AND id > ? "
+                                    f"ORDER BY id LIMIT ?",
+                             True: f"SELECT {OFFER_COLUMNS} FROM offers WHERE {user_field} = ? AND status = ? "
+                                   f"AND id > ? ORDER BY id LIMIT ?"}
+                for user_field in USER_FIELDS}
+
+
+def _view_document(row: sqlite3.Row) -> dict:
+    """Nests the joined product columns of a page row the way the MongoDB $lookup does."""
+    document = {column: row[column] for column in OFFER_COLUMNS.split(", ")}
+    for prefix in ("product", "offered_product"):
+        # product_id and offered_product_id name the offer's own columns; owner_id is only NULL for a missing product.
+        if row[f"{prefix}_owner_id"] is not None:
+            document[prefix] = {field: row[f"{prefix}_{field}"] for field in SUMMARY_FIELDS}
+    return document
+
+
+class SQLiteOfferRepository:
+    """Asynchronous repository for managing offers in SQLite."""
+
+    def __init__(self, database: SQLiteDatabase, ttl_seconds: int = OFFER_TTL_SECONDS,
+                 retention_seconds: int = OFFER_RETENTION_SECONDS):
+        """
+        Initializes the SQLiteOfferRepository instance.
+
+        Args:
+            database (SQLiteDatabase): The database.
+            ttl_seconds (int): How long a new offer stays pending before it expires.
+            retention_seconds (int): How long a closed offer is kept before the expiry sweep deletes it.
+        """
+        self.database = database
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.retention = timedelta(seconds=retention_seconds)
+
+    def _stamp(self, offer: OfferRecord, now: datetime):
+        """Fills in the ID, the first version and the lifecycle timestamps of a new offer."""
+        if offer.id is None:
+            offer.id = uuid4()
+        offer.version = 1
+        offer.created_at = offer.created_at or now
+        offer.expires_at = offer.expires_at or offer.created_at + self.ttl
+        if offer.status != OFFER_STATUS_PENDING:
+            offer.closed_at = offer.closed_at or now
+
+    async def create_offer(self, offer: OfferRecord) -> OfferRecord:
+        """
+        Creates a new offer.
+
+        Args:
+            offer (OfferRecord): The offer to be created.
+
+        Returns:
+            OfferRecord: The created offer.
+        """
+        self._stamp(offer, bson_now())
+        await self.database.execute(INSERT_OFFER, _offer_values(offer))
+        return offer
+
+    async def create_offers(self, offers: list[OfferRecord], chunk_size: int = BULK_CHUNK_SIZE) -> list[Optional[str]]:
+        """
+        Creates many offers with one transaction per chunk of at most ``chunk_size`` offers.
+
+        A failing row (for example a duplicate ID) only fails its own statement,
+        so the rest of its chunk is still written.
+
+        Args:
+            offers (list[OfferRecord]): The offers to be created; missing IDs are assigned.
+            chunk_size (int): Maximum number of offers per transaction.
+
+        Returns:
+            list[Optional[str]]: One entry per offer, None if it was inserted or the error message otherwise.
+        """
+        now = bson_now()
+        for offer in offers:
+            self._stamp(offer, now)
+
+        def insert(chunk: list[OfferRecord]):
+            def operation(connection: sqlite3.Connection) -> list[Optional[str]]:
+                errors = []
+                for offer in chunk:
+                    try:
+                        connection.execute(INSERT_OFFER, _offer_values(offer))
+                        errors.append(None)
+                    except sqlite3.IntegrityError as e:
+                        errors.append(str(e))
+                return errors
+            return operation
+
+        errors = []
+        for offset in range(0, len(offers), chunk_size):
+            errors.extend(await self.database.transaction(insert(offers[offset:offset + chunk_size])))
+        return errors
+
+    async def get_offer_by_id(self, offer_id: UUID) -> OfferRecord:
+        """
+        Retrieves an offer by its ID.
+
+        Args:
+            offer_id (UUID): The ID of the offer.
+
+        Returns:
+            OfferRecord: The retrieved offer.
+        """
+        return offer_mapper.from_document(await self.database.fetch_one(SELECT_OFFER_BY_ID, (offer_id,)))
+
+    async def update_offer(self, offer: OfferRecord, expected_versions: Optional[list[int]] = None,
+                           from_user_id: Optional[UUID] = None) -> OfferRecord:
+        """
+        Updates a pending offer and increments its version. The status and lifecycle timestamps are kept as
+        stored: they only change through ``update_offer_status`` and the expiry sweep.
+
+        Args:
+            offer (OfferRecord): The offer to be updated; its status and version are ignored.
+            expected_versions (Optional[list[int]]): Only update if the stored version is one of these.
+            from_user_id (Optional[UUID]): Only update if the stored offer was made by this user.
+
+        Returns:
+            OfferRecord: The updated offer.
+
+        Raises:
+            VersionConflictError: If the offer is at another version than expected.
+            PermissionDeniedError: If the offer was made by another user than ``from_user_id``.
+            ValueError: If the offer is no longer pending.
+            NotFoundError: If the offer does not exist.
+        """
+        sql = UPDATE_OFFER
+        parameters = (offer.product_id, offer.from_user_id, offer.to_user_id, offer.offered_product_id, offer.id,
+                      OFFER_STATUS_PENDING)
+        if expected_versions is not None:
+            sql += f" AND version IN ({placeholders(len(expected_versions))})"
+            parameters += tuple(expected_versions)
+        if from_user_id is not None:
+            sql += " AND from_user_id = ?"
+            parameters += (from_user_id,)
+        row = await self.database.fetch_one(f"{sql} RETURNING {OFFER_COLUMNS}", parameters)
+        if not row:
+            current = await self.database.fetch_one(SELECT_OFFER_STATE, (offer.id,))
+            if current is not None and from_user_id is not None and current["from_user_id"] != from_user_id:
+                raise PermissionDeniedError("Only the user who made the offer may change it")
+            if current is not None and current["status"] != OFFER_STATUS_PENDING:
+                raise ValueError(f"Offer is {current['status']} and can no longer be changed")
+            if current is not None and expected_versions is not None:
+                raise VersionConflictError("Offer was modified since it was read")
+            raise NotFoundError("Offer not found")
+        return offer_mapper.from_document(row)
+
+    async def delete_offer(self, offer_id: UUID, from_user_id: Optional[UUID] = None):
+        """
+        Deletes an offer by its ID.
+
+        Args:
+            offer_id (UUID): The ID of the offer.
+            from_user_id (Optional[UUID]): Only delete the offer if it was made by this user.
+
+        Raises:
+            PermissionDeniedError: If the offer was made by another user than ``from_user_id``.
+            NotFoundError: If the offer does not exist.
+        """
+        if from_user_id is None:
+            deleted = await self.database.execute(DELETE_OFFER, (offer_id,))
+        else:
+            deleted = await self.database.execute(f"{DELETE_OFFER} AND from_user_id = ?", (offer_id, from_user_id))
+        if deleted == 0:
+            if from_user_id is not None and await self.database.fetch_one(SELECT_OFFER_STATE, (offer_id,)):
+                raise PermissionDeniedError("Only the user who made the offer may delete it")
+            raise NotFoundError("Offer not found")
+
+    async def update_offer_status(self, offer_id: UUID, status: str, to_user_id: Optional[UUID] = None) \
+            -> Optional[tuple[OfferRecord, list[OfferRecord]]]:
+        """
+        Moves an offer to a new status in one transaction.
+
+        The update only matches while the offer is in a status allowed by
+        OFFER_TRANSITIONS, so concurrent accepts cannot both succeed, and, with
+        ``to_user_id``, while it is made to that user, so the recipient check
+        costs no read. Accepting an offer also rejects every other pending
+        offer involving either of its products, in the same transaction.
+
+        Args:
+            offer_id (UUID): The ID of the offer.
+            status (str): The new status of the offer.
+            to_user_id (Optional[UUID]): Only update the offer if it was made to this user.
+
+        Returns:
+            Optional[tuple[OfferRecord, list[OfferRecord]]]: The updated offer and the competing offers an
+            accept rejected, as they are now; None if the offer does not exist.
+
+        Raises:
+            PermissionDeniedError: If the offer was made to another user than ``to_user_id``.
+            ValueError: If the offer cannot move to the requested status.
+        """
+        now = bson_now()
+        allowed = statuses_allowed_before(status)
+        update = f"UPDATE offers SET status = ?, closed_at = ?, version = version + 1 " \
+                 f"WHERE id = ? AND status IN ({placeholders(len(allowed))})"
+        parameters = (status, now, offer_id, *allowed)
+        if to_user_id is not None:
+            update += " AND to_user_id = ?"
+            parameters += (to_user_id,)
+
+        def transition(connection: sqlite3.Connection) -> tuple[Optional[dict], list[dict], Optional[sqlite3.Row]]:
+            row = connection.execute(f"{update} RETURNING {OFFER_COLUMNS}", parameters).fetchone()
+            if row is None:
+                return None, [], connection.execute(SELECT_OFFER_STATE, (offer_id,)).fetchone()
+            rejected = []
+            if status == OFFER_STATUS_ACCEPTED:
+                traded_products = (row["product_id"], row["offered_product_id"])
+                rejected = [dict(rejected_row) for rejected_row in connection.execute(
+                    REJECT_COMPETING, (OFFER_STATUS_REJECTED, now, offer_id, OFFER_STATUS_PENDING,
+                                       *traded_products, *traded_products))]
+            return dict(row), rejected, None
+
+        offer_dict, rejected, current = await self.database.transaction(transition)
+        if offer_dict is None:
+            if current is None:
+                return None
+            if to_user_id is not None and current["to_user_id"] != to_user_id:
+                raise PermissionDeniedError("Only the user the offer was made to may accept or reject it")
+            raise ValueError(f"Offer cannot move from {current['status']} to {status}")
+        return offer_mapper.from_document(offer_dict), [offer_mapper.from_document(row) for row in rejected]
+
+    async def get_offers_to_user(self, user_id: UUID, status: Optional[str] = None, after: Optional[UUID] = None,
+                                 limit: Optional[int] = None) -> list[OfferRecord]:
+        """
+        Retrieves one page of offers received by a user, ordered by offer ID.
+
+        Args:
+            user_id (UUID): The ID of the receiving user.
+            status (Optional[str]): Only return offers in this status.
+            after (Optional[UUID]): Only return offers whose ID sorts after this one.
+            limit (Optional[int]): Maximum number of offers to return.
+
+        Returns:
+            list[OfferRecord]: The received offers.
+        """
+        return [offer async for offer in self.iter_offers("to_user_id", user_id, status, after, limit)]
+
+    async def get_offers_from_user(self, user_id: UUID, status: Optional[str] = None, after: Optional[UUID] = None,
+                                   limit: Optional[int] = None) -> list[OfferRecord]:
+        """
+        Retrieves one page of offers sent by a user, ordered by offer ID.
+
+        Args:
+            user_id (UUID): The ID of the sending user.
+            status (Optional[str]): Only return offers in this status.
+            after (Optional[UUID]): Only return offers whose ID sorts after this one.
+            limit (Optional[int]): Maximum number of offers to return.
+
+        Returns:
+            list[OfferRecord]: The sent offers.
+        """
+        return [offer async for offer in self.iter_offers("from_user_id", user_id, status, after, limit)]
+
+    async def get_offer_page(self, user_field: str, user_id: UUID, status: Optional[str] = None,
+                             after: Optional[UUID] = None, limit: int = 50) -> OfferPage:
+        """
+        Retrieves one page of a user's offers with both products joined in, and the user's
+        offer counts per status, with two queries on one pool thread.
+
+        Both queries use the (user field, status, id) index; the counts are read
+        from the index alone.
+
+        Args:
+            user_field (str): Either "to_user_id" or "from_user_id".
+            user_id (UUID): The ID of the user.
+            status (Optional[str]): Only list offers in this status. Counts always cover every status.
+            after (Optional[UUID]): Only list offers whose ID sorts after this one.
+            limit (int): Maximum number of offers to list.
+
+        Returns:
+            OfferPage: The offers, ordered by offer ID, and the counts per status.
+        """
+        page_query = PAGE_QUERIES[user_field][status is not None]
+        parameters = (user_id, *((status,) if status is not None else ()), after or NO_UUID, limit)
+
+        def read(connection: sqlite3.Connection) -> tuple[list[dict], dict[str, int]]:
+            items = [_view_document(row) for row in connection.execute(page_query, parameters)]
+            counts = {row["status"]: row["count"]
+                      for row in connection.execute(COUNT_QUERIES[user_field], (user_id,))}
+            return items, counts
+
+        items, counts = await self.database.run(read)
+        return OfferPage(items=[offer_view_mapper.from_document(document) for document in items], counts=counts)
+
+    async def iter_offers(self, user_field: str, user_id: UUID, status: Optional[str] = None,
+                          after: Optional[UUID] = None, limit: Optional[int] = None) -> AsyncIterator[OfferRecord]:
+        """
+        Yields the offers of a user, ordered by offer ID.
+
+        Args:
+            user_field (str): Either "to_user_id" or "from_user_id".
+            user_id (UUID): The ID of the user.
+            status (Optional[str]): Only yield offers in this status.
+            after (Optional[UUID]): Only yield offers whose ID sorts after this one.
+            limit (Optional[int]): Maximum number of offers to yield.
+
+        Yields:
+            OfferRecord: The matching offers.
+        """
+        parameters = (user_id, *((status,) if status is not None else ()), after or NO_UUID, limit or NO_LIMIT)
+        for row in await self.database.fetch_all(LIST_QUERIES[user_field][status is not None], parameters):
+            yield offer_mapper.from_document(row)
+
+    async def iter_offers_by_status(self, status: str) -> AsyncIterator[OfferRecord]:
+        """
+        Yields every offer in a status, read in pages by ID. This is meant for
+        rebuilding in-process state at startup, not for request handling.
+
+        Args:
+            status (str): The status of the offers.
+
+        Yields:
+            OfferRecord: The matching offers.
+        """
+        after = NO_UUID
+        while True:
+            rows = await self.database.fetch_all(SELECT_OFFERS_BY_STATUS_PAGE, (status, after, SCAN_PAGE_SIZE))
+            for row in rows:
+                yield offer_mapper.from_document(row)
+            if len(rows) < SCAN_PAGE_SIZE:
+                return
+            after = rows[-1]["id"]
+
+    async def expire_pending_offers(self, now: datetime, limit: int = OFFER_SWEEP_BATCH_SIZE) -> list[OfferRecord]:
+        """
+        Moves at most ``limit`` pending offers whose expiry has passed to expired.
+
+        The batch is selected on the (status, expires_at) index and closed by
+        the same UPDATE, so an offer accepted or rejected by another worker is
+        never expired. SQLite has no TTL index, so the transaction
+        also deletes at most ``limit`` offers closed before the retention period.
+
+        Args:
+            now (datetime): The sweep time; offers expiring at or before it are expired.
+            limit (int): Maximum number of offers expired.
+
+        Returns:
+            list[OfferRecord]: The offers this call expired, as they are now.
+        """
+        def expire(connection: sqlite3.Connection) -> list[dict]:
+            connection.execute(DELETE_RETIRED, (now - self.retention, limit))
+            rows = connection.execute(EXPIRE_OVERDUE, (OFFER_STATUS_EXPIRED, now, OFFER_STATUS_PENDING, now, limit))
+            return [dict(row) for row in rows]
+
+        return [offer_mapper.from_document(row) for row in await self.database.transaction(expire)]
+
+    async def reject_offers_for_products(self, product_ids: list[UUID]) -> list[OfferRecord]:
+        """
+        Rejects every pending offer involving one of the products, e.g. once a trade has given them away.
+
+        Args:
+            product_ids (list[UUID]): The products that are no longer available.
+
+        Returns:
+            list[OfferRecord]: The offers this call rejected, as they are now.
+        """
+        if not product_ids:
+            return []
+        sql = REJECT_FOR_PRODUCTS.format(products=placeholders(len(product_ids)))
+        rows = await self.database.fetch_all(sql, (OFFER_STATUS_REJECTED, bson_now(), OFFER_STATUS_PENDING,
+                                                   *product_ids, *product_ids))
+        return [offer_mapper.from_document(row) for row in rows]
@@ -0,0 +1,263 @@
+# src/infrastructure/repositories/sqlite_product_repository.py
+
+import sqlite3
+from typing import AsyncIterator, Optional
+from uuid import UUID, uuid4
+
+from src.core.entities.product import Product, ProductRecord
+from src.core.repositories import NotFoundError
+from src.core.tokens import PermissionDeniedError
+from src.core.versioning import VersionConflictError
+from src.infrastructure.config import BULK_CHUNK_SIZE
+from src.infrastructure.mappers import product_mapper
+from src.infrastructure.sqlite_database import NO_LIMIT, NO_UUID, SCAN_PAGE_SIZE, SQLiteDatabase, placeholders, \
+    to_json
+
+PRODUCT_COLUMNS = "id, owner_id, title, description, image_url, interests, version"
+INSERT_PRODUCT = f"INSERT INTO products ({PRODUCT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)"
+SELECT_PRODUCT_BY_ID = f"SELECT {PRODUCT_COLUMNS} FROM products WHERE id = ?"
+SELECT_PRODUCT_VERSION = "SELECT version FROM products WHERE id = ?"
+SELECT_PRODUCT_OWNER = "SELECT owner_id FROM products WHERE id = ?"
+UPDATE_PRODUCT = "UPDATE products SET owner_id = ?, title = ?, description = ?, image_url = ?, interests = ?, " \
+                 "version = version + 1 WHERE id = ?"
+DELETE_PRODUCT = "DELETE FROM products WHERE id = ?"
+# Served by the (owner_id, id) index, in ID order.
+SELECT_PRODUCTS_BY_OWNER = f"SELECT {PRODUCT_COLUMNS} FROM products WHERE owner_id = ? AND id > ? ORDER BY id LIMIT ?"
+SELECT_PRODUCTS_PAGE = f"SELECT {PRODUCT_COLUMNS} FROM products WHERE id > ? ORDER BY id LIMIT ?"
+
+
+def _product_values(product: ProductRecord) -> tuple:
+    return (product.id, product.owner_id, product.title, product.description, product.image_url,
+            to_json(product.interests or []), product.version)
+
+
+class SQLiteProductRepository:
+    """Asynchronous repository for managing products in SQLite."""
+
+    def __init__(self, database: SQLiteDatabase):
+        """
+        Initializes the SQLiteProductRepository instance.
+
+        Args:
+            database (SQLiteDatabase): The database.
+        """
+        self.database = database
+
+    async def create_product(self, product: ProductRecord) -> ProductRecord:
+        """
+        Creates a new product.
+
+        Args:
+            product (ProductRecord): The product to be created.
+
+        Returns:
+            ProductRecord: The created product.
+        """
+        if product.id is None:
+            product.id = uuid4()
+        product.version = 1
+        await self.database.execute(INSERT_PRODUCT, _product_values(product))
+        return product
+
+    async def create_products(self, products: list[ProductRecord],
+                              chunk_size: int = BULK_CHUNK_SIZE) -> list[Optional[str]]:
+        """
+        Creates many products with one transaction per chunk of at most ``chunk_size`` products.
+
+        A failing row (for example a duplicate ID) only fails its own statement,
+        so the rest of its chunk is still written.
+
+        Args:
+            products (list[ProductRecord]): The products to be created; missing IDs are assigned.
+            chunk_size (int): Maximum number of products per transaction.
+
+        Returns:
+            list[Optional[str]]: One entry per product, None if it was inserted or the error message otherwise.
+        """
+        for product in products:
+            if product.id is None:
+                product.id = uuid4()
+            product.version = 1
+
+        def insert(chunk: list[ProductRecord]):
+            def operation(connection: sqlite3.Connection) -> list[Optional[str]]:
+                errors = []
+                for product in chunk:
+                    try:
+                        connection.execute(INSERT_PRODUCT, _product_values(product))
+                        errors.append(None)
+                    except sqlite3.IntegrityError as e:
+                        errors.append(str(e))
+                return errors
+            return operation
+
+        errors = []
+        for offset in range(0, len(products), chunk_size):
+            errors.extend(await self.database.transaction(insert(products[offset:offset + chunk_size])))
+        return errors
+
+    async def get_product_by_id(self, product_id: UUID) -> ProductRecord:
+        """
+        Retrieves a product by its ID.
+
+        Args:
+            product_id (UUID): The ID of the product.
+
+        Returns:
+            ProductRecord: The retrieved product.
+        """
+        return product_mapper.from_document(await self.database.fetch_one(SELECT_PRODUCT_BY_ID, (product_id,)))
+
+    async def get_product_version(self, product_id: UUID) -> Optional[int]:
+        """
+        Reads only the version of a product, to answer conditional requests without loading it.
+
+        Args:
+            product_id (UUID): The ID of the product.
+
+        Returns:
+            Optional[int]: The current version, or None if the product does not exist.
+        """
+        row = await self.database.fetch_one(SELECT_PRODUCT_VERSION, (product_id,))
+        return None if row is None else row["version"]
+
+    async def get_products_by_ids(self, product_ids: list[UUID]) -> list[ProductRecord]:
+        """
+        Retrieves several products in one query, in the order of ``product_ids``.
+
+        Args:
+            product_ids (list[UUID]): The IDs of the products.
+
+        Returns:
+            list[ProductRecord]: The products that exist.
+        """
+        if not product_ids:
+            return []
+        rows = await self.database.fetch_all(
+            f"SELECT {PRODUCT_COLUMNS} FROM products WHERE id IN ({placeholders(len(product_ids))})",
+            tuple(product_ids))
+        products = {row["id"]: product_mapper.from_document(row) for row in rows}
+        return [products[product_id] for product_id in product_ids if product_id in products]
+
+    async def update_product(self, product: ProductRecord, expected_versions: Optional[list[int]] = None,
+                             owner_id: Optional[UUID] = None) -> ProductRecord:
+        """
+        Updates an existing product and increments its version.
+
+        Args:
+            product (ProductRecord): The product to be updated; its version is ignored.
+            expected_versions (Optional[list[int]]): Only update if the stored version is one of these.
+            owner_id (Optional[UUID]): Only update if the stored product is owned by this user.
+
+        Returns:
+            ProductRecord: The updated product, with its new version.
+
+        Raises:
+            VersionConflictError: If the product is at another version than expected.
+            PermissionDeniedError: If the product is owned by another user than ``owner_id``.
+            NotFoundError: If the product does not exist.
+        """
+        sql = UPDATE_PRODUCT
+        parameters = _product_values(product)[1:-1] + (product.id,)
+        if expected_versions is not None:
+            sql += f" AND version IN ({placeholders(len(expected_versions))})"
+            parameters += tuple(expected_versions)
+        if owner_id is not None:
+            sql += " AND owner_id = ?"
+            parameters += (owner_id,)
+        row = await self.database.fetch_one(f"{sql} RETURNING {PRODUCT_COLUMNS}", parameters)
+        if not row:
+            current = await self.database.fetch_one(SELECT_PRODUCT_OWNER, (product.id,))
+            if current is not None and owner_id is not None and current["owner_id"] != owner_id:
+                raise PermissionDeniedError("Only the owner of the product may change it")
+            if current is not None and expected_versions is not None:
+                raise VersionConflictError("Product was modified since it was read")
+            raise NotFoundError("Product not found")
+        return product_mapper.from_document(row)
+
+    async def delete_product(self, product_id: UUID, owner_id: Optional[UUID] = None):
+        """
+        Deletes a product by its ID.
+
+        Args:
+            product_id (UUID): The ID of the product.
+            owner_id (Optional[UUID]): Only delete the product if it is owned by this user.
+
+        Raises:
+            PermissionDeniedError: If the product is owned by another user than ``owner_id``.
+            NotFoundError: If the product does not exist.
+        """
+        if owner_id is None:
+            deleted = await self.database.execute(DELETE_PRODUCT, (product_id,))
+        else:
+            deleted = await self.database.execute(f"{DELETE_PRODUCT} AND owner_id = ?", (product_id, owner_id))
+        if deleted == 0:
+            if owner_id is not None and await self.database.fetch_one(SELECT_PRODUCT_OWNER, (product_id,)):
+                raise PermissionDeniedError("Only the owner of the product may delete it")
+            raise NotFoundError("Product not found")
+
+    async def get_products_by_owner_id(self, owner_id: UUID, after: Optional[UUID] = None,
+                                       limit: Optional[int] = None) -> list[ProductRecord]:
+        """
+        Retrieves one page of products by the owner's ID, ordered by product ID.
+
+        Args:
+            owner_id (UUID): The ID of the owner.
+            after (Optional[UUID]): Only return products whose ID sorts after this one.
+            limit (Optional[int]): Maximum number of products to return.
+
+        Returns:
+            list[ProductRecord]: List of products owned by the user.
+        """
+        rows = await self.get_product_documents_by_owner_id(owner_id, after, limit)
+        return [product_mapper.from_document(row) for row in rows]
+
+    async def iter_products_by_owner_id(self, owner_id: UUID, after: Optional[UUID] = None,
+                                        limit: Optional[int] = None) -> AsyncIterator[ProductRecord]:
+        """
+        Yields products by the owner's ID, ordered by product ID.
+
+        Args:
+            owner_id (UUID): The ID of the owner.
+            after (Optional[UUID]): Only yield products whose ID sorts after this one.
+            limit (Optional[int]): Maximum number of products to yield.
+
+        Yields:
+            ProductRecord: The products owned by the user.
+        """
+        for product in await self.get_products_by_owner_id(owner_id, after, limit):
+            yield product
+
+    async def get_product_documents_by_owner_id(self, owner_id: UUID, after: Optional[UUID] = None,
+                                                limit: Optional[int] = None) -> list[dict]:
+        """
+        Retrieves one page of an owner's products as decoded rows, for
+        serialization without building a Product per row.
+
+        Args:
+            owner_id (UUID): The ID of the owner.
+            after (Optional[UUID]): Only return products whose ID sorts after this one.
+            limit (Optional[int]): Maximum number of products to return.
+
+        Returns:
+            list[dict]: The rows, holding exactly the Product fields.
+        """
+        return await self.database.fetch_all(SELECT_PRODUCTS_BY_OWNER,
+                                             (owner_id, after or NO_UUID, limit or NO_LIMIT))
+
+    async def iter_products(self) -> AsyncIterator[ProductRecord]:
+        """
+        Yields every product, e.g. to build an in-process search index. The table
+        is read in pages by ID, so no read transaction stays open for the whole scan.
+
+        Yields:
+            ProductRecord: All stored products.
+        """
+        after = NO_UUID
+        while True:
+            rows = await self.database.fetch_all(SELECT_PRODUCTS_PAGE, (after, SCAN_PAGE_SIZE))
+            for row in rows:
+                yield product_mapper.from_document(row)
+            if len(rows) < SCAN_PAGE_SIZE:
+                return
+            after = rows[-1]["id"]
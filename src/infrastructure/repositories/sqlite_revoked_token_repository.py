@@ -0,0 +1,50 @@
+# src/infrastructure/repositories/sqlite_revoked_token_repository.py
+
+import sqlite3
+from datetime import datetime
+
+from src.infrastructure.sqlite_database import SQLiteDatabase
+
+INSERT_REVOKED_TOKEN = "INSERT OR IGNORE INTO revoked_tokens (token_id, expires_at) VALUES (?, ?)"
+# SQLite has no TTL index; reading the list deletes the tokens that have expired on their own instead.
+DELETE_EXPIRED = "DELETE FROM revoked_tokens WHERE expires_at <= ?"
+SELECT_REVOKED_TOKEN_IDS = "SELECT token_id FROM revoked_tokens"
+
+
+class SQLiteRevokedTokenRepository:
+    """Asynchronous repository for revoked access tokens in SQLite, one row per token."""
+
+    def __init__(self, database: SQLiteDatabase):
+        """
+        Initializes the SQLiteRevokedTokenRepository instance.
+
+        Args:
+            database (SQLiteDatabase): The database.
+        """
+        self.database = database
+
+    async def revoke_token(self, token_id: str, expires_at: datetime):
+        """
+        Records a token as revoked; revoking it again is a no-op.
+
+        Args:
+            token_id (str): The ID of the token.
+            expires_at (datetime): When the token expires, after which the record may go.
+        """
+        await self.database.execute(INSERT_REVOKED_TOKEN, (token_id, expires_at))
+
+    async def get_revoked_token_ids(self, now: datetime) -> list[str]:
+        """
+        Lists the revoked tokens that have not expired yet.
+
+        Args:
+            now (datetime): The current time.
+
+        Returns:
+            list[str]: Their IDs.
+        """
+        def get(connection: sqlite3.Connection) -> list[str]:
+            connection.execute(DELETE_EXPIRED, (now,))
+            return [row["token_id"] for row in connection.execute(SELECT_REVOKED_TOKEN_IDS)]
+
+        return await self.database.transaction(get)
@@ -0,0 +1,216 @@
+# src/infrastructure/repositories/sqlite_trade_repository.py
+
+import sqlite3
+from typing import Optional
+from uuid import UUID, uuid4
+
+from src.core.entities.trade import TradeCycle, TRADE_STATUS_ACCEPTED, TRADE_STATUS_CANCELLED, \
+    TRADE_STATUS_PROPOSED, TRADE_STATUS_REJECTED
+from src.infrastructure.mappers import trade_mapper
+from src.infrastructure.sqlite_database import NO_LIMIT, NO_UUID, SQLiteDatabase, placeholders, to_json
+
+TRADE_COLUMNS = "id, key, legs, participants, product_ids, accepted_by, status"
+INSERT_TRADE = f"INSERT INTO trades ({TRADE_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)"
+INSERT_PARTICIPANT = "INSERT OR IGNORE INTO trade_participants (user_id, trade_id) VALUES (?, ?)"
+INSERT_PRODUCT = "INSERT OR IGNORE INTO trade_products (product_id, trade_id) VALUES (?, ?)"
+SELECT_TRADE_BY_ID = f"SELECT {TRADE_COLUMNS} FROM trades WHERE id = ?"
+SELECT_PARTICIPANT = "SELECT 1 FROM trade_participants WHERE user_id = ? AND trade_id = ?"
+# Served by the trade_participants primary key, in trade ID order.
+SELECT_TRADES_FOR_USER = {
+    False: f"SELECT {TRADE_COLUMNS} FROM trades WHERE id IN "
+           f"(SELECT trade_id FROM trade_participants WHERE user_id = ? AND trade_id > ?) ORDER BY id LIMIT ?",
+    True: f"SELECT {TRADE_COLUMNS} FROM trades WHERE id IN "
+          f"(SELECT trade_id FROM trade_participants WHERE user_id = ? AND trade_id > ?) AND status = ? "
+          f"ORDER BY id LIMIT ?",
+}
+UPDATE_ACCEPTED_BY = "UPDATE trades SET accepted_by = ?, status = ? WHERE id = ?"
+UPDATE_STATUS = "UPDATE trades SET status = ? WHERE id = ?"
+SELECT_PROPOSED_WITH_PRODUCT = "SELECT t.id, t.legs FROM trade_products p JOIN trades t ON t.id = p.trade_id " \
+                               "WHERE p.product_id = ? AND t.status = ?"
+
+
+def _trade_values(trade: TradeCycle) -> tuple:
+    return (trade.id, trade.key, to_json([leg.model_dump() for leg in trade.legs]), to_json(trade.participants),
+            to_json(trade.product_ids), to_json(trade.accepted_by), trade.status)
+
+
+def _explain_no_match(connection: sqlite3.Connection, trade_id: UUID, user_id: UUID, row: Optional[sqlite3.Row]):
+    if row is None:
+        return None
+    if connection.execute(SELECT_PARTICIPANT, (user_id, trade_id)).fetchone() is None:
+        raise ValueError("User is not part of this trade")
+    raise ValueError(f"Trade is already {row['status']}")
+
+
+class SQLiteTradeRepository:
+    """
+    Asynchronous repository for multi-party trade proposals in SQLite.
+
+    Legs and participant lists are stored with the trade as JSON; the
+    ``trade_participants`` and ``trade_products`` tables index the trades by
+    user and by product, and are written in the same transaction.
+    """
+
+    def __init__(self, database: SQLiteDatabase):
+        """
+        Initializes the SQLiteTradeRepository instance.
+
+        Args:
+            database (SQLiteDatabase): The database.
+        """
+        self.database = database
+
+    async def create_trades(self, trades: list[TradeCycle]) -> list[TradeCycle]:
+        """
+        Inserts trade proposals in one transaction.
+
+        A cycle that is already proposed is skipped: the partial unique index on
+        ``key`` rejects it and the other proposals are still inserted.
+
+        Args:
+            trades (list[TradeCycle]): The proposals.
+
+        Returns:
+            list[TradeCycle]: The proposals that were inserted.
+        """
+        if not trades:
+            return []
+        for trade in trades:
+            trade.id = trade.id or uuid4()
+
+        def insert(connection: sqlite3.Connection) -> list[TradeCycle]:
+            inserted = []
+            for trade in trades:
+                try:
+                    connection.execute(INSERT_TRADE, _trade_values(trade))
+                except sqlite3.IntegrityError:
+                    continue
+                connection.executemany(INSERT_PARTICIPANT, ((user_id, trade.id) for user_id in trade.participants))
+                connection.executemany(INSERT_PRODUCT, ((product_id, trade.id) for product_id in trade.product_ids))
+                inserted.append(trade)
+            return inserted
+
+        return await self.database.transaction(insert)
+
+    async def get_trade_by_id(self, trade_id: UUID) -> TradeCycle:
+        """
+        Retrieves a trade proposal by its ID.
+
+        Args:
+            trade_id (UUID): The ID of the trade.
+
+        Returns:
+            TradeCycle: The trade, or None if it does not exist.
+        """
+        return trade_mapper.from_document(await self.database.fetch_one(SELECT_TRADE_BY_ID, (trade_id,)))
+
+    async def get_trades_for_user(self, user_id: UUID, status: Optional[str] = None, after: Optional[UUID] = None,
+                                  limit: Optional[int] = None) -> list[TradeCycle]:
+        """
+        Retrieves one page of the trades a user takes part in, ordered by trade ID.
+
+        Args:
+            user_id (UUID): The ID of the participant.
+            status (Optional[str]): Only return trades in this status.
+            after (Optional[UUID]): Only return trades whose ID sorts after this one.
+            limit (Optional[int]): Maximum number of trades to return.
+
+        Returns:
+            list[TradeCycle]: The trades.
+        """
+        parameters = (user_id, after or NO_UUID, *(() if status is None else (status,)), limit or NO_LIMIT)
+        rows = await self.database.fetch_all(SELECT_TRADES_FOR_USER[status is not None], parameters)
+        return [trade_mapper.from_document(row) for row in rows]
+
+    async def accept_trade(self, trade_id: UUID, user_id: UUID) -> TradeCycle:
+        """
+        Records a participant's acceptance; the trade becomes accepted once every participant has accepted.
+
+        Args:
+            trade_id (UUID): The ID of the trade.
+            user_id (UUID): The accepting participant.
+
+        Returns:
+            TradeCycle: The updated trade, or None if the trade does not exist.
+
+        Raises:
+            ValueError: If the user is not a participant or the trade is no longer proposed.
+        """
+        def accept(connection: sqlite3.Connection) -> Optional[dict]:
+            row = connection.execute(SELECT_TRADE_BY_ID, (trade_id,)).fetchone()
+            if row is None or row["status"] != TRADE_STATUS_PROPOSED or \
+                    connection.execute(SELECT_PARTICIPANT, (user_id, trade_id)).fetchone() is None:
+                return _explain_no_match(connection, trade_id, user_id, row)
+            trade = dict(row)
+            if str(user_id) not in trade["accepted_by"]:
+                trade["accepted_by"] = [*trade["accepted_by"], str(user_id)]
+            if len(trade["accepted_by"]) == len(trade["participants"]):
+                trade["status"] = TRADE_STATUS_ACCEPTED
+            connection.execute(UPDATE_ACCEPTED_BY, (to_json(trade["accepted_by"]), trade["status"], trade_id))
+            return trade
+
+        return trade_mapper.from_document(await self.database.transaction(accept))
+
+    async def reject_trade(self, trade_id: UUID, user_id: UUID) -> TradeCycle:
+        """
+        Rejects a proposed trade on behalf of one of its participants.
+
+        Args:
+            trade_id (UUID): The ID of the trade.
+            user_id (UUID): The rejecting participant.
+
+        Returns:
+            TradeCycle: The updated trade, or None if the trade does not exist.
+
+        Raises:
+            ValueError: If the user is not a participant or the trade is no longer proposed.
+        """
+        def reject(connection: sqlite3.Connection) -> Optional[dict]:
+            row = connection.execute(SELECT_TRADE_BY_ID, (trade_id,)).fetchone()
+            if row is None or row["status"] != TRADE_STATUS_PROPOSED or \
+                    connection.execute(SELECT_PARTICIPANT, (user_id, trade_id)).fetchone() is None:
+                return _explain_no_match(connection, trade_id, user_id, row)
+            connection.execute(UPDATE_STATUS, (TRADE_STATUS_REJECTED, trade_id))
+            return {**dict(row), "status": TRADE_STATUS_REJECTED}
+
+        return trade_mapper.from_document(await self.database.transaction(reject))
+
+    async def cancel_trades_with_products(self, product_ids: list[UUID], except_id: Optional[UUID] = None) -> int:
+        """
+        Cancels the proposed trades that involve any of the given products.
+
+        Args:
+            product_ids (list[UUID]): Products that are no longer available.
+            except_id (Optional[UUID]): A trade to leave untouched.
+
+        Returns:
+            int: The number of cancelled trades.
+        """
+        if not product_ids:
+            return 0
+        return await self.database.execute(
+            f"UPDATE trades SET status = ? WHERE status = ? AND id != ? AND id IN "
+            f"(SELECT trade_id FROM trade_products WHERE product_id IN ({placeholders(len(product_ids))}))",
+            (TRADE_STATUS_CANCELLED, TRADE_STATUS_PROPOSED, except_id or NO_UUID, *product_ids))
+
+    async def cancel_trades_with_leg(self, to_user_id: UUID, product_id: UUID) -> int:
+        """
+        Cancels the proposed trades in which a user receives a product they no longer want.
+
+        Args:
+            to_user_id (UUID): The receiving user.
+            product_id (UUID): The product.
+
+        Returns:
+            int: The number of cancelled trades.
+        """
+        def cancel(connection: sqlite3.Connection) -> int:
+            # The trades holding the product come from trade_products; the legs are matched here.
+            leg = (str(to_user_id), str(product_id))
+            trade_ids = [row["id"] for row in connection.execute(
+                             SELECT_PROPOSED_WITH_PRODUCT, (product_id, TRADE_STATUS_PROPOSED))
+                         if leg in ((item["to_user_id"], item["product_id"]) for item in row["legs"])]
+            connection.executemany(UPDATE_STATUS, ((TRADE_STATUS_CANCELLED, trade_id) for trade_id in trade_ids))
+            return len(trade_ids)
+
+        return await self.database.transaction(cancel)
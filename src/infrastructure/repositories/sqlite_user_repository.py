@@ -0,0 +1,150 @@
+# src/infrastructure/repositories/sqlite_user_repository.py
+import sqlite3
+from typing import AsyncIterator, Optional
+from uuid import uuid4, UUID
+
+from src.core.entities.user import UserRecord
+from src.infrastructure.mappers import user_mapper
+from src.infrastructure.sqlite_database import NO_UUID, SCAN_PAGE_SIZE, SQLiteDatabase, placeholders, to_json
+
+USER_COLUMNS = "id, username, email, hashed_password, profile_picture, interests"
+INSERT_USER = f"INSERT INTO users ({USER_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)"
+SELECT_USER_BY_ID = f"SELECT {USER_COLUMNS} FROM users WHERE id = ?"
+SELECT_USER_BY_EMAIL = f"SELECT {USER_COLUMNS} FROM users WHERE email = ?"
+UPDATE_USER = "UPDATE users SET username = ?, email = ?, hashed_password = ?, profile_picture = ?, interests = ? " \
+              "WHERE id = ?"
+INSERT_INTEREST = "INSERT OR IGNORE INTO user_interests (interest, user_id) VALUES (?, ?)"
+DELETE_INTERESTS = "DELETE FROM user_interests WHERE user_id = ?"
+SELECT_USER_INTERESTS_PAGE = "SELECT id, interests FROM users WHERE id > ? ORDER BY id LIMIT ?"
+# Patchable columns, so field names from a request never reach the SQL text unchecked.
+PATCH_COLUMNS = ("username", "email", "hashed_password", "profile_picture", "interests")
+
+
+def _user_values(user: UserRecord) -> tuple:
+    return user.username, user.email, user.hashed_password, user.profile_picture, to_json(user.interests or [])
+
+
+def _replace_interests(connection: sqlite3.Connection, user_id: UUID, interests: list[str]):
+    connection.execute(DELETE_INTERESTS, (user_id,))
+    connection.executemany(INSERT_INTEREST, ((interest, user_id) for interest in set(interests)))
+
+
+class SQLiteUserRepository:
+    """
+    Asynchronous repository for managing users in SQLite.
+
+    Interests are stored with the user as JSON and, one row per interest, in
+    ``user_interests``, which serves the lookup of users sharing an interest.
+    Both are written in the same transaction.
+    """
+
+    def __init__(self, database: SQLiteDatabase):
+        """
+        Initializes the SQLiteUserRepository instance.
+
+        Args:
+            database (SQLiteDatabase): The database.
+        """
+        self.database = database
+
+    async def create_user(self, user: UserRecord) -> UserRecord:
+        if not user.id:
+            user.id = uuid4()
+
+        def insert(connection: sqlite3.Connection):
+            connection.execute(INSERT_USER, (user.id, *_user_values(user)))
+            _replace_interests(connection, user.id, user.interests or [])
+
+        try:
+            await self.database.transaction(insert)
+        except sqlite3.IntegrityError:
+            raise ValueError("Email already registered")
+        return user
+
+    async def get_user_by_email(self, email: str) -> UserRecord:
+        return user_mapper.from_document(await self.database.fetch_one(SELECT_USER_BY_EMAIL, (email,)))
+
+    async def get_user_by_id(self, id: UUID) -> UserRecord:
+        return user_mapper.from_document(await self.database.fetch_one(SELECT_USER_BY_ID, (id,)))
+
+    async def iter_user_interests(self) -> AsyncIterator[tuple[UUID, list[str]]]:
+        """Yields (user ID, interests) for every user, e.g. to build an in-process index."""
+        after = NO_UUID
+        while True:
+            rows = await self.database.fetch_all(SELECT_USER_INTERESTS_PAGE, (after, SCAN_PAGE_SIZE))
+            for row in rows:
+                yield row["id"], row["interests"]
+            if len(rows) < SCAN_PAGE_SIZE:
+                return
+            after = rows[-1]["id"]
+
+    async def iter_users_with_interests(self, interests: list[str]) -> AsyncIterator[tuple[UUID, list[str]]]:
+        """Yields (user ID, interests) for every user sharing at least one of ``interests``."""
+        if not interests:
+            return
+        rows = await self.database.fetch_all(
+            f"SELECT id, interests FROM users WHERE id IN "
+            f"(SELECT user_id FROM user_interests WHERE interest IN ({placeholders(len(interests))}))",
+            tuple(interests))
+        for row in rows:
+            yield row["id"], row["interests"]
+
+    async def update_user(self, user: UserRecord) -> UserRecord:
+        def update(connection: sqlite3.Connection) -> Optional[sqlite3.Row]:
+            if connection.execute(UPDATE_USER, (*_user_values(user), user.id)).rowcount == 0:
+                return None
+            _replace_interests(connection, user.id, user.interests or [])
+            return connection.execute(SELECT_USER_BY_ID, (user.id,)).fetchone()
+
+        try:
+            row = await self.database.transaction(update)
+        except sqlite3.IntegrityError:
+            raise ValueError("Email already registered")
+        return user_mapper.from_document(None if row is None else dict(row))
+
+    async def patch_user(self, id: UUID, fields: Optional[dict] = None, add_interests: Optional[list[str]] = None,
+                         remove_interests: Optional[list[str]] = None) -> UserRecord:
+        """
+        Applies a partial update in one transaction and returns the updated user.
+
+        ``fields`` replace columns, ``add_interests`` are appended unless already
+        present and ``remove_interests`` are removed, as with $set, $addToSet and
+        $pull on MongoDB. Returns None if the user does not exist.
+
+        Raises:
+            ValueError: If the update touches ``interests`` in conflicting ways,
+                or the new email is already registered.
+        """
+        fields = dict(fields or {})
+        interest_operations = ("interests" in fields) + bool(add_interests) + bool(remove_interests)
+        if interest_operations > 1:
+            raise ValueError("Interests can only be replaced, added to or removed from in one request")
+        unknown = set(fields) - set(PATCH_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown user fields: {', '.join(sorted(unknown))}")
+        if not (fields or add_interests or remove_interests):
+            return await self.get_user_by_id(id)
+
+        def patch(connection: sqlite3.Connection) -> Optional[sqlite3.Row]:
+            row = connection.execute(SELECT_USER_BY_ID, (id,)).fetchone()
+            if row is None:
+                return None
+            values = dict(row)
+            values.update(fields)
+            interests = values["interests"] or []
+            if add_interests:
+                interests = interests + [interest for interest in dict.fromkeys(add_interests)
+                                         if interest not in interests]
+            if remove_interests:
+                interests = [interest for interest in interests if interest not in remove_interests]
+            connection.execute(UPDATE_USER, (values["username"], values["email"], values["hashed_password"],
+                                              values["profile_picture"], to_json(interests), id))
+            if interests != row["interests"]:
+                _replace_interests(connection, id, interests)
+            return connection.execute(SELECT_USER_BY_ID, (id,)).fetchone()
+
+        try:
+            row = await self.database.transaction(patch)
+        except sqlite3.IntegrityError:
+            raise ValueError("Email already registered")
+        return user_mapper.from_document(None if row is None else dict(row))
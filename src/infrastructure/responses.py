@@ -0,0 +1,80 @@
+# src/infrastructure/responses.py
+"""
+JSON responses rendered with orjson for content that is already valid.
+
+With ``response_model=`` FastAPI validates whatever the route returns against
+the model and then serializes it, so an entity the repository just built is
+validated a second time. Entities built by the mappers, and documents decoded
+with ``CODEC_OPTIONS``, are valid already, so routes on hot paths wrap them in
+an ``EntityResponse``. FastAPI sends a returned Response as is, and orjson
+writes UUIDs and datetimes natively, producing the same JSON as the entities'
+``json_encoders``. Those routes keep ``response_model`` for the OpenAPI schema.
+"""
+
+from typing import Any, AsyncIterator
+
+import orjson
+from pydantic import BaseModel
+from starlette.responses import Response
+
+from src.core.versioning import etag
+
+# pydantic writes UTC offsets as "Z"; orjson would write "+00:00" without OPT_UTC_Z.
+ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+
+def _model_fields(value: Any) -> dict:
+    if isinstance(value, BaseModel):
+        return value.__dict__
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def json_bytes(content: Any) -> bytes:
+    """
+    Serializes entities, records, lists of them or decoded documents without validating them.
+
+    Args:
+        content (Any): The content; records are dataclasses, which orjson writes natively,
+            and nested pydantic models are written field by field.
+
+    Returns:
+        bytes: The JSON document.
+    """
+    return orjson.dumps(content, default=_model_fields, option=ORJSON_OPTIONS)
+
+
+async def ndjson_lines(entities: AsyncIterator[Any]) -> AsyncIterator[bytes]:
+    """
+    Serializes entities or records one per line as they are produced.
+
+    Args:
+        entities (AsyncIterator[Any]): The entities or records to serialize.
+
+    Yields:
+        bytes: One JSON document followed by a newline.
+    """
+    async for entity in entities:
+        yield json_bytes(entity) + b"\n"
+
+
+class EntityResponse(Response):
+    """Response for pre-validated entities or decoded documents, serialized by orjson."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return json_bytes(content)
+
+
+def not_modified(version: int, cache_control: str) -> Response:
+    """
+    Builds the 304 answer to a conditional GET whose ``If-None-Match`` matched.
+
+    Args:
+        version (int): The current version of the entity.
+        cache_control (str): The Cache-Control header of the full response.
+
+    Returns:
+        Response: An empty 304 response carrying the same validators.
+    """
+    return Response(status_code=304, headers={"ETag": etag(version), "Cache-Control": cache_control})
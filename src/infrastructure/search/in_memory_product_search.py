@@ -0,0 +1,108 @@
+# src/infrastructure/search/in_memory_product_search.py
+
+import math
+import re
+from bisect import bisect_right
+from collections import defaultdict
+from typing import Iterable, Optional
+from uuid import UUID
+
+from src.core.entities.product import ProductRecord, ProductSummary
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Same relative weights as the products text index in src/infrastructure/indexes.py.
+FIELD_WEIGHTS = {"title": 10, "interests": 5, "description": 1}
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class InMemoryProductSearch:
+    """
+    In-process inverted index with the same API as MongoProductSearch.
+
+    It lets search run where MongoDB text search is unavailable (offline
+    development, tests, embedded deployments). Products must be fed through
+    ``index_product``/``remove_product``; the product service does so on every
+    write.
+    """
+
+    def __init__(self):
+        self._postings: dict[str, dict[UUID, float]] = defaultdict(dict)
+        self._terms: dict[UUID, set[str]] = {}
+        self._summaries: dict[UUID, ProductSummary] = {}
+
+    def __len__(self) -> int:
+        return len(self._summaries)
+
+    async def index_product(self, product: ProductRecord):
+        """
+        Adds a product to the index, replacing any previous version of it.
+
+        Args:
+            product (ProductRecord): The product to index.
+        """
+        await self.remove_product(product.id)
+        weights = defaultdict(float)
+        for field, weight in FIELD_WEIGHTS.items():
+            value = getattr(product, field) or ""
+            for token in tokenize(" ".join(value) if isinstance(value, list) else value):
+                weights[token] += weight
+        for token, weight in weights.items():
+            self._postings[token][product.id] = weight
+        self._terms[product.id] = set(weights)
+        self._summaries[product.id] = ProductSummary(id=product.id, owner_id=product.owner_id, title=product.title,
+                                                     image_url=product.image_url, interests=product.interests)
+
+    async def index_products(self, products: Iterable[ProductRecord]):
+        for product in products:
+            await self.index_product(product)
+
+    async def remove_product(self, product_id: UUID):
+        """
+        Removes a product from the index.
+
+        Args:
+            product_id (UUID): The ID of the product.
+        """
+        for token in self._terms.pop(product_id, ()):
+            postings = self._postings[token]
+            postings.pop(product_id, None)
+            if not postings:
+                del self._postings[token]
+        self._summaries.pop(product_id, None)
+
+    async def search(self, query: str, interest: Optional[str] = None, after: Optional[tuple[float, UUID]] = None,
+                     limit: int = 50) -> list[ProductSummary]:
+        """
+        Finds products matching any query term, ranked by weighted term frequency times IDF.
+
+        Args:
+            query (str): The search terms.
+            interest (Optional[str]): Only return products tagged with this interest.
+            after (Optional[tuple[float, UUID]]): Position of the last result of the previous page.
+            limit (int): Maximum number of results.
+
+        Returns:
+            list[ProductSummary]: The matching products, without descriptions.
+        """
+        scores = defaultdict(float)
+        total = len(self._summaries)
+        for token in set(tokenize(query)):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            idf = math.log(1 + total / len(postings))
+            for product_id, weight in postings.items():
+                scores[product_id] += weight * idf
+
+        ranked = sorted(((-score, product_id.bytes, product_id) for product_id, score in scores.items()
+                         if interest is None or interest in (self._summaries[product_id].interests or ())))
+        start = 0
+        if after is not None:
+            score, last_id = after
+            start = bisect_right(ranked, (-score, last_id.bytes, last_id))
+        return [self._summaries[product_id].copy(update={"score": -negative_score})
+                for negative_score, _, product_id in ranked[start:start + limit]]
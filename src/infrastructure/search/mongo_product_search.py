@@ -0,0 +1,65 @@
+# src/infrastructure/search/mongo_product_search.py
+
+from typing import Optional
+from uuid import UUID
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from src.core.entities.product import ProductRecord, ProductSummary
+from src.infrastructure.mappers import PRODUCT_SUMMARY_PROJECTION, product_summary_mapper
+
+
+class MongoProductSearch:
+    """Relevance-ranked product search on the products text index."""
+
+    def __init__(self, collection: AsyncIOMotorCollection):
+        """
+        Initializes the MongoProductSearch instance.
+
+        Args:
+            collection (AsyncIOMotorCollection): The products collection.
+        """
+        self.collection = collection
+
+    async def search(self, query: str, interest: Optional[str] = None, after: Optional[tuple[float, UUID]] = None,
+                     limit: int = 50) -> list[ProductSummary]:
+        """
+        Finds products whose title, description or interests match the query.
+
+        Results are ordered by descending text score and then by ID, so
+        ``after`` (the score and ID of the last result already returned)
+        continues the ranking without skipping or repeating products.
+
+        Args:
+            query (str): The search terms.
+            interest (Optional[str]): Only return products tagged with this interest.
+            after (Optional[tuple[float, UUID]]): Position of the last result of the previous page.
+            limit (int): Maximum number of results.
+
+        Returns:
+            list[ProductSummary]: The matching products, without descriptions.
+        """
+        match = {"$text": {"$search": query}}
+        if interest is not None:
+            match["interests"] = interest
+        pipeline = [
+            {"$match": match},
+            {"$addFields": {"score": {"$meta": "textScore"}}},
+        ]
+        if after is not None:
+            score, last_id = after
+            pipeline.append({"$match": {"$or": [{"score": {"$lt": score}},
+                                                {"score": score, "id": {"$gt": last_id}}]}})
+        pipeline += [
+            {"$sort": {"score": -1, "id": 1}},
+            {"$limit": limit},
+            {"$project": PRODUCT_SUMMARY_PROJECTION},
+        ]
+        cursor = self.collection.aggregate(pipeline)
+        return [product_summary_mapper.from_document(document) async for document in cursor]
+
+    async def index_product(self, product: ProductRecord):
+        """The text index is maintained by MongoDB; nothing to do."""
+
+    async def remove_product(self, product_id: UUID):
+        """The text index is maintained by MongoDB; nothing to do."""
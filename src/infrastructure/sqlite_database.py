@@ -0,0 +1,366 @@
+# src/infrastructure/sqlite_database.py
+"""
+SQLite connection lifecycle, schema and column types.
+
+``sqlite.connect()`` opens the database file named by ``BARTER_SQLITE_PATH``
+from the application lifespan, like ``mongo.connect()`` for MongoDB, and
+``ensure_schema`` creates the tables and indexes in ``SCHEMA``. The file is put
+in WAL mode, so readers never block the single writer and commits append to
+the log instead of rewriting pages.
+
+sqlite3 calls block, so statements run on a pool of ``BARTER_SQLITE_POOL_SIZE``
+threads and the coroutines await them. Each thread opens its own connection
+the first time it runs a statement and keeps it, so a connection is never
+shared between threads, and each connection keeps its compiled (prepared)
+statements in a cache of ``BARTER_SQLITE_STATEMENT_CACHE_SIZE`` entries keyed
+by the SQL text. The repositories therefore only use constant SQL with ``?``
+parameters. Concurrent writers wait up to ``BARTER_SQLITE_BUSY_TIMEOUT_MS`` for
+the write lock.
+
+Columns are declared with the types registered below, which the connections
+decode on read (``PARSE_DECLTYPES``): ``UUID`` as 16 bytes, which sort like
+the BSON binary UUIDs in MongoDB; ``EPOCH_MS`` as integer milliseconds since
+the epoch, the precision MongoDB stores; and ``JSON`` as text for lists and
+other nested values.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional, TypeVar
+from uuid import UUID
+
+import orjson
+
+from src.core.entities.trade import TRADE_STATUS_PROPOSED
+from src.infrastructure.config import SQLITE_BUSY_TIMEOUT_MS, SQLITE_PATH, SQLITE_POOL_SIZE, \
+    SQLITE_STATEMENT_CACHE_SIZE, SQLITE_SYNCHRONOUS
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MEMORY = ":memory:"
+NO_UUID = UUID(int=0)  # Sorts before every ID, for the first keyset page
+NO_LIMIT = -1
+# Full-table scans read pages of this many rows by ID, so no read transaction stays open for the whole table.
+SCAN_PAGE_SIZE = 1000
+
+
+def to_millis(value: datetime) -> int:
+    """Converts a datetime (naive ones are taken as UTC) to milliseconds since the epoch."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - EPOCH) // timedelta(milliseconds=1)
+
+
+def from_millis(value: bytes) -> datetime:
+    return EPOCH + timedelta(milliseconds=int(value))
+
+
+def to_json(value: Any) -> str:
+    """Encodes a list or dict for a JSON column; UUIDs and datetimes are written as strings."""
+    return orjson.dumps(value).decode()
+
+
+sqlite3.register_adapter(UUID, lambda value: value.bytes)
+sqlite3.register_adapter(datetime, to_millis)
+sqlite3.register_converter("UUID", lambda value: UUID(bytes=value))
+sqlite3.register_converter("EPOCH_MS", from_millis)
+sqlite3.register_converter("JSON", orjson.loads)
+
+
+SCHEMA: list[str] = [
+    """CREATE TABLE IF NOT EXISTS users (
+        id UUID BLOB PRIMARY KEY,
+        username TEXT NOT NULL,
+        email TEXT NOT NULL UNIQUE,
+        hashed_password TEXT NOT NULL,
+        profile_picture TEXT,
+        interests JSON TEXT NOT NULL DEFAULT '[]'
+    )""",
+    # One row per interest of a user, so the users sharing an interest are a range of the primary key.
+    """CREATE TABLE IF NOT EXISTS user_interests (
+        interest TEXT NOT NULL,
+        user_id UUID BLOB NOT NULL,
+        PRIMARY KEY (interest, user_id)
+    ) WITHOUT ROWID""",
+    "CREATE INDEX IF NOT EXISTS user_interests_user_id ON user_interests (user_id)",
+
+    """CREATE TABLE IF NOT EXISTS products (
+        id UUID BLOB PRIMARY KEY,
+        owner_id UUID BLOB NOT NULL,
+        title TEXT NOT NULL,
+        description TEXT NOT NULL,
+        image_url TEXT,
+        interests JSON TEXT NOT NULL DEFAULT '[]',
+        version INTEGER NOT NULL DEFAULT 0
+    )""",
+    "CREATE INDEX IF NOT EXISTS products_owner_id_id ON products (owner_id, id)",
+
+    """CREATE TABLE IF NOT EXISTS offers (
+        id UUID BLOB PRIMARY KEY,
+        product_id UUID BLOB NOT NULL,
+        from_user_id UUID BLOB NOT NULL,
+        to_user_id UUID BLOB NOT NULL,
+        offered_product_id UUID BLOB NOT NULL,
+        status TEXT NOT NULL,
+        created_at EPOCH_MS INTEGER,
+        expires_at EPOCH_MS INTEGER,
+        closed_at EPOCH_MS INTEGER,
+        version INTEGER NOT NULL DEFAULT 0
+    )""",
+    "CREATE INDEX IF NOT EXISTS offers_to_user_id_status_id ON offers (to_user_id, status, id)",
+    "CREATE INDEX IF NOT EXISTS offers_from_user_id_status_id ON offers (from_user_id, status, id)",
+    "CREATE INDEX IF NOT EXISTS offers_product_id_status ON offers (product_id, status)",
+    "CREATE INDEX IF NOT EXISTS offers_offered_product_id_status ON offers (offered_product_id, status)",
+    "CREATE INDEX IF NOT EXISTS offers_status_expires_at ON offers (status, expires_at)",
+    "CREATE INDEX IF NOT EXISTS offers_closed_at ON offers (closed_at) WHERE closed_at IS NOT NULL",
+
+    """CREATE TABLE IF NOT EXISTS trades (
+        id UUID BLOB PRIMARY KEY,
+        key TEXT NOT NULL,
+        legs JSON TEXT NOT NULL,
+        participants JSON TEXT NOT NULL,
+        product_ids JSON TEXT NOT NULL,
+        accepted_by JSON TEXT NOT NULL DEFAULT '[]',
+        status TEXT NOT NULL
+    )""",
+    # A cycle may only be proposed once at a time; settled proposals do not block a new one.
+    f"""CREATE UNIQUE INDEX IF NOT EXISTS trades_key_proposed ON trades (key)
+        WHERE status = '{TRADE_STATUS_PROPOSED}'""",
+    """CREATE TABLE IF NOT EXISTS trade_participants (
+        user_id UUID BLOB NOT NULL,
+        trade_id UUID BLOB NOT NULL,
+        PRIMARY KEY (user_id, trade_id)
+    ) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS trade_products (
+        product_id UUID BLOB NOT NULL,
+        trade_id UUID BLOB NOT NULL,
+        PRIMARY KEY (product_id, trade_id)
+    ) WITHOUT ROWID""",
+
+    """CREATE TABLE IF NOT EXISTS feed_items (
+        user_id UUID BLOB NOT NULL,
+        product_id UUID BLOB NOT NULL,
+        owner_id UUID BLOB NOT NULL,
+        title TEXT NOT NULL,
+        image_url TEXT,
+        interests JSON TEXT NOT NULL DEFAULT '[]',
+        score INTEGER NOT NULL,
+        added_at EPOCH_MS INTEGER NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS feed_items_user_id_score ON feed_items (user_id, score DESC, added_at DESC)",
+    "CREATE INDEX IF NOT EXISTS feed_items_product_id ON feed_items (product_id)",
+
+    """CREATE TABLE IF NOT EXISTS conversations (
+        id UUID BLOB PRIMARY KEY,
+        key TEXT NOT NULL UNIQUE,
+        participants JSON TEXT NOT NULL,
+        offer_id UUID BLOB,
+        last_message_at EPOCH_MS INTEGER,
+        last_message_preview TEXT
+    )""",
+    # The participants of each conversation with their unread counters.
+    """CREATE TABLE IF NOT EXISTS conversation_participants (
+        conversation_id UUID BLOB NOT NULL,
+        user_id UUID BLOB NOT NULL,
+        unread INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (conversation_id, user_id)
+    ) WITHOUT ROWID""",
+    "CREATE INDEX IF NOT EXISTS conversation_participants_user_id ON conversation_participants (user_id)",
+    """CREATE TABLE IF NOT EXISTS messages (
+        id UUID BLOB PRIMARY KEY,
+        conversation_id UUID BLOB NOT NULL,
+        sender_id UUID BLOB NOT NULL,
+        body TEXT NOT NULL,
+        offer_id UUID BLOB,
+        sent_at EPOCH_MS INTEGER NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS messages_conversation_id_sent_at ON messages (conversation_id, sent_at DESC, id DESC)",
+
+    """CREATE TABLE IF NOT EXISTS revoked_tokens (
+        token_id TEXT PRIMARY KEY,
+        expires_at EPOCH_MS INTEGER NOT NULL
+    ) WITHOUT ROWID""",
+]
+
+
+class SQLiteDatabase:
+    """A SQLite database file and the pool of threads, one connection each, that run its statements."""
+
+    def __init__(self, path: str = SQLITE_PATH, pool_size: int = SQLITE_POOL_SIZE,
+                 busy_timeout_ms: int = SQLITE_BUSY_TIMEOUT_MS,
+                 statement_cache_size: int = SQLITE_STATEMENT_CACHE_SIZE, synchronous: str = SQLITE_SYNCHRONOUS):
+        """
+        Initializes the SQLiteDatabase instance. Connections are opened by the threads on first use.
+
+        Args:
+            path (str): The database file, or ":memory:" for a private in-memory database.
+            pool_size (int): Threads running statements; ":memory:" always uses one, since every
+                connection to it would open another database.
+            busy_timeout_ms (int): How long a statement waits for a lock held by another connection.
+            statement_cache_size (int): Prepared statements kept per connection.
+            synchronous (str): The synchronous pragma, e.g. "NORMAL" or "FULL".
+        """
+        self.path = path
+        self.pool_size = 1 if path == MEMORY else pool_size
+        self.busy_timeout_ms = busy_timeout_ms
+        self.statement_cache_size = statement_cache_size
+        self.synchronous = synchronous
+        self._executor = ThreadPoolExecutor(self.pool_size, thread_name_prefix="sqlite")
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # Autocommit (isolation_level=None): single statements commit on their own, and
+            # ``transaction`` issues BEGIN IMMEDIATE itself. check_same_thread is off only so
+            # that ``close`` can close every thread's connection.
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout_ms / 1000,
+                                         detect_types=sqlite3.PARSE_DECLTYPES, isolation_level=None,
+                                         check_same_thread=False, cached_statements=self.statement_cache_size)
+            connection.row_factory = sqlite3.Row
+            connection.execute(f"PRAGMA synchronous = {self.synchronous}")
+            connection.execute("PRAGMA temp_store = MEMORY")
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def _call(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        return operation(self._connection())
+
+    def _call_in_transaction(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            result = operation(connection)
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        return result
+
+    async def run(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        """
+        Runs blocking sqlite3 calls on a pool thread, with that thread's connection.
+
+        Args:
+            operation (Callable[[sqlite3.Connection], T]): The calls; each statement commits on its own.
+
+        Returns:
+            T: What ``operation`` returned.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._call, operation)
+
+    async def transaction(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        """
+        Runs blocking sqlite3 calls in one write transaction, rolled back if they raise.
+
+        BEGIN IMMEDIATE takes the write lock up front, so a transaction that reads
+        before it writes cannot fail halfway on a lock upgrade.
+
+        Args:
+            operation (Callable[[sqlite3.Connection], T]): The calls.
+
+        Returns:
+            T: What ``operation`` returned.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._call_in_transaction, operation)
+
+    async def fetch_one(self, sql: str, parameters: tuple = ()) -> Optional[dict]:
+        """Runs a query and returns its first row as a dict of decoded columns, or None."""
+        row = await self.run(lambda connection: connection.execute(sql, parameters).fetchone())
+        return None if row is None else dict(row)
+
+    async def fetch_all(self, sql: str, parameters: tuple = ()) -> list[dict]:
+        """Runs a query and returns its rows as dicts of decoded columns."""
+        rows = await self.run(lambda connection: connection.execute(sql, parameters).fetchall())
+        return [dict(row) for row in rows]
+
+    async def execute(self, sql: str, parameters: tuple = ()) -> int:
+        """Runs one statement in its own transaction and returns the number of rows it changed."""
+        return await self.run(lambda connection: connection.execute(sql, parameters).rowcount)
+
+    def close(self):
+        """Waits for running statements, then closes every connection and stops the threads."""
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+
+
+async def ensure_schema(database: SQLiteDatabase):
+    """
+    Switches the file to WAL mode and creates every table and index in ``SCHEMA`` that does not exist yet.
+
+    Args:
+        database (SQLiteDatabase): The database.
+    """
+    def create(connection: sqlite3.Connection) -> str:
+        journal_mode = connection.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+        for statement in SCHEMA:
+            connection.execute(statement)
+        return journal_mode
+
+    journal_mode = await database.run(create)
+    logger.info(f"Ensured SQLite schema in {database.path} (journal_mode={journal_mode})")
+
+
+def placeholders(count: int) -> str:
+    """
+    Builds the ``?, ?, ...`` list of an IN clause. The SQL then depends on the number of
+    values, so statements using it are only prepared once per distinct count.
+    """
+    return ", ".join("?" * count)
+
+
+class SQLiteConnection:
+    """Owns the SQLite database of the process, opened on connect rather than on import."""
+
+    def __init__(self):
+        """Initializes the SQLiteConnection instance, without opening the database."""
+        self._database: Optional[SQLiteDatabase] = None
+
+    def connect(self, path: str = SQLITE_PATH) -> SQLiteDatabase:
+        """
+        Creates the database and its thread pool if there are none yet.
+
+        Args:
+            path (str): The database file.
+
+        Returns:
+            SQLiteDatabase: The database.
+        """
+        if self._database is None:
+            self._database = SQLiteDatabase(path)
+        return self._database
+
+    @property
+    def database(self) -> SQLiteDatabase:
+        """
+        The application database.
+
+        Raises:
+            RuntimeError: If ``connect`` has not been called.
+        """
+        if self._database is None:
+            raise RuntimeError("SQLite is not connected; call sqlite.connect() first")
+        return self._database
+
+    def close(self):
+        """Closes the connections. A later ``connect`` opens the file again."""
+        if self._database is not None:
+            self._database.close()
+            self._database = None
+
+
+sqlite = SQLiteConnection()
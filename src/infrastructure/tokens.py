@@ -0,0 +1,177 @@
+# src/infrastructure/tokens.py
+"""
+Issuing and verifying access tokens without touching the database.
+
+``TokenVerifier`` signs tokens with ``BARTER_TOKEN_SECRET`` and checks them
+on every authenticated request. Without a secret it refuses to start, unless
+``BARTER_TOKEN_ALLOW_RANDOM_SECRET`` allows a random one for development. A token that has been verified once is kept
+in an LRU cache of ``BARTER_TOKEN_CACHE_SIZE`` entries, so repeated requests
+with the same token skip the HMAC and the JSON decoding and cost a dict
+lookup; the expiry is still checked on every hit.
+
+Tokens revoked before they expire (on logout) are refused through a small
+in-memory set of token IDs. A revocation takes effect at once in the process
+that recorded it; every ``BARTER_TOKEN_REVOCATION_REFRESH_SECONDS`` a
+background task reloads the set from storage, which is how the other
+workers learn about it. The set only holds unexpired tokens, so it stays as
+small as the number of recent logouts.
+"""
+
+import asyncio
+import logging
+import secrets
+import time
+from typing import Awaitable, Callable, Iterable, Optional
+from uuid import UUID
+
+from src.core.tokens import InvalidTokenError, TokenClaims, issue_token, verify_token
+from src.infrastructure.cache import LRUCache
+from src.infrastructure.config import TOKEN_ALLOW_RANDOM_SECRET, TOKEN_CACHE_SIZE, TOKEN_REVOCATION_REFRESH_SECONDS, \
+    TOKEN_SCOPES, TOKEN_SECRET, TOKEN_TTL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+RevocationLoader = Callable[[], Awaitable[Iterable[str]]]
+
+
+class TokenVerifier:
+    """Issues signed access tokens and verifies them from memory."""
+
+    def __init__(self, secret: str = TOKEN_SECRET, ttl: int = TOKEN_TTL_SECONDS,
+                 scopes: Iterable[str] = TOKEN_SCOPES, cache_size: int = TOKEN_CACHE_SIZE,
+                 refresh_interval: float = TOKEN_REVOCATION_REFRESH_SECONDS,
+                 clock: Callable[[], float] = time.time, allow_random_secret: bool = TOKEN_ALLOW_RANDOM_SECRET):
+        """
+        Initializes the TokenVerifier instance.
+
+        Args:
+            secret (str): The signing secret. If empty, the verifier refuses to issue, verify or start.
+            ttl (int): Seconds a token stays valid after it is issued.
+            scopes (Iterable[str]): The scopes granted by ``issue``.
+            cache_size (int): Verified tokens kept in memory.
+            refresh_interval (float): Seconds between reloads of the revocation list.
+            clock (Callable[[], float]): Wall-clock time source, injectable for tests.
+            allow_random_secret (bool): Generate a random per-process secret when none is given, for development.
+        """
+        if not secret and allow_random_secret:
+            logger.warning("BARTER_TOKEN_SECRET is not set; tokens are signed with a random per-process secret")
+            secret = secrets.token_urlsafe(32)
+        self._secret = secret.encode("utf-8")
+        self.ttl = ttl
+        self.scopes = frozenset(scopes)
+        self.refresh_interval = refresh_interval
+        self.clock = clock
+        # Entries outlive no token: a hit past its expiry is refused and dropped.
+        self.cache = LRUCache(max_size=cache_size, ttl=ttl)
+        self._revoked: set[str] = set()
+        self._revoked_since_refresh: set[str] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def _signing_secret(self) -> bytes:
+        if not self._secret:
+            raise RuntimeError("BARTER_TOKEN_SECRET is not set; set it to a secret shared by every worker, "
+                               "or set BARTER_TOKEN_ALLOW_RANDOM_SECRET=1 for development")
+        return self._secret
+
+    def issue(self, user_id: UUID) -> tuple[str, TokenClaims]:
+        """
+        Issues a token with the configured scopes to a user.
+
+        Args:
+            user_id (UUID): The ID of the user.
+
+        Returns:
+            tuple[str, TokenClaims]: The token and its claims.
+        """
+        token, claims = issue_token(self._signing_secret(), user_id, self.scopes, int(self.clock()) + self.ttl)
+        self.cache.set(token, claims)
+        return token, claims
+
+    def verify(self, token: str) -> TokenClaims:
+        """
+        Checks a token and returns its claims.
+
+        Args:
+            token (str): The token.
+
+        Returns:
+            TokenClaims: The claims.
+
+        Raises:
+            InvalidTokenError: If the token is malformed, badly signed, expired or revoked.
+        """
+        now = self.clock()
+        claims = self.cache.get(token)
+        if claims is None:
+            claims = verify_token(self._signing_secret(), token, now)
+            self.cache.set(token, claims)
+        elif claims.expires_at <= now:
+            self.cache.invalidate(token)
+            raise InvalidTokenError("Token has expired")
+        if claims.token_id in self._revoked:
+            raise InvalidTokenError("Token has been revoked")
+        return claims
+
+    def revoke(self, token_id: str):
+        """
+        Refuses a token in this process from now on; storing the revocation is up to the caller.
+
+        Args:
+            token_id (str): The ID of the token.
+        """
+        self._revoked.add(token_id)
+        self._revoked_since_refresh.add(token_id)
+
+    @property
+    def revoked_count(self) -> int:
+        """The number of revoked tokens currently refused."""
+        return len(self._revoked)
+
+    async def refresh(self, load_revoked: RevocationLoader):
+        """
+        Replaces the revocation list with the one in storage.
+
+        Args:
+            load_revoked (RevocationLoader): Coroutine function returning the IDs of the unexpired revoked tokens.
+        """
+        # Revocations made while loading may be missing from what was read; keep them until the next refresh.
+        recent, self._revoked_since_refresh = self._revoked_since_refresh, set()
+        loaded = set(await load_revoked())
+        self._revoked = loaded | recent | self._revoked_since_refresh
+
+    async def _run(self, load_revoked: RevocationLoader):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh(load_revoked)
+            except Exception:
+                # Keep refusing the tokens known so far and retry at the next interval.
+                logger.exception("Refreshing the token revocation list failed")
+
+    async def start(self, load_revoked: RevocationLoader):
+        """
+        Loads the revocation list, then keeps reloading it in the background.
+
+        Args:
+            load_revoked (RevocationLoader): Coroutine function returning the IDs of the unexpired revoked tokens.
+
+        Raises:
+            RuntimeError: If no signing secret is configured.
+        """
+        self._signing_secret()
+        await self.refresh(load_revoked)
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(load_revoked))
+
+    async def stop(self):
+        """Stops reloading the revocation list."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+token_verifier = TokenVerifier()
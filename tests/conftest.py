@@ -0,0 +1,136 @@
+# tests/conftest.py
+
+import os
+from uuid import uuid4
+
+# Read by src/infrastructure/config.py at import time, so set before any test module imports the application.
+os.environ.setdefault("BARTER_TOKEN_SECRET", "test-secret")
+os.environ.setdefault("BARTER_SEARCH_BACKEND", "memory")
+os.environ.setdefault("BARTER_PASSWORD_SCRYPT_N", str(2 ** 10))
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(params=["motor", "sqlite"])
+async def offer_repository(request, tmp_path):
+    """An offer repository on the MongoDB stand-in with the application's indexes, then on a fresh SQLite file."""
+    if request.param == "motor":
+        from benchmarks.standin import standin_database
+        from src.infrastructure.indexes import ensure_indexes
+        from src.infrastructure.repositories.motor_offer_repository import MotorOfferRepository
+        database = standin_database()
+        await ensure_indexes(database)
+        yield MotorOfferRepository(database["offers"])
+    else:
+        from src.infrastructure.repositories.sqlite_offer_repository import SQLiteOfferRepository
+        from src.infrastructure.sqlite_database import SQLiteDatabase, ensure_schema
+        database = SQLiteDatabase(str(tmp_path / "barter_app.db"))
+        await ensure_schema(database)
+        yield SQLiteOfferRepository(database)
+        database.close()
+
+
+@pytest.fixture(params=["motor", "sqlite"])
+async def message_repository(request, tmp_path):
+    """A message repository with two-message buckets on the MongoDB stand-in, then one on a fresh SQLite file."""
+    if request.param == "motor":
+        from benchmarks.standin import standin_database
+        from src.infrastructure.indexes import ensure_indexes
+        from src.infrastructure.repositories.motor_message_repository import MotorMessageRepository
+        database = standin_database()
+        await ensure_indexes(database)
+        yield MotorMessageRepository(database["conversations"], database["message_buckets"], bucket_size=2)
+    else:
+        from src.infrastructure.repositories.sqlite_message_repository import SQLiteMessageRepository
+        from src.infrastructure.sqlite_database import SQLiteDatabase, ensure_schema
+        database = SQLiteDatabase(str(tmp_path / "barter_app.db"))
+        await ensure_schema(database)
+        yield SQLiteMessageRepository(database)
+        database.close()
+
+
+@pytest.fixture(params=["motor", "sqlite"])
+async def storage(request, tmp_path):
+    """
+    The uncached user, product, trade, feed and revoked token repositories of one backend: the MongoDB stand-in
+    with the application's indexes, then a fresh SQLite file.
+    """
+    from types import SimpleNamespace
+    if request.param == "motor":
+        from benchmarks.standin import standin_database
+        from src.infrastructure.indexes import ensure_indexes
+        from src.infrastructure.repositories.motor_feed_repository import MotorFeedRepository
+        from src.infrastructure.repositories.motor_product_repository import MotorProductRepository
+        from src.infrastructure.repositories.motor_revoked_token_repository import MotorRevokedTokenRepository
+        from src.infrastructure.repositories.motor_trade_repository import MotorTradeRepository
+        from src.infrastructure.repositories.motor_user_repository import MotorUserRepository
+        database = standin_database()
+        await ensure_indexes(database)
+        yield SimpleNamespace(backend=request.param, users=MotorUserRepository(database["users"]),
+                              products=MotorProductRepository(database["products"]),
+                              trades=MotorTradeRepository(database["trades"]),
+                              feeds=MotorFeedRepository(database["feeds"]),
+                              revoked_tokens=MotorRevokedTokenRepository(database["revoked_tokens"]))
+    else:
+        from src.infrastructure.repositories.sqlite_feed_repository import SQLiteFeedRepository
+        from src.infrastructure.repositories.sqlite_product_repository import SQLiteProductRepository
+        from src.infrastructure.repositories.sqlite_revoked_token_repository import SQLiteRevokedTokenRepository
+        from src.infrastructure.repositories.sqlite_trade_repository import SQLiteTradeRepository
+        from src.infrastructure.repositories.sqlite_user_repository import SQLiteUserRepository
+        from src.infrastructure.sqlite_database import SQLiteDatabase, ensure_schema
+        database = SQLiteDatabase(str(tmp_path / "barter_app.db"))
+        await ensure_schema(database)
+        yield SimpleNamespace(backend=request.param, users=SQLiteUserRepository(database),
+                              products=SQLiteProductRepository(database), trades=SQLiteTradeRepository(database),
+                              feeds=SQLiteFeedRepository(database),
+                              revoked_tokens=SQLiteRevokedTokenRepository(database))
+        database.close()
+
+
+@pytest.fixture(scope="session")
+async def client():
+    """
+    An HTTP client for ``main.app``, started with its lifespan on the MongoDB stand-in. The application's
+    singletons (event bus, caches, indexes) bind to one event loop, so the app is started once per session.
+    """
+    import httpx
+    import main
+    from benchmarks.standin import standin_database, use_standin
+
+    use_standin(standin_database())
+    async with main.app.router.lifespan_context(main.app):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://test") as http:
+            yield http
+
+
+@pytest.fixture
+def register(client):
+    """Registers and logs in a new user through the API; resolves to the user's ID and authorization headers."""
+
+    async def register_user() -> tuple[str, dict]:
+        name = f"user-{uuid4().hex[:12]}"
+        credentials = {"email": f"{name}@example.com", "password": "not-a-real-password"}
+        response = await client.post("/auth/register", json={"username": name, **credentials})
+        assert response.status_code == 200
+        login = (await client.post("/auth/login", json=credentials)).json()
+        return login["user"]["id"], {"Authorization": f"Bearer {login['access_token']}"}
+
+    return register_user
+
+
+@pytest.fixture
+def create_product(client):
+    """Creates a product through the API; resolves to its ID."""
+
+    async def create(owner_id: str, headers: dict, title: str = "Lamp") -> str:
+        response = await client.post("/products/", headers=headers, json={
+            "owner_id": owner_id, "title": title, "description": f"A well kept {title.lower()}"})
+        assert response.status_code == 200
+        return response.json()["id"]
+
+    return create
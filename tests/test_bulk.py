@@ -0,0 +1,80 @@
+# tests/test_bulk.py
+
+from uuid import uuid4
+
+import pytest
+
+from src.core.bulk import chunked
+from src.core.entities.offer import OfferRecord
+from src.features.offers.offer_service import get_offer_by_id, ingest_offers
+from src.features.products.product_service import get_product_by_id, ingest_products
+
+pytestmark = pytest.mark.anyio
+
+
+def test_chunked_splits_lazily():
+    assert list(chunked(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+
+
+async def test_ingest_products_reports_each_item_in_order(client):
+    owner_id, duplicate_id = str(uuid4()), str(uuid4())
+    items = [{"owner_id": owner_id, "title": "Lamp", "description": "Brass"},
+             {"owner_id": owner_id, "description": "No title"},
+             {"id": duplicate_id, "owner_id": owner_id, "title": "Chair", "description": "Oak"},
+             {"id": duplicate_id, "owner_id": owner_id, "title": "Chair", "description": "Copy"},
+             {"owner_id": owner_id, "title": "Rug", "description": "Wool"}]
+
+    results = await ingest_products(items, chunk_size=2)
+
+    assert [result.index for result in results] == [0, 1, 2, 3, 4]
+    assert [result.error is None for result in results] == [True, False, True, False, True]
+    stored = await get_product_by_id(results[4].id)
+    assert (stored.title, stored.version) == ("Rug", 1)
+
+
+async def test_ingest_offers_refuses_products_the_users_do_not_own(client):
+    sender_id, recipient_id = str(uuid4()), str(uuid4())
+    wanted, offered = await ingest_products([{"owner_id": recipient_id, "title": "Lamp", "description": "Brass"},
+                                             {"owner_id": sender_id, "title": "Rug", "description": "Wool"}])
+    offer = {"from_user_id": sender_id, "to_user_id": recipient_id}
+
+    results = await ingest_offers([{**offer, "product_id": str(wanted.id), "offered_product_id": str(offered.id)},
+                                   {**offer, "product_id": str(offered.id), "offered_product_id": str(wanted.id)},
+                                   {**offer, "product_id": str(wanted.id)}])
+
+    assert [result.error is None for result in results] == [True, False, False]
+    assert (await get_offer_by_id(results[0].id)).status == "pending"
+
+
+async def test_ingest_offers_sets_the_server_fields(client):
+    sender_id, recipient_id = str(uuid4()), str(uuid4())
+    wanted, offered = await ingest_products([{"owner_id": recipient_id, "title": "Lamp", "description": "Brass"},
+                                             {"owner_id": sender_id, "title": "Rug", "description": "Wool"}])
+
+    (result,) = await ingest_offers([{"from_user_id": sender_id, "to_user_id": recipient_id,
+                                      "product_id": str(wanted.id), "offered_product_id": str(offered.id),
+                                      "status": "accepted", "version": 7, "closed_at": "2020-01-01T00:00:00Z",
+                                      "expires_at": "2020-01-01T00:00:00Z"}])
+
+    stored = await get_offer_by_id(result.id)
+    assert (stored.status, stored.version, stored.closed_at) == ("pending", 1, None)
+    assert stored.expires_at > stored.created_at
+
+
+async def test_create_offers_keeps_going_past_a_duplicate(offer_repository):
+    first, duplicate, last = (OfferRecord(product_id=uuid4(), from_user_id=uuid4(), to_user_id=uuid4(),
+                                          offered_product_id=uuid4()) for _ in range(3))
+    await offer_repository.create_offer(duplicate)
+
+    errors = await offer_repository.create_offers([first, duplicate, last], chunk_size=2)
+
+    assert [error is None for error in errors] == [True, False, True]
+    assert await offer_repository.get_offer_by_id(last.id) is not None
+
+
+async def test_bulk_endpoints_need_the_bulk_scope(client, register):
+    user_id, headers = await register()
+    item = {"owner_id": user_id, "title": "Lamp", "description": "Brass"}
+
+    assert (await client.post("/products/bulk", headers=headers, json=[item])).status_code == 403
+    assert (await client.post("/offers/bulk", headers=headers, json=[])).status_code == 403
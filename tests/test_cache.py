@@ -0,0 +1,133 @@
+# tests/test_cache.py
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from src.core.entities.offer import OfferRecord
+from src.core.entities.product import ProductRecord
+from src.infrastructure.cache import LRUCache, copy_record
+from src.infrastructure.repositories.cached_offer_repository import CachedOfferRepository
+
+pytestmark = pytest.mark.anyio
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def test_concurrent_misses_share_one_load():
+    cache = LRUCache()
+    calls = 0
+    release = asyncio.Event()
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "value"
+
+    readers = [asyncio.create_task(cache.get_or_load("key", load)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*readers) == ["value"] * 5
+    assert calls == 1
+    assert (cache.stats.misses, cache.stats.coalesced) == (1, 4)
+    assert cache.get("key") == "value"
+
+
+async def test_failed_load_is_shared_and_not_cached():
+    cache = LRUCache()
+    release = asyncio.Event()
+
+    async def load():
+        await release.wait()
+        raise RuntimeError("database down")
+
+    readers = [asyncio.create_task(cache.get_or_load("key", load)) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*readers, return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(cache) == 0
+
+
+async def test_invalidation_during_a_load_keeps_the_stale_value_out():
+    cache = LRUCache()
+    release = asyncio.Event()
+
+    async def load():
+        await release.wait()
+        return "stale"
+
+    reader = asyncio.create_task(cache.get_or_load("key", load))
+    await asyncio.sleep(0)
+    cache.invalidate("key")
+    release.set()
+
+    assert await reader == "stale"
+    assert cache.get("key") is None
+
+
+async def test_missing_entities_are_not_cached():
+    cache = LRUCache()
+
+    async def load():
+        return None
+
+    assert await cache.get_or_load("key", load) is None
+    assert len(cache) == 0
+
+
+def test_entries_expire_and_least_recently_used_are_evicted():
+    clock = Clock()
+    cache = LRUCache(max_size=2, ttl=10, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+    assert cache.stats.evictions == 1
+
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.stats.expirations == 1
+
+
+async def test_cached_repository_follows_writes(offer_repository):
+    cache = LRUCache()
+    repository = CachedOfferRepository(offer_repository, cache)
+    offer = await repository.create_offer(OfferRecord(
+        product_id=uuid4(), from_user_id=uuid4(), to_user_id=uuid4(), offered_product_id=uuid4()))
+    assert cache.get(offer.id).version == offer.version
+
+    offer.offered_product_id = uuid4()
+    updated = await repository.update_offer(offer)
+    assert (await repository.get_offer_by_id(offer.id)).version == updated.version == offer.version + 1
+
+    await repository.delete_offer(offer.id)
+    assert cache.get(offer.id) is None
+    assert await repository.get_offer_by_id(offer.id) is None
+
+
+async def test_copying_cache_hands_out_records_callers_can_change():
+    cache = LRUCache(copy=copy_record)
+    product = ProductRecord(id=uuid4(), owner_id=uuid4(), title="Lamp", description="Brass", interests=["lamps"])
+    cache.set(product.id, product)
+    product.title = "Changed after storing"
+
+    first = cache.get(product.id)
+    first.title = "Changed after reading"
+    first.interests.append("rugs")
+    second = await cache.get_or_load(product.id, None)
+
+    assert (second.title, second.interests) == ("Lamp", ["lamps"])
+    assert second is not first
@@ -0,0 +1,65 @@
+# tests/test_feed.py
+
+from uuid import uuid4
+
+import pytest
+
+from src.infrastructure.events import event_bus
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_products_fan_out_to_interested_users(client, register):
+    tag, other_tag = f"lamps-{uuid4().hex[:8]}", f"brass-{uuid4().hex[:8]}"
+    (reader, reader_headers), (partial_reader, partial_headers) = await register(), await register()
+    owner, owner_headers = await register()
+    await client.patch(f"/profile/{reader}", headers=reader_headers, json={"interests": [tag, other_tag]})
+    await client.patch(f"/profile/{partial_reader}", headers=partial_headers, json={"interests": [tag]})
+    await client.patch(f"/profile/{owner}", headers=owner_headers, json={"interests": [tag]})
+    body = {"owner_id": owner, "title": "Lamp", "description": "Brass", "interests": [tag, other_tag]}
+    weak = (await client.post("/products/", headers=owner_headers, json={**body, "interests": [tag]})).json()
+    strong = (await client.post("/products/", headers=owner_headers, json=body)).json()
+    await event_bus.drain()
+
+    feed = (await client.get(f"/feed/{reader}", headers=reader_headers)).json()
+    assert [(item["product_id"], item["score"]) for item in feed] == [(strong["id"], 2), (weak["id"], 1)]
+    assert len((await client.get(f"/feed/{partial_reader}", headers=partial_headers)).json()) == 2
+    assert (await client.get(f"/feed/{owner}", headers=owner_headers)).json() == []
+
+    await client.put("/products/", headers=owner_headers, json={**body, "id": strong["id"], "interests": [other_tag]})
+    await client.delete(f"/products/{weak['id']}", headers=owner_headers)
+    await event_bus.drain()
+
+    assert [item["product_id"] for item in (await client.get(f"/feed/{reader}", headers=reader_headers)).json()] \
+        == [strong["id"]]
+    assert (await client.get(f"/feed/{partial_reader}", headers=partial_headers)).json() == []
+
+
+async def test_feed_pages_with_a_cursor(client, register):
+    tag = f"rugs-{uuid4().hex[:8]}"
+    (reader, reader_headers), (owner, owner_headers) = await register(), await register()
+    await client.patch(f"/profile/{reader}", headers=reader_headers, json={"interests": [tag]})
+    for title in ("Rug", "Mat", "Carpet"):
+        await client.post("/products/", headers=owner_headers, json={
+            "owner_id": owner, "title": title, "description": "Wool", "interests": [tag]})
+    await event_bus.drain()
+
+    first = await client.get(f"/feed/{reader}", headers=reader_headers, params={"limit": 2})
+    second = await client.get(f"/feed/{reader}", headers=reader_headers,
+                              params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]})
+
+    assert len(first.json()) == 2 and len(second.json()) == 1
+    assert (await client.get(f"/feed/{reader}", headers=owner_headers)).status_code == 403
+
+
+async def test_fan_out_ignores_tag_case_like_the_matcher(client, register):
+    tag = f"Lamps-{uuid4().hex[:8]}"
+    (reader, reader_headers), (owner, owner_headers) = await register(), await register()
+    profile = await client.patch(f"/profile/{reader}", headers=reader_headers,
+                                 json={"interests": [tag.upper(), tag.lower()]})
+    await client.post("/products/", headers=owner_headers, json={
+        "owner_id": owner, "title": "Lamp", "description": "Brass", "interests": [tag]})
+    await event_bus.drain()
+
+    assert profile.json()["interests"] == [tag.lower()]
+    assert [item["score"] for item in (await client.get(f"/feed/{reader}", headers=reader_headers)).json()] == [1]
@@ -0,0 +1,45 @@
+# tests/test_inbox.py
+
+from uuid import uuid4
+
+import pytest
+
+from src.core.entities.offer import OfferRecord
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_page_counts_every_status_and_pages_by_id(offer_repository):
+    recipient = uuid4()
+    offers = [await offer_repository.create_offer(OfferRecord(
+        product_id=uuid4(), from_user_id=uuid4(), to_user_id=recipient, offered_product_id=uuid4()))
+        for _ in range(3)]
+    await offer_repository.create_offer(OfferRecord(
+        product_id=uuid4(), from_user_id=recipient, to_user_id=uuid4(), offered_product_id=uuid4()))
+    await offer_repository.update_offer_status(offers[0].id, "rejected")
+    pending = sorted(offer.id for offer in offers[1:])
+
+    first = await offer_repository.get_offer_page("to_user_id", recipient, "pending", None, 1)
+    second = await offer_repository.get_offer_page("to_user_id", recipient, "pending", first.items[0].id, 1)
+
+    assert [item.id for item in first.items + second.items] == pending
+    assert first.counts == {"pending": 2, "rejected": 1}
+    assert first.items[0].product is None  # The products were never created
+
+
+async def test_inbox_joins_product_summaries(client, register, create_product):
+    (sender, sender_headers), (recipient, recipient_headers) = await register(), await register()
+    wanted = await create_product(recipient, recipient_headers, title="Lamp")
+    offered = await create_product(sender, sender_headers, title="Rug")
+    await client.post("/offers/", headers=sender_headers, json={
+        "product_id": wanted, "from_user_id": sender, "to_user_id": recipient, "offered_product_id": offered})
+
+    inbox = (await client.get(f"/offers/inbox/{recipient}", headers=recipient_headers)).json()
+    outbox = await client.get(f"/offers/outbox/{sender}", headers=sender_headers)
+
+    (item,) = inbox["items"]
+    assert (item["product"]["title"], item["offered_product"]["title"]) == ("Lamp", "Rug")
+    assert "description" not in item["product"]
+    assert inbox["counts"] == {"pending": 1}
+    assert [offer["id"] for offer in outbox.json()["items"]] == [item["id"]]
+    assert (await client.get(f"/offers/inbox/{recipient}", headers=sender_headers)).status_code == 403
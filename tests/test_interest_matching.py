@@ -0,0 +1,64 @@
+# tests/test_interest_matching.py
+
+from src.core.interest_matching import WORD_BITS, InterestMatcher
+
+
+def two_traders() -> InterestMatcher:
+    """Alice wants books and owns a bicycle; Bob wants bicycles and owns a book."""
+    matcher = InterestMatcher()
+    matcher.set_user_interests("alice", ["books"])
+    matcher.set_user_interests("bob", ["bicycles"])
+    matcher.set_product("bike", "alice", ["bicycles"])
+    matcher.set_product("novel", "bob", ["books", "fiction"])
+    return matcher
+
+
+def test_matches_are_mutual():
+    matcher = two_traders()
+
+    assert matcher.matches("alice") == [("novel", 2)]
+    assert matcher.matches("bob") == [("bike", 2)]
+
+
+def test_no_match_when_the_owner_wants_nothing_the_user_owns():
+    matcher = two_traders()
+    matcher.set_user_interests("bob", ["cameras"])
+
+    assert matcher.matches("alice") == []
+
+
+def test_own_products_are_never_matched():
+    matcher = two_traders()
+    matcher.set_product("atlas", "alice", ["books"])
+
+    assert [product for product, _ in matcher.matches("alice")] == ["novel"]
+
+
+def test_score_counts_both_sides_and_orders_best_first():
+    matcher = two_traders()
+    matcher.set_user_interests("alice", ["books", "fiction"])
+    matcher.set_product("manual", "bob", ["books"])
+
+    assert matcher.matches("alice") == [("novel", 3), ("manual", 2)]
+    assert matcher.matches("alice", k=1) == [("novel", 3)]
+
+
+def test_removed_product_no_longer_matches_or_counts_as_owned():
+    matcher = two_traders()
+
+    matcher.remove_product("bike")
+    matcher.remove_product("unknown")
+
+    assert matcher.matches("alice") == []
+    assert matcher.matches("bob") == []
+
+
+def test_tags_are_case_insensitive_and_grow_past_one_word():
+    matcher = two_traders()
+    filler = [f"tag-{index}" for index in range(WORD_BITS * 2)]
+    matcher.set_user_interests("carol", filler + ["BOOKS"])
+    matcher.set_product("lamp", "carol", ["Bicycles", filler[-1]])
+
+    assert matcher.words == 3
+    assert dict(matcher.matches("bob")) == {"bike": 2, "lamp": 2}
+    assert matcher.matches("unknown") == []
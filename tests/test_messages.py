@@ -0,0 +1,95 @@
+# tests/test_messages.py
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from src.core.entities.message import Conversation, Message
+
+pytestmark = pytest.mark.anyio
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+async def send(repository, conversation: Conversation, count: int) -> list[Message]:
+    sender = conversation.participants[0]
+    return [await repository.append_message(
+        Message(conversation_id=conversation.id, sender_id=sender, body=f"Message {n}",
+                sent_at=START + timedelta(seconds=n)), conversation.participants) for n in range(count)]
+
+
+async def test_conversation_is_shared_whatever_the_participant_order(message_repository):
+    first, second = uuid4(), uuid4()
+
+    created = await message_repository.get_or_create_conversation(Conversation(participants=[first, second]))
+    found = await message_repository.get_or_create_conversation(Conversation(participants=[second, first]))
+
+    assert found.id == created.id
+    assert [conversation.id for conversation in await message_repository.get_conversations_for_user(second)] \
+        == [created.id]
+
+
+async def test_history_pages_newest_first_across_buckets(message_repository):
+    conversation = await message_repository.get_or_create_conversation(Conversation(participants=[uuid4(), uuid4()]))
+    sent = await send(message_repository, conversation, 5)
+
+    pages, before = [], None
+    while page := await message_repository.get_messages(conversation.id, before, limit=2):
+        pages.append([message.body for message in page])
+        before = (page[-1].sent_at.timestamp(), page[-1].id)
+
+    assert pages == [["Message 4", "Message 3"], ["Message 2", "Message 1"], ["Message 0"]]
+    assert [message.id for message in await message_repository.get_messages(conversation.id, limit=10)] \
+        == [message.id for message in reversed(sent)]
+
+
+async def test_unread_counters_and_preview(message_repository):
+    sender, reader = uuid4(), uuid4()
+    conversation = await message_repository.get_or_create_conversation(Conversation(participants=[sender, reader]))
+    await send(message_repository, conversation, 3)
+
+    stored = await message_repository.get_conversation_by_id(conversation.id)
+    assert stored.unread.get(str(reader)) == 3
+    assert not stored.unread.get(str(sender))
+    assert stored.last_message_preview == "Message 2"
+
+    read = await message_repository.mark_read(conversation.id, reader)
+    assert read.unread[str(reader)] == 0
+    assert await message_repository.mark_read(conversation.id, uuid4()) is None
+
+
+async def test_buckets_hold_at_most_bucket_size_messages(message_repository):
+    if not hasattr(message_repository, "buckets"):
+        pytest.skip("SQLite stores one row per message")
+    conversation = await message_repository.get_or_create_conversation(Conversation(participants=[uuid4(), uuid4()]))
+    await send(message_repository, conversation, 5)
+
+    counts = [bucket["count"] async for bucket in message_repository.buckets.find({"conversation_id": conversation.id})]
+
+    assert sorted(counts) == [1, 2, 2]
+
+
+async def test_a_sender_that_loses_the_race_for_a_new_bucket_appends_to_it(message_repository):
+    if not hasattr(message_repository, "buckets"):
+        pytest.skip("SQLite stores one row per message")
+    conversation = await message_repository.get_or_create_conversation(Conversation(participants=[uuid4(), uuid4()]))
+    await send(message_repository, conversation, 2)
+    buckets = message_repository.buckets
+    find_one = buckets.find_one
+
+    async def find_latest_then_lose_the_race(*args, **kwargs):
+        latest = await find_one(*args, **kwargs)
+        await buckets.insert_one({"conversation_id": conversation.id, "seq": latest["seq"] + 1, "count": 1,
+                                  "messages": [], "first_at": START, "last_at": START})
+        return latest
+
+    buckets.find_one = find_latest_then_lose_the_race
+    try:
+        await send(message_repository, conversation, 1)
+    finally:
+        buckets.find_one = find_one
+
+    stored = [(bucket["seq"], bucket["count"])
+              async for bucket in buckets.find({"conversation_id": conversation.id}).sort("seq")]
+    assert stored == [(0, 2), (1, 2)]
@@ -0,0 +1,70 @@
+# tests/test_metrics.py
+
+from dataclasses import dataclass
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from prometheus_client.parser import text_string_to_metric_families
+
+from src.infrastructure.metrics import MongoCommandListener, StatsCollector, UNMATCHED_ROUTE, \
+    mongodb_command_duration, mongodb_command_failures
+
+pytestmark = pytest.mark.anyio
+
+
+async def scrape(client) -> dict[tuple[str, frozenset], float]:
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    return {(sample.name, frozenset(sample.labels.items())): sample.value
+            for family in text_string_to_metric_families(response.text) for sample in family.samples}
+
+
+def response_count(samples: dict, method: str, route: str, status: int) -> float:
+    labels = frozenset({"method": method, "route": route, "status": str(status)}.items())
+    return samples.get(("http_responses_total", labels), 0)
+
+
+async def test_requests_are_recorded_by_route_template(client, register):
+    _, headers = await register()
+    before = await scrape(client)
+
+    for _ in range(2):
+        await client.get(f"/products/{uuid4()}", headers=headers)
+    await client.get(f"/no/such/path/{uuid4()}")
+    after = await scrape(client)
+
+    assert response_count(after, "GET", "/products/{product_id}", 404) \
+        - response_count(before, "GET", "/products/{product_id}", 404) == 2
+    assert response_count(after, "GET", UNMATCHED_ROUTE, 404) - response_count(before, "GET", UNMATCHED_ROUTE, 404) \
+        == 1
+    assert not any("/no/such/path" in dict(labels).get("route", "") for _, labels in after)
+    # The scrape itself is the only GET in flight.
+    assert after[("http_requests_in_progress", frozenset({"method": "GET"}.items()))] == 1
+
+
+def test_mongo_commands_are_timed_by_collection():
+    listener = MongoCommandListener()
+    event = SimpleNamespace(request_id=uuid4(), connection_id=("localhost", 27017), command_name="find",
+                            command={"find": "products"}, duration_micros=1500)
+    labels = ("products", "find")
+    before = dict(mongodb_command_failures._values).get(labels, 0)
+
+    listener.started(event)
+    listener.failed(event)
+
+    assert mongodb_command_failures._values[labels] == before + 1
+    assert labels in mongodb_command_duration._series
+    assert listener._collections == {}
+
+
+def test_stats_collector_exports_numeric_fields():
+    @dataclass
+    class Stats:
+        runs: int = 3
+        last_error: str = "none"
+
+    (family,) = StatsCollector("sweeper", {"offers": Stats}, label="kind").collect()
+
+    assert family.name == "sweeper_runs"
+    assert [(sample.labels, sample.value) for sample in family.samples] == [({"kind": "offers"}, 3)]
@@ -0,0 +1,106 @@
+# tests/test_offer_events.py
+
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.core.entities.offer import OfferRecord
+from src.features.offers.offer_service import stream_offer_events
+from src.infrastructure.events import EventBus, OFFER_CHANGED, event_bus
+from src.infrastructure.notifications import HEARTBEAT, OVERFLOW, InProcessOfferSource, NotificationHub, \
+    offer_notifications
+
+pytestmark = pytest.mark.anyio
+
+
+def offer_between(from_user_id: UUID, to_user_id: UUID) -> OfferRecord:
+    return OfferRecord(id=uuid4(), product_id=uuid4(), from_user_id=from_user_id, to_user_id=to_user_id,
+                       offered_product_id=uuid4())
+
+
+async def received(subscription) -> list:
+    """Waits for the event bus to deliver what is queued, then takes everything the subscription holds."""
+    await event_bus.drain()
+    items = list(subscription.items)
+    subscription.items.clear()
+    return items
+
+
+async def test_update_and_delete_notify_both_parties(client, register, create_product):
+    (sender, sender_headers), (recipient, recipient_headers) = await register(), await register()
+    body = {"product_id": await create_product(recipient, recipient_headers), "from_user_id": sender,
+            "to_user_id": recipient, "offered_product_id": await create_product(sender, sender_headers)}
+    offer = (await client.post("/offers/", headers=sender_headers, json=body)).json()
+    await event_bus.drain()
+    sender_stream = offer_notifications.subscribe(UUID(sender))
+    recipient_stream = offer_notifications.subscribe(UUID(recipient))
+    try:
+        await client.put("/offers/", headers=sender_headers, json={**body, "id": offer["id"]})
+        updated = await received(sender_stream)
+        assert [str(item.id) for item in await received(recipient_stream)] == [offer["id"]]
+
+        await client.delete(f"/offers/{offer['id']}", headers=sender_headers)
+        deleted = await received(recipient_stream)
+        assert [str(item.id) for item in await received(sender_stream)] == [offer["id"]]
+    finally:
+        offer_notifications.unsubscribe(sender_stream)
+        offer_notifications.unsubscribe(recipient_stream)
+
+    assert [item.version for item in updated] == [offer["version"] + 1]
+    assert [str(item.id) for item in deleted] == [offer["id"]]
+
+
+async def test_in_process_source_unsubscribes_when_stopped():
+    bus = EventBus()
+    hub = NotificationHub()
+
+    await hub.start(InProcessOfferSource(bus))
+    assert len(bus._handlers[OFFER_CHANGED]) == 1
+    await hub.stop()
+    await hub.start(InProcessOfferSource(bus))
+    await hub.stop()
+
+    assert bus._handlers[OFFER_CHANGED] == []
+
+
+def test_a_full_buffer_is_replaced_by_one_overflow_marker():
+    hub = NotificationHub(queue_size=2)
+    sender, recipient = uuid4(), uuid4()
+    slow, other = hub.subscribe(recipient), hub.subscribe(sender)
+
+    for _ in range(3):
+        hub.publish(offer_between(sender, recipient))
+
+    assert list(slow.items) == [OVERFLOW]
+    assert list(other.items) == [OVERFLOW]
+    hub.publish(offer_between(sender, recipient))
+    assert len(slow.items) == 2
+
+
+async def test_heartbeat_wakes_only_idle_connections():
+    hub = NotificationHub()
+    idle, busy = hub.subscribe(uuid4()), hub.subscribe(uuid4())
+    busy.offer("pending")
+
+    assert await hub.heartbeat_sweep() == 1
+    assert list(idle.items) == [HEARTBEAT]
+    assert list(busy.items) == ["pending"]
+
+
+async def test_event_stream_encodes_items_and_unsubscribes_when_closed():
+    user_id = uuid4()
+    events = stream_offer_events(user_id)
+    assert await events.__anext__() == b"retry: 5000\n\n"
+    (subscription,) = offer_notifications._subscriptions[user_id]
+
+    offer = offer_between(user_id, uuid4())
+    for item in (HEARTBEAT, OVERFLOW, offer):
+        subscription.offer(item)
+    heartbeat, overflow, change = [await events.__anext__() for _ in range(3)]
+    await events.aclose()
+
+    assert heartbeat == b": heartbeat\n\n"
+    assert overflow == b"event: overflow\ndata: {}\n\n"
+    assert change.startswith(b"event: offer\ndata: {") and str(offer.id).encode() in change
+    assert user_id not in offer_notifications._subscriptions
@@ -0,0 +1,46 @@
+# tests/test_offer_expiry.py
+
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.core.entities.offer import OfferRecord
+from src.features.offers.offer_expiry import OfferExpirySweeper
+from src.infrastructure.container import repositories
+from src.infrastructure.mappers import bson_now
+
+pytestmark = pytest.mark.anyio
+
+
+def offer_expiring_at(expires_at) -> OfferRecord:
+    return OfferRecord(product_id=uuid4(), from_user_id=uuid4(), to_user_id=uuid4(), offered_product_id=uuid4(),
+                       expires_at=expires_at)
+
+
+async def test_expiry_closes_overdue_pending_offers_in_batches(offer_repository):
+    now = bson_now()
+    overdue = [await offer_repository.create_offer(offer_expiring_at(now - timedelta(minutes=n))) for n in range(3)]
+    accepted = await offer_repository.create_offer(offer_expiring_at(now - timedelta(minutes=5)))
+    await offer_repository.update_offer_status(accepted.id, "accepted")
+    current = await offer_repository.create_offer(offer_expiring_at(now + timedelta(minutes=5)))
+
+    first = await offer_repository.expire_pending_offers(now, 2)
+    second = await offer_repository.expire_pending_offers(now, 2)
+
+    assert sorted(offer.id for offer in first + second) == sorted(offer.id for offer in overdue)
+    assert (len(first), len(second)) == (2, 1)
+    assert all((offer.status, offer.closed_at, offer.version) == ("expired", now, 2) for offer in first + second)
+    assert (await offer_repository.get_offer_by_id(accepted.id)).status == "accepted"
+    assert (await offer_repository.get_offer_by_id(current.id)).status == "pending"
+    assert await offer_repository.expire_pending_offers(now, 2) == []
+
+
+async def test_sweeper_expires_every_batch_and_counts_them(client):
+    overdue = [await repositories.offers.create_offer(offer_expiring_at(bson_now() - timedelta(minutes=1)))
+               for _ in range(3)]
+    sweeper = OfferExpirySweeper(batch_size=2)
+
+    assert await sweeper.sweep() == 3
+    assert (sweeper.stats.sweeps, sweeper.stats.batches, sweeper.stats.offers_expired) == (1, 2, 3)
+    assert {(await repositories.offers.get_offer_by_id(offer.id)).status for offer in overdue} == {"expired"}
@@ -0,0 +1,114 @@
+# tests/test_offer_repositories.py
+
+from uuid import uuid4
+
+import pytest
+
+from src.core.entities.offer import OFFER_STATUS_ACCEPTED, OFFER_STATUS_PENDING, OFFER_STATUS_REJECTED, OfferRecord
+from src.core.repositories import NotFoundError
+from src.core.tokens import PermissionDeniedError
+from src.core.versioning import VersionConflictError
+
+pytestmark = pytest.mark.anyio
+
+
+async def make_offer(repository, product_id, from_user_id, to_user_id, offered_product_id) -> OfferRecord:
+    return await repository.create_offer(OfferRecord(product_id=product_id, from_user_id=from_user_id,
+                                                     to_user_id=to_user_id, offered_product_id=offered_product_id))
+
+
+async def test_accept_rejects_the_pending_offers_competing_for_either_product(offer_repository):
+    alice, bob, carol = uuid4(), uuid4(), uuid4()
+    lamp, bike, camera, unrelated = uuid4(), uuid4(), uuid4(), uuid4()
+    accepted = await make_offer(offer_repository, lamp, bob, alice, bike)
+    for_the_lamp = await make_offer(offer_repository, lamp, carol, alice, camera)
+    for_the_bike = await make_offer(offer_repository, camera, bob, carol, bike)
+    untouched = await make_offer(offer_repository, unrelated, carol, bob, camera)
+
+    offer, rejected = await offer_repository.update_offer_status(accepted.id, OFFER_STATUS_ACCEPTED, alice)
+
+    assert (offer.status, offer.version) == (OFFER_STATUS_ACCEPTED, accepted.version + 1)
+    assert offer.closed_at is not None
+    assert sorted(str(record.id) for record in rejected) == sorted([str(for_the_lamp.id), str(for_the_bike.id)])
+    for record in rejected:
+        assert (record.status, record.version) == (OFFER_STATUS_REJECTED, 2)
+        assert record == await offer_repository.get_offer_by_id(record.id)
+    assert (await offer_repository.get_offer_by_id(untouched.id)).status == OFFER_STATUS_PENDING
+
+
+async def test_reject_leaves_competing_offers_pending(offer_repository):
+    alice, bob, carol = uuid4(), uuid4(), uuid4()
+    lamp = uuid4()
+    offer = await make_offer(offer_repository, lamp, bob, alice, uuid4())
+    competing = await make_offer(offer_repository, lamp, carol, alice, uuid4())
+
+    rejected_offer, rejected = await offer_repository.update_offer_status(offer.id, OFFER_STATUS_REJECTED, alice)
+
+    assert rejected_offer.status == OFFER_STATUS_REJECTED
+    assert rejected == []
+    assert (await offer_repository.get_offer_by_id(competing.id)).status == OFFER_STATUS_PENDING
+
+
+async def test_offer_is_accepted_once_and_only_by_its_recipient(offer_repository):
+    alice, bob = uuid4(), uuid4()
+    offer = await make_offer(offer_repository, uuid4(), bob, alice, uuid4())
+
+    with pytest.raises(PermissionDeniedError):
+        await offer_repository.update_offer_status(offer.id, OFFER_STATUS_ACCEPTED, bob)
+    await offer_repository.update_offer_status(offer.id, OFFER_STATUS_ACCEPTED, alice)
+    with pytest.raises(ValueError):
+        await offer_repository.update_offer_status(offer.id, OFFER_STATUS_REJECTED, alice)
+    assert await offer_repository.update_offer_status(uuid4(), OFFER_STATUS_ACCEPTED, alice) is None
+
+
+async def test_update_with_a_stale_version_conflicts(offer_repository):
+    alice, bob = uuid4(), uuid4()
+    offer = await make_offer(offer_repository, uuid4(), bob, alice, uuid4())
+    offer.offered_product_id = uuid4()
+
+    updated = await offer_repository.update_offer(offer, [offer.version], bob)
+
+    assert updated.version == offer.version + 1
+    with pytest.raises(VersionConflictError):
+        await offer_repository.update_offer(offer, [offer.version], bob)
+
+
+async def test_update_keeps_the_status_and_only_applies_to_pending_offers(offer_repository):
+    alice, bob = uuid4(), uuid4()
+    offer = await make_offer(offer_repository, uuid4(), bob, alice, uuid4())
+    offer.status = OFFER_STATUS_ACCEPTED
+
+    updated = await offer_repository.update_offer(offer, None, bob)
+
+    assert updated.status == OFFER_STATUS_PENDING
+    assert updated.closed_at is None
+    await offer_repository.update_offer_status(offer.id, OFFER_STATUS_REJECTED, alice)
+    offer.status = OFFER_STATUS_PENDING
+    with pytest.raises(ValueError, match="rejected"):
+        await offer_repository.update_offer(offer, None, bob)
+    assert (await offer_repository.get_offer_by_id(offer.id)).status == OFFER_STATUS_REJECTED
+
+
+async def test_update_or_delete_of_a_missing_offer_is_not_found(offer_repository):
+    offer = OfferRecord(id=uuid4(), product_id=uuid4(), from_user_id=uuid4(), to_user_id=uuid4(),
+                        offered_product_id=uuid4())
+
+    with pytest.raises(NotFoundError):
+        await offer_repository.update_offer(offer, None, offer.from_user_id)
+    with pytest.raises(NotFoundError):
+        await offer_repository.delete_offer(offer.id, offer.from_user_id)
+
+
+async def test_reject_offers_for_products_closes_every_pending_offer_on_them(offer_repository):
+    alice, bob = uuid4(), uuid4()
+    traded, other = uuid4(), uuid4()
+    wanting = await make_offer(offer_repository, traded, bob, alice, uuid4())
+    offering = await make_offer(offer_repository, uuid4(), bob, alice, traded)
+    untouched = await make_offer(offer_repository, other, bob, alice, uuid4())
+
+    rejected = await offer_repository.reject_offers_for_products([traded])
+
+    assert sorted(str(offer.id) for offer in rejected) == sorted([str(wanting.id), str(offering.id)])
+    assert all(offer.status == OFFER_STATUS_REJECTED and offer.closed_at for offer in rejected)
+    assert (await offer_repository.get_offer_by_id(untouched.id)).status == OFFER_STATUS_PENDING
+    assert await offer_repository.reject_offers_for_products([traded]) == []
@@ -0,0 +1,82 @@
+# tests/test_offer_routes.py
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def offer(client, register, create_product):
+    """An offer from a sender to a recipient, and the headers of the sender, the recipient and a third user."""
+    (sender, sender_headers), (recipient, recipient_headers) = await register(), await register()
+    _, outsider_headers = await register()
+    response = await client.post("/offers/", headers=sender_headers, json={
+        "product_id": await create_product(recipient, recipient_headers), "from_user_id": sender,
+        "to_user_id": recipient, "offered_product_id": await create_product(sender, sender_headers)})
+    assert response.status_code == 200
+    return response.json(), sender_headers, recipient_headers, outsider_headers
+
+
+async def test_only_the_recipient_may_accept(client, offer):
+    offer, sender_headers, recipient_headers, outsider_headers = offer
+
+    assert (await client.patch(f"/offers/{offer['id']}/accept", headers=sender_headers)).status_code == 403
+    assert (await client.patch(f"/offers/{offer['id']}/accept", headers=outsider_headers)).status_code == 403
+    assert (await client.patch(f"/offers/{offer['id']}/accept", headers=recipient_headers)).status_code == 200
+
+
+async def test_put_cannot_change_the_status(client, offer):
+    offer, sender_headers, _, outsider_headers = offer
+    body = {key: offer[key] for key in ("id", "product_id", "from_user_id", "to_user_id", "offered_product_id")}
+
+    updated = await client.put("/offers/", headers=sender_headers, json={**body, "status": "accepted"})
+    by_outsider = await client.put("/offers/", headers=outsider_headers, json=body)
+
+    assert updated.status_code == 200
+    assert updated.json()["status"] == "pending"
+    assert by_outsider.status_code == 403
+    stored = (await client.get(f"/offers/{offer['id']}", headers=sender_headers)).json()
+    assert stored["status"] == "pending"
+
+
+async def test_conditional_get_authorizes_before_comparing_etags(client, offer):
+    offer, sender_headers, _, outsider_headers = offer
+    current = {"If-None-Match": f'"{offer["version"]}"'}
+
+    assert (await client.get(f"/offers/{offer['id']}", headers={**sender_headers, **current})).status_code == 304
+    assert (await client.get(f"/offers/{offer['id']}", headers={**outsider_headers, **current})).status_code == 403
+    assert (await client.get(f"/offers/{offer['id']}", headers=outsider_headers)).status_code == 403
+
+
+
+async def test_closed_offer_cannot_be_updated(client, offer):
+    offer, sender_headers, recipient_headers, _ = offer
+    body = {key: offer[key] for key in ("id", "product_id", "from_user_id", "to_user_id", "offered_product_id")}
+    await client.patch(f"/offers/{offer['id']}/reject", headers=recipient_headers)
+
+    assert (await client.put("/offers/", headers=sender_headers, json=body)).status_code == 409
+
+
+async def test_missing_offer_is_not_found(client, offer):
+    offer, sender_headers, _, _ = offer
+    missing = "00000000-0000-4000-8000-000000000000"
+    body = {**{key: offer[key] for key in ("product_id", "from_user_id", "to_user_id", "offered_product_id")},
+            "id": missing}
+
+    assert (await client.put("/offers/", headers=sender_headers, json=body)).status_code == 404
+    assert (await client.delete(f"/offers/{missing}", headers=sender_headers)).status_code == 404
+
+
+async def test_offer_must_name_products_its_users_own(client, register, create_product):
+    (sender, sender_headers), (recipient, recipient_headers) = await register(), await register()
+    owned_by_recipient = await create_product(recipient, recipient_headers)
+    owned_by_sender = await create_product(sender, sender_headers)
+    body = {"from_user_id": sender, "to_user_id": recipient}
+
+    swapped = await client.post("/offers/", headers=sender_headers, json={
+        **body, "product_id": owned_by_sender, "offered_product_id": owned_by_recipient})
+    not_offered_by_sender = await client.post("/offers/", headers=sender_headers, json={
+        **body, "product_id": owned_by_recipient, "offered_product_id": owned_by_recipient})
+
+    assert swapped.status_code == 400
+    assert not_offered_by_sender.status_code == 400
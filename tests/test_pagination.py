@@ -0,0 +1,41 @@
+# tests/test_pagination.py
+
+from uuid import uuid4
+
+import pytest
+
+from src.core.pagination import decode_cursor, decode_offset_cursor, decode_score_cursor, encode_cursor, \
+    encode_offset_cursor, encode_score_cursor
+
+
+def test_cursor_round_trips_the_last_id():
+    last_id = uuid4()
+
+    cursor = encode_cursor(last_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == last_id
+
+
+def test_score_cursor_round_trips_the_score_and_last_id():
+    last_id = uuid4()
+
+    assert decode_score_cursor(encode_score_cursor(2.5, last_id)) == (2.5, last_id)
+
+
+def test_offset_cursor_round_trips_the_offset():
+    assert decode_offset_cursor(encode_offset_cursor(1234)) == 1234
+
+
+@pytest.mark.parametrize("decode, first_page", [(decode_cursor, None), (decode_score_cursor, None),
+                                                (decode_offset_cursor, 0)])
+def test_missing_cursor_means_the_first_page(decode, first_page):
+    assert decode(None) == first_page
+    assert decode("") == first_page
+
+
+@pytest.mark.parametrize("decode", [decode_cursor, decode_score_cursor, decode_offset_cursor])
+@pytest.mark.parametrize("cursor", ["!!!", "abc", encode_cursor(uuid4())[:-4]])
+def test_malformed_cursor_is_refused(decode, cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode(cursor)
@@ -0,0 +1,61 @@
+# tests/test_passwords.py
+
+from uuid import uuid4
+
+import pytest
+
+from src.core.entities.user import UserRecord
+from src.core.passwords import hash_password, needs_rehash, verify_password
+from src.infrastructure.container import repositories
+
+# Far below the production cost, to keep the tests fast.
+N, R, P = 2 ** 10, 8, 1
+
+
+def test_hash_verifies_only_the_same_password():
+    hashed = hash_password("correct horse", N, R, P)
+
+    assert verify_password("correct horse", hashed)
+    assert not verify_password("correct horse!", hashed)
+
+
+def test_hash_carries_its_cost_parameters_and_a_random_salt():
+    hashed = hash_password("correct horse", N, R, P)
+
+    assert hashed.split("$")[:4] == ["scrypt", str(N), str(R), str(P)]
+    assert hashed != hash_password("correct horse", N, R, P)
+    assert verify_password("correct horse", hash_password("correct horse", N * 2, R, P))
+
+
+@pytest.mark.parametrize("hashed", ["", "plain-text", "bcrypt$10$8$1$c2FsdA$a2V5", "scrypt$x$8$1$c2FsdA$a2V5",
+                                    "scrypt$1024$8$1$!!$a2V5"])
+def test_malformed_hash_does_not_verify(hashed):
+    assert not verify_password("correct horse", hashed)
+
+
+def test_legacy_hash_is_the_credential_itself():
+    assert verify_password("client-side-digest", "client-side-digest")
+    assert not verify_password("client-side-digest!", "client-side-digest")
+    assert not verify_password("", "")
+
+
+def test_legacy_hashes_and_other_costs_need_a_rehash():
+    hashed = hash_password("correct horse", N, R, P)
+
+    assert not needs_rehash(hashed, N, R, P)
+    assert needs_rehash(hashed, N * 2, R, P)
+    assert needs_rehash("client-side-digest", N, R, P)
+
+
+@pytest.mark.anyio
+async def test_login_replaces_a_legacy_hash(client):
+    email = f"{uuid4().hex[:12]}@example.com"
+    user = await repositories.users.create_user(UserRecord(username="legacy", email=email,
+                                                           hashed_password="client-side-digest"))
+
+    response = await client.post("/auth/login", json={"email": email, "password": "client-side-digest"})
+
+    assert response.status_code == 200
+    assert (await repositories.users.get_user_by_id(user.id)).hashed_password.startswith("scrypt$")
+    assert (await client.post("/auth/login", json={"email": email, "password": "client-side-digest"})) \
+        .status_code == 200
@@ -0,0 +1,74 @@
+# tests/test_product_search.py
+
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.core.entities.product import ProductRecord
+from src.infrastructure.indexes import INDEXES
+from src.infrastructure.search.in_memory_product_search import FIELD_WEIGHTS, InMemoryProductSearch
+
+pytestmark = pytest.mark.anyio
+
+
+def product(title: str, description: str = "", interests: tuple = (), product_id: UUID = None) -> ProductRecord:
+    return ProductRecord(id=product_id or uuid4(), owner_id=uuid4(), title=title, description=description,
+                         interests=list(interests))
+
+
+def test_field_weights_match_the_mongo_text_index():
+    (text_index,) = [index.document for index in INDEXES["products"] if index.document["name"] == "product_text"]
+
+    assert FIELD_WEIGHTS == text_index["weights"]
+
+
+async def test_title_outranks_interests_and_interests_outrank_description():
+    search = InMemoryProductSearch()
+    in_description = product("Chair", "Goes well with a lamp")
+    in_interests = product("Table", interests=["lamp"])
+    in_title = product("Lamp")
+    await search.index_products([in_description, in_interests, in_title, product("Rug")])
+
+    results = await search.search("LAMP")
+
+    assert [result.id for result in results] == [in_title.id, in_interests.id, in_description.id]
+    assert results[0].score > results[1].score > results[2].score
+
+
+async def test_interest_filter_and_reindexing():
+    search = InMemoryProductSearch()
+    lamp = product("Lamp", interests=["lighting"])
+    await search.index_products([lamp, product("Lamp", interests=["decor"])])
+
+    assert [result.id for result in await search.search("lamp", interest="lighting")] == [lamp.id]
+
+    lamp.title = "Desk"
+    await search.index_product(lamp)
+    assert await search.search("lamp", interest="lighting") == []
+    await search.remove_product(lamp.id)
+    assert len(search) == 1
+
+
+async def test_pages_follow_score_then_id_like_the_mongo_sort():
+    search = InMemoryProductSearch()
+    # Ties are broken by ascending ID bytes, the order MongoDB sorts UUIDs in.
+    tied = [product("Lamp", product_id=UUID(int=n)) for n in (3, 1, 2)]
+    await search.index_products([product("Lamp lamp"), *tied])
+
+    first = await search.search("lamp", limit=2)
+    second = await search.search("lamp", after=(first[-1].score, first[-1].id), limit=2)
+
+    assert [result.id for result in first + second][1:] == [UUID(int=1), UUID(int=2), UUID(int=3)]
+
+
+async def test_search_endpoint_pages_with_a_cursor(client, register, create_product):
+    owner_id, headers = await register()
+    word = uuid4().hex
+    created = {await create_product(owner_id, headers, title=f"{word} {n}") for n in range(3)}
+
+    first = await client.get("/products/search", params={"q": word, "limit": 2})
+    second = await client.get("/products/search", params={"q": word, "limit": 2,
+                                                          "cursor": first.headers["X-Next-Cursor"]})
+
+    assert {result["id"] for result in first.json() + second.json()} == created
+    assert "X-Next-Cursor" not in second.headers
@@ -0,0 +1,62 @@
+# tests/test_profile_routes.py
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_patch_changes_only_the_fields_sent(client, register):
+    user_id, headers = await register()
+    before = (await client.patch(f"/profile/{user_id}", headers=headers,
+                                 json={"profile_picture": "https://example.com/me.png", "interests": ["lamps"]})).json()
+
+    response = await client.patch(f"/profile/{user_id}", headers=headers, json={"username": "renamed", "email": None})
+
+    assert response.status_code == 200
+    after = response.json()
+    assert after["username"] == "renamed"
+    assert after["email"] == before["email"]
+    assert after["profile_picture"] == "https://example.com/me.png"
+    assert after["interests"] == ["lamps"]
+
+
+async def test_patch_adds_removes_and_clears(client, register):
+    user_id, headers = await register()
+    await client.patch(f"/profile/{user_id}", headers=headers, json={"interests": ["lamps", "chairs"]})
+
+    added = (await client.patch(f"/profile/{user_id}", headers=headers,
+                                json={"add_interests": ["lamps", "rugs"]})).json()
+    removed = (await client.patch(f"/profile/{user_id}", headers=headers,
+                                  json={"remove_interests": ["chairs"], "profile_picture": None})).json()
+
+    assert sorted(added["interests"]) == ["chairs", "lamps", "rugs"]
+    assert sorted(removed["interests"]) == ["lamps", "rugs"]
+    assert removed["profile_picture"] is None
+
+
+async def test_patch_refuses_conflicting_interest_changes(client, register):
+    user_id, headers = await register()
+
+    response = await client.patch(f"/profile/{user_id}", headers=headers,
+                                  json={"interests": ["lamps"], "add_interests": ["rugs"]})
+
+    assert response.status_code == 400
+
+
+async def test_patch_refuses_a_registered_email(client, register):
+    user_id, headers = await register()
+    other_id, other_headers = await register()
+    other_email = (await client.patch(f"/profile/{other_id}", headers=other_headers, json={})).json()["email"]
+
+    response = await client.patch(f"/profile/{user_id}", headers=headers, json={"email": other_email})
+
+    assert response.status_code == 400
+
+
+async def test_patch_is_limited_to_ones_own_profile(client, register):
+    user_id, _ = await register()
+    _, other_headers = await register()
+
+    response = await client.patch(f"/profile/{user_id}", headers=other_headers, json={"username": "taken-over"})
+
+    assert response.status_code == 403
@@ -0,0 +1,112 @@
+# tests/test_storage_parity.py
+"""The same behaviour from the MongoDB and SQLite repositories, beyond offers and messages (see their own tests)."""
+
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.core.entities.feed import FeedItem
+from src.core.entities.product import ProductRecord
+from src.core.entities.trade import TradeCycle, TradeLeg
+from src.core.entities.user import UserRecord
+from src.core.repositories import NotFoundError
+from src.core.tokens import PermissionDeniedError
+from src.core.versioning import VersionConflictError
+from src.infrastructure.mappers import bson_now
+
+pytestmark = pytest.mark.anyio
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def user(interests: list[str] = ()) -> UserRecord:
+    name = uuid4().hex[:12]
+    return UserRecord(username=name, email=f"{name}@example.com", hashed_password="hash", interests=list(interests))
+
+
+def trade_between(participants: list[UUID]) -> TradeCycle:
+    products = [uuid4() for _ in participants]
+    legs = [TradeLeg(from_user_id=giver, to_user_id=participants[(n + 1) % len(participants)], product_id=product)
+            for n, (giver, product) in enumerate(zip(participants, products))]
+    return TradeCycle(key="-".join(str(participant) for participant in participants), legs=legs,
+                      participants=participants, product_ids=products)
+
+
+async def test_users(storage):
+    created = await storage.users.create_user(user(["lamps"]))
+    await storage.users.create_user(user(["rugs"]))
+
+    assert (await storage.users.get_user_by_email(created.email)).id == created.id
+    with pytest.raises(ValueError):
+        await storage.users.create_user(UserRecord(username="copy", email=created.email, hashed_password="hash"))
+    patched = await storage.users.patch_user(created.id, {"username": "renamed"}, add_interests=["chairs"])
+    assert (patched.username, sorted(patched.interests)) == ("renamed", ["chairs", "lamps"])
+    assert [user_id async for user_id, _ in storage.users.iter_users_with_interests(["chairs"])] == [created.id]
+    assert await storage.users.patch_user(uuid4(), {"username": "nobody"}) is None
+
+
+async def test_products(storage):
+    owner = uuid4()
+    products = [await storage.products.create_product(ProductRecord(owner_id=owner, title=title, description="Old"))
+                for title in ("Lamp", "Rug", "Chair")]
+    lamp = products[0]
+
+    assert {product.id for product in await storage.products.get_products_by_ids([lamp.id, uuid4()])} == {lamp.id}
+    lamp.title = "Desk lamp"
+    updated = await storage.products.update_product(lamp, expected_versions=[1], owner_id=owner)
+    assert (updated.title, updated.version) == ("Desk lamp", 2)
+    with pytest.raises(VersionConflictError):
+        await storage.products.update_product(lamp, expected_versions=[1])
+    with pytest.raises(PermissionDeniedError):
+        await storage.products.delete_product(lamp.id, owner_id=uuid4())
+    with pytest.raises(NotFoundError):
+        await storage.products.delete_product(uuid4())
+
+    first = await storage.products.get_products_by_owner_id(owner, limit=2)
+    rest = await storage.products.get_products_by_owner_id(owner, after=first[-1].id, limit=2)
+    assert [product.id for product in first + rest] == sorted(product.id for product in products)
+
+
+async def test_feeds(storage):
+    reader, other_reader = uuid4(), uuid4()
+    items = [FeedItem(product_id=uuid4(), owner_id=uuid4(), title=f"Product {n}", score=score,
+                      added_at=START + timedelta(seconds=n)) for n, score in enumerate((1, 2, 1))]
+    await storage.feeds.push_items([(reader, item) for item in items] + [(other_reader, items[1])])
+
+    feed = [item.title for item in await storage.feeds.get_feed(reader)]
+    assert sorted(feed) == ["Product 0", "Product 1", "Product 2"]
+    if storage.backend != "motor":  # The stand-in ignores all but one key of a compound $push $sort
+        assert feed == ["Product 1", "Product 2", "Product 0"]
+        assert [item.title for item in await storage.feeds.get_feed(reader, offset=1, limit=1)] == ["Product 2"]
+    assert await storage.feeds.pull_product(items[1].product_id) == 2
+    assert await storage.feeds.get_feed(other_reader) == []
+
+
+async def test_trades(storage):
+    participants = [uuid4(), uuid4(), uuid4()]
+    trade = trade_between(participants)
+    competing = trade_between([participants[0], uuid4()])
+    competing.product_ids[0] = trade.product_ids[0]
+
+    assert len(await storage.trades.create_trades([trade, competing])) == 2
+    assert await storage.trades.create_trades([trade_between(participants)]) == []  # Already proposed
+    with pytest.raises(ValueError):
+        await storage.trades.accept_trade(trade.id, uuid4())
+    for participant in participants:
+        accepted = await storage.trades.accept_trade(trade.id, participant)
+    assert accepted.status == "accepted"
+    assert await storage.trades.cancel_trades_with_products(trade.product_ids, except_id=trade.id) == 1
+    assert (await storage.trades.get_trade_by_id(competing.id)).status == "cancelled"
+    assert [found.id for found in await storage.trades.get_trades_for_user(participants[0], status="accepted")] \
+        == [trade.id]
+    assert await storage.trades.accept_trade(uuid4(), participants[0]) is None
+
+
+async def test_revoked_tokens(storage):
+    now = bson_now()  # Not a fixed date: the stand-in's TTL index removes documents by the wall clock
+    await storage.revoked_tokens.revoke_token("expired", now - timedelta(minutes=1))
+    await storage.revoked_tokens.revoke_token("live", now + timedelta(minutes=1))
+    await storage.revoked_tokens.revoke_token("live", now + timedelta(minutes=1))
+
+    assert await storage.revoked_tokens.get_revoked_token_ids(now) == ["live"]
@@ -0,0 +1,108 @@
+# tests/test_tokens.py
+
+from uuid import uuid4
+
+import pytest
+
+from src.core.tokens import InvalidTokenError, issue_token, verify_token
+from src.infrastructure.tokens import TokenVerifier
+
+SECRET = b"test-secret"
+
+
+class Clock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_issued_token_verifies_to_its_claims():
+    user_id = uuid4()
+
+    token, claims = issue_token(SECRET, user_id, ["offers", "products"], expires_at=2000)
+
+    assert verify_token(SECRET, token, now=1000) == claims
+    assert claims.user_id == user_id
+    assert claims.scopes == {"offers", "products"}
+
+
+@pytest.mark.parametrize("tamper", [
+    lambda token: token[:-1] + ("B" if token.endswith("A") else "A"),
+    lambda token: "e30." + token.partition(".")[2],
+    lambda token: token.partition(".")[0],
+    lambda token: "",
+])
+def test_tampered_token_is_refused(tamper):
+    token, _ = issue_token(SECRET, uuid4(), ["offers"], expires_at=2000)
+
+    with pytest.raises(InvalidTokenError, match="Invalid token"):
+        verify_token(SECRET, tamper(token), now=1000)
+
+
+def test_token_signed_with_another_secret_is_refused():
+    token, _ = issue_token(b"other-secret", uuid4(), ["offers"], expires_at=2000)
+
+    with pytest.raises(InvalidTokenError, match="Invalid token"):
+        verify_token(SECRET, token, now=1000)
+
+
+def test_expired_token_is_refused():
+    token, _ = issue_token(SECRET, uuid4(), ["offers"], expires_at=2000)
+
+    with pytest.raises(InvalidTokenError, match="expired"):
+        verify_token(SECRET, token, now=2000)
+
+
+def test_verifier_checks_expiry_on_cached_tokens():
+    clock = Clock()
+    verifier = TokenVerifier(secret="test-secret", ttl=60, scopes=["offers"], clock=clock)
+    token, claims = verifier.issue(uuid4())
+
+    assert verifier.verify(token) == claims
+    clock.now += 60
+    with pytest.raises(InvalidTokenError, match="expired"):
+        verifier.verify(token)
+
+
+def test_verifier_refuses_revoked_tokens():
+    verifier = TokenVerifier(secret="test-secret", scopes=["offers"])
+    token, claims = verifier.issue(uuid4())
+    other, _ = verifier.issue(uuid4())
+
+    verifier.revoke(claims.token_id)
+
+    with pytest.raises(InvalidTokenError, match="revoked"):
+        verifier.verify(token)
+    verifier.verify(other)
+
+
+@pytest.mark.anyio
+async def test_refresh_replaces_the_revocation_list_but_keeps_recent_revocations():
+    verifier = TokenVerifier(secret="test-secret", scopes=["offers"])
+    stored, _ = verifier.issue(uuid4())
+    stored_claims = verifier.verify(stored)
+    verifier.revoke("stale")
+    await verifier.refresh(lambda: _revoked([stored_claims.token_id]))
+
+    verifier.revoke("recent")
+    await verifier.refresh(lambda: _revoked([stored_claims.token_id]))
+
+    assert verifier.revoked_count == 2
+    with pytest.raises(InvalidTokenError, match="revoked"):
+        verifier.verify(stored)
+
+
+async def _revoked(token_ids: list[str]) -> list[str]:
+    return token_ids
+
+
+@pytest.mark.anyio
+async def test_verifier_without_secret_refuses_to_start():
+    verifier = TokenVerifier(secret="", allow_random_secret=False)
+
+    with pytest.raises(RuntimeError, match="BARTER_TOKEN_SECRET"):
+        await verifier.start(lambda: _revoked([]))
+    with pytest.raises(RuntimeError, match="BARTER_TOKEN_SECRET"):
+        verifier.issue(uuid4())
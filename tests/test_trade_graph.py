@@ -0,0 +1,65 @@
+# tests/test_trade_graph.py
+
+import pytest
+
+from src.core.trade_graph import TradeGraph
+
+
+def ring(graph: TradeGraph, size: int) -> tuple[str, str]:
+    """Adds a ring of ``size`` users where each wants the next one's product; returns the last edge added."""
+    for index in range(size):
+        wanter, owner = f"u{index}", f"u{(index + 1) % size}"
+        graph.add_want(wanter, owner, f"p{(index + 1) % size}")
+    return f"u{size - 1}", "u0"
+
+
+@pytest.mark.parametrize("size, found", [(2, False), (3, True), (4, True), (5, True), (6, False)])
+def test_cycles_through_finds_cycles_between_min_and_max_length(size, found):
+    graph = TradeGraph()
+    wanter, owner = ring(graph, size)
+
+    cycles = list(graph.cycles_through(wanter, owner, min_length=3, max_length=5))
+
+    assert cycles == ([[wanter, owner] + [f"u{index}" for index in range(1, size - 1)]] if found else [])
+
+
+def test_cycles_through_with_equal_min_and_max_length():
+    graph = TradeGraph()
+    wanter, owner = ring(graph, 3)
+
+    assert len(list(graph.cycles_through(wanter, owner, min_length=3, max_length=3))) == 1
+
+
+def test_cycle_legs_give_each_participant_a_wanted_product():
+    graph = TradeGraph()
+    wanter, owner = ring(graph, 3)
+    cycle = next(graph.cycles_through(wanter, owner))
+
+    legs = graph.legs(cycle)
+
+    assert [(leg.giver, leg.receiver, leg.product) for leg in legs] == [
+        ("u0", "u2", "p0"), ("u1", "u0", "p1"), ("u2", "u1", "p2")]
+
+
+def test_want_stays_until_every_offer_expressing_it_is_removed():
+    graph = TradeGraph()
+    graph.add_want("a", "b", "p")
+    graph.add_want("a", "b", "p")
+
+    assert graph.remove_want("a", "p") is False
+    assert graph.has_edge("a", "b")
+    assert graph.remove_want("a", "p") is True
+    assert not graph.has_edge("a", "b")
+    assert graph.edge_count == 0
+
+
+def test_remove_product_drops_every_count_of_its_wants():
+    graph = TradeGraph()
+    graph.add_want("a", "b", "p")
+    graph.add_want("a", "b", "p")
+    graph.add_want("c", "b", "p")
+
+    graph.remove_product("p")
+
+    assert graph.edge_count == 0
+    assert graph.remove_want("a", "p") is False
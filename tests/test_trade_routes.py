@@ -0,0 +1,34 @@
+# tests/test_trade_routes.py
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def make_offer(client, sender: tuple, recipient_id: str, product_id: str, offered_product_id: str) -> dict:
+    sender_id, headers = sender
+    response = await client.post("/offers/", headers=headers, json={
+        "product_id": product_id, "from_user_id": sender_id, "to_user_id": recipient_id,
+        "offered_product_id": offered_product_id})
+    assert response.status_code == 200
+    return response.json()
+
+
+async def test_completed_trade_rejects_the_pending_offers_on_its_products(client, register, create_product):
+    users = [await register() for _ in range(4)]
+    products = [await create_product(user_id, headers) for user_id, headers in users]
+    (a, _), (b, b_headers), (c, _), _ = users
+    # a wants b's product, b wants c's and c wants a's: a three-party cycle.
+    ring = [await make_offer(client, users[0], b, products[1], products[0]),
+            await make_offer(client, users[1], c, products[2], products[1]),
+            await make_offer(client, users[2], a, products[0], products[2])]
+    competing = await make_offer(client, users[3], b, products[1], products[3])
+
+    (trade,) = (await client.get(f"/trades/user/{b}", headers=b_headers, params={"status": "proposed"})).json()
+    for user_id, headers in users[:3]:
+        response = await client.patch(f"/trades/{trade['id']}/accept", params={"user_id": user_id}, headers=headers)
+        assert response.status_code == 200
+    assert response.json()["status"] == "accepted"
+
+    for offer, (_, headers) in [*zip(ring, users), (competing, users[3])]:
+        assert (await client.get(f"/offers/{offer['id']}", headers=headers)).json()["status"] == "rejected"
@@ -0,0 +1,61 @@
+# tests/test_versioning.py
+
+from uuid import uuid4
+
+import pytest
+
+from src.core.versioning import etag, etag_matches, parse_etags
+
+
+def test_parse_etags_reads_strong_tags_and_skips_foreign_ones():
+    assert parse_etags('"3", "7", "abc", W/"9"', weak=False) == [3, 7]
+    assert parse_etags('"3", W/"9"', weak=True) == [3, 9]
+    assert parse_etags(" * ", weak=False) is None
+
+
+def test_etag_matches_the_current_version_or_any():
+    assert etag_matches(etag(4), 4)
+    assert etag_matches(f'"1", {etag(4)}', 4)
+    assert etag_matches("*", 4)
+    assert not etag_matches(etag(3), 4)
+
+
+async def create_product(client) -> tuple[dict, dict]:
+    name = f"user-{uuid4().hex[:12]}"
+    credentials = {"email": f"{name}@example.com", "password": "not-a-real-password"}
+    assert (await client.post("/auth/register", json={"username": name, **credentials})).status_code == 200
+    login = (await client.post("/auth/login", json=credentials)).json()
+    headers = {"Authorization": f"Bearer {login['access_token']}"}
+    response = await client.post("/products/", headers=headers, json={
+        "owner_id": login["user"]["id"], "title": "Bicycle", "description": "A well kept bicycle"})
+    assert response.status_code == 200
+    return response.json(), headers
+
+
+@pytest.mark.anyio
+async def test_get_with_current_etag_is_not_modified(client):
+    product, _ = await create_product(client)
+
+    response = await client.get(f"/products/{product['id']}")
+    revalidated = await client.get(f"/products/{product['id']}", headers={"If-None-Match": response.headers["ETag"]})
+    stale = await client.get(f"/products/{product['id']}", headers={"If-None-Match": etag(product["version"] + 1)})
+
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == response.headers["ETag"]
+    assert revalidated.content == b""
+    assert stale.status_code == 200
+
+
+@pytest.mark.anyio
+async def test_update_with_stale_if_match_fails_with_412(client):
+    product, headers = await create_product(client)
+    current = etag(product["version"])
+    body = {key: product[key] for key in ("id", "owner_id", "description")}
+
+    updated = await client.put("/products/", headers={**headers, "If-Match": current}, json={**body, "title": "Bike"})
+    stale = await client.put("/products/", headers={**headers, "If-Match": current}, json={**body, "title": "Cycle"})
+
+    assert updated.status_code == 200
+    assert updated.headers["ETag"] == etag(product["version"] + 1)
+    assert stale.status_code == 412
+    assert (await client.get(f"/products/{product['id']}")).json()["title"] == "Bike"
@@ -0,0 +1,34 @@
+# tests/test_workers.py
+
+import pytest
+
+import main
+
+
+def configure(monkeypatch, workers: int, search_backend: str, offer_event_source: str):
+    monkeypatch.setattr(main, "WORKERS", workers)
+    monkeypatch.setattr(main, "SEARCH_BACKEND", search_backend)
+    monkeypatch.setattr(main, "OFFER_EVENT_SOURCE", offer_event_source)
+
+
+def test_a_single_worker_may_use_per_process_backends(monkeypatch):
+    configure(monkeypatch, 1, "memory", "memory")
+
+    main.check_workers()
+
+
+@pytest.mark.parametrize("search_backend, offer_event_source", [
+    ("memory", "change_stream"), ("mongo", "memory"), ("memory", "memory")])
+def test_several_workers_need_the_shared_backends(monkeypatch, search_backend, offer_event_source):
+    configure(monkeypatch, 4, search_backend, offer_event_source)
+
+    with pytest.raises(RuntimeError, match="4 workers"):
+        main.check_workers()
+
+
+def test_several_workers_start_on_the_shared_backends(monkeypatch, caplog):
+    configure(monkeypatch, 4, "mongo", "change_stream")
+
+    main.check_workers()
+
+    assert "trade graph" in caplog.text